@@ -1,12 +1,48 @@
 # Filename: __init__.py
-# Description: This file initializes the Battleship game package by importing key components: Board, Player, Renderer, and Game classes.
+# Description: This file initializes the Battleship game package by exposing key components: Board, Player, Renderer, and Game classes. Each class is imported from its module the first time it is used, so the game logic can be imported without loading pyray/raylib.
 # Inputs: None
 # Output: Initializes the package by exposing the main classes for use.
 # Other sources for the code: ChatGPT(for proper commenting format)
 # Authors: Xavier and Andrew
 # Creation Date: 9th of September, 2024
 
-from .board import Board
-from .player import Player
-from .renderer import Renderer
-from .game import Game
+import importlib  # Importing the module of a class when it is first used.
+
+# class name is the key, module that defines it is the value
+# Renderer and Game (and everything that draws) load pyray, so "from battleship import Board" must not import them up front.
+LAZY_IMPORTS = {
+    "Board": ".board",
+    "Player": ".player",
+    "Renderer": ".renderer",
+    "Game": ".game",
+    "Engine": ".engine",
+    "BitBoard": ".bitboard",
+    "BitPlayer": ".bitboard",
+    "ProbabilityAI": ".ai",
+    "GameState": ".state",
+    "CompactBoard": ".compact",
+    "CompactPlayer": ".compact",
+    "FleetSampler": ".fleet",
+    "EndgameSolver": ".solver",
+    "SparseBoard": ".sparse",
+    "SparsePlayer": ".sparse",
+    "Viewport": ".viewport",
+    "BatchSimulator": ".batch",
+    "OpeningBook": ".book",
+    "ArchiveStats": ".analytics",
+}
+__all__ = list(LAZY_IMPORTS)
+
+def __getattr__(name):
+    '''
+    Imports a class of the package the first time it is looked up (battleship.Game, from battleship import Game).
+    '''
+    module = LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups find it directly.
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
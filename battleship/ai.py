@@ -0,0 +1,259 @@
+# Filename: ai.py
+# Description: This module defines the ProbabilityAI class, a hunt/target computer opponent. It keeps a probability heatmap of where the enemy's remaining ships can still fit and updates it incrementally after every attack. Once few configurations of the enemy fleet are left, it attacks the cell with the highest exact hit probability from the EndgameSolver. Until its first hit, it plays the opening shots of the OpeningBook when the fleet is in the book, and only builds the heatmap once it leaves the book.
+# Inputs: The enemy Player being attacked and the result of every attack made on it
+# Output: Attack coordinates (and random ship placements for the computer's own fleet)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import random  # Used to break ties between equally likely cells and to place ships.
+import numpy as np  # Used to pick a random legal placement from the board's placement masks.
+from .board import Orientation
+from .constants import *  # Importing cell values like HIT_CELL, MISS_CELL and SUNK_CELL.
+from .solver import EndgameSolver  # Exact hit probabilities once few configurations are left.
+from .book import OpeningBook  # Precomputed opening shots, read from the mapped book file.
+
+class ProbabilityAI:
+    layouts = {}  # (rows, cols, ship size) is the key, (placements, placement indices crossing each cell) is the value
+    ENDGAME_PLACEMENTS = 5000  # The exact solver is tried once the live placements of the unsunk ships multiply to at most this.
+    ENDGAME_SECONDS = 0.008  # Time one move may spend in the solver before falling back to the heatmaps, to stay inside a frame.
+
+    def __init__(self, enemy, rng=None):
+        '''
+        Initializes the AI against the given enemy player.
+        - If no shot was made on the enemy board yet and the fleet is in the OpeningBook, the AI follows the book
+          and the heatmaps below are only built once it leaves the book (first hit, or no book shots left).
+        - Every placement of every unsunk enemy ship is enumerated once.
+        - heat[cell] counts the live placements covering a cell (hunt mode).
+        - target[cell] counts, over live placements covering a cell, how many unsunk hits they explain (target mode).
+        Args:
+            enemy: The Player whose board the AI attacks.
+            rng: Optional random.Random instance used to break ties.
+        '''
+        self.enemy = enemy  # The player being attacked.
+        self.rng = rng or random.Random()  # Random source for tie breaking.
+        self.rows = enemy.board.rows  # Board dimensions taken from the enemy board.
+        self.cols = enemy.board.cols
+        self.book_shots = None  # Opening shots of the OpeningBook still being followed, None once out of the book.
+        self.book_move = 0  # Number of book shots played.
+        self.heatmap_ready = False  # Set by build_heatmap.
+
+        board = enemy.board
+        book = OpeningBook.open()
+        if book is not None and not any(value <= 0 for _, _, value in board.nonempty_cells(0, self.rows, 0, self.cols)):  # No shot made yet.
+            self.book_shots = book.opening(self.rows, self.cols, list(enemy.ship_sizes.values()))
+        if self.book_shots is None:
+            self.build_heatmap()
+
+    def build_heatmap(self):
+        '''
+        Builds the heatmaps from the placements of the unsunk enemy ships and everything visible on the enemy board.
+        '''
+        enemy = self.enemy
+        num_cells = self.rows * self.cols
+        self.book_shots = None
+        self.heatmap_ready = True
+
+        self.shot = [False] * num_cells  # Cells the AI has already attacked.
+        self.open_hits = set()  # Hit cells whose ship has not been sunk yet.
+        self.heat = [0] * num_cells  # Number of live placements covering each cell.
+        self.target = [0] * num_cells  # Hit-weighted number of live placements covering each cell.
+
+        self.placements = {}  # ship id is the key, list of placements (tuples of cell indices) is the value
+        self.cell_placements = {}  # ship id is the key, list of placement indices crossing each cell is the value
+        self.live = {}  # ship id is the key, list of booleans telling if each placement is still possible
+        self.hits_covered = {}  # ship id is the key, list of unsunk hits covered by each placement
+
+        for ship, cells_left in enemy.ship_count.items():
+            if cells_left > 0:  # Only unsunk ships can still be somewhere on the board.
+                self.add_ship_placements(ship)
+
+        # Apply anything already visible on the enemy board (for an AI created mid-game, or leaving the book).
+        for i, row in enumerate(enemy.board.cells):
+            for j, cell in enumerate(row):
+                if cell == MISS_CELL or cell == SUNK_CELL:
+                    self.block_cell(i * self.cols + j)
+                elif cell == HIT_CELL:
+                    self.add_hit(i * self.cols + j)
+
+    def get_layout(self, ship_size):
+        '''
+        Returns every horizontal and vertical placement of a ship on this board size, and for each cell the indices
+        of the placements crossing it. Layouts never change, so they are shared by every ProbabilityAI.
+        '''
+        key = (self.rows, self.cols, ship_size)
+        layout = ProbabilityAI.layouts.get(key)
+        if layout is None:
+            placements = []
+            for i in range(self.rows):
+                for j in range(self.cols):
+                    if j + ship_size <= self.cols:  # Horizontal placement fits.
+                        placements.append(tuple(i * self.cols + j + x for x in range(ship_size)))
+                    if ship_size > 1 and i + ship_size <= self.rows:  # Vertical placement fits (size 1 is the same either way).
+                        placements.append(tuple((i + x) * self.cols + j for x in range(ship_size)))
+
+            crossing = [[] for _ in range(self.rows * self.cols)]
+            for index, cells in enumerate(placements):
+                for cell in cells:
+                    crossing[cell].append(index)
+            layout = (placements, crossing)
+            ProbabilityAI.layouts[key] = layout
+        return layout
+
+    def add_ship_placements(self, ship):
+        '''
+        Adds every placement of a ship (by id; ships of the same size share one layout) to the heatmap.
+        '''
+        placements, crossing = self.get_layout(self.enemy.ship_sizes[ship])
+        self.placements[ship] = placements
+        self.cell_placements[ship] = crossing
+        self.live[ship] = [True] * len(placements)
+        self.hits_covered[ship] = [0] * len(placements)
+        heat = self.heat
+        for cell, indices in enumerate(crossing):
+            heat[cell] += len(indices)  # Every placement starts out possible.
+
+    def remove_placement(self, ship, index):
+        '''
+        Marks a placement as impossible and subtracts it from both heatmaps.
+        '''
+        self.live[ship][index] = False
+        covered = self.hits_covered[ship][index]
+        for cell in self.placements[ship][index]:
+            self.heat[cell] -= 1
+            self.target[cell] -= covered
+
+    def block_cell(self, cell):
+        '''
+        Removes every live placement crossing a cell that can no longer hold an unsunk ship (a miss or a sunk cell).
+        '''
+        self.shot[cell] = True
+        for ship, live in self.live.items():
+            for index in self.cell_placements[ship][cell]:
+                if live[index]:
+                    self.remove_placement(ship, index)
+
+    def add_hit(self, cell):
+        '''
+        Records an unsunk hit: every live placement crossing the cell now explains one more hit.
+        '''
+        self.shot[cell] = True
+        self.open_hits.add(cell)
+        for ship, live in self.live.items():
+            hits_covered = self.hits_covered[ship]
+            for index in self.cell_placements[ship][cell]:
+                if live[index]:
+                    hits_covered[index] += 1
+                    for covered_cell in self.placements[ship][index]:
+                        self.target[covered_cell] += 1
+
+    def sink_ship(self, ship, ship_cells):
+        '''
+        Records a sunk ship: its cells are blocked for the other ships and all of its placements are dropped.
+        '''
+        for i, j in ship_cells:
+            cell = i * self.cols + j
+            self.open_hits.discard(cell)
+            self.block_cell(cell)
+
+        live = self.live[ship]
+        for index in range(len(live)):
+            if live[index]:
+                self.remove_placement(ship, index)  # The ship is gone, so none of its placements remain.
+        for table in (self.placements, self.cell_placements, self.live, self.hits_covered):
+            del table[ship]  # Later updates no longer need to look at this ship.
+
+    def record_attack(self, i, j, res, ship):
+        '''
+        Updates the heatmaps with the result of an attack, touching only placements crossing the changed cells.
+        Args:
+            i, j: The attacked cell.
+            res, ship: The values returned by Player.place_attack.
+        '''
+        if ship == MISS_CELL:  # The cell had already been attacked, nothing changed.
+            return
+        if not self.heatmap_ready:
+            if not res and i * self.cols + j == self.book_shots[self.book_move]:
+                self.book_move += 1  # A book shot missed, the next one is still the best.
+            else:
+                self.build_heatmap()  # Out of the book; the board already shows this attack.
+            return
+
+        cell = i * self.cols + j
+        if not res:
+            self.block_cell(cell)  # A miss rules out every placement crossing the cell.
+        elif self.enemy.ship_count[ship] == 0:
+            self.add_hit(cell)
+            self.sink_ship(ship, self.enemy.ship_hits[ship])
+        else:
+            self.add_hit(cell)
+
+    def endgame_cells(self):
+        '''
+        Returns the cells with the highest exact hit probability from the EndgameSolver, or None if too many
+        configurations are still possible for the solver to finish within ENDGAME_SECONDS. The solver starts over
+        on every move, so the budget is what keeps a move inside one frame, whatever the machine's speed.
+        '''
+        estimate = 1
+        for live in self.live.values():
+            estimate *= live.count(True)  # Upper bound on the configurations of the unsunk ships.
+        if not self.live or estimate > self.ENDGAME_PLACEMENTS or self.rows * self.cols > EndgameSolver.MAX_CELLS:
+            return None
+        solver = EndgameSolver.for_player(self.enemy, max_seconds=self.ENDGAME_SECONDS)
+        return solver.best_cells if solver.solve() else None
+
+    def choose_attack(self):
+        '''
+        Picks the next cell to attack.
+        - Endgame (few configurations left): the cell with the highest exact hit probability.
+        - Target mode (there are unsunk hits): the cell most placements through those hits agree on.
+        - Hunt mode: the cell covered by the most possible placements.
+        Returns:
+            A tuple (i, j) of the cell to attack.
+        '''
+        if not self.heatmap_ready:
+            if self.book_move < len(self.book_shots):
+                return divmod(int(self.book_shots[self.book_move]), self.cols)  # Opening shot looked up in the book.
+            self.build_heatmap()
+
+        best = self.endgame_cells()
+        if best:
+            return self.rng.choice(best)
+
+        scores = self.target if self.open_hits else self.heat
+        best_score = -1
+        best_cells = []
+        for cell, score in enumerate(scores):
+            if self.shot[cell]:
+                continue
+            if score > best_score:
+                best_score = score
+                best_cells = [cell]
+            elif score == best_score:
+                best_cells.append(cell)
+
+        if best_score <= 0 and self.open_hits:  # No placement explains the hits, fall back to hunting.
+            best_score = max(self.heat[cell] for cell in best_cells)
+            best_cells = [cell for cell in best_cells if self.heat[cell] == best_score]
+
+        return divmod(self.rng.choice(best_cells), self.cols)
+
+    @staticmethod
+    def choose_placement(player, rng=None):
+        '''
+        Picks a uniformly random legal (i, j, orientation) for the player's next ship from the board's placement masks.
+        Returns:
+            A tuple (i, j, orientation), or None if the ship cannot be placed anywhere.
+        '''
+        rng = rng or random
+        ship_size = player.ship_sizes[player.ships[-1]]
+        options = []
+        for orientation in (Orientation.HORIZONTAL, Orientation.VERTICAL):
+            for cell in np.flatnonzero(player.board.placement_mask(ship_size, orientation)):
+                options.append((int(cell), orientation))
+        if not options:
+            return None
+
+        cell, orientation = rng.choice(options)
+        i, j = divmod(cell, player.board.cols)
+        return i, j, orientation
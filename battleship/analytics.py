@@ -0,0 +1,354 @@
+# Filename: analytics.py
+# Description: This module defines the streaming analytics over replay archives. A pipeline of generators reads the recorded games one at a time (ReplayArchive.stream), checks their headers, groups them into small batches per board size and folds every batch into ArchiveStats with NumPy: where ships were placed (cells covered and orientation), which cells were shot and hit, and running statistics of how many shots games take. Memory stays the same whatever the size of the archive, processes can each fold a part of the archive and merge their partial results, and the result is exported to a file that the game draws as a heatmap overlay.
+# Inputs: A replay archive (python -m battleship.analytics replays/games.bsra), the number of worker processes and where to export the result
+# Output: A summary of the archive and a .npz file with the placement and shot heatmaps of every board size
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import argparse  # Command line of the analytics tool.
+import multiprocessing  # Folding parts of the archive in parallel.
+import numpy as np  # Heatmaps and the batched event decoding.
+from .replay import Replay, ReplayArchive, PLACE_EVENT, ATTACK_EVENT, RESULT_MISS
+
+# One replay event as a NumPy record, matching ReplayLog.EVENT ("<BBHH").
+EVENT_DTYPE = np.dtype([("flags", "u1"), ("ship", "u1"), ("i", "<u2"), ("j", "<u2")])
+
+class RunningStats:
+    '''
+    Count, mean, variance, minimum and maximum of a stream of values, updated a batch at a time.
+    Partial results merge exactly (the parallel form of Welford's update), so the order batches arrive in does not matter.
+    '''
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared differences from the mean.
+        self.low = float("inf")
+        self.high = float("-inf")
+
+    def add(self, values):
+        '''
+        Adds a NumPy array of values.
+        '''
+        if len(values):
+            mean = float(values.mean())
+            self.combine(len(values), mean, float(((values - mean) ** 2).sum()), float(values.min()), float(values.max()))
+
+    def merge(self, other):
+        '''
+        Adds the values summarized by another RunningStats.
+        '''
+        self.combine(other.count, other.mean, other.m2, other.low, other.high)
+
+    def combine(self, count, mean, m2, low, high):
+        '''
+        Adds count values with the given mean, sum of squared differences, minimum and maximum.
+        '''
+        if not count:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.low = min(self.low, low)
+        self.high = max(self.high, high)
+
+    def std(self):
+        '''
+        Returns the sample standard deviation (0 for fewer than two values).
+        '''
+        return (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+
+    def to_array(self):
+        '''
+        Returns the statistics as a float64 array, for export.
+        '''
+        return np.array([self.count, self.mean, self.m2, self.low, self.high], dtype=np.float64)
+
+    @staticmethod
+    def from_array(values):
+        '''
+        Returns the RunningStats exported by to_array.
+        '''
+        stats = RunningStats()
+        stats.count = int(values[0])
+        stats.mean, stats.m2, stats.low, stats.high = (float(value) for value in values[1:])
+        return stats
+
+class BoardHeatmaps:
+    '''
+    Aggregates of every recorded game on one board size; every array is (rows, cols) counts.
+    - placements: how many placed fleets covered each cell with a ship.
+    - shots / hits: how many attacks landed on each cell, and how many of those hit a ship.
+    '''
+    KINDS = ("placements", "shots", "hits")  # Arrays that are exported and can be drawn as a heatmap.
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.placements = np.zeros((rows, cols), dtype=np.int64)
+        self.shots = np.zeros((rows, cols), dtype=np.int64)
+        self.hits = np.zeros((rows, cols), dtype=np.int64)
+        self.orientations = np.zeros(2, dtype=np.int64)  # Ships placed horizontally, vertically.
+        self.fleets = 0  # Players whose placements were counted.
+        self.games = 0  # Replays folded in.
+        self.finished = 0  # Replays that ended with a win.
+        self.game_shots = RunningStats()  # Attacks by both players in every finished game.
+        self.winner_shots = RunningStats()  # Attacks the winner needed in every finished game.
+
+    def add_batch(self, replays, include_computer=False):
+        '''
+        Folds a batch of replays of this board size into the counts, decoding all of their events at once.
+        Args:
+            replays: List of (ship sizes, single player flag, raw events) as yielded by ArchiveStats.parse.
+            include_computer: Whether the computer's placements in single player games are counted; by default only
+                              placements made by people are, since the computer always places uniformly at random.
+        '''
+        count = len(replays)
+        events = np.frombuffer(b"".join(replay[2] for replay in replays), dtype=EVENT_DTYPE)
+        lengths = np.fromiter((len(replay[2]) // EVENT_DTYPE.itemsize for replay in replays), dtype=np.int64, count=count)
+        game = np.repeat(np.arange(count), lengths)  # Replay of every event in the batch.
+        # ship_table[first[g] + ship] is the size of ship id ship in replay g (index first[g] is the unused id 0).
+        ship_table = np.fromiter((size for replay in replays for size in (0,) + replay[0]), dtype=np.int64)
+        num_ships = np.fromiter((len(replay[0]) for replay in replays), dtype=np.int64, count=count)
+        first = np.concatenate(([0], np.cumsum(num_ships + 1)[:-1]))
+        fleet_cells = np.fromiter((sum(replay[0]) for replay in replays), dtype=np.int64, count=count)
+        computer = np.fromiter((replay[1] for replay in replays), dtype=bool, count=count)  # Player 2 is the computer.
+
+        flags = events["flags"]
+        ship = events["ship"].astype(np.int64)
+        i = events["i"].astype(np.int64)
+        j = events["j"].astype(np.int64)
+        player = (flags >> 1) & 1  # 0 for player 1, 1 for player 2.
+        side = game * 2 + player  # One counter per player of every replay.
+        inside = (i < self.rows) & (j < self.cols)
+
+        placed = ((flags & 1) == PLACE_EVENT) & inside & (ship >= 1) & (ship <= num_ships[game])
+        if not include_computer:
+            placed &= ~(computer[game] & (player == 1))
+        vertical = ((flags >> 2) & 1).astype(np.int64)
+        self.orientations += np.bincount(vertical[placed], minlength=2)
+        self.fleets += len(np.unique(side[placed]))
+        sizes = ship_table[first[game[placed]] + ship[placed]]
+        flat = self.placements.reshape(-1)
+        for size in np.unique(sizes):  # Ships of one size cover the same number of cells, so each size is one array op.
+            same = sizes == size
+            steps = np.arange(size)
+            rows = i[placed][same, None] + steps * vertical[placed][same, None]
+            cols = j[placed][same, None] + steps * (1 - vertical[placed][same, None])
+            on_board = (rows < self.rows) & (cols < self.cols)
+            flat += np.bincount((rows * self.cols + cols)[on_board], minlength=flat.size)
+
+        attacked = ((flags & 1) == ATTACK_EVENT) & inside
+        hit = attacked & (((flags >> 3) & 3) != RESULT_MISS)
+        cells = i * self.cols + j
+        self.shots.reshape(-1)[:] += np.bincount(cells[attacked], minlength=flat.size)
+        self.hits.reshape(-1)[:] += np.bincount(cells[hit], minlength=flat.size)
+
+        side_shots = np.bincount(side[attacked], minlength=2 * count).reshape(count, 2)
+        side_hits = np.bincount(side[hit], minlength=2 * count).reshape(count, 2)
+        won = (side_hits >= fleet_cells[:, None]) & (fleet_cells[:, None] > 0)  # The winner hit every cell of the other fleet.
+        finished = won.any(axis=1)
+        self.games += count
+        self.finished += int(finished.sum())
+        self.game_shots.add(side_shots.sum(axis=1)[finished])
+        self.winner_shots.add(side_shots[finished, won[finished].argmax(axis=1)])
+
+    def merge(self, other):
+        '''
+        Adds the counts of another BoardHeatmaps of the same board size.
+        '''
+        for kind in self.KINDS:
+            getattr(self, kind)[:] += getattr(other, kind)
+        self.orientations += other.orientations
+        self.fleets += other.fleets
+        self.games += other.games
+        self.finished += other.finished
+        self.game_shots.merge(other.game_shots)
+        self.winner_shots.merge(other.winner_shots)
+
+    def heatmap(self, kind):
+        '''
+        Returns a (rows, cols) float array to draw: the share of fleets with a ship on each cell ("placements"),
+        the average attacks on each cell per game ("shots"), or the share of attacks on each cell that hit ("hits").
+        '''
+        if kind == "placements":
+            return self.placements / max(self.fleets, 1)
+        if kind == "shots":
+            return self.shots / max(self.games, 1)
+        return self.hits / np.maximum(self.shots, 1)
+
+class ArchiveStats:
+    BATCH_GAMES = 1024  # Replays of one board size decoded together; bounds the memory of the pipeline.
+
+    def __init__(self, include_computer=False):
+        '''
+        Starts empty statistics; add_records folds replays in and merge adds another ArchiveStats.
+        Args:
+            include_computer: Whether the computer's placements in single player games are counted.
+        '''
+        self.include_computer = include_computer
+        self.boards = {}  # (rows, cols) is the key, BoardHeatmaps of the games on that board size is the value
+        self.skipped = 0  # Records that were not valid replays.
+
+    def parse(self, records):
+        '''
+        Lazily turns raw replay bytes into (rows, cols, ship sizes, single player flag, raw events), skipping and counting
+        records that are not valid replays. Only the header is read; no players are built.
+        '''
+        for data in records:
+            try:
+                single_player, rows, cols, ship_sizes, header_size = Replay.read_header(data)
+            except (ValueError, TypeError):
+                self.skipped += 1
+                continue
+            yield rows, cols, ship_sizes, single_player, memoryview(data)[header_size:]
+
+    def add_records(self, records):
+        '''
+        Folds the replays of an iterable of raw replay bytes (usually ReplayArchive.stream) into the statistics,
+        holding at most BATCH_GAMES replays per board size at a time.
+        '''
+        for rows, cols, replays in batches(self.parse(records), self.BATCH_GAMES):
+            board = self.boards.get((rows, cols))
+            if board is None:
+                board = self.boards[(rows, cols)] = BoardHeatmaps(rows, cols)
+            board.add_batch(replays, self.include_computer)
+
+    def merge(self, other):
+        '''
+        Adds the statistics of another ArchiveStats, such as the result of another part of the archive.
+        '''
+        self.skipped += other.skipped
+        for key, board in other.boards.items():
+            if key in self.boards:
+                self.boards[key].merge(board)
+            else:
+                self.boards[key] = board
+
+    @staticmethod
+    def analyze(path, workers=1, include_computer=False):
+        '''
+        Returns the ArchiveStats of every replay in an archive file.
+        With more than one worker, each process streams its own part of the file (ReplayArchive.stream) and the partial
+        results are merged; workers=None uses every CPU.
+        '''
+        if workers == 1:
+            return analyze_part((path, 0, 1, include_computer))
+        workers = workers or multiprocessing.cpu_count()
+        stats = ArchiveStats(include_computer)
+        tasks = [(path, part, workers, include_computer) for part in range(workers)]
+        with multiprocessing.Pool(workers) as pool:
+            for partial in pool.imap_unordered(analyze_part, tasks):
+                stats.merge(partial)
+        return stats
+
+    def save(self, path):
+        '''
+        Exports the heatmaps and statistics of every board size to a NumPy .npz file.
+        '''
+        arrays = {"skipped": np.array(self.skipped), "boards": np.array(sorted(self.boards), dtype=np.int64).reshape(-1, 2)}
+        for (rows, cols), board in self.boards.items():
+            prefix = f"{rows}x{cols}_"
+            for kind in BoardHeatmaps.KINDS:
+                arrays[prefix + kind] = getattr(board, kind)
+            arrays[prefix + "orientations"] = board.orientations
+            arrays[prefix + "counts"] = np.array([board.fleets, board.games, board.finished], dtype=np.int64)
+            arrays[prefix + "game_shots"] = board.game_shots.to_array()
+            arrays[prefix + "winner_shots"] = board.winner_shots.to_array()
+        with open(path, "wb") as file:  # A file object keeps numpy from adding its own extension.
+            np.savez_compressed(file, **arrays)
+
+    @staticmethod
+    def load(path):
+        '''
+        Returns the ArchiveStats exported by save.
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If it is not an exported ArchiveStats.
+        '''
+        stats = ArchiveStats()
+        try:
+            with np.load(path, allow_pickle=False) as arrays:
+                stats.skipped = int(arrays["skipped"])
+                for rows, cols in arrays["boards"].tolist():
+                    prefix = f"{rows}x{cols}_"
+                    board = BoardHeatmaps(rows, cols)
+                    for kind in BoardHeatmaps.KINDS:
+                        getattr(board, kind)[:] = arrays[prefix + kind]
+                    board.orientations[:] = arrays[prefix + "orientations"]
+                    board.fleets, board.games, board.finished = (int(count) for count in arrays[prefix + "counts"])
+                    board.game_shots = RunningStats.from_array(arrays[prefix + "game_shots"])
+                    board.winner_shots = RunningStats.from_array(arrays[prefix + "winner_shots"])
+                    stats.boards[(rows, cols)] = board
+        except KeyError as error:
+            raise ValueError(f"{path} is not an exported heatmap file") from error
+        return stats
+
+    def summary(self):
+        '''
+        Returns a readable report of every board size.
+        '''
+        lines = []
+        for (rows, cols), board in sorted(self.boards.items()):
+            horizontal, vertical = (int(count) for count in board.orientations)
+            placed = max(horizontal + vertical, 1)
+            lines.append(f"{rows}x{cols}: {board.games} games, {board.finished} finished, {board.fleets} fleets placed")
+            for label, stats in (("shots per game", board.game_shots), ("winner's shots", board.winner_shots)):
+                if stats.count:
+                    lines.append(f"  {label:>15}: mean {stats.mean:7.2f}  std {stats.std():6.2f}  min {stats.low:5.0f}  max {stats.high:5.0f}")
+            lines.append(f"  {'orientation':>15}: {horizontal / placed:.1%} horizontal, {vertical / placed:.1%} vertical")
+            for kind in ("placements", "shots"):
+                heat = board.heatmap(kind).reshape(-1)
+                top = [divmod(int(cell), cols) for cell in np.argsort(heat, kind="stable")[::-1][:5] if heat[cell] > 0]
+                lines.append(f"  {'top ' + kind:>15}: " + ", ".join(f"({i}, {j}) {heat[i * cols + j]:.2f}" for i, j in top))
+        if self.skipped:
+            lines.append(f"skipped {self.skipped} records that are not valid replays")
+        return "\n".join(lines) or "no replays"
+
+def batches(replays, size):
+    '''
+    Groups the parsed replays of ArchiveStats.parse by board size, lazily yielding (rows, cols, list of
+    (ship sizes, single player flag, raw events)) whenever size replays of one board size are waiting, then the rest.
+    '''
+    pending = {}  # (rows, cols) is the key, replays waiting to be folded is the value
+    for rows, cols, ship_sizes, single_player, events in replays:
+        waiting = pending.setdefault((rows, cols), [])
+        waiting.append((ship_sizes, single_player, events))
+        if len(waiting) >= size:
+            yield rows, cols, waiting
+            pending[(rows, cols)] = []
+    for (rows, cols), waiting in pending.items():
+        if waiting:
+            yield rows, cols, waiting
+
+def analyze_part(task):
+    '''
+    Worker task: folds one part of an archive, given as (path, part, parts, include_computer), into an ArchiveStats.
+    '''
+    path, part, parts, include_computer = task
+    stats = ArchiveStats(include_computer)
+    stats.add_records(ReplayArchive(path).stream(part, parts))
+    return stats
+
+def main():
+    '''
+    Parses the command line, analyzes an archive, prints the summary and optionally exports the heatmaps.
+    '''
+    parser = argparse.ArgumentParser(description="Placement and shot heatmaps of a Battleship replay archive.")
+    parser.add_argument("archive", nargs="?", default="replays/games.bsra", help="replay archive to analyze")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="worker processes (0: CPU count)")
+    parser.add_argument("--include-computer", action="store_true", help="also count the computer's placements in single player games")
+    parser.add_argument("-o", "--output", help="export the heatmaps to this .npz file (shown in the game with --heatmaps)")
+    args = parser.parse_args()
+
+    stats = ArchiveStats.analyze(args.archive, args.workers or None, args.include_computer)
+    print(stats.summary())
+    if args.output:
+        stats.save(args.output)
+        print(f"wrote {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+# Filename: batch.py
+# Description: This module defines the BatchSimulator class, a headless engine that plays many Battleship games in lockstep. The boards of all K games are stored together as NumPy arrays (struct of arrays): the cell values as a (K, rows, cols) array, plus the ship id under every cell and the cells left of every ship. Every step applies one shot to each game with vectorized operations and the same HIT/MISS/SUNK rules as Player.place_attack, so the cost of a shot is shared by the whole batch. Batched attack policies are included for evaluating shot order over millions of games.
+# Inputs: Board dimensions, the fleet, the number of games, and one (i, j) shot per game per step
+# Output: The cell values, attack results, shot counts and losses of every game
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import numpy as np  # Every game's state is a slice of the same arrays.
+from .board import Orientation
+from .fleet import FleetSampler  # Uniform fleet layouts, drawn in batches.
+from .constants import *  # Importing cell values like HIT_CELL, MISS_CELL and SUNK_CELL.
+
+class BatchSimulator:
+    placement_cells = {}  # (rows, cols, ship size) is the key, (placements, ship size) array of the cell indices of every placement in the FleetSampler index is the value
+
+    def __init__(self, count, rows=10, cols=10, fleet=CLASSIC_FLEET):
+        '''
+        Initializes count games with empty boards; place_random or load_players fills in the ships.
+        Cell (i, j) of game g is cells[g, i, j], with the same values as Board.cells (ship ids, HIT_CELL, MISS_CELL, SUNK_CELL).
+        Args:
+            count: Number of games played in lockstep.
+            rows: Number of rows in every board.
+            cols: Number of columns in every board.
+            fleet: Number of ships (sizes 1 up to fleet) or the list of ship sizes, like Player.get_ships.
+        '''
+        self.count = count
+        self.rows = rows
+        self.cols = cols
+        sizes = range(1, fleet + 1) if isinstance(fleet, int) else sorted(fleet)  # Ship ids from 1 up, the smallest ship first, like Player.
+        self.ship_sizes = np.array([0] + list(sizes), dtype=np.int32)  # ship_sizes[ship] is the size of ship id ship (id 0 is unused).
+        self.cells = np.full((count, rows, cols), EMPTY_CELL, dtype=np.int16)  # Cell values of every game.
+        self.ship_ids = np.zeros((count, rows, cols), dtype=np.int16)  # Ship id under every cell (0 for water), kept after hits like Player.ship_index.
+        self.ship_count = np.zeros((count, len(self.ship_sizes)), dtype=np.int32)  # Cells left of every ship of every game, like Player.ship_count.
+        self.num_ship_cells = np.zeros(count, dtype=np.int32)  # Ship cells left in every game, like Player.num_ship_cells.
+        self.shots = np.zeros(count, dtype=np.int32)  # Attacks that counted in every game (repeated cells and shots after a loss do not).
+        self.games = np.arange(count)  # Row index of every game, used to pick one cell per game.
+
+    @classmethod
+    def cells_of(cls, sampler, ship_size):
+        '''
+        Returns the cell indices (i * cols + j) covered by every placement of a ship size, in the order of the FleetSampler index.
+        '''
+        key = (sampler.rows, sampler.cols, ship_size)
+        cells = cls.placement_cells.get(key)
+        if cells is None:
+            sampler.index(ship_size)
+            starts = np.array([(i, j, orientation == Orientation.VERTICAL) for i, j, orientation in sampler.starts[ship_size]], dtype=np.int64).reshape(-1, 3)
+            step = np.where(starts[:, 2:], sampler.cols, 1)  # Cell distance between ship cells.
+            cells = starts[:, :1] * sampler.cols + starts[:, 1:2] + step * np.arange(ship_size)
+            cls.placement_cells[key] = cells
+        return cells
+
+    def reset(self):
+        '''
+        Empties every board, ready for new ships.
+        '''
+        self.cells.fill(EMPTY_CELL)
+        self.ship_ids.fill(0)
+        self.ship_count.fill(0)
+        self.num_ship_cells.fill(0)
+        self.shots.fill(0)
+
+    def place_random(self, rng=None):
+        '''
+        Places a fleet drawn uniformly at random (FleetSampler.sample_batch) on every board.
+        Args:
+            rng: Optional numpy.random.Generator for reproducible layouts.
+        '''
+        self.reset()
+        sampler = FleetSampler.for_board(self)  # Boards of the same size share the placement index.
+        ship_sizes = [int(ship_size) for ship_size in self.ship_sizes[1:]]
+        layouts = sampler.sample_batch(ship_sizes, self.count, rng)
+        flat_ids = self.ship_ids.reshape(self.count, -1)
+        for k, ship_size in enumerate(ship_sizes):
+            ship = k + 1
+            flat_ids[self.games[:, None], self.cells_of(sampler, ship_size)[layouts[:, k]]] = ship
+        self.cells[self.ship_ids > 0] = self.ship_ids[self.ship_ids > 0]  # Unhit ship cells hold the ship id, like Board.cells.
+        self.ship_count[:] = self.ship_sizes
+        self.num_ship_cells[:] = self.ship_sizes.sum()
+
+    def load_players(self, players):
+        '''
+        Copies the boards of Players (one per game, ships placed and none attacked yet) into the batch,
+        so the batch plays the same games as Player.place_attack would.
+        '''
+        self.reset()
+        for game, player in enumerate(players):
+            for (i, j), ship in player.ship_index.items():
+                self.ship_ids[game, i, j] = ship
+                self.cells[game, i, j] = ship
+            for ship, cells_left in player.ship_count.items():
+                self.ship_count[game, ship] = cells_left
+            self.num_ship_cells[game] = player.num_ship_cells
+
+    def attack(self, i, j):
+        '''
+        Attacks one cell of every game at once, like Player.place_attack on every board.
+        - A shot on a ship cell makes it a HIT_CELL; if it was the ship's last cell, every cell of the ship becomes a SUNK_CELL.
+        - A shot on water makes it a MISS_CELL.
+        - A shot on a cell that was already attacked, or in a game that is already lost, changes nothing.
+        Args:
+            i: (count,) array with the row attacked in every game.
+            j: (count,) array with the column attacked in every game.
+        Returns:
+            (hit, ship): hit is True where a ship was hit; ship is the id of the ship hit, EMPTY_CELL for a miss,
+            or MISS_CELL where nothing changed (the same values Player.place_attack returns).
+        '''
+        flat = self.cells.reshape(self.count, -1)
+        cell = np.asarray(i) * self.cols + np.asarray(j)
+        value = flat[self.games, cell]
+        ship = self.ship_ids.reshape(self.count, -1)[self.games, cell].astype(np.int32)
+        valid = ((value > 0) | (value == EMPTY_CELL)) & (self.num_ship_cells > 0)  # Not attacked yet and the game is still on.
+        hit = valid & (ship > 0)
+        miss = valid & (ship == 0)
+
+        self.shots += valid
+        flat[self.games[miss], cell[miss]] = MISS_CELL
+        hit_games = self.games[hit]
+        hit_ships = ship[hit]
+        self.ship_count[hit_games, hit_ships] -= 1
+        self.num_ship_cells[hit_games] -= 1
+        flat[hit_games, cell[hit]] = HIT_CELL
+
+        sunk = self.ship_count[hit_games, hit_ships] == 0
+        if sunk.any():  # Sinking is rare, so only the boards with a sunk ship are rewritten.
+            sunk_games = hit_games[sunk]
+            ship_cells = self.ship_ids[sunk_games] == hit_ships[sunk][:, None, None]
+            self.cells[sunk_games] = np.where(ship_cells, SUNK_CELL, self.cells[sunk_games])
+
+        result = np.where(hit, ship, np.where(miss, EMPTY_CELL, MISS_CELL))
+        return hit, result
+
+    def attacked(self):
+        '''
+        Returns a (count, rows, cols) boolean array that is True for every cell already attacked.
+        '''
+        return (self.cells == HIT_CELL) | (self.cells == MISS_CELL) | (self.cells == SUNK_CELL)
+
+    def is_loss(self):
+        '''
+        Returns a (count,) boolean array that is True for every game whose ships are all sunk.
+        '''
+        return self.num_ship_cells <= 0
+
+    def play(self, policy, rng=None, max_steps=None):
+        '''
+        Attacks with the policy until every game is lost.
+        Args:
+            policy: Function (simulator, rng) returning the (i, j) arrays of the next shots, like the ones in BATCH_POLICIES.
+            rng: Optional numpy.random.Generator passed to the policy.
+            max_steps: Optional limit on the number of steps (rows * cols by default, enough for any policy that never repeats a cell).
+        Returns:
+            The (count,) array of shots every game took.
+        '''
+        rng = rng or np.random.default_rng()
+        for _ in range(max_steps or self.rows * self.cols):
+            if self.is_loss().all():
+                break
+            self.attack(*policy(self, rng))
+        return self.shots
+
+def random_policy(simulator, rng):
+    '''
+    Attacks a random cell that was not attacked yet in every game, like RandomAttack.
+    '''
+    scores = rng.random(simulator.cells.shape)
+    scores[simulator.attacked()] = -1.0
+    return np.unravel_index(scores.reshape(simulator.count, -1).argmax(axis=1), (simulator.rows, simulator.cols))
+
+def hunt_target_policy(simulator, rng):
+    '''
+    Hunt/target play like HuntTargetAttack: attack next to an unsunk hit if there is one, otherwise a random
+    cell of the checkerboard, otherwise any random cell not attacked yet.
+    '''
+    cells = simulator.cells
+    hits = cells == HIT_CELL
+    near_hit = np.zeros_like(hits)  # Cells next to an unsunk hit.
+    near_hit[:, 1:, :] |= hits[:, :-1, :]
+    near_hit[:, :-1, :] |= hits[:, 1:, :]
+    near_hit[:, :, 1:] |= hits[:, :, :-1]
+    near_hit[:, :, :-1] |= hits[:, :, 1:]
+    rows, cols = np.indices((simulator.rows, simulator.cols))
+    checkerboard = (rows + cols) % 2 == 0
+    scores = rng.random(cells.shape) + checkerboard + 2.0 * near_hit  # Targets beat the checkerboard, which beats the rest.
+    scores[simulator.attacked()] = -1.0
+    return np.unravel_index(scores.reshape(simulator.count, -1).argmax(axis=1), (simulator.rows, simulator.cols))
+
+# policy name is the key, function choosing the next shot of every game is the value
+BATCH_POLICIES = {
+    "random": random_policy,
+    "hunt": hunt_target_policy,
+}
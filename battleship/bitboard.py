@@ -0,0 +1,380 @@
+# Filename: bitboard.py
+# Description: This module defines the BitBoard and BitPlayer classes, an alternative Board/Player backend that stores ships, hits, misses and sunk cells as integer bitmasks so placement checks, attacks and loss/sunk detection are a few mask operations. Attacks only update the masks; the cells view, ship_count and ship_hits are read from the masks when the renderer or the AI asks for them.
+# Inputs: None
+# Output: A drop-in Board/Player backend (use Engine(player_class=BitPlayer)) that still exposes a cells view for the renderer.
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+from collections.abc import Mapping  # Read-only dict views of the fleet built from the masks.
+from .board import Board  # Importing the Board class this backend replaces.
+from .board import Orientation
+from .player import Player  # Importing the Player class this backend replaces.
+from .constants import *  # Importing all constants like HIT_CELL and MISS_CELL used for game logic.
+
+class BitBoard(Board):
+    placement_tables = {}  # (rows, cols, ship size, orientation) is the key, list of placement masks is the value, oldest first
+    PLACEMENT_TABLES = 64  # Tables kept at most (a 10x10 game with 5 ships uses 10); building a new one drops the oldest.
+
+    def __init__(self, rows=10, cols=10):
+        '''
+        Initializes a BitBoard instance with the specified number of rows and columns.
+        Cell (i, j) is stored at bit i * cols + j of each mask.
+        Args:
+            rows: Number of rows in the board.
+            cols: Number of columns in the board.
+        '''
+        self.rows = rows  # Number of rows on the board.
+        self.cols = cols  # Number of columns on the board.
+        self.ship_masks = {}  # ship id is the key, mask of the cells it covers is the value
+        self.cell_ships = [EMPTY_CELL] * (rows * cols)  # Id of the ship on each bit index, EMPTY_CELL if none.
+        self.ships = 0  # Mask of every cell a ship was placed on.
+        self.remaining = 0  # Mask of ship cells that have not been attacked yet.
+        self.shots = 0  # Mask of every cell that has been attacked.
+        self.sunk = 0  # Mask of cells belonging to sunk ships.
+        self.cell_view = None  # (ships, shots, sunk, cells) of the last cells view built, reused until a mask changes.
+        self.cell_bits = self.placement_table(1, Orientation.HORIZONTAL)  # Single-bit mask of each bit index, shared by boards of this size.
+        self.placement_masks = {}  # (ship size, orientation) is the key, cached legality grid is the value
+        self.dirty_cells = DirtyCells(self)  # (i, j) cells changed since the renderer last drew them, read from the masks
+
+    @property
+    def hits(self):
+        '''
+        Mask of ship cells that were hit but are not sunk yet.
+        '''
+        return self.ships & self.shots & ~self.sunk
+
+    @property
+    def misses(self):
+        '''
+        Mask of cells where an attack missed.
+        '''
+        return self.shots & ~self.ships
+
+    @property
+    def cells(self):
+        '''
+        Returns the 2D list view of the board used by the renderer, with the same cell values as Board.cells.
+        The view is built from the masks the first time it is read after a mask changed, and reused until the next
+        change, so attacks never touch it. It is read-only: changes must go through the masks.
+        '''
+        view = self.cell_view
+        if view is not None and view[0] == self.ships and view[1] == self.shots and view[2] == self.sunk:
+            return view[3]
+        cells = [[EMPTY_CELL] * self.cols for _ in range(self.rows)]  # Start from an empty board.
+        for ship, mask in self.ship_masks.items():
+            self.fill_cells(cells, mask, ship)  # Unhit ship cells hold the ship id.
+        self.fill_cells(cells, self.hits, HIT_CELL)  # Hit cells override ship cells.
+        self.fill_cells(cells, self.sunk, SUNK_CELL)  # Sunk cells override ship cells.
+        self.fill_cells(cells, self.misses, MISS_CELL)  # Attacked cells without a ship are misses.
+        self.cell_view = (self.ships, self.shots, self.sunk, cells)
+        return cells
+
+    def mask_cells(self, mask):
+        '''
+        Returns the (i, j) cells set in mask, in row-major order.
+        '''
+        cells = []
+        while mask:
+            low = mask & -mask  # Isolate the lowest set bit.
+            cells.append(divmod(low.bit_length() - 1, self.cols))
+            mask ^= low
+        return cells
+
+    def fill_cells(self, cells, mask, value):
+        '''
+        Writes value into every cell of the 2D list that is set in mask.
+        '''
+        while mask:
+            low = mask & -mask  # Isolate the lowest set bit.
+            i, j = divmod(low.bit_length() - 1, self.cols)  # Convert the bit index back into (i, j).
+            cells[i][j] = value
+            mask ^= low  # Clear the bit we just handled.
+
+    def bit(self, i, j):
+        '''
+        Returns the single-bit mask for cell (i, j).
+        '''
+        return 1 << (i * self.cols + j)
+
+    def placement_table(self, ship_size, orientation):
+        '''
+        Returns a list, indexed by bit index i * cols + j, of the mask a ship of the given size and orientation
+        covers when placed there (0 where it would leave the board). Tables are shared by boards of the same size.
+        '''
+        key = (self.rows, self.cols, ship_size, orientation)
+        table = BitBoard.placement_tables.get(key)
+        if table is None:
+            step = 1 if orientation == Orientation.HORIZONTAL else self.cols  # Bit distance between ship cells.
+            run = 0
+            for x in range(ship_size):
+                run |= 1 << (x * step)  # Mask of the ship placed at cell (0, 0).
+
+            table = []
+            for i in range(self.rows):
+                for j in range(self.cols):
+                    fits = j + ship_size <= self.cols if orientation == Orientation.HORIZONTAL else i + ship_size <= self.rows
+                    table.append(run << (i * self.cols + j) if fits else 0)
+            tables = BitBoard.placement_tables
+            while len(tables) >= BitBoard.PLACEMENT_TABLES:  # Keep the cache bounded across board sizes.
+                del tables[next(iter(tables))]
+            tables[key] = table  # Cache so later checks are a single list lookup.
+        return table
+
+    def ship_mask_at(self, i, j, ship_size, orientation = Orientation.HORIZONTAL):
+        '''
+        Returns the mask of the cells a ship would cover at (i, j), or 0 if it does not fit inside the board.
+        '''
+        if i < 0 or i >= self.rows or j < 0 or j >= self.cols:
+            return 0
+        return self.placement_table(ship_size, orientation)[i * self.cols + j]
+
+    def is_placeable_on(self, i, j, ship_size, orientation = Orientation.HORIZONTAL):
+        '''
+        Determines if a ship of the given size can be placed at the specified location (i, j).
+        Returns:
+            True if the ship fits on the board without touching any used cell, otherwise False.
+        '''
+        if i < 0 or i >= self.rows or j < 0 or j >= self.cols:  # The starting cell must be on the board.
+            return False
+        mask = self.placement_table(ship_size, orientation)[i * self.cols + j]
+        return mask != 0 and not mask & (self.ships | self.shots)
+
+    def is_ship(self, i, j):
+        '''
+        Checks if the cell at position (i, j) contains a ship that has not been hit.
+        '''
+        return bool(self.bit(i, j) & self.remaining)
+
+    def copy_cells(self):
+        '''
+        Returns a copy of the masks and ship ids that load_cells can put back (the masks are ints, so they are shared).
+        '''
+        return dict(self.ship_masks), list(self.cell_ships), self.ships, self.remaining, self.shots, self.sunk
+
+    def load_cells(self, cells):
+        '''
+        Replaces every mask and ship id with a copy of cells from copy_cells.
+        '''
+        ship_masks, cell_ships, self.ships, self.remaining, self.shots, self.sunk = cells
+        self.ship_masks = dict(ship_masks)
+        self.cell_ships = list(cell_ships)
+        self.cell_view = None
+        self.invalidate_placement_masks()
+
+class DirtyCells:
+    __slots__ = ("board", "drawn", "extra")
+
+    def __init__(self, board):
+        '''
+        The set of cells the renderer must redraw, worked out from the masks that changed since the last clear(),
+        so placing ships and attacking never record anything. Supports the set operations the renderer uses.
+        '''
+        self.board = board
+        self.drawn = (0, 0, 0)  # (ships, shots, sunk) masks when the renderer last caught up.
+        self.extra = 0  # Mask of cells added by hand with add().
+
+    def mask(self):
+        '''
+        Mask of the cells changed since the last clear().
+        '''
+        board = self.board
+        ships, shots, sunk = self.drawn
+        return (board.ships ^ ships) | (board.shots ^ shots) | (board.sunk ^ sunk) | self.extra
+
+    def add(self, cell):
+        self.extra |= self.board.bit(*cell)
+
+    def clear(self):
+        board = self.board
+        self.drawn = (board.ships, board.shots, board.sunk)
+        self.extra = 0
+
+    def __bool__(self):
+        return bool(self.mask())
+
+    def __len__(self):
+        return self.mask().bit_count()
+
+    def __iter__(self):
+        return iter(self.board.mask_cells(self.mask()))
+
+class ShipCellsLeft(Mapping):
+    __slots__ = ("player",)
+
+    def __init__(self, player):
+        '''
+        ship id is the key, num of cells left of ship is the value, like Player.ship_count, counted from the masks
+        on every lookup (a ship that is not placed yet has all of its cells left).
+        '''
+        self.player = player
+
+    def __getitem__(self, ship):
+        board = self.player.board
+        mask = board.ship_masks.get(ship)
+        if mask is None:
+            return self.player.ship_sizes[ship]  # Not placed yet (KeyError for an unknown id).
+        return (mask & board.remaining).bit_count()
+
+    def __iter__(self):
+        return iter(self.player.fleet)
+
+    def __len__(self):
+        return len(self.player.fleet)
+
+class ShipHits(Mapping):
+    __slots__ = ("player",)
+
+    def __init__(self, player):
+        '''
+        ship id is the key, list of its hit (or sunk) cells is the value, like Player.ship_hits, read from the masks
+        on every lookup.
+        '''
+        self.player = player
+
+    def __getitem__(self, ship):
+        if ship not in self.player.ship_sizes:
+            raise KeyError(ship)
+        board = self.player.board
+        return board.mask_cells(board.ship_masks.get(ship, 0) & board.shots)
+
+    def __iter__(self):
+        return iter(self.player.fleet)
+
+    def __len__(self):
+        return len(self.player.fleet)
+
+class ShipCells(Mapping):
+    __slots__ = ("board",)
+
+    def __init__(self, board):
+        '''
+        ship id is the key, frozenset of the (i, j) cells the placed ship covers is the value, like Player.ship_cells,
+        read from the ship masks.
+        '''
+        self.board = board
+
+    def __getitem__(self, ship):
+        return frozenset(self.board.mask_cells(self.board.ship_masks[ship]))
+
+    def __iter__(self):
+        return iter(self.board.ship_masks)
+
+    def __len__(self):
+        return len(self.board.ship_masks)
+
+class BitPlayer(Player):
+    board_class = BitBoard  # Every BitPlayer keeps its ships on a BitBoard.
+
+    def __init__(self, num):
+        '''
+        Initializes a new BitPlayer, like Player. Hits, misses and sunk ships are only kept in the board masks;
+        ship_count, ship_hits and num_ship_cells are worked out from them when asked for.
+        '''
+        self.num = num  # The player number.
+        self.ships = []  # Ids of the ships still to place.
+        self.fleet = ()  # Ids of every ship of the player.
+        self.ship_sizes = {}  # ship id is the key, size of the ship is the value
+        self.ship_count = ShipCellsLeft(self)  # Read-only view, see ShipCellsLeft.
+        self.ship_hits = ShipHits(self)  # Read-only view, see ShipHits.
+        self.board = self.board_class()  # The player's board.
+        self.ship_cells = ShipCells(self.board)  # Read-only view, see ShipCells.
+        self.ships_placed = False  # Indicates if all ships have been placed.
+
+    def get_ships(self, fleet):
+        '''
+        Generates ships for the player like Player.get_ships: sizes 1..fleet, or the given ship sizes, with ids from 1 up.
+        '''
+        sizes = range(1, fleet + 1) if isinstance(fleet, int) else sorted(fleet)  # Ship sizes from smallest to largest.
+        self.ships = [i for i in range(1, len(sizes) + 1)]
+        self.fleet = tuple(self.ships)
+        self.ship_sizes = dict(zip(self.ships, sizes))
+
+    @property
+    def num_ship_cells(self):
+        '''
+        Number of ship cells that have not been hit, counting the ships that are not placed yet.
+        '''
+        board = self.board
+        sizes = self.ship_sizes
+        return board.remaining.bit_count() + sum(sizes[ship] for ship in self.fleet if ship not in board.ship_masks)
+
+    def place_ship(self, i, j, ship, orientation = Orientation.HORIZONTAL):
+        '''
+        Places the ship with the given id on the player's board.
+        - Returns True if the ship is successfully placed, False otherwise.
+        '''
+        board = self.board
+        ship_size = self.ship_sizes[ship]
+        mask = board.ship_mask_at(i, j, ship_size, orientation)
+        if mask == 0 or mask & (board.ships | board.shots):  # Out of bounds or overlapping another ship.
+            return False
+        board.ship_masks[ship] = mask  # Record which cells the ship covers.
+        board.ships |= mask
+        board.remaining |= mask
+        step = 1 if orientation == Orientation.HORIZONTAL else board.cols
+        for x in range(ship_size):
+            board.cell_ships[i * board.cols + j + x * step] = ship  # Remember the ship id for O(1) lookups on hit.
+        board.invalidate_placement_masks()  # Cached placement masks no longer match the board.
+        return True
+
+    def ship_at(self, i, j):
+        '''
+        Returns the id of the ship placed on cell (i, j), hit or not, or 0 if there is none.
+        '''
+        return max(self.board.cell_ships[i * self.board.cols + j], 0)
+
+    def change_cells_to_sunk(self, sunk_ship):
+        '''
+        Changes the ship cells that now should be sunk to a SUNK_CELL
+        - sunk_ship: the id of the ship that was sunk
+        '''
+        self.board.sunk |= self.board.ship_masks[sunk_ship]  # The whole ship becomes sunk.
+
+    def place_attack(self, i, j):
+        '''
+        Places an attack on the player's board.
+        - Returns True if the attack hits a ship, False otherwise. Also returns the id of the ship if hit
+        '''
+        board = self.board
+        index = i * board.cols + j
+        bit = board.cell_bits[index]
+        shots = board.shots
+        # if this cell has already been interacted with we need to inform the game not to change turns
+        if bit & shots:
+            return False, MISS_CELL
+        board.shots = shots | bit  # Mark the cell as attacked (a miss unless a ship is there).
+
+        remaining = board.remaining
+        if bit & remaining:  # Check if there is a ship at (i, j).
+            remaining ^= bit  # The hit is the shot bit on a ship cell; nothing else is counted.
+            board.remaining = remaining
+            ship = board.cell_ships[index]
+            mask = board.ship_masks[ship]
+            if not mask & remaining:  # Every cell of the ship is hit.
+                board.sunk |= mask
+            return True, ship
+
+        return False, EMPTY_CELL
+
+    def is_loss(self):
+        """
+        Determines if the player has lost the game.
+        - Returns True if every ship cell has been hit or sunk, False otherwise.
+        """
+        board = self.board
+        return not board.remaining and len(board.ship_masks) == len(self.fleet)  # Unplaced ships still count as cells left.
+
+    def copy_state(self):
+        '''
+        Returns a copy of the player's state for load_state, like Player.copy_state; the masks hold all of it.
+        '''
+        return self.board.copy_cells(), list(self.ships), self.ships_placed
+
+    def load_state(self, state):
+        '''
+        Puts a copy of a state from copy_state into the player, whose board must be new and of the same size.
+        '''
+        cells, ships, self.ships_placed = state
+        self.board.load_cells(cells)
+        self.ships = list(ships)
@@ -6,6 +6,9 @@
 # Authors: Xavier and Andrew
 # Creation Date: 9th of September, 2024
 from enum import Enum
+from .constants import EMPTY_CELL
+# NumPy (used to compute whole-board placement masks in one pass) is imported by the methods that need it,
+# so importing the Board alone stays quick for short-lived worker processes.
 
 class Orientation(Enum):
     '''Orientation enumeration for ship orientation'''
@@ -23,7 +26,9 @@ class Board:
         '''
         self.rows = rows  # Number of rows on the board.
         self.cols = cols  # Number of columns on the board.
-        self.cells = [[-1] * rows for _ in range(cols)]  # Initialize a 2D list of cells, all set to -1 (EMPTY_CELL).
+        self.cells = [[-1] * cols for _ in range(rows)]  # Initialize a 2D list of cells (one list per row), all set to -1 (EMPTY_CELL).
+        self.placement_masks = {}  # (ship size, orientation) is the key, cached legality grid is the value
+        self.dirty_cells = set()  # (i, j) cells changed since the renderer last drew them
 
     def is_valid_cell(self, i, j):
         '''
@@ -62,6 +67,71 @@ class Board:
 
         return True  # Return True if the ship can be placed successfully.
 
+    def placement_mask(self, ship_size, orientation = Orientation.HORIZONTAL):
+        '''
+        Returns a boolean NumPy grid where entry [i][j] is True if a ship of the given size and orientation
+        can be placed starting at (i, j), matching is_placeable_on for every cell at once.
+        The grid is cached until invalidate_placement_masks is called (Player.place_ship does this).
+        Args:
+            ship_size: The size of the ship to be placed.
+            orientation: The orientation of the ship (anything but VERTICAL is treated as horizontal).
+        Returns:
+            A (rows, cols) boolean array. Callers must not modify it.
+        '''
+        key = (ship_size, orientation)
+        mask = self.placement_masks.get(key)
+        if mask is None:
+            import numpy as np  # Imported on first use so loading a board does not pull in NumPy.
+            from numpy.lib.stride_tricks import sliding_window_view
+            free = self.free_grid()  # True for every empty cell.
+            mask = np.zeros((self.rows, self.cols), dtype=bool)
+            axis = 0 if orientation == Orientation.VERTICAL else 1  # Ships extend down rows or along columns.
+            if 0 < ship_size <= free.shape[axis]:
+                # A ship fits where all ship_size cells in its window are empty.
+                fits = sliding_window_view(free, ship_size, axis=axis).all(axis=-1)
+                mask[:fits.shape[0], :fits.shape[1]] = fits
+            mask.flags.writeable = False  # The grid is shared by every caller.
+            self.placement_masks[key] = mask
+        return mask
+
+    def free_grid(self):
+        '''
+        Returns a (rows, cols) boolean NumPy grid that is True for every empty cell.
+        '''
+        import numpy as np
+        return np.array(self.cells)[:self.rows, :self.cols] == EMPTY_CELL
+
+    def nonempty_cells(self, first_row, last_row, first_col, last_col):
+        '''
+        Yields (i, j, value) for every cell that is not empty in rows first_row..last_row - 1 and
+        columns first_col..last_col - 1, so callers only visit the cells that have something on them.
+        '''
+        cells = self.cells
+        for i in range(first_row, last_row):
+            row = cells[i]
+            for j in range(first_col, last_col):
+                if row[j] != EMPTY_CELL:
+                    yield i, j, row[j]
+
+    def invalidate_placement_masks(self):
+        '''
+        Drops the cached placement masks after the ships on the board changed.
+        '''
+        self.placement_masks.clear()
+
+    def copy_cells(self):
+        '''
+        Returns a copy of the cell values that load_cells can put back (the rows, as lists).
+        '''
+        return [list(row) for row in self.cells]
+
+    def load_cells(self, cells):
+        '''
+        Replaces every cell with a copy of cells from copy_cells.
+        '''
+        self.cells = [list(row) for row in cells]
+        self.invalidate_placement_masks()
+
     def is_ship(self, i, j):
         '''
         Checks if the cell at position (i, j) contains a ship.
@@ -0,0 +1,169 @@
+# Filename: book.py
+# Description: This module defines the OpeningBook class, a precomputed table of opening moves for the computer opponent. For every fleet the menu can start (ships of sizes 1..N) and the classic fleet, an offline build estimates how often each cell holds a ship over uniformly random fleet layouts, and the best first shots while every shot so far has missed. The results are stored in one compact binary file that the AI opens with mmap, so its opening moves are table lookups instead of a heatmap built at the start of the game.
+# Inputs: Board dimensions and fleets to build (python -m battleship.book), or the book file at battleship/resources/opening_book.bsob
+# Output: The book file, and the cell occupancy and opening shots of a fleet read straight from the mapped file
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import argparse  # Command line of the offline builder.
+import mmap  # The book is read from the mapped file, never loaded as a whole.
+import os  # Locating the book next to the package.
+import struct  # Packing the header and the directory.
+import numpy as np  # Occupancy grids and opening lines.
+from .batch import BatchSimulator  # Draws the random fleet layouts the book is estimated from.
+from .constants import *  # Importing CLASSIC_FLEET.
+
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources")  # Works from any working directory.
+
+class OpeningBook:
+    MAGIC = b"BSOB"  # Marks an opening book file.
+    VERSION = 1  # Bump when the format changes.
+    PATH = os.path.join(RESOURCES_DIR, "opening_book.bsob")  # The book shipped with the game.
+    # Header: magic, version, number of entries.
+    HEADER = struct.Struct("<4sBH")
+    # Directory entry: rows, columns, number of ships, number of opening shots, offset of the entry's data.
+    # Every entry is followed by one size byte per ship, smallest first (the order of Player ship ids).
+    # The data is rows * cols little-endian float32 occupancies (row-major), then the opening shots as uint16 cell indices.
+    ENTRY = struct.Struct("<HHBBI")
+    SAMPLES = 500000  # Random fleet layouts drawn per fleet by the builder.
+    SHOTS = 8  # Opening shots stored per fleet.
+
+    books = {}  # path of the book file is the key, opened OpeningBook (None if the file is missing or not a book) is the value
+
+    def __init__(self, path):
+        '''
+        Maps the book file and reads its directory; the occupancy grids and opening lines stay in the mapped file.
+        Raises:
+            ValueError: If the file is not an opening book of this version.
+        '''
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)  # The mapping stays valid after the file is closed.
+        magic, version, count = self.HEADER.unpack_from(self.data, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(f"{path} is not a version {self.VERSION} opening book")
+        self.entries = {}  # (rows, cols, ship sizes) is the key, (number of opening shots, offset of the data) is the value
+        offset = self.HEADER.size
+        for _ in range(count):
+            rows, cols, num_ships, num_shots, data_offset = self.ENTRY.unpack_from(self.data, offset)
+            offset += self.ENTRY.size
+            ship_sizes = tuple(self.data[offset:offset + num_ships])
+            offset += num_ships
+            self.entries[(rows, cols, ship_sizes)] = (num_shots, data_offset)
+
+    @classmethod
+    def open(cls, path=None):
+        '''
+        Returns the OpeningBook of the file at path (the shipped book by default), mapped once and shared,
+        or None if there is no valid book there.
+        '''
+        path = path or cls.PATH
+        if path not in cls.books:
+            try:
+                cls.books[path] = cls(path)
+            except (OSError, ValueError, struct.error):
+                cls.books[path] = None  # The AI builds its heatmap instead.
+        return cls.books[path]
+
+    @staticmethod
+    def key(rows, cols, fleet):
+        '''
+        Returns the directory key of a fleet, given as a number of ships (sizes 1..fleet) or a list of sizes like Player.get_ships.
+        '''
+        return rows, cols, tuple(range(1, fleet + 1) if isinstance(fleet, int) else sorted(fleet))
+
+    def occupancy(self, rows, cols, fleet):
+        '''
+        Returns the (rows, cols) grid of the chance that each cell holds a ship before any shot, or None if the fleet is not in the book.
+        The grid is a read-only view of the mapped file.
+        '''
+        entry = self.entries.get(self.key(rows, cols, fleet))
+        if entry is None:
+            return None
+        return np.frombuffer(self.data, dtype="<f4", count=rows * cols, offset=entry[1]).reshape(rows, cols)
+
+    def opening(self, rows, cols, fleet):
+        '''
+        Returns the opening shots of a fleet as cell indices (i * cols + j), or None if the fleet is not in the book.
+        Shot k is the best cell to attack when the k shots before it all missed.
+        '''
+        entry = self.entries.get(self.key(rows, cols, fleet))
+        if entry is None:
+            return None
+        num_shots, offset = entry
+        return np.frombuffer(self.data, dtype="<u2", count=num_shots, offset=offset + 4 * rows * cols)
+
+    @staticmethod
+    def compute(rows, cols, fleet, samples, shots, rng=None):
+        '''
+        Estimates one book entry from random fleet layouts (uniform over every legal layout, like FleetSampler).
+        - Occupancy: the fraction of layouts with a ship on each cell.
+        - Opening: the cell with the most layouts not ruled out yet; then, keeping only the layouts that this shot
+          would have missed, the next best cell, and so on.
+        Returns:
+            (occupancy as a (rows * cols,) float32 array, opening shots as a uint16 array).
+        '''
+        simulator = BatchSimulator(samples, rows, cols, fleet)
+        simulator.place_random(rng or np.random.default_rng())
+        occupied = (simulator.ship_ids > 0).reshape(samples, -1)
+        occupancy = occupied.mean(axis=0, dtype=np.float64).astype(np.float32)
+
+        opening = []
+        left = occupied  # Layouts every opening shot so far would have missed.
+        for _ in range(min(shots, rows * cols)):
+            counts = left.sum(axis=0)
+            counts[opening] = -1  # Never the same cell twice.
+            cell = int(counts.argmax())
+            opening.append(cell)
+            left = left[~left[:, cell]]
+            if not len(left):
+                break  # Every layout is hit by now.
+        return occupancy, np.array(opening, dtype=np.uint16)
+
+    @classmethod
+    def write(cls, path, entries):
+        '''
+        Writes a book file.
+        Args:
+            entries: List of (rows, cols, ship sizes, occupancy, opening) for every fleet.
+        '''
+        directory = bytearray(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(entries)))
+        offset = cls.HEADER.size + sum(cls.ENTRY.size + len(entry[2]) for entry in entries)
+        offset += -offset % 4  # Keep every grid 4-byte aligned.
+        data = bytearray()
+        for rows, cols, ship_sizes, occupancy, opening in entries:
+            directory += cls.ENTRY.pack(rows, cols, len(ship_sizes), len(opening), offset + len(data))
+            directory += bytes(sorted(ship_sizes))
+            data += occupancy.astype("<f4").tobytes() + opening.astype("<u2").tobytes()
+            data += bytes(-len(data) % 4)
+        directory += bytes(-len(directory) % 4)
+        with open(path, "wb") as file:
+            file.write(directory + data)
+        cls.books.pop(path, None)  # Map the new file on the next open.
+
+def main():
+    '''
+    Parses the command line and builds the opening book for the fleets of sizes 1..1 up to 1..N and the classic fleet.
+    '''
+    parser = argparse.ArgumentParser(description="Build the opening book of the Battleship computer opponent.")
+    parser.add_argument("--rows", type=int, default=10, help="board rows")
+    parser.add_argument("--cols", type=int, default=10, help="board columns")
+    parser.add_argument("--max-ships", type=int, default=5, help="build fleets of sizes 1..N for every N up to this (the menu choices)")
+    parser.add_argument("--samples", type=int, default=OpeningBook.SAMPLES, help="random fleet layouts per fleet")
+    parser.add_argument("--shots", type=int, default=OpeningBook.SHOTS, help="opening shots stored per fleet")
+    parser.add_argument("--seed", type=int, default=0, help="seed for a reproducible book")
+    parser.add_argument("-o", "--output", default=OpeningBook.PATH, help="book file to write")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    fleets = [list(range(1, n + 1)) for n in range(1, args.max_ships + 1)] + [sorted(CLASSIC_FLEET)]
+    entries = []
+    for ship_sizes in fleets:
+        occupancy, opening = OpeningBook.compute(args.rows, args.cols, ship_sizes, args.samples, args.shots, rng)
+        entries.append((args.rows, args.cols, ship_sizes, occupancy, opening))
+        print(f"fleet {ship_sizes}: opening {[divmod(int(cell), args.cols) for cell in opening]}", flush=True)
+    OpeningBook.write(args.output, entries)
+    print(f"wrote {len(entries)} fleets to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+# Filename: client.py
+# Description: This module defines NetworkGame, the client mode of the pyray front end. The local player places ships and attacks with the usual mouse and keyboard controls, while the match server runs the rules and tells both players what happened.
+# Inputs: Mouse and keyboard input, and messages from the match server
+# Output: The game window for one player of a networked match
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import socket  # Non-blocking TCP connection to the match server, polled once per frame.
+from .game import Game  # The client reuses the whole front end, only the game commands change.
+from .renderer import Renderer  # Drawing the board while waiting for the opponent.
+from .board import Orientation
+from .constants import *  # Importing cell values like MISS_CELL.
+from .replay import RESULT_MISS, RESULT_SUNK  # Attack results in SHOT messages.
+from . import protocol
+
+class NetworkGame(Game):
+    '''
+    Front end for one player of a match hosted by the match server.
+    - Commands are checked locally for instant feedback, then sent to the server.
+    - The boards only change when the server confirms a placement or reports a shot.
+    '''
+    WAIT_FOR_EVENTS = False  # Server messages arrive without any input, so the socket is polled on every tick.
+
+    def __init__(self, host=protocol.DEFAULT_HOST, port=protocol.DEFAULT_PORT):
+        '''
+        Connects to the match server and starts in the menu.
+        '''
+        super().__init__()
+        self.socket = socket.create_connection((host, port))
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Moves are tiny, send them right away.
+        self.socket.setblocking(False)
+        self.incoming = bytearray()  # Received bytes not yet handled.
+        self.outgoing = bytearray()  # Messages not yet accepted by the socket.
+        self.num = 0  # Our player number, known once the server starts the match.
+        self.joined = False  # Whether we asked the server for a match.
+        self.waiting_for_server = False  # A placement or attack was sent and not answered yet.
+        self.pending_placements = 0  # PLACE messages sent and not answered yet (auto-placement sends a batch).
+        self.enemy_sunk = []  # Ids of the opponent's ships we sank, from the SHOT messages.
+        self.connected = True  # Whether the connection to the server is still open.
+
+    def current_player(self):
+        '''
+        Returns the local player (the player this window controls).
+        '''
+        return self.player_lookup_table[self.num or 1]
+
+    def current_enemy(self):
+        '''
+        Returns the remote player. Its board only holds what the server revealed.
+        '''
+        return self.enemy_lookup_table[self.num or 1]
+
+    def send(self, kind, arg=0, i=0, j=0):
+        '''
+        Queues a message; poll() writes it.
+        '''
+        self.outgoing += protocol.pack(kind, arg, i, j)
+
+    def select_ship_count(self, num):
+        '''
+        Menu command: asks the server for a match with num ships.
+        '''
+        if not self.menu_phase or self.joined or num < self.MIN_SHIPS or num > self.MAX_SHIPS:
+            return False
+        self.joined = True
+        self.send(protocol.JOIN, num)
+        self.menu_title = self.title  # Shown again if the server rejects the JOIN.
+        self.title = "Waiting for an opponent..."
+        self.secondary_message = ""
+        return True
+
+    def select_fleet(self, ship_sizes=None):
+        '''
+        The match server pairs players by ship count, so only fleets of sizes 1..N can be played.
+        '''
+        if self.menu_phase and not self.joined:
+            self.last_move_message = "Network games use ships of sizes 1..N"
+        return False
+
+    def toggle_single_player(self):
+        '''
+        The opponent is always the other client in a network game.
+        '''
+        return False
+
+    def update_opponent_message(self):
+        '''
+        Shows that the opponent comes from the server.
+        '''
+        self.secondary_message = "Opponent: NETWORK"
+
+    def place_ship(self, i, j):
+        '''
+        Placement command: sends the next ship's placement if it fits on the local board.
+        '''
+        player = self.current_player()
+        if not self.place_ship_phase or self.waiting_for_server or not player.ships:
+            return False
+        if not player.board.is_placeable_on(i, j, player.ship_sizes[player.ships[-1]], self.ship_orientation):
+            self.last_move_message = "Not a correct placement!"
+            return False
+        arg = player.ships[-1] | (protocol.VERTICAL_FLAG if self.ship_orientation == Orientation.VERTICAL else 0)
+        self.send(protocol.PLACE, arg, i, j)
+        self.pending_placements += 1
+        self.waiting_for_server = True
+        self.last_move_message = ""
+        return True
+
+    def auto_place_ships(self, rng=None):
+        '''
+        Placement command: sends a uniformly random layout for every remaining ship at once.
+        '''
+        player = self.current_player()
+        if not self.place_ship_phase or self.waiting_for_server or not player.ships:
+            return False
+        from .fleet import FleetSampler  # Imported here so games placed by hand never load the sampler (and NumPy).
+        ships = list(player.ships)
+        layout = FleetSampler.for_board(player.board).sample([player.ship_sizes[ship] for ship in ships], FleetSampler.occupied_mask(player.board), rng)
+        if layout is None:
+            self.last_move_message = "No room left for the remaining ships!"
+            return False
+        for ship, (i, j, orientation) in reversed(list(zip(ships, layout))):
+            arg = ship | (protocol.VERTICAL_FLAG if orientation == Orientation.VERTICAL else 0)
+            self.send(protocol.PLACE, arg, i, j)
+        self.pending_placements += len(layout)
+        self.waiting_for_server = True  # Cleared once every placement is answered.
+        self.last_move_message = ""
+        return True
+
+    def attack(self, i, j):
+        '''
+        Attack command: sends an attack on the remote board if it is our turn.
+        '''
+        if not self.attack_phase or self.waiting_for_server:
+            return False
+        if self.show_own_board:
+            self.last_move_message = "Can't attack! Currently viewing own board!"
+            return False
+        if self.turn != self.num:
+            self.last_move_message = "Wait for your turn!"
+            return False
+        enemy = self.current_enemy()
+        if not enemy.board.is_valid_cell(i, j):
+            return False
+        if enemy.board.cells[i][j] != EMPTY_CELL:
+            self.last_move_message = f"{self.player_names[self.num]} already shot as this cell!"
+            return False
+        self.send(protocol.ATTACK, 0, i, j)
+        self.waiting_for_server = True
+        return True
+
+    def show_place_ship_phase(self):
+        '''
+        Draws the ship placement phase; once our fleet is placed, only shows it while the opponent finishes.
+        '''
+        if self.current_player().ships:
+            super().show_place_ship_phase()
+        else:
+            Renderer.draw_board(self.current_player().board, False)
+
+    def poll(self):
+        '''
+        Writes queued messages and handles every message the server sent since the last frame.
+        '''
+        if not self.connected:
+            return
+        try:
+            if self.outgoing:
+                sent = self.socket.send(self.outgoing)
+                del self.outgoing[:sent]
+            while True:
+                data = self.socket.recv(4096)
+                if not data:
+                    self.disconnected()
+                    return
+                self.incoming += data
+        except BlockingIOError:
+            pass  # Nothing more to read (or the send buffer is full) this frame.
+        except OSError:
+            self.disconnected()
+            return
+        for kind, arg, i, j in protocol.split(self.incoming):
+            self.handle(kind, arg, i, j)
+
+    def disconnected(self):
+        '''
+        Stops the game when the connection to the server is lost.
+        '''
+        self.connected = False
+        self.socket.close()
+        self.end_game("Connection to the server lost")
+
+    def end_game(self, message):
+        '''
+        Switches to the game end phase without a winner.
+        '''
+        self.menu_phase = self.place_ship_phase = self.attack_phase = False
+        self.game_end_phase = True
+        self.title = ""
+        self.message = ""
+        self.secondary_message = ""
+        self.last_move_message = message
+
+    def handle(self, kind, arg, i, j):
+        '''
+        Applies one message from the server.
+        '''
+        if kind == protocol.START:
+            self.num = arg
+            self.turn = arg  # During placement the turn only selects which board and panel are drawn.
+            self.player_names = {arg: "You", 3 - arg: "Opponent"}
+            self.player1.get_ships(i)
+            self.player2.get_ships(i)
+            self.menu_phase = False
+            self.place_ship_phase = True
+            self.title = ""
+            self.message = f"You are Player {arg}: Place Your Ships"
+            self.secondary_message = "Press R to Auto-Place Ships"
+        elif kind == protocol.PLACED:
+            player = self.current_player()
+            ship = arg & ~protocol.VERTICAL_FLAG
+            orientation = Orientation.VERTICAL if arg & protocol.VERTICAL_FLAG else Orientation.HORIZONTAL
+            player.place_ship(i, j, ship, orientation)
+            player.ships.remove(ship)
+            player.ships_placed = not player.ships
+            self.placement_answered()
+            if player.ships_placed:
+                self.message = "Waiting for the opponent to place ships..."
+        elif kind == protocol.REJECTED:
+            if arg == protocol.PLACE:
+                self.placement_answered()
+            elif arg == protocol.JOIN:
+                self.joined = False  # Back in the menu, so another ship count can be chosen.
+                self.title = self.menu_title
+            else:
+                self.waiting_for_server = False
+            self.last_move_message = "The server rejected that move!"
+        elif kind == protocol.ATTACK_START:
+            self.place_ship_phase = False
+            self.attack_phase = True
+            self.turn = arg
+            self.message = self.turn_message()
+            self.secondary_message = "Viewing ENEMY'S Board [B to Switch]"
+        elif kind == protocol.SHOT:
+            self.shot(arg & 3, arg >> 2 & 3, arg >> 4, i, j)
+        elif kind == protocol.SUNK_CELL:
+            if arg != self.num:  # Our own board already marked the sunk ship in place_attack.
+                self.hints_stale = True
+                board = self.current_enemy().board
+                board.cells[i][j] = SUNK_CELL
+                board.dirty_cells.add((i, j))
+        elif kind == protocol.GAME_OVER:
+            self.attack_phase = False
+            self.game_end_phase = True
+            self.turn = arg
+            self.message = ""
+            self.last_move_message = ""
+            self.secondary_message = ""
+            self.win_message = f"{self.player_names[arg]} {'Have' if arg == self.num else 'Has'} Won!"
+        elif kind == protocol.OPPONENT_LEFT:
+            self.end_game("The opponent left the game")
+
+    def placement_answered(self):
+        '''
+        Counts one PLACED or rejected PLACE reply; more placements may be sent once every sent one is answered.
+        '''
+        self.pending_placements = max(self.pending_placements - 1, 0)
+        self.waiting_for_server = self.pending_placements > 0
+
+    def shot(self, attacker, result, sunk_ship, i, j):
+        '''
+        Applies a SHOT message to the board that was attacked.
+        '''
+        self.hints_stale = True  # The board the hints were solved for changed.
+        if attacker == self.num:
+            self.waiting_for_server = False
+            board = self.current_enemy().board  # Only hits and misses are known on the remote board.
+            board.cells[i][j] = MISS_CELL if result == RESULT_MISS else HIT_CELL
+            board.dirty_cells.add((i, j))
+            if result == RESULT_SUNK:
+                self.enemy_sunk.append(sunk_ship)  # Lets the hint solver know which ships are left.
+        else:
+            self.current_player().place_attack(i, j)  # Our own board follows the same rules as the server.
+
+        name = self.player_names[attacker]
+        if result == RESULT_SUNK:
+            self.last_move_message = f"{name} sunk a ship!"
+        elif result == RESULT_MISS:
+            self.last_move_message = f"{name} missed!"
+        else:
+            self.last_move_message = f"{name} hit a ship!"
+        self.turn = 3 - attacker
+        self.message = self.turn_message()
+
+    def hint_ship_sizes(self, enemy):
+        '''
+        Returns the sizes of the opponent's ships that are not sunk yet. The remote board only holds what the server
+        revealed, so its ship_count is never updated; the sunk ships come from the SHOT messages instead.
+        '''
+        return [enemy.ship_sizes[ship] for ship in enemy.ship_count if ship not in self.enemy_sunk]
+
+    def turn_message(self):
+        '''
+        Returns the message telling whose turn it is to attack.
+        '''
+        return "Your Turn to Attack" if self.turn == self.num else "Opponent's Turn to Attack"
+
+    def game_loop(self):
+        '''
+        Handles the network, then runs the usual front end for the current phase.
+        '''
+        self.poll()
+        super().game_loop()
@@ -0,0 +1,281 @@
+# Filename: compact.py
+# Description: This module defines the CompactBoard and CompactPlayer classes, a memory-compact Board/Player backend for holding many live or archived games. Both use __slots__, the board cells and the ship id on each cell live in two flat byte arrays, and the fleet bookkeeping lives in one small bytearray instead of dicts of lists.
+# Inputs: None
+# Output: A drop-in Board/Player backend (use Engine(player_class=CompactPlayer) or MatchServer(CompactPlayer)) that still exposes cells, ship_count and ship_hits for the renderer and the AI.
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+from array import array  # One signed byte per board cell.
+from .board import Board  # Importing the Board class this backend mirrors.
+from .board import Orientation
+from .constants import *  # Importing all constants like HIT_CELL and MISS_CELL used for game logic.
+
+class CompactBoard:
+    # No per-instance __dict__; the dirty cell set and the placement mask cache are only created once used.
+    __slots__ = ("rows", "cols", "data", "owners", "dirty_set", "mask_cache", "row_views")
+
+    def __init__(self, rows=10, cols=10):
+        '''
+        Initializes a CompactBoard with every cell empty. Cell (i, j) is data[i * cols + j].
+        Args:
+            rows: Number of rows in the board.
+            cols: Number of columns in the board.
+        '''
+        self.rows = rows  # Number of rows on the board.
+        self.cols = cols  # Number of columns on the board.
+        self.data = array("b", bytes([EMPTY_CELL & 0xFF]) * (rows * cols))  # Same cell values as Board.cells, flattened.
+        self.owners = bytearray(rows * cols)  # Id of the ship placed on each cell, 0 if none; kept once the cell is hit.
+        self.dirty_set = None  # Created when the renderer first asks for dirty_cells.
+        self.mask_cache = None  # Created when the first placement mask is computed.
+        self.row_views = None  # Created when something first reads cells.
+
+    # These Board methods only use rows, cols, cells and placement_masks, so they work unchanged.
+    is_valid_cell = Board.is_valid_cell
+    placement_mask = Board.placement_mask
+    free_grid = Board.free_grid
+    nonempty_cells = Board.nonempty_cells
+
+    @property
+    def cells(self):
+        '''
+        Row views of the board with the same cell values as Board.cells, used by the renderer and the AI.
+        Each row is a memoryview into data, so cells[i][j] reads (and writes) the live cell without copying,
+        and the list of rows is only built once per board.
+        '''
+        if self.row_views is None:
+            view = memoryview(self.data)  # data is never resized, so the views stay valid.
+            cols = self.cols
+            self.row_views = [view[i * cols:(i + 1) * cols] for i in range(self.rows)]
+        return self.row_views
+
+    @property
+    def dirty_cells(self):
+        '''
+        (i, j) cells changed since the renderer last drew them. Boards that are never drawn never track them.
+        '''
+        if self.dirty_set is None:
+            self.dirty_set = set()
+        return self.dirty_set
+
+    @property
+    def placement_masks(self):
+        '''
+        (ship size, orientation) is the key, cached legality grid is the value.
+        '''
+        if self.mask_cache is None:
+            self.mask_cache = {}
+        return self.mask_cache
+
+    def invalidate_placement_masks(self):
+        '''
+        Drops the cached placement masks after the ships on the board changed.
+        '''
+        self.mask_cache = None
+
+    def mark_dirty(self, index):
+        '''
+        Tells the renderer that cell index changed, if the board is being drawn.
+        '''
+        if self.dirty_set is not None:
+            self.dirty_set.add(divmod(index, self.cols))
+
+    def is_placeable_on(self, i, j, ship_size, orientation = Orientation.HORIZONTAL):
+        '''
+        Determines if a ship of the given size can be placed at the specified location (i, j).
+        Returns:
+            True if the ship fits on the board on empty cells only, otherwise False.
+        '''
+        if i < 0 or j < 0:
+            return False
+        if orientation == Orientation.VERTICAL:
+            if i + ship_size > self.rows or j >= self.cols:
+                return False
+            step = self.cols
+        else:
+            if j + ship_size > self.cols or i >= self.rows:
+                return False
+            step = 1
+        start = i * self.cols + j
+        cells = self.data[start:start + (ship_size - 1) * step + 1:step]  # The cells the ship would cover.
+        return cells.count(EMPTY_CELL) == ship_size
+
+    def is_ship(self, i, j):
+        '''
+        Checks if the cell at position (i, j) contains a ship.
+        '''
+        return self.data[i * self.cols + j] > 0
+
+    def copy_cells(self):
+        '''
+        Returns a copy of the cell and owner arrays that load_cells can put back.
+        '''
+        return bytes(self.data), bytes(self.owners)
+
+    def load_cells(self, cells):
+        '''
+        Replaces every cell and owner with a copy of cells from copy_cells.
+        '''
+        data, owners = cells
+        self.data = array("b", data)
+        self.owners = bytearray(owners)
+        self.row_views = None  # The row views point into the old array.
+        self.invalidate_placement_masks()
+
+class CompactPlayer:
+    __slots__ = ("num", "board", "ships", "fleet", "num_ship_cells", "ships_placed")
+    board_class = CompactBoard  # Board backend used for the player's board.
+    FLEET_RECORD = 2  # Bytes per ship id in fleet: cells left, ship size.
+    MAX_SHIPS = 127  # Ship ids are stored in signed bytes (the cells and ships arrays).
+
+    def __init__(self, num):
+        '''
+        Initializes a new CompactPlayer, like Player.
+        - fleet holds, for every ship id, the cells left and the ship size; the board's owners array says which
+          ship covers each cell, so ship_at() stays O(1) once the cell itself only shows HIT_CELL or SUNK_CELL.
+        '''
+        self.num = num  # The player number.
+        self.board = self.board_class()  # The player's board.
+        self.ships = array("b")  # Ids of the ships still to place (supports pop, remove and [-1] like a list).
+        self.fleet = bytearray()  # FLEET_RECORD bytes per ship id, index 0 unused.
+        self.num_ship_cells = 0  # Total number of ship cells that have not been hit.
+        self.ships_placed = False  # Indicates if all ships have been placed.
+
+    def get_ships(self, fleet):
+        '''
+        Generates ships for the player like Player.get_ships: sizes 1..fleet, or the given ship sizes, with ids from 1 up.
+        Raises:
+            ValueError: If there are more than MAX_SHIPS ships, or a ship is larger than MAX_SHIPS.
+        '''
+        sizes = range(1, fleet + 1) if isinstance(fleet, int) else sorted(fleet)  # Ship sizes from smallest to largest.
+        if len(sizes) > self.MAX_SHIPS or (sizes and sizes[-1] > self.MAX_SHIPS):
+            raise ValueError(f"a CompactPlayer holds at most {self.MAX_SHIPS} ships of at most {self.MAX_SHIPS} cells")
+        self.ships = array("b", range(1, len(sizes) + 1))
+        self.num_ship_cells = sum(sizes)
+        self.fleet = bytearray(self.FLEET_RECORD * (len(sizes) + 1))
+        for ship, ship_size in zip(self.ships, sizes):
+            self.fleet[ship * self.FLEET_RECORD] = ship_size  # Every cell of the ship is left.
+            self.fleet[ship * self.FLEET_RECORD + 1] = ship_size
+
+    @property
+    def ship_sizes(self):
+        '''
+        ship id is the key, size of the ship is the value (a new dict, like Player.ship_sizes).
+        '''
+        fleet = self.fleet
+        return {ship: fleet[ship * self.FLEET_RECORD + 1] for ship in range(1, len(fleet) // self.FLEET_RECORD)}
+
+    @property
+    def ship_count(self):
+        '''
+        ship id is the key, num of cells left of ship is the value (a new dict, like Player.ship_count).
+        '''
+        fleet = self.fleet
+        return {ship: fleet[ship * self.FLEET_RECORD] for ship in range(1, len(fleet) // self.FLEET_RECORD)}
+
+    @property
+    def ship_hits(self):
+        '''
+        ship id is the key, list of its hit (or sunk) cells is the value (a new dict, like Player.ship_hits).
+        '''
+        return {ship: self.hit_cells(ship) for ship in range(1, len(self.fleet) // self.FLEET_RECORD)}
+
+    def ship_at(self, i, j):
+        '''
+        Returns the id of the ship placed on cell (i, j), hit or not, or 0 if there is none.
+        '''
+        return self.board.owners[i * self.board.cols + j]
+
+    def ship_cells(self, ship):
+        '''
+        Returns the cell indices covered by the placed ship with the given id (empty if it was not placed).
+        The ship starts on the first cell owned by its id and runs along the row or down the column.
+        '''
+        owners = self.board.owners
+        start = owners.find(ship)
+        if start < 0:  # Not placed yet.
+            return range(0)
+        ship_size = self.fleet[ship * self.FLEET_RECORD + 1]
+        cols = self.board.cols
+        horizontal = ship_size == 1 or (start % cols + 1 < cols and owners[start + 1] == ship)
+        step = 1 if horizontal else cols
+        return range(start, start + ship_size * step, step)
+
+    def hit_cells(self, ship):
+        '''
+        Returns the (i, j) cells of a ship that have been hit, in the order of the ship.
+        '''
+        data = self.board.data
+        cols = self.board.cols
+        return [divmod(index, cols) for index in self.ship_cells(ship) if data[index] == HIT_CELL or data[index] == SUNK_CELL]
+
+    def place_ship(self, i, j, ship, orientation = Orientation.HORIZONTAL):
+        '''
+        Places the ship with the given id on the player's board.
+        - Returns True if the ship is successfully placed, False otherwise.
+        '''
+        board = self.board
+        ship_size = self.fleet[ship * self.FLEET_RECORD + 1]
+        if not board.is_placeable_on(i, j, ship_size, orientation):
+            return False
+        start = i * board.cols + j
+        step = board.cols if orientation == Orientation.VERTICAL else 1
+        for index in range(start, start + ship_size * step, step):
+            board.data[index] = ship  # Mark the cells with the ship id.
+            board.owners[index] = ship  # Keeps the id once the cell is hit.
+            board.mark_dirty(index)
+        board.invalidate_placement_masks()  # Cached placement masks no longer match the board.
+        return True
+
+    def change_cells_to_sunk(self, sunk_ship):
+        '''
+        Changes the cells of a sunk ship to SUNK_CELL.
+        '''
+        board = self.board
+        for index in self.ship_cells(sunk_ship):
+            board.data[index] = SUNK_CELL
+            board.mark_dirty(index)
+
+    def place_attack(self, i, j):
+        '''
+        Places an attack on the player's board, with the same rules and results as Player.place_attack.
+        - Returns True if the attack hits a ship, False otherwise. Also returns the id of the ship if hit
+        '''
+        board = self.board
+        index = i * board.cols + j
+        value = board.data[index]
+        if value == SUNK_CELL or value == HIT_CELL or value == MISS_CELL:
+            return False, MISS_CELL
+        board.mark_dirty(index)
+        if value == EMPTY_CELL:
+            board.data[index] = MISS_CELL
+            return False, EMPTY_CELL
+
+        record = value * self.FLEET_RECORD
+        self.fleet[record] -= 1  # One less cell left of this ship.
+        self.num_ship_cells -= 1
+        board.data[index] = HIT_CELL
+        if self.fleet[record] == 0:
+            self.change_cells_to_sunk(value)
+        return True, value
+
+    def is_loss(self):
+        '''
+        Returns True if the player has no ship cells left.
+        '''
+        return self.num_ship_cells <= 0
+
+    def copy_state(self):
+        '''
+        Returns a copy of the player's state for load_state, like Player.copy_state.
+        '''
+        return self.board.copy_cells(), bytes(self.fleet), bytes(self.ships), self.num_ship_cells, self.ships_placed
+
+    def load_state(self, state):
+        '''
+        Puts a copy of a state from copy_state into the player, whose board must be new and of the same size.
+        '''
+        cells, fleet, ships, self.num_ship_cells, self.ships_placed = state
+        self.board.load_cells(cells)
+        self.fleet = bytearray(fleet)
+        self.ships = array("b", ships)
@@ -10,9 +10,17 @@
 ASCII_A = 97  # ASCII value for 'a'. (chr(65) == 'a')
 ASCII_0 = 48  # ASCII value for '0'. (chr(48) == '0')
 ASCII_B = 66  # ASCII value for 'b'. (chr(98) == 'b')
+ASCII_C = 67  # Key code for 'c' (raylib reports letter keys as uppercase ASCII).
+ASCII_R = 82  # Key code for 'r'.
+ASCII_H = 72  # Key code for 'h'.
+ASCII_F = 70  # Key code for 'f'.
+ASCII_M = 77  # Key code for 'm'.
+ASCII_ENTER = 257  # Key code for Enter (raylib's KEY_ENTER).
+ASCII_BACKSPACE = 259  # Key code for Backspace (raylib's KEY_BACKSPACE).
 
 # Cell and board-related constants
 CELL_SIZE = 28  # The size of each cell in the Battleship game board in pixels.
+BOARD_VIEW_SIZE = 280  # Width and height in pixels of the board area; larger boards are panned and zoomed inside it.
 
 # Game cell status values
 HIT_CELL = 0  # Represents a cell that has been hit by an attack.
@@ -20,8 +28,16 @@ EMPTY_CELL = -1  # Represents an empty cell on the board.
 MISS_CELL = -2  # Represents a cell where an attack was made but no ship was hit.
 SUNK_CELL = -3 # Represents a cell where a ship has no cells left of itself
 
+# Attack results recorded in replays
+RESULT_MISS = 0  # The attack missed.
+RESULT_HIT = 1  # The attack hit a ship that is still afloat.
+RESULT_SUNK = 2  # The attack sunk a ship.
+
+# Fleets
+CLASSIC_FLEET = (5, 4, 3, 3, 2)  # Ship sizes of the classic game, picked with F in the menu (sizes may repeat).
+
 # Color information for displaying different game states
-SHIP_COLOR_INFO = "RIGHT-CLICK = ROTATE\n\nEMPTY = WHITE\nMISSED = GREEN\nHIT = RED\nSUNK = YELLOW"  # Color legend to explain the state of cells on the board.
+SHIP_COLOR_INFO = "RIGHT-CLICK = ROTATE\nH = HINTS\nEMPTY = WHITE\nMISSED = GREEN\nHIT = RED\nSUNK = YELLOW"  # Color legend to explain the state of cells on the board.
 
 # Window dimensions
 WINDOW_WIDTH = 670  # Width of the game window in pixels.
@@ -31,4 +47,4 @@ WINDOW_HEIGHT = 450  # Height of the game window in pixels.
 BOARD_PADDING_LEFT = 200  # Distance in pixels from the left edge of the window to where the board is drawn.
 BOARD_PADDING_TOP  = 85   # Distance in pixels from the top edge of the window to where the board is drawn.
 
-# Ship size representation: Any other number than HIT_CELL, EMPTY_CELL, or MISS_CELL corresponds to the size of the ship placed in that cell.
+# Ship id representation: Any other number than HIT_CELL, EMPTY_CELL, or MISS_CELL corresponds to the id of the ship placed in that cell (Player.ship_sizes gives its size).
@@ -0,0 +1,329 @@
+# Filename: engine.py
+# Description: This module defines the Engine class, a pure-logic state machine for the Battleship game. It covers the menu, ship placement, attack and game end phases and is driven by explicit commands instead of mouse/keyboard polling, so games can run without a window.
+# Inputs: Explicit commands (ship count or fleet selection, placements, rotations, attacks, board toggles)
+# Output: Game state (phases, turn, players, messages) that a front end such as Game can draw
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+from .player import Player  # Import the Player class that manages player-specific actions and state.
+from .constants import *  # Import necessary game constants like cell values.
+from .board import Orientation # Import Orientation enum for ship orientation.
+
+class Engine:
+    # Smallest and largest number of ships that can be chosen in the menu.
+    MIN_SHIPS = 1
+    MAX_SHIPS = 5
+    AI_MAX_CELLS = 4096  # Larger boards get LargeBoardHuntAttack, ProbabilityAI enumerates every placement.
+
+    def __init__(self, player_class=Player, single_player=False, rows=10, cols=10, max_ships=None, fleet=CLASSIC_FLEET, record=False):
+        '''
+        Initializes a new game in the menu phase.
+        Args:
+            player_class: The Player class (and so the Board backend) used for both players.
+            single_player: If True, Player 2 is controlled by the computer.
+            rows, cols: Size of both boards (use SparsePlayer for very large boards).
+            max_ships: Largest ship count the menu accepts, MAX_SHIPS by default.
+            fleet: Ship sizes picked with select_fleet from the menu (sizes may repeat), the classic 5-4-3-3-2 by default;
+                   empty for no fleet option.
+            record: If True, every placement and attack is recorded to a ReplayLog (self.replay).
+        '''
+        # Initialize game information
+        self.turn = 1  # Indicates whose turn it is (1 for Player 1, 2 for Player 2).
+        self.player1 = player_class(1)  # Create Player 1.
+        self.player2 = player_class(2)  # Create Player 2.
+        if (rows, cols) != (self.player1.board.rows, self.player1.board.cols):
+            for player in (self.player1, self.player2):
+                player.board = player.board_class(rows, cols)  # Swap in boards of the requested size.
+        self.max_ships = max_ships or self.MAX_SHIPS  # Largest ship count that can be chosen in the menu.
+        self.fleet = tuple(fleet)  # Ship sizes of the fleet that can be picked in the menu instead of a ship count.
+        self.show_own_board = False  # Tracks whether the player is viewing their own board.
+        self.ship_orientation = Orientation.HORIZONTAL # Set intial ship orientation to horizontal.
+
+        # Utility lookup tables for player and enemy references
+        self.player_lookup_table = {1: self.player1, 2: self.player2}  # Maps turn number to the current player.
+        self.enemy_lookup_table = {1: self.player2, 2: self.player1}  # Maps turn number to the enemy player.
+        self.player_names = {1: "Player 1", 2: "Player 2"}  # Names used in messages for each player.
+
+        # Computer opponent state
+        self.single_player = False  # Whether Player 2 is controlled by the computer.
+        self.ai = None  # The computer opponent attacking Player 1, created by new_ai when the attack phase starts.
+        self.record = record  # Whether games are recorded; nothing is recorded unless asked for.
+        self.replay = None  # ReplayLog of every placement and attack when recording, started when the fleet is chosen.
+
+        # Game phase states
+        self.menu_phase = True  # Start the game in the menu phase.
+        self.place_ship_phase = False  # Ship placement phase will activate after the menu.
+        self.attack_phase = False  # Attack phase will activate once both players have placed their ships.
+        self.game_end_phase = False # Game end phase will show the board that lost and their sunk ships
+
+        # Game messages to display during different phases
+        self.message = "" # Used later for player turn information
+        self.title = f"Enter Ship Number to Play with (Min: {self.MIN_SHIPS}, Max: {self.max_ships})"  # Initial message for the ship selection phase.
+        if self.fleet:
+            self.title += f"\nor F for the {'-'.join(map(str, self.fleet))} Fleet"
+        self.win_message = "" # The message to display when a player wins.
+        self.last_move_message = ""  # Message for showing the result of the last move (hit/miss).
+        self.secondary_message = ""  # Secondary message for additional information.
+        self.color_info = SHIP_COLOR_INFO  # Display ship color legend/info.
+        self.update_opponent_message()  # Show which opponent is selected in the menu.
+        if single_player:
+            self.toggle_single_player()  # Start with the computer selected as Player 2.
+
+    def current_player(self):
+        '''
+        Returns the player whose turn it currently is.
+        '''
+        return self.player_lookup_table[self.turn]
+
+    def current_enemy(self):
+        '''
+        Returns the opponent of the player whose turn it currently is.
+        '''
+        return self.enemy_lookup_table[self.turn]
+
+    def winner(self):
+        '''
+        Returns the winning Player once the game has ended, otherwise None.
+        '''
+        if not self.game_end_phase:
+            return None
+        return self.current_player()  # The attacker that sunk the last ship keeps the turn.
+
+    def update_opponent_message(self):
+        '''
+        Shows the selected opponent in the menu.
+        '''
+        opponent = "COMPUTER" if self.single_player else "HUMAN"
+        self.secondary_message = f"Opponent: {opponent} [C to Switch]"
+
+    def toggle_single_player(self):
+        '''
+        Menu command: switches Player 2 between a human and the computer.
+        Returns:
+            True if the command was accepted, otherwise False.
+        '''
+        if not self.menu_phase:
+            return False
+
+        self.single_player = not self.single_player
+        self.player_names[2] = "Computer" if self.single_player else "Player 2"
+        self.update_opponent_message()
+        return True
+
+    def select_ship_count(self, num):
+        '''
+        Menu command: chooses how many ships each player plays with and starts the placement phase.
+        Args:
+            num: The number of ships (sizes 1..num) to give each player.
+        Returns:
+            True if the command was accepted, otherwise False.
+        '''
+        if not self.menu_phase or num < self.MIN_SHIPS or num > self.max_ships:  # Ensure the ship count is in range.
+            return False
+        return self.select_fleet(range(1, num + 1))
+
+    def select_fleet(self, ship_sizes=None):
+        '''
+        Menu command: chooses the sizes of the ships each player plays with and starts the placement phase.
+        Args:
+            ship_sizes: The ship sizes (sizes may repeat, like 5-4-3-3-2), self.fleet by default.
+        Returns:
+            True if the command was accepted, otherwise False.
+        '''
+        ship_sizes = sorted(self.fleet if ship_sizes is None else ship_sizes)
+        board = self.player1.board
+        if not self.menu_phase or not ship_sizes:
+            return False
+        if ship_sizes[0] < 1 or ship_sizes[-1] > max(board.rows, board.cols) or sum(ship_sizes) > board.rows * board.cols:
+            return False  # Every ship must fit on the board.
+
+        self.player1.get_ships(ship_sizes)  # Give Player 1 the chosen ships.
+        self.player2.get_ships(ship_sizes)  # Give Player 2 the same ships.
+        if self.record:
+            from .replay import ReplayLog  # Imported here so games that are not recorded never load the replay code.
+            try:
+                self.replay = ReplayLog(board.rows, board.cols, ship_sizes, self.single_player)  # Start recording the game.
+            except ValueError:
+                self.replay = None  # The game does not fit the replay format, so it is not recorded.
+        self.message = "Player 1's Turn to Place Ships"  # Update the message to indicate the next phase.
+        self.menu_phase = False  # Exit the menu phase.
+        self.place_ship_phase = True  # Enter the ship placement phase.
+        self.title = "" # Remove title line from the screen
+        self.secondary_message = "Press R to Auto-Place Ships" # Replace the opponent selection line with the auto-place hint.
+        return True
+
+    def rotate_ship(self):
+        '''
+        Placement command: flips the orientation used for the next ship placement.
+        '''
+        if (self.ship_orientation is Orientation.HORIZONTAL): # Check if orientation is currently horizontal
+            self.ship_orientation = Orientation.VERTICAL # If horizontal, go vertical
+        else:
+            self.ship_orientation = Orientation.HORIZONTAL # Otherwise, go horizontal (flip)
+
+    def place_ship(self, i, j):
+        '''
+        Placement command: places the current player's next ship at (i, j) using the current orientation.
+        Args:
+            i: Row index where the ship starts.
+            j: Column index where the ship starts.
+        Returns:
+            True if the ship was placed, otherwise False.
+        '''
+        if not self.place_ship_phase:
+            return False
+
+        player = self.current_player()
+        res = player.place_ship(i, j, player.ships[-1], self.ship_orientation)  # Attempt to place the player's last remaining ship at the coordinates.
+        if not res:
+            self.last_move_message = "Not a correct placement!"  # If the placement failed, show an error message.
+            return False
+
+        self.last_move_message = "" # Reset the last move message.
+        if self.replay is not None:
+            self.replay.record_placement(player.num, i, j, player.ships[-1], self.ship_orientation)  # Record the placement.
+        player.ships.pop()  # Remove the placed ship from the player's list.
+
+        # If all ships have been placed, mark the player as finished placing ships.
+        if not player.ships:
+            player.ships_placed = True
+
+        if self.player1.ships_placed and self.turn == 1:  # If Player 1 has placed all ships:
+            self.message = f"{self.player_names[2]}'s Turn to Place Ships"  # Update the message for Player 2's turn.
+            self.turn = 2  # Switch the turn to Player 2.
+            if self.single_player:
+                self.place_ai_ships()  # The computer places its whole fleet right away.
+
+        if self.player1.ships_placed and self.player2.ships_placed and self.place_ship_phase:  # Once both players have placed all ships:
+            self.place_ship_phase = False  # Exit the ship placement phase.
+            self.attack_phase = True  # Enter the attack phase.
+            self.message = f"{self.player_names[self.turn]}'s Turn to Attack"  # Update the message to indicate whose turn it is.
+            self.secondary_message = "Viewing ENEMY'S Board [B to Switch]"  # Display instruction for viewing the player's own board.
+            if self.single_player:
+                self.ai = self.new_ai()  # The computer starts tracking Player 1's board.
+                self.play_ai_turn()
+        return True
+
+    def auto_place_ships(self, rng=None):
+        '''
+        Placement command: places every remaining ship of the current player, with the layout drawn uniformly
+        from every legal way to fit them around the ships already placed.
+        Args:
+            rng: Optional random.Random for reproducible layouts.
+        Returns:
+            True if the ships were placed, otherwise False.
+        '''
+        if not self.place_ship_phase:
+            return False
+
+        from .fleet import FleetSampler  # Imported here so games placed by hand never load the sampler (and NumPy).
+        player = self.current_player()
+        layout = FleetSampler.for_board(player.board).sample_board(player.board, [player.ship_sizes[ship] for ship in player.ships], rng)
+        if layout is None:
+            self.last_move_message = "No room left for the remaining ships!"
+            return False
+
+        orientation = self.ship_orientation  # Keep the player's orientation choice.
+        for i, j, self.ship_orientation in reversed(layout):  # place_ship places the last ship in the list first.
+            self.place_ship(i, j)
+        self.ship_orientation = orientation
+        return True
+
+    def place_ai_ships(self):
+        '''
+        Places every remaining ship of the computer player with a uniformly random layout.
+        '''
+        if self.place_ship_phase and self.current_player() is self.player2:
+            self.auto_place_ships()
+
+    def new_ai(self):
+        '''
+        Returns a new computer opponent attacking Player 1: ProbabilityAI, or LargeBoardHuntAttack on boards
+        with more than AI_MAX_CELLS cells, where enumerating every placement would take too long.
+        '''
+        # Imported here so two-player games never load the AI (and NumPy).
+        board = self.player1.board
+        if board.rows * board.cols > self.AI_MAX_CELLS:
+            from .strategies import LargeBoardHuntAttack
+            return LargeBoardHuntAttack(self.player1)
+        from .ai import ProbabilityAI
+        return ProbabilityAI(self.player1)
+
+    def play_ai_turn(self):
+        '''
+        Lets the computer attack if it is its turn.
+        '''
+        if not self.attack_phase or self.turn != 2 or self.ai is None:
+            return
+
+        i, j = self.ai.choose_attack()
+        self.attack(i, j)
+
+    def toggle_show_board(self):
+        '''
+        Attack command: toggles the display between the player's own board and the enemy's board.
+        '''
+        if self.show_own_board:  # If the player is currently viewing their own board:
+            self.secondary_message = "Viewing ENEMY'S Board [B to Switch]"  # Update the message for viewing the enemy board.
+            self.show_own_board = False  # Switch to viewing the enemy board.
+        else:
+            self.secondary_message = "Viewing OWN Board [B to Switch]"  # Update the message for viewing own board.
+            self.show_own_board = True  # Switch to viewing own board.
+
+    def attack(self, i, j):
+        '''
+        Attack command: the current player attacks cell (i, j) on the enemy's board.
+        Args:
+            i: Row index of the attacked cell.
+            j: Column index of the attacked cell.
+        Returns:
+            True if an attack occurred (and the turn was used), otherwise False.
+        '''
+        if not self.attack_phase:
+            return False
+
+        if self.show_own_board:
+            self.last_move_message = "Can't attack! Currently viewing own board!"  # If viewing own board, disallow attacks.
+            return False
+
+        player = self.current_player()  # Get the current attacking player.
+        enemy = self.current_enemy()  # Get the current enemy player.
+        if not enemy.board.is_valid_cell(i, j):  # Ensure the chosen cell is valid for an attack.
+            return False
+
+        res, ship = enemy.place_attack(i, j)  # Perform the attack on the enemy's board (ship is the id of the ship hit).
+        if self.ai is not None and enemy is self.player1:
+            self.ai.record_attack(i, j, res, ship)  # Keep the computer's heatmap in sync with Player 1's board.
+
+        name = self.player_names[player.num]
+        if ship == MISS_CELL: # player chose a cell they already missed/hit/sunk
+            self.last_move_message = f"{name} already shot as this cell!"
+            return False
+
+        if res and enemy.ship_count[ship] == 0:
+            self.last_move_message = f"{name} has sunk a ship!"  # Notifys the player that they sunk a ship.
+            result = RESULT_SUNK
+        elif res:
+            self.last_move_message = f"{name} has hit a ship!"  # Notifys the player of a successful hit.
+            result = RESULT_HIT
+        else:
+            self.last_move_message = f"{name} has missed!"  # Notifys the player of a miss.
+            result = RESULT_MISS
+        if self.replay is not None:
+            self.replay.record_attack(player.num, i, j, result, ship)  # Record the attack.
+
+        if enemy.is_loss():  # Check if the enemy has lost all their ships.
+            self.message = "" # Remove message from the UI.
+            self.last_move_message = "" # Remove the last move message from UI.
+            self.secondary_message = "" # Remove the secondary message from UI.
+            self.win_message = f"{self.player_names[self.turn]} Has Won!"  # Declare the winner.
+            self.attack_phase = False  # End the attack phase.
+            self.game_end_phase = True  # Set phase to game end
+            return True
+
+        self.turn = 2 if self.turn == 1 else 1  # Switch turns after a valid attack.
+        self.message = f"{self.player_names[self.turn]}'s Turn to Attack"  # Update the message to indicate whose turn it is.
+        if self.single_player:
+            self.play_ai_turn()  # The computer answers immediately.
+        return True
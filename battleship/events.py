@@ -0,0 +1,71 @@
+# Filename: events.py
+# Description: This module defines the InputQueue class, which reads the keyboard and mouse once per logic tick and turns what happened into a queue of input events. The Game handles the queued events instead of polling pyray in every phase, and the window loop uses the queue to tell when the game is idle and can sleep until the next input.
+# Inputs: Keyboard and mouse state from pyray, once per tick
+# Output: Queued (kind, value, x, y) input events
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+from pyray import *  # Importing all the necessary functions from the pyray module, used for input.
+from collections import deque  # The event queue.
+
+# Event kinds. Every event is a (kind, value, x, y) tuple.
+KEY_EVENT = 0  # value is the key code, (x, y) the mouse position.
+CLICK_EVENT = 1  # value is the mouse button pressed, (x, y) the mouse position.
+WHEEL_EVENT = 2  # value is the wheel movement in steps, (x, y) the mouse position.
+PAN_EVENT = 3  # (x, y) is how far the board should move in pixels (middle-drag or arrow keys).
+
+class InputQueue:
+    CLICK_BUTTONS = (MouseButton.MOUSE_BUTTON_LEFT, MouseButton.MOUSE_BUTTON_RIGHT)  # Buttons queued as clicks.
+    PAN_SPEED = 8  # Pixels the board moves per tick while an arrow key is held.
+
+    def __init__(self):
+        '''
+        Initializes an empty queue.
+        '''
+        self.events = deque()  # Input events not handled yet, oldest first.
+        self.held = False  # Whether a pan key or the middle button was held at the last poll (the game is not idle).
+
+    def poll(self):
+        '''
+        Reads everything that happened since the last tick and queues it. Call once per tick.
+        Mouse moves are not queued: hover highlights read the mouse position when the frame is drawn, and the event
+        wait in the window loop already wakes up on them.
+        Returns:
+            True if any event was queued.
+        '''
+        queued = len(self.events)
+        pos = get_mouse_position()
+        x, y = pos.x, pos.y
+
+        key = get_key_pressed()
+        while key:  # Every key pressed since the last tick, in order.
+            self.events.append((KEY_EVENT, key, x, y))
+            key = get_key_pressed()
+
+        for button in self.CLICK_BUTTONS:
+            if is_mouse_button_pressed(button):
+                self.events.append((CLICK_EVENT, button, x, y))
+
+        wheel = get_mouse_wheel_move()
+        if wheel:
+            self.events.append((WHEEL_EVENT, wheel, x, y))
+
+        dragging = is_mouse_button_down(MouseButton.MOUSE_BUTTON_MIDDLE)
+        if dragging:
+            delta = get_mouse_delta()
+            if delta.x or delta.y:
+                self.events.append((PAN_EVENT, 0, delta.x, delta.y))
+        dx = is_key_down(KeyboardKey.KEY_LEFT) - is_key_down(KeyboardKey.KEY_RIGHT)
+        dy = is_key_down(KeyboardKey.KEY_UP) - is_key_down(KeyboardKey.KEY_DOWN)
+        if dx or dy:
+            self.events.append((PAN_EVENT, 0, dx * self.PAN_SPEED, dy * self.PAN_SPEED))  # Held keys pan on every tick.
+        self.held = dragging or bool(dx or dy)
+        return len(self.events) > queued
+
+    def __iter__(self):
+        '''
+        Yields and removes every queued event, oldest first. Events queued while iterating are yielded too.
+        '''
+        while self.events:
+            yield self.events.popleft()
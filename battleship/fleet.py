@@ -0,0 +1,228 @@
+# Filename: fleet.py
+# Description: This module defines the FleetSampler class, which draws whole fleet layouts uniformly at random from every legal configuration. It keeps a precomputed index of every legal placement (as a cell bitmask) per ship size and orientation for a board size, picks one placement per ship from the index and starts the fleet over on any overlap, so every legal layout is equally likely. Very large boards skip the index and work placements out arithmetically.
+# Inputs: Board dimensions, the ship sizes to place, and optionally cells that are already taken
+# Output: Fleet layouts (one (i, j, orientation) per ship), one at a time for the placement phase or in NumPy batches for simulation
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import random  # Random source for single layouts.
+import numpy as np  # Vectorized batches of layouts.
+from .board import Orientation
+
+class FleetSampler:
+    samplers = {}  # (rows, cols) is the key, shared FleetSampler for that board size is the value
+    MAX_ATTEMPTS = 100000  # Fleets drawn before deciding the remaining ships do not fit.
+    INDEX_CELLS = 4096  # Larger boards (up to 1000x1000) draw placements arithmetically instead of building the index.
+
+    def __init__(self, rows=10, cols=10):
+        '''
+        Initializes an empty placement index for boards of the given size; ship sizes are indexed when first used.
+        Cell (i, j) is bit i * cols + j of every mask, like BitBoard.
+        Args:
+            rows: Number of rows in the board.
+            cols: Number of columns in the board.
+        '''
+        self.rows = rows
+        self.cols = cols
+        self.words = (rows * cols + 63) // 64  # uint64 words per mask in the NumPy index.
+        self.masks = {}  # size of ship is the key, list of the mask of every legal placement is the value
+        self.starts = {}  # size of ship is the key, list of (i, j, orientation) of every legal placement is the value
+        self.mask_words = {}  # size of ship is the key, (placements, words) uint64 array of the masks is the value
+
+    @classmethod
+    def for_board(cls, board):
+        '''
+        Returns the shared FleetSampler for boards the size of board, so the index is only built once.
+        '''
+        key = (board.rows, board.cols)
+        sampler = cls.samplers.get(key)
+        if sampler is None:
+            sampler = cls.samplers[key] = cls(board.rows, board.cols)
+        return sampler
+
+    def index(self, ship_size):
+        '''
+        Builds (once) the index of every placement of a ship of the given size on an empty board:
+        horizontal placements first, then vertical ones, each in row-major order of their starting cell.
+        Returns:
+            The list of placement masks; self.starts[ship_size] holds the matching (i, j, orientation).
+        '''
+        masks = self.masks.get(ship_size)
+        if masks is not None:
+            return masks
+
+        masks = []
+        starts = []
+        for orientation in (Orientation.HORIZONTAL, Orientation.VERTICAL):
+            step = 1 if orientation == Orientation.HORIZONTAL else self.cols  # Bit distance between ship cells.
+            run = 0
+            for x in range(ship_size):
+                run |= 1 << (x * step)  # Mask of the ship placed at cell (0, 0).
+            last_i = self.rows - (ship_size if orientation == Orientation.VERTICAL else 1)  # Last row the ship can start on.
+            last_j = self.cols - (ship_size if orientation == Orientation.HORIZONTAL else 1)
+            for i in range(last_i + 1):
+                for j in range(last_j + 1):
+                    masks.append(run << (i * self.cols + j))
+                    starts.append((i, j, orientation))
+        self.masks[ship_size] = masks
+        self.starts[ship_size] = starts
+        return masks
+
+    def index_words(self, ship_size):
+        '''
+        Returns the placement masks of a ship size as a (placements, words) uint64 array for batches.
+        '''
+        words = self.mask_words.get(ship_size)
+        if words is None:
+            masks = self.index(ship_size)
+            words = np.zeros((len(masks), self.words), dtype=np.uint64)
+            for k, mask in enumerate(masks):
+                for w in range(self.words):
+                    words[k, w] = (mask >> (64 * w)) & 0xFFFFFFFFFFFFFFFF
+            self.mask_words[ship_size] = words
+        return words
+
+    @staticmethod
+    def occupied_mask(board):
+        '''
+        Returns the mask of every cell of board that is not empty (ships already placed).
+        '''
+        mask = 0
+        for i, j, _ in board.nonempty_cells(0, board.rows, 0, board.cols):
+            mask |= 1 << (i * board.cols + j)
+        return mask
+
+    def sample_board(self, board, ship_sizes, rng=None):
+        '''
+        Draws one fleet layout of the given ships around whatever is already on board, uniformly like sample.
+        Boards with more than INDEX_CELLS cells use sample_large, so no index is built for them.
+        Returns:
+            A list with the (i, j, orientation) of every ship, in the order of ship_sizes, or None if the ships do not fit.
+        '''
+        if self.rows * self.cols > self.INDEX_CELLS:
+            occupied = {i * self.cols + j for i, j, _ in board.nonempty_cells(0, board.rows, 0, board.cols)}
+            return self.sample_large(ship_sizes, occupied, rng)
+        return self.sample(ship_sizes, self.occupied_mask(board), rng)
+
+    def sample_large(self, ship_sizes, occupied=(), rng=None):
+        '''
+        Draws one fleet layout like sample, without the index: placement k of a ship (same order as the index)
+        is worked out from k directly, and the whole fleet is drawn again if it touches occupied or overlaps itself.
+        On a large board with few ships almost every fleet is kept.
+        Args:
+            ship_sizes: Sizes of the ships to place (sizes may repeat).
+            occupied: Set of cell indices (i * cols + j) that are already taken.
+            rng: Optional random.Random for reproducible layouts.
+        Returns:
+            A list with the (i, j, orientation) of every ship, in the order of ship_sizes, or None if the ships do not fit.
+        '''
+        rand = (rng or random).random
+        cols = self.cols
+        options = []  # (position in ship_sizes, ship size, horizontal placements, every placement) for every ship, largest first.
+        for k in sorted(range(len(ship_sizes)), key=lambda k: -ship_sizes[k]):
+            ship_size = ship_sizes[k]
+            horizontal = self.rows * max(cols - ship_size + 1, 0)
+            vertical = max(self.rows - ship_size + 1, 0) * cols
+            if not horizontal + vertical:
+                return None
+            options.append((k, ship_size, horizontal, horizontal + vertical))
+
+        for _ in range(self.MAX_ATTEMPTS):
+            used = set()
+            chosen = [None] * len(ship_sizes)
+            for position, ship_size, horizontal, count in options:
+                k = int(rand() * count)
+                if k < horizontal:
+                    i, j = divmod(k, cols - ship_size + 1)
+                    orientation, step = Orientation.HORIZONTAL, 1
+                else:
+                    i, j = divmod(k - horizontal, cols)
+                    orientation, step = Orientation.VERTICAL, cols
+                start = i * cols + j
+                ship = [start + x * step for x in range(ship_size)]
+                if any(cell in used or cell in occupied for cell in ship):
+                    break  # Overlap, start the fleet over.
+                used.update(ship)
+                chosen[position] = (i, j, orientation)
+            else:
+                return chosen
+        return None
+
+    def sample(self, ship_sizes, occupied=0, rng=None):
+        '''
+        Draws one fleet layout uniformly from every legal configuration of the given ships that avoids occupied.
+        Every ship gets a uniformly random placement from the index; if any two overlap, the whole fleet is
+        drawn again. Stopping at the first overlap (largest ships first, they overlap most) does not change
+        which fleets are kept, so the layouts stay uniform.
+        Args:
+            ship_sizes: Sizes of the ships to place (sizes may repeat, like the classic 5-4-3-3-2 fleet).
+            occupied: Mask of cells that are already taken.
+            rng: Optional random.Random for reproducible layouts.
+        Returns:
+            A list with the (i, j, orientation) of every ship, in the order of ship_sizes, or None if the ships do not fit.
+        '''
+        rand = (rng or random).random
+        options = []  # (position in ship_sizes, masks it may use, matching starts, count) for every ship, largest first.
+        for position in sorted(range(len(ship_sizes)), key=lambda k: -ship_sizes[k]):
+            ship_size = ship_sizes[position]
+            masks = self.index(ship_size)
+            starts = self.starts[ship_size]
+            if occupied:  # Drop placements on taken cells once.
+                free = [k for k, mask in enumerate(masks) if not mask & occupied]
+                masks = [masks[k] for k in free]
+                starts = [starts[k] for k in free]
+            if not masks:
+                return None
+            options.append((position, masks, starts, len(masks)))
+
+        for _ in range(self.MAX_ATTEMPTS):
+            used = occupied
+            chosen = [None] * len(ship_sizes)
+            for position, masks, starts, count in options:
+                k = int(rand() * count)
+                if masks[k] & used:
+                    break  # Overlap, start the fleet over.
+                used |= masks[k]
+                chosen[position] = starts[k]
+            else:
+                return chosen
+        return None
+
+    def sample_batch(self, ship_sizes, count, rng=None):
+        '''
+        Draws count fleet layouts on an empty board at once, uniformly like sample, using NumPy.
+        Args:
+            ship_sizes: Sizes of the ships to place.
+            count: Number of layouts.
+            rng: Optional numpy.random.Generator.
+        Returns:
+            A (count, len(ship_sizes)) int array; column k holds indices into self.starts[ship_sizes[k]].
+        '''
+        rng = rng or np.random.default_rng()
+        order = sorted(range(len(ship_sizes)), key=lambda k: -ship_sizes[k])  # Largest ships first.
+        layouts = np.empty((count, len(ship_sizes)), dtype=np.int64)
+        filled = 0
+        while filled < count:
+            draw = max(1024, 2 * (count - filled))  # About half the fleets are kept with 5 ships on 10x10.
+            picks = np.empty((draw, len(ship_sizes)), dtype=np.int64)
+            used = np.zeros((draw, self.words), dtype=np.uint64)
+            keep = np.ones(draw, dtype=bool)
+            for k in order:
+                words = self.index_words(ship_sizes[k])
+                picks[:, k] = rng.integers(0, len(words), size=draw)
+                masks = words[picks[:, k]]
+                keep &= ~(used & masks).any(axis=1)
+                used |= masks
+            kept = picks[keep][:count - filled]
+            layouts[filled:filled + len(kept)] = kept
+            filled += len(kept)
+        return layouts
+
+    def decode(self, ship_sizes, layout):
+        '''
+        Turns one row of sample_batch into the list returned by sample.
+        '''
+        for ship_size in ship_sizes:
+            self.index(ship_size)
+        return [self.starts[ship_size][int(k)] for ship_size, k in zip(ship_sizes, layout)]
@@ -0,0 +1,150 @@
+# Filename: fonts.py
+# Description: This module defines the FontManager class, which bakes the Roboto font only at the pixel sizes the UI draws and caches the glyph atlases on disk next to the package so later launches load them directly.
+# Inputs: battleship/resources/roboto.ttf
+# Output: Fonts for each UI text size, and the atlas cache in battleship/resources/font_cache
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+from pyray import *  # Importing all the necessary functions from the pyray module, used for loading fonts.
+import os  # Resolving the font path relative to the package and managing the cache directory.
+import struct  # Reading and writing the glyph metrics cache (imported after pyray, which exports its own "struct").
+
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources")  # Works from any working directory.
+
+class FontManager:
+    # Only one set of fonts, so we make the methods static
+    FONT_PATH = os.path.join(RESOURCES_DIR, "roboto.ttf")  # The UI font.
+    CACHE_DIR = os.path.join(RESOURCES_DIR, "font_cache")  # Where baked atlases are stored.
+    FONT_SIZES = (15, 20, 22, 30)  # Every text size the UI draws.
+    GLYPH_COUNT = 95  # ASCII 32..126, the same set load_font_ex loads by default.
+    GLYPH_PADDING = 4  # Padding between glyphs in the atlas, the same as load_font_ex.
+    CACHE_VERSION = 1  # Bump when the cache format changes.
+
+    # Cache header: magic, version, ttf file size, ttf modification time, font size, glyph count.
+    HEADER = struct.Struct("<4sIqqII")
+    # One record per glyph: codepoint, offsetX, offsetY, advanceX, atlas rectangle (x, y, width, height).
+    GLYPH = struct.Struct("<iiii4f")
+
+    fonts = {}  # font size is the key, loaded Font is the value
+    keep_alive = []  # Glyph arrays referenced by the loaded fonts (owned by Python, so they must stay alive).
+
+    @staticmethod
+    def cache_paths(size):
+        '''
+        Returns the (atlas image path, glyph metrics path) of the cache for a font size.
+        '''
+        base = os.path.join(FontManager.CACHE_DIR, f"roboto_{size}")
+        return base + ".png", base + ".bin"
+
+    @staticmethod
+    def cache_header(size):
+        '''
+        Returns the cache header expected for a font size, tied to the current ttf file.
+        '''
+        stat = os.stat(FontManager.FONT_PATH)
+        return FontManager.HEADER.pack(b"BSFC", FontManager.CACHE_VERSION, stat.st_size, stat.st_mtime_ns, size, FontManager.GLYPH_COUNT)
+
+    @staticmethod
+    def bake(size):
+        '''
+        Rasterizes the glyph atlas for one font size on the CPU and tries to store it in the cache.
+        Returns:
+            (atlas Image, list of glyph metric tuples)
+        '''
+        with open(FontManager.FONT_PATH, "rb") as file:
+            data = file.read()
+        buffer = ffi.new("unsigned char[]", data)
+        glyphs = load_font_data(ffi.cast("unsigned char *", buffer), len(data), size, ffi.NULL, FontManager.GLYPH_COUNT, FONT_DEFAULT)
+        recs = ffi.new("Rectangle **")
+        atlas = gen_image_font_atlas(glyphs, recs, FontManager.GLYPH_COUNT, size, FontManager.GLYPH_PADDING, 0)
+
+        metrics = []
+        for k in range(FontManager.GLYPH_COUNT):
+            glyph = glyphs[k]
+            rec = recs[0][k]
+            metrics.append((glyph.value, glyph.offsetX, glyph.offsetY, glyph.advanceX, rec.x, rec.y, rec.width, rec.height))
+        unload_font_data(glyphs, FontManager.GLYPH_COUNT)  # The atlas and metrics are all we keep.
+        mem_free(recs[0])
+
+        try:
+            os.makedirs(FontManager.CACHE_DIR, exist_ok=True)
+            image_path, metrics_path = FontManager.cache_paths(size)
+            if export_image(atlas, image_path):
+                with open(metrics_path, "wb") as file:
+                    file.write(FontManager.cache_header(size))
+                    for glyph in metrics:
+                        file.write(FontManager.GLYPH.pack(*glyph))
+        except OSError:
+            pass  # A read-only install still works, it just bakes on every launch.
+        return atlas, metrics
+
+    @staticmethod
+    def read_cache(size):
+        '''
+        Loads the cached atlas and glyph metrics for a font size.
+        Returns:
+            (atlas Image, list of glyph metric tuples), or None if the cache is missing or stale.
+        '''
+        image_path, metrics_path = FontManager.cache_paths(size)
+        try:
+            with open(metrics_path, "rb") as file:
+                data = file.read()
+            header = FontManager.cache_header(size)
+        except OSError:
+            return None
+
+        expected_length = len(header) + FontManager.GLYPH_COUNT * FontManager.GLYPH.size
+        if len(data) != expected_length or not data.startswith(header) or not os.path.exists(image_path):
+            return None  # Written for another ttf file or cache version.
+
+        atlas = load_image(image_path)
+        if atlas.data == ffi.NULL:
+            return None
+        metrics = list(FontManager.GLYPH.iter_unpack(data[len(header):]))
+        return atlas, metrics
+
+    @staticmethod
+    def build_font(size, atlas, metrics):
+        '''
+        Uploads an atlas to the GPU and assembles the Font struct from the glyph metrics. Needs an open window.
+        '''
+        texture = load_texture_from_image(atlas)
+        unload_image(atlas)
+        set_texture_filter(texture, TextureFilter.TEXTURE_FILTER_BILINEAR)
+
+        recs = ffi.new("Rectangle[]", len(metrics))
+        glyphs = ffi.new("GlyphInfo[]", len(metrics))
+        for k, (value, offsetX, offsetY, advanceX, x, y, width, height) in enumerate(metrics):
+            glyphs[k].value = value
+            glyphs[k].offsetX = offsetX
+            glyphs[k].offsetY = offsetY
+            glyphs[k].advanceX = advanceX
+            recs[k] = (x, y, width, height)
+        FontManager.keep_alive.append((recs, glyphs))
+        return Font(size, len(metrics), FontManager.GLYPH_PADDING, texture, recs, glyphs)
+
+    @staticmethod
+    def load():
+        '''
+        Loads a font for every UI text size, from the cache when it is valid and by baking it otherwise.
+        Must be called after the window is created.
+        '''
+        for size in FontManager.FONT_SIZES:
+            try:
+                baked = FontManager.read_cache(size) or FontManager.bake(size)
+            except OSError:
+                continue  # Missing font file: get() falls back to the pyray default font.
+            FontManager.fonts[size] = FontManager.build_font(size, *baked)
+
+    @staticmethod
+    def get(size):
+        '''
+        Returns the loaded font best suited to a text size (the smallest baked size that is at least as large),
+        or None if no font is loaded.
+        '''
+        font = FontManager.fonts.get(size)
+        if font is not None or not FontManager.fonts:
+            return font
+        larger = [baked for baked in FontManager.fonts if baked >= size]
+        return FontManager.fonts[min(larger) if larger else max(FontManager.fonts)]
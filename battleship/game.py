@@ -1,173 +1,273 @@
 # Filename: game.py
-# Description: This module defines the Game class, which handles the game logic, phases (menu, ship placement, attack), and player turns for the Battleship game.
+# Description: This module defines the Game class, the pyray front end for the Battleship game. It turns queued mouse and keyboard events into Engine commands and draws each phase (menu, ship placement, attack).
 # Inputs: None
-# Output: Controls game flow, manages turns, handles board rendering, and manages user input (ship placement and attacks).
+# Output: Handles board rendering and manages user input (ship placement and attacks) on top of the Engine game logic.
 # Other sources for the code: ChatGPT (for proper commenting)
 # Authors: Xavier and Andrew
 # Creation Date: 9th of September, 2024
 
 from pyray import *  # Import necessary functions from pyray for window and input handling.
 from .renderer import Renderer  # Import the Renderer class for drawing the game board and window.
-from .player import Player  # Import the Player class that manages player-specific actions and state.
+from .hud import Hud  # Import the retained HUD layer for drawing messages.
+from .engine import Engine  # Import the Engine class that holds the game rules and state.
+from .profiler import Profiler  # Import the Profiler that times each phase.
+from .events import InputQueue, KEY_EVENT, CLICK_EVENT, WHEEL_EVENT, PAN_EVENT  # Import the input event queue.
+import os  # Import os to create the replay directory.
 from .constants import *  # Import necessary game constants like cell size, colors, etc.
 from .board import Orientation # Import Orientation enum for ship orientation.
 
-class Game:
-    def __init__(self):
-        # Initialize game information
-        self.turn = 1  # Indicates whose turn it is (1 for Player 1, 2 for Player 2).
-        self.player1 = Player(1)  # Create Player 1.
-        self.player2 = Player(2)  # Create Player 2.
-        self.show_own_board = False  # Tracks whether the player is viewing their own board.
-        self.ship_orientation = Orientation.HORIZONTAL # Set intial ship orientation to horizontal.
-
-        # Utility lookup tables for player and enemy references
-        self.player_lookup_table = {1: self.player1, 2: self.player2}  # Maps turn number to the current player.
-        self.enemy_lookup_table = {1: self.player2, 2: self.player1}  # Maps turn number to the enemy player.
-
-        # Game phase states
-        self.menu_phase = True  # Start the game in the menu phase.
-        self.place_ship_phase = False  # Ship placement phase will activate after the menu.
-        self.attack_phase = False  # Attack phase will activate once both players have placed their ships.
-        self.game_end_phase = False # Game end phase will show the board that lost and their sunk ships 
-
-        # Game messages to display during different phases
-        self.message = "" # Used later for player turn information
-        self.title = "Enter Ship Number to Play with (Min: 1, Max: 5)"  # Initial message for the ship selection phase.
-        self.win_message = "" # The message to display when a player wins.
-        self.last_move_message = ""  # Message for showing the result of the last move (hit/miss).
-        self.secondary_message = ""  # Secondary message for additional information.
-        self.color_info = SHIP_COLOR_INFO  # Display ship color legend/info.
-
-    def get_placement(self, player):
-        '''
-        Handles ship placement for a player.
-        Args:
-            player: The player placing their ships.
-        '''
-        i, j = Renderer.get_mouse_board_coordinates()  # Get mouse cursor coordinates on the board.
-
-        if is_mouse_button_pressed(MouseButton.MOUSE_BUTTON_LEFT):  # Check if the left mouse button was clicked.
-            res = player.place_ship(i, j, player.ships[-1], self.ship_orientation)  # Attempt to place the player's last remaining ship at the coordinates.
-            if not res:
-                self.last_move_message = "Not a correct placement!"  # If the placement failed, show an error message.
-            else:
-                self.last_move_message = "" # Reset the last move message.
-                player.ships.pop()  # Remove the placed ship from the player's list.
-        
-        if is_mouse_button_pressed(MouseButton.MOUSE_BUTTON_RIGHT): # Check if right mouse button was clicked.
-            if (self.ship_orientation is Orientation.HORIZONTAL): # Check if orientation is currently horizontal
-                self.ship_orientation = Orientation.VERTICAL # If horizontal, go vertical
-            else:
-                self.ship_orientation = Orientation.HORIZONTAL # Otherwise, go horizontal (flip)
+class Game(Engine):
+    '''
+    Thin pyray front end over the Engine state machine.
+    - Queues mouse/keyboard input once per tick and turns the events into Engine commands.
+    - Draws the boards and messages for the current phase.
+    '''
+    HINT_SHIPS = 3  # Hints are only solved once at most this many enemy ships are left, so the solver stays quick.
+    WAIT_FOR_EVENTS = True  # Nothing changes without input, so the window loop may sleep until the next event.
+    HEATMAP_KINDS = (None, "placements", "shots")  # M cycles through these overlays (None hides the heatmap).
 
-        # If all ships have been placed, mark the player as finished placing ships.
-        if not player.ships:
-            player.ships_placed = True
+    def __init__(self, *args, **kwargs):
+        '''
+        Initializes the game like the Engine does.
+        '''
+        super().__init__(*args, **kwargs)
+        self.replay_archive = None  # Archive file finished games are appended to (main.py --record), None to not record.
+        self.replay_saved = False  # Whether the finished game was appended to the replay archive.
+        self.show_hints = False  # Whether the hint overlay is drawn on the enemy board (toggled with H).
+        self.hints = None  # Solved EndgameSolver for the board being attacked, or None if it could not be solved.
+        self.hints_for = None  # The enemy Player the hints were solved for.
+        self.hints_stale = True  # Set when the board being attacked changes.
+        self.hint_message = ""  # Hint summary drawn next to the board.
+        self.ship_entry = ""  # Digits typed in the menu when more than 9 ships can be chosen.
+        self.events = InputQueue()  # Input read once per tick, handled before the frame is drawn.
+        self.analytics = None  # ArchiveStats loaded with load_heatmaps, or None if no heatmaps were given.
+        self.heatmap_kind = None  # Heatmap drawn over the board (one of HEATMAP_KINDS).
+        self.heatmap = None  # (rows, cols) array of the heatmap drawn, or None.
+        self.heatmap_message = ""  # Heatmap summary drawn next to the board.
+        board = self.player1.board
+        if not Renderer.viewport.fits(board.rows, board.cols):
+            self.color_info += "\nWHEEL = ZOOM\nARROWS = PAN"  # Large boards are panned and zoomed.
 
-    def get_attack(self, player, enemy):
+    def record_replays(self, path):
         '''
-        Handles player attacks on the enemy's board.
-        Args:
-            player: The attacking player.
-            enemy: The enemy player whose board is being attacked.
-        Returns:
-            True if an attack occurred, otherwise False.
+        Turns on recording: the finished game is appended to the replay archive at path. Nothing is written otherwise.
         '''
-        i, j = Renderer.get_mouse_board_coordinates()  # Get mouse cursor coordinates on the enemy's board.
-        if is_mouse_button_pressed(MouseButton.MOUSE_BUTTON_LEFT):  # Check if the left mouse button was clicked.
-            if enemy.board.is_valid_cell(i, j):  # Ensure the clicked cell is valid for an attack.
-                res, ship_size = enemy.place_attack(i, j)  # Perform the attack on the enemy's board.
-                if ship_size == MISS_CELL: # player chose a cell they already missed/hit/sunk  
-                    self.last_move_message = f"Player {player.num} already shot as this cell!"
-                    return False 
+        self.record = True
+        self.replay_archive = path
 
-                if res and enemy.ship_count[ship_size] == 0: 
-                    self.last_move_message = f"Player {player.num} has sunk a ship!"  # Notifys the player that they sunk a ship.
-                elif res:
-                    self.last_move_message = f"Player {player.num} has hit a ship!"  # Notifys the player of a successful hit.
-                else:
-                    self.last_move_message = f"Player {player.num} has missed!"  # Notifys the player of a miss.
+    def save_replay(self):
+        '''
+        Appends the finished game's replay to the replay archive, once, if recording was turned on.
+        '''
+        if self.replay_saved or self.replay is None or self.replay_archive is None:
+            return
+        self.replay_saved = True
+        try:
+            os.makedirs(os.path.dirname(self.replay_archive) or ".", exist_ok=True)
+            from .replay import ReplayArchive  # Only loaded when recording.
+            ReplayArchive(self.replay_archive).append(self.replay)
+        except OSError:
+            pass  # Failing to save a replay must not stop the game.
 
-                return True
+    def attack(self, i, j):
+        '''
+        Attack command, like the Engine's; an attack that was made changes the board the hints were solved for.
+        '''
+        attacked = super().attack(i, j)
+        if attacked:
+            self.hints_stale = True
+        return attacked
 
-        return False
+    def load_heatmaps(self, path):
+        '''
+        Loads the heatmaps exported by python -m battleship.analytics, so M draws them over the board.
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If it is not an exported heatmap file.
+        '''
+        from .analytics import ArchiveStats  # Only loaded when heatmaps are given; it needs NumPy.
+        self.analytics = ArchiveStats.load(path)
+        self.color_info += "\nM = HEATMAP"
 
-    def show_menu(self):
+    def toggle_heatmap(self):
         '''
-        Displays the initial menu where players choose how many ships to use.
+        Switches the overlay to the next heatmap kind: where ships were placed, where shots landed, then none.
+        Boards of a size with no recorded games have no heatmap.
         '''
-        key = get_key_pressed() - ASCII_0  # Get the key the user pressed and adjust it to a numeric value.
-        if key > 0 and key <= 5:  # Ensure the ship count is between 1 and 5.
-            self.player1.get_ships(key)  # Give Player 1 the specified number of ships.
-            self.player2.get_ships(key)  # Give Player 2 the same number of ships.
-            self.message = "Player 1's Turn to Place Ships"  # Update the message to indicate the next phase.
-            self.menu_phase = False  # Exit the menu phase.
-            self.place_ship_phase = True  # Enter the ship placement phase.
-            self.title = "" # Remove title line from the screen
+        if self.analytics is None:
+            return
+        kinds = self.HEATMAP_KINDS
+        self.heatmap_kind = kinds[(kinds.index(self.heatmap_kind) + 1) % len(kinds)]
+        self.heatmap = None
+        if self.heatmap_kind is None:
+            return
+        board = self.player1.board
+        stats = self.analytics.boards.get((board.rows, board.cols))
+        if stats is None:
+            self.heatmap_message = f"Heatmap: no games on\n{board.rows}x{board.cols} boards [M]"
+        elif self.heatmap_kind == "placements":
+            self.heatmap = stats.heatmap("placements")  # Computed once per toggle, not every frame.
+            self.heatmap_message = f"Heatmap: ship placements\nof {stats.fleets} fleets [M]"
+        else:
+            self.heatmap = stats.heatmap("shots")
+            self.heatmap_message = f"Heatmap: shots of {stats.games} games\n{stats.game_shots.mean:.0f} shots per game [M]"
 
-    def show_place_ship_phase(self):
+    def toggle_hints(self):
         '''
-        Manages the ship placement phase.
+        Shows or hides the hint overlay.
         '''
-        current_player = self.player_lookup_table[self.turn] # Get current player
-        Renderer.draw_board(current_player.board, False, current_player.ships[-1], self.ship_orientation)  # Draw the current player's board.
-        self.get_placement(current_player)  # Handle ship placement for the current player.
-        if self.player1.ships_placed:  # If Player 1 has placed all ships:
-            self.message = "Player 2's Turn to Place Ships"  # Update the message for Player 2's turn.
-            self.turn = 2  # Switch the turn to Player 2.
+        self.show_hints = not self.show_hints
+        self.hints_stale = True
+
+    def update_hints(self):
+        '''
+        Solves the board being attacked again if it changed since the hints were last solved.
+        '''
+        enemy = self.current_enemy()
+        if not self.hints_stale and self.hints_for is enemy:
+            return
+        self.hints_stale = False
+        self.hints_for = enemy
+        self.hints = None
+        from .solver import EndgameSolver  # Imported here so games that never show hints do not load the solver.
+        if enemy.board.rows * enemy.board.cols > EndgameSolver.MAX_CELLS:
+            self.hint_message = "Hints: board too\nlarge to solve [H]"
+            return
+        solver = EndgameSolver(enemy.board, self.hint_ship_sizes(enemy))
+        ships_left = len(solver.ship_sizes)
+        if ships_left > self.HINT_SHIPS:
+            self.hint_message = f"Hints: sink {ships_left - self.HINT_SHIPS} more\nship(s) first [H]"
+        elif solver.solve():
+            self.hints = solver
+            best = solver.probability(*solver.best_cells[0])
+            self.hint_message = f"Best shot: {best:.0%} [H]\n{solver.total} layouts left"
         else:
-            self.turn = 1  # Otherwise, it's still Player 1's turn.
+            self.hint_message = "Hints: too many\nlayouts left [H]"
+
+    def hint_ship_sizes(self, enemy):
+        '''
+        Returns the sizes of the enemy ships that are not sunk yet, the ships the hint solver places.
+        '''
+        return [enemy.ship_sizes[ship] for ship, cells_left in enemy.ship_count.items() if cells_left > 0]
+
+    def current_hints(self):
+        '''
+        Returns the hints to draw over the enemy board, or None if they are hidden or unavailable.
+        '''
+        if not self.show_hints:
+            return None
+        self.update_hints()
+        return self.hints
+
+    def handle_events(self):
+        '''
+        Reads this tick's input and applies every queued event, so the frame drawn next shows the result.
+        '''
+        self.events.poll()
+        for kind, value, x, y in self.events:
+            if kind == KEY_EVENT:
+                self.handle_key(value)
+            elif kind == CLICK_EVENT:
+                self.handle_click(value, x, y)
+            elif kind == WHEEL_EVENT or kind == PAN_EVENT:
+                self.move_viewport(kind, value, x, y)
 
-        if self.player1.ships_placed and self.player2.ships_placed:  # Once both players have placed all ships:
-            self.place_ship_phase = False  # Exit the ship placement phase.
-            self.attack_phase = True  # Enter the attack phase.
-            self.secondary_message = "Viewing ENEMY'S Board [B to Switch]"  # Display instruction for viewing the player's own board.
+    def is_idle(self):
+        '''
+        Returns True if the game only changes on new input, so the window loop can sleep until the next event.
+        Held pan keys or a middle-button drag keep it ticking.
+        '''
+        return self.WAIT_FOR_EVENTS and not self.events.held
 
-    def toggle_show_board(self):
+    def handle_key(self, key):
         '''
-        Toggles the display between the player's own board and the enemy's board.
+        Handles a key press for the current phase.
+        - Menu: C switches the opponent, F picks the fleet, digits choose the ship count.
+        - Placement: R auto-places the remaining ships, M cycles the heatmaps.
+        - Attack: B switches between the boards, H shows or hides the hints, M cycles the heatmaps.
         '''
-        key = get_key_pressed()  # Get the key pressed by the user.
-        if key == ASCII_B:  # If the user presses the 'B' key:
-            if self.show_own_board:  # If the player is currently viewing their own board:
-                self.secondary_message = "Viewing ENEMY'S Board [B to Switch]"  # Update the message for viewing the enemy board.
-                self.show_own_board = False  # Switch to viewing the enemy board.
+        if self.menu_phase:
+            if key == ASCII_C:  # If the user presses the 'C' key:
+                self.toggle_single_player()  # Switch between a human and a computer opponent.
+            elif key == ASCII_F:  # If the user presses the 'F' key:
+                self.select_fleet()  # Start the placement phase with the fleet of self.fleet (5-4-3-3-2 by default).
+            elif self.max_ships < 10:
+                self.select_ship_count(key - ASCII_0)  # Start the placement phase if the ship count is in range.
             else:
-                self.secondary_message = "Viewing OWN Board [B to Switch]"  # Update the message for viewing own board.
-                self.show_own_board = True  # Switch to viewing own board.
+                self.enter_ship_digit(key)  # Larger fleets are typed in and confirmed with Enter.
+        elif self.place_ship_phase:
+            if key == ASCII_R: # If the user presses the 'R' key:
+                self.auto_place_ships() # Place every remaining ship with a random layout.
+            elif key == ASCII_M:  # If the user presses the 'M' key:
+                self.toggle_heatmap()  # Show the next replay heatmap.
+        elif self.attack_phase:
+            if key == ASCII_B:  # If the user presses the 'B' key:
+                self.toggle_show_board()  # Toggle the board view between the player's own and enemy's board.
+            elif key == ASCII_H:  # If the user presses the 'H' key:
+                self.toggle_hints()  # Show or hide the hint overlay.
+            elif key == ASCII_M:  # If the user presses the 'M' key:
+                self.toggle_heatmap()  # Show the next replay heatmap.
 
-    def show_attack_phase(self):
+    def handle_click(self, button, x, y):
+        '''
+        Handles a mouse click at window position (x, y): places or rotates the next ship, or attacks the cell clicked.
+        '''
+        i, j = Renderer.viewport.cell_at(x, y)  # Board cell under the click, (-1, -1) off the board.
+        if self.place_ship_phase:
+            if button == MouseButton.MOUSE_BUTTON_LEFT:  # Check if the left mouse button was clicked.
+                self.place_ship(i, j)  # Attempt to place the player's last remaining ship at the coordinates.
+            elif button == MouseButton.MOUSE_BUTTON_RIGHT: # Check if right mouse button was clicked.
+                self.rotate_ship() # Flip the ship orientation.
+        elif self.attack_phase and button == MouseButton.MOUSE_BUTTON_LEFT:
+            self.attack(i, j)  # The engine refuses attacks while viewing own board.
+
+    def enter_ship_digit(self, key):
         '''
-        Manages the attack phase where players take turns attacking each other.
+        Adds a typed digit to the ship count in the menu; Backspace removes one and Enter chooses the count.
         '''
-        self.toggle_show_board()  # Toggle the board view between the player's own and enemy's board.
-        self.message = f"Player {self.turn}'s Turn to Attack"  # Update the message to indicate whose turn it is.
+        if ASCII_0 <= key <= ASCII_0 + 9 and len(self.ship_entry) < len(str(self.max_ships)):
+            self.ship_entry += chr(key)
+        elif key == ASCII_BACKSPACE:
+            self.ship_entry = self.ship_entry[:-1]
+        elif key == ASCII_ENTER and self.ship_entry:
+            if self.select_ship_count(int(self.ship_entry)):
+                return
+            self.ship_entry = ""  # Out of range, start over.
+        self.last_move_message = f"Ships: {self.ship_entry}_ [Enter]" if self.ship_entry else ""
 
-        current_player = self.player_lookup_table[self.turn]  # Get the current attacking player.
-        current_enemy_player = self.enemy_lookup_table[self.turn]  # Get the current enemy player.
+    def move_viewport(self, kind, value, x, y):
+        '''
+        Pans and zooms a board too large for the board area: a wheel event zooms at the cursor,
+        a pan event (arrow keys or dragging with the middle mouse button) moves the board by (x, y) pixels.
+        '''
+        view = Renderer.viewport
+        if self.menu_phase or view.fits(view.rows, view.cols):
+            return
+        if kind == WHEEL_EVENT:
+            if view.contains(x, y):
+                view.zoom_at(value, x, y)
+        else:
+            view.pan(x, y)
+
+    def show_place_ship_phase(self):
+        '''
+        Draws the ship placement phase.
+        '''
+        current_player = self.current_player() # Get current player
+        ship_length = current_player.ship_sizes[current_player.ships[-1]]  # Size of the next ship to place.
+        Renderer.draw_board(current_player.board, False, ship_length, self.ship_orientation, heatmap=self.heatmap)  # Draw the current player's board.
+
+    def show_attack_phase(self):
+        '''
+        Draws the attack phase: the player's own board, or the enemy's board with the heatmap and hints if enabled.
+        '''
         if self.show_own_board:
-            Renderer.draw_board(current_player.board, False)  # Draw the current player's own board.
-            if is_mouse_button_pressed(MouseButton.MOUSE_BUTTON_LEFT):
-                self.last_move_message = "Can't attack! Currently viewing own board!"  # If viewing own board, disallow attacks.
+            Renderer.draw_board(self.current_player().board, False)  # Draw the current player's own board.
         else:
-            Renderer.draw_board(current_enemy_player.board, True)  # Draw the enemy player's board.
-            res = self.get_attack(current_player, current_enemy_player)  # Perform an attack if allowed.
-            if current_enemy_player.is_loss():  # Check if the enemy has lost all their ships.
-                self.message = "" # Remove message from the UI.
-                self.last_move_message = "" # Remove the last move message from UI.
-                self.secondary_message = "" # Remove the secondary message from UI.
-                self.win_message = f"Player {self.turn} Has Won!"  # Declare the winner.
-                self.attack_phase = False  # End the attack phase.
-                self.game_end_phase = True  # Set phase to game end 
-                return 
-
-            if res and self.turn == 1:
-                self.turn = 2  # Switch turns if Player 1 attacked.
-            elif res and self.turn == 2:
-                self.turn = 1  # Switch turns if Player 2 attacked.
+            Renderer.draw_board(self.current_enemy().board, True, hints=self.current_hints(), heatmap=self.heatmap)  # Draw the enemy player's board (with hints and heatmap if enabled).
 
     def show_game_end_phase(self): 
+        self.save_replay()  # Keep the finished game in the replay archive when recording.
         losing_player = self.enemy_lookup_table[self.turn]
         Renderer.draw_board(losing_player.board, True)
 
@@ -176,26 +276,36 @@ class Game:
         Draws informational messages below the game board.
         '''
         turn_message_color = BLUE if self.turn == 1 else GREEN
-        Renderer.draw_font_text(self.message, BOARD_PADDING_LEFT, 34, 22, turn_message_color) # draw turn-based message
-        Renderer.draw_font_text(self.title, 70, 225, 30, BLACK)  # Draw the main message.
-        Renderer.draw_font_text(self.win_message, 235, 370, 30, turn_message_color) # Draw the win message.
-        Renderer.draw_font_text(self.last_move_message, BOARD_PADDING_LEFT, 370, 20, RED)  # Draw the last move message.
-        Renderer.draw_font_text(self.secondary_message, BOARD_PADDING_LEFT, 395, 20, turn_message_color)  # Draw any secondary messages.
-        Renderer.draw_font_text(self.color_info, 10, 10, 15, BLACK)  # Draw the ship color legend/info.
+        # Every message is drawn through the retained HUD, so text is only rasterized again when it changes.
+        Hud.draw_text("message", self.message, BOARD_PADDING_LEFT, 34, 22, turn_message_color) # draw turn-based message
+        Hud.draw_text("title", self.title, 70, 225, 30, BLACK)  # Draw the main message.
+        Hud.draw_text("win_message", self.win_message, 235, 370, 30, turn_message_color) # Draw the win message.
+        Hud.draw_text("last_move_message", self.last_move_message, BOARD_PADDING_LEFT, 370, 20, RED)  # Draw the last move message.
+        Hud.draw_text("secondary_message", self.secondary_message, BOARD_PADDING_LEFT, 395, 20, turn_message_color)  # Draw any secondary messages.
+        Hud.draw_text("color_info", self.color_info, 10, 10, 15, BLACK)  # Draw the ship color legend/info.
+        if self.attack_phase and self.show_hints and not self.show_own_board:
+            Hud.draw_text("hint_message", self.hint_message, 490, BOARD_PADDING_TOP, 15, BLACK)  # Draw the hint summary right of the board.
+        if self.heatmap_kind is not None and (self.place_ship_phase or self.attack_phase):
+            Hud.draw_text("heatmap_message", self.heatmap_message, 490, BOARD_PADDING_TOP + 45, 15, BLACK)  # Draw the heatmap summary below the hints.
         if self.place_ship_phase: 
-            Renderer.draw_remaining_ships_to_place(self.player_lookup_table[self.turn])
+            Hud.draw_remaining_ships(self.player_lookup_table[self.turn], 10, 130)
 
     def game_loop(self):
         '''
-        The main game loop. This function is continuously called to update the game state.
+        The main game loop. This function is called once per tick: it applies the queued input, then draws the current state.
         '''
-        self.draw_info_messages()  # Draw the game messages.
-        if self.menu_phase:
-            self.show_menu()  # Show the menu phase.
-        elif self.place_ship_phase:
-            self.show_place_ship_phase()  # Show the ship placement phase.
+        with Profiler.section("input"):
+            self.handle_events()  # Apply this tick's input before the frame is drawn.
+        with Profiler.section("messages"):
+            self.draw_info_messages()  # Draw the game messages.
+        # Each phase is timed in its own profiler section.
+        if self.place_ship_phase:
+            with Profiler.section("place_ship"):
+                self.show_place_ship_phase()  # Show the ship placement phase.
         elif self.attack_phase:
-            self.show_attack_phase()  # Show the attack phase.
+            with Profiler.section("attack"):
+                self.show_attack_phase()  # Show the attack phase.
         elif self.game_end_phase: 
-            self.show_game_end_phase()
+            with Profiler.section("game_end"):
+                self.show_game_end_phase()
 
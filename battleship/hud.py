@@ -0,0 +1,87 @@
+# Filename: hud.py
+# Description: This module defines the Hud class, a retained layer for the game's text and side panels. Each HUD element is rasterized once into a render texture and only re-rendered when its content changes.
+# Inputs: The messages and remaining ships to show each frame
+# Output: HUD elements drawn with one texture draw call each
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+from pyray import *  # Importing all the necessary functions from the pyray module, used for rendering.
+from .renderer import Renderer  # The Renderer owns the drawing routines for HUD contents.
+from .fonts import FontManager  # The FontManager provides the font used to measure text.
+
+class Hud:
+    # Only one HUD, so we make the methods static
+    layers = {}  # slot name is the key, (content key, RenderTexture) is the value
+
+    @staticmethod
+    def color_key(color):
+        '''
+        Returns a hashable (r, g, b, a) tuple for a pyray color (tuple or Color struct).
+        '''
+        if isinstance(color, tuple):
+            return color
+        return (color.r, color.g, color.b, color.a)
+
+    @staticmethod
+    def draw_layer(slot, key, measure, draw_contents, posX, posY):
+        '''
+        Draws a cached HUD layer, re-rendering it only if its content key changed.
+        Args:
+            slot: Name of the HUD element (one texture per slot).
+            key: Hashable description of the content; a new key means the texture is redrawn.
+            measure: Function returning the (width, height) of the element, only called when re-rendering.
+            draw_contents: Function that draws the element with its top-left corner at (0, 0).
+            posX, posY: Where the element is drawn on screen.
+        '''
+        layer = Hud.layers.get(slot)
+        if layer is None or layer[0] != key:
+            if layer is not None:
+                unload_render_texture(layer[1])  # Free the texture of the old content.
+            width, height = measure()
+            texture = load_render_texture(max(int(width), 1), max(int(height), 1))
+            begin_texture_mode(texture)
+            clear_background(WHITE)  # Same background as the window, so text edges blend the same way.
+            draw_contents()
+            end_texture_mode()
+            layer = (key, texture)
+            Hud.layers[slot] = layer
+
+        texture = layer[1].texture
+        # Render textures are stored upside down, so the source rectangle uses a negative height.
+        draw_texture_rec(texture, Rectangle(0, 0, texture.width, -texture.height), Vector2(posX, posY), WHITE)
+
+    @staticmethod
+    def draw_text(slot, text, posX, posY, fontSize, color):
+        '''
+        Draws a text message through a cached layer, like Renderer.draw_font_text.
+        Empty messages draw nothing.
+        '''
+        if not text:
+            return
+
+        def measure():
+            font = FontManager.get(fontSize)
+            spacing = 0  # draw_font_text draws Roboto without extra spacing ...
+            if font is None:
+                font = get_font_default()
+                spacing = fontSize / 10  # ... and draw_text uses fontSize / 10 with the default font.
+            size = measure_text_ex(font, text, fontSize, spacing)
+            return size.x + 1, size.y + 1
+
+        key = (text, fontSize, Hud.color_key(color))
+        Hud.draw_layer(slot, key, measure, lambda: Renderer.draw_font_text(text, 0, 0, fontSize, color), posX, posY)
+
+    @staticmethod
+    def draw_remaining_ships(player, posX, posY):
+        '''
+        Draws the panel of ships the player still has to place, re-rendering it only when that list changes.
+        '''
+        def measure():
+            longest = max((player.ship_sizes[ship] for ship in player.ships), default=0)
+            width = max(131, min(longest, Renderer.SHIP_CELLS_SHOWN) * 22 + (40 if longest > Renderer.SHIP_CELLS_SHOWN else 0))  # Wide enough for the underline and the longest ship (and its size).
+            height = 50 + min(len(player.ships), Renderer.SHIPS_SHOWN) * 25  # Label and underline, then one row per ship shown.
+            return width, height
+
+        key = (player.num, tuple(player.ships))
+        Hud.draw_layer("remaining_ships", key, measure, lambda: Renderer.draw_remaining_ships_to_place(player, 0, 0), posX, posY)
@@ -11,6 +11,8 @@ from .board import Orientation
 from .constants import *  # Importing all constants like HIT_CELL and MISS_CELL used for game logic.
 
 class Player:
+    board_class = Board  # Board backend used for the player's board (subclasses may swap it).
+
     def __init__(self, num):
         """
         Initializes a new Player object.
@@ -21,55 +23,81 @@ class Player:
         - The ships_placed flag indicates whether all ships have been placed.
         """
         self.num = num  # The player number is stored in the instance variable.
-        self.ships = []  # Empty list to hold the player's ships.
-        self.ship_count = {} # size of ship is the key, num of cells left of ship is the value 
-        self.ship_hits = {} # size of ship is the key, (coordinate is the value) , we use this to store ship locations that have been hit 
+        self.ships = []  # Empty list to hold the ids of the ships still to place.
+        self.ship_sizes = {} # ship id is the key, size of the ship is the value
+        self.ship_count = {} # ship id is the key, num of cells left of ship is the value 
+        self.ship_hits = {} # ship id is the key, (coordinate is the value) , we use this to store ship locations that have been hit 
+        self.ship_cells = {} # ship id is the key, frozenset of the (i, j) cells the placed ship covers is the value
+        self.ship_index = {} # (i, j) cell is the key, id of the ship placed on it is the value
         self.num_ship_cells = 0  # Total number of cells occupied by ships, initialized to 0.
-        self.board = Board()  # Initializes a new Board instance for the player.
+        self.board = self.board_class()  # Initializes a new Board instance for the player.
         self.ships_placed = False  # Indicates if ships have been placed, initialized to False.
 
-    def get_ships(self, num):
+    def get_ships(self, fleet):
         """
         Generates ships for the player.
-        - num: The number of ships to create.
-        - The ships list contains ships from size 1 up to 'num'.
+        - fleet: The number of ships to create (sizes 1 up to 'fleet'), or the list of ship sizes to play with.
+          Sizes may repeat, like the classic 5-4-3-3-2 fleet.
+        - Every ship gets an id from 1 up, the smallest ship first, so with sizes 1 up to 'num' the id is the size.
+        - The ships list contains the ship ids; the last one is placed first.
         - Also calculates the total number of ship cells.
         """
-        self.ships = [i for i in range(1, num + 1)]  # Create ships with sizes from 1 to 'num'.
-        self.num_ship_cells = sum(self.ships)  # Calculate total number of cells that the ships occupy.
-
-        for i in range(1, num+1): 
-            self.ship_count[i] = i # sets the ship count for ship to how large it is 
-            self.ship_hits[i] = [] # initializes an empty list for ship hits for size i 
-
-    def place_ship(self, i, j, ship_size, orientation = Orientation.HORIZONTAL):
+        sizes = range(1, fleet + 1) if isinstance(fleet, int) else sorted(fleet)  # Ship sizes from smallest to largest.
+        self.ships = [i for i in range(1, len(sizes) + 1)]  # Create ship ids from 1 to the number of ships.
+        self.num_ship_cells = sum(sizes)  # Calculate total number of cells that the ships occupy.
+        self.ship_sizes = {}
+        self.ship_count = {}
+        self.ship_hits = {}
+        self.ship_cells = {}  # Filled in as the ships are placed.
+        self.ship_index = {}
+
+        for ship, ship_size in zip(self.ships, sizes): 
+            self.ship_sizes[ship] = ship_size # remembers how large the ship is
+            self.ship_count[ship] = ship_size # sets the ship count for ship to how large it is 
+            self.ship_hits[ship] = [] # initializes an empty list for ship hits for the ship
+
+    def place_ship(self, i, j, ship, orientation = Orientation.HORIZONTAL):
         '''
         Places a ship on the player's board.
         - i: Row index where the ship starts.
         - j: Column index where the ship starts.
-        - ship_size: The size of the ship to place.
+        - ship: The id of the ship to place; its size comes from ship_sizes.
         - Returns True if the ship is successfully placed, False otherwise.
         '''
+        ship_size = self.ship_sizes[ship]
         if self.board.is_placeable_on(i, j, ship_size, orientation):  # Check if the ship can be placed at (i, j).
             stepX = orientation == Orientation.HORIZONTAL # X step is 1 if horizontal, 0 otherwise.
             stepY = orientation == Orientation.VERTICAL   # Y step is 1 if vertical  , 0 otherwise.
 
             # Place the ship by marking the cells occupied by the ship on the board.
+            cells = []
             for pos in range(ship_size):
                 setX = j + pos * stepX # Calculate the X position to set.
                 setY = i + pos * stepY # Calculate the Y position to set.
-                self.board.cells[setY][setX] = ship_size  # Mark the cells with the ship size.
+                self.board.cells[setY][setX] = ship  # Mark the cells with the ship id.
+                self.board.dirty_cells.add((setY, setX))  # The renderer must redraw the ship cell.
+                self.ship_index[(setY, setX)] = ship  # Lets an attack find the ship in O(1).
+                cells.append((setY, setX))
+            self.ship_cells[ship] = frozenset(cells)
+            self.board.invalidate_placement_masks()  # Cached placement masks no longer match the board.
             return True  # Ship placement was successful.
         return False  # Ship placement failed.
 
-    def change_cells_to_sunk(self, sunk_ship_size): 
+    def ship_at(self, i, j):
+        '''
+        Returns the id of the ship placed on cell (i, j), hit or not, or 0 if there is none.
+        '''
+        return self.ship_index.get((i, j), 0)
+
+    def change_cells_to_sunk(self, sunk_ship): 
         '''
         Changes the ship cells that now should be sunk to a SUNK_CELL
-        - sunk_ship_size: the size of the ship that was sunk
+        - sunk_ship: the id of the ship that was sunk
         '''
-        # loop over ship_hits dict to make the sunk ship a sunk cell 
-        for i, j in self.ship_hits[sunk_ship_size]: 
+        # loop over the cells of the sunk ship to make them sunk cells 
+        for i, j in self.ship_cells[sunk_ship]: 
             self.board.cells[i][j] = SUNK_CELL
+            self.board.dirty_cells.add((i, j))  # The renderer must redraw the sunk cell.
 
 
 
@@ -78,33 +106,35 @@ class Player:
         Places an attack on the player's board.
         - i: Row index where the attack occurs.
         - j: Column index where the attack occurs.
-        - Returns True if the attack hits a ship, False otherwise. Also returns ship_size if hit 
+        - Returns True if the attack hits a ship, False otherwise. Also returns the id of the ship if hit 
         '''
         # if this cell has already been interacted with we need to inform the game not to change turns 
         if self.board.cells[i][j] == SUNK_CELL or self.board.cells[i][j] == HIT_CELL or self.board.cells[i][j] == MISS_CELL: 
             return False, MISS_CELL # return False and tell game that the user needs to choose another valid cell 
 
 
-        if self.board.is_ship(i, j):  # Check if there is a ship at (i, j).
+        ship = self.ship_index.get((i, j))  # The ship on (i, j), if any.
+        if ship is not None:
             # Attack hits a ship, mark the cell as a hit.
 
             # update player ships status 
-            ship_size = self.board.cells[i][j]
-            self.ship_count[ship_size] -= 1  # decrease the count of the ship that was hit 
+            self.ship_count[ship] -= 1  # decrease the count of the ship that was hit 
             self.num_ship_cells -= 1  # Decrease the count of ship cells after a hit.
-            self.ship_hits[ship_size].append((i, j)) 
+            self.ship_hits[ship].append((i, j)) 
 
             # now we can change the board 
             # if the attack sunk a ship we put it as a sunk cell 
-            if self.ship_count[ship_size] == 0: 
-                self.change_cells_to_sunk(ship_size)
+            if self.ship_count[ship] == 0: 
+                self.change_cells_to_sunk(ship)
             else: 
                 self.board.cells[i][j] = HIT_CELL  # Mark the cell with HIT_CELL constant.
+                self.board.dirty_cells.add((i, j))  # The renderer must redraw the hit cell.
 
-            return True, ship_size  # Attack was a hit.
+            return True, ship  # Attack was a hit.
         else:
             # Attack misses, mark the cell as a miss.
             self.board.cells[i][j] = MISS_CELL  # Mark the cell with MISS_CELL constant.
+            self.board.dirty_cells.add((i, j))  # The renderer must redraw the missed cell.
             return False, EMPTY_CELL  # Attack was a miss and previous cell was an empty cell.
 
     def is_loss(self):
@@ -114,3 +144,34 @@ class Player:
         - Returns True if the player has lost, False otherwise.
         """
         return self.num_ship_cells <= 0  # If no ship cells remain, the player has lost.
+
+    def copy_state(self):
+        """
+        Returns a copy of everything place_ship and place_attack change, for load_state (used by replay snapshots).
+        - Nothing in the copy is shared with the player, so later moves do not change it.
+        """
+        return (
+            self.board.copy_cells(),
+            dict(self.ship_count),
+            {ship: list(hits) for ship, hits in self.ship_hits.items()},
+            dict(self.ship_cells),  # The cell sets are frozensets, so they can be shared.
+            dict(self.ship_index),
+            self.num_ship_cells,
+            list(self.ships),
+            self.ships_placed,
+        )
+
+    def load_state(self, state):
+        """
+        Puts a copy of a state from copy_state into the player, whose board must be new and of the same size.
+        - Nothing is placed or attacked again, so loading costs one copy of the state.
+        """
+        cells, ship_count, ship_hits, ship_cells, ship_index, num_ship_cells, ships, ships_placed = state
+        self.board.load_cells(cells)
+        self.ship_count = dict(ship_count)
+        self.ship_hits = {ship: list(hits) for ship, hits in ship_hits.items()}
+        self.ship_cells = dict(ship_cells)
+        self.ship_index = dict(ship_index)
+        self.num_ship_cells = num_ship_cells
+        self.ships = list(ships)
+        self.ships_placed = ships_placed
@@ -0,0 +1,273 @@
+# Filename: profiler.py
+# Description: This module defines the Profiler class, built-in frame instrumentation for the game. It records per-phase and per-renderer-call timings and draw-call counts for every frame, shows percentiles of the work done per frame (update and draw, without the buffer swap and the idle wait for input) in a toggleable overlay (F3), and exports the recent frames as a trace file (F4).
+# Inputs: Timed sections opened by the game loop and by the instrumented Renderer/Hud methods; F3 and F4 key presses
+# Output: The profiler overlay and trace files (Chrome trace event JSON, open with chrome://tracing or Perfetto) in the repository's traces directory
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+from pyray import *  # Importing all the necessary functions from the pyray module, used for the overlay and key input.
+from collections import deque  # Fixed-size histories of the most recent frames.
+import json  # Writing trace files.
+import os  # Creating the trace directory.
+import time  # High resolution timer.
+from .constants import WINDOW_WIDTH  # The overlay is drawn in the top-right corner of the window.
+
+# pyray functions that each issue at least one draw call.
+DRAW_FUNCTIONS = (
+    "clear_background", "draw_text", "draw_text_ex", "draw_line", "draw_rectangle", "draw_rectangle_lines",
+    "draw_rectangle_lines_ex", "draw_texture_rec", "draw_rectangle_rec",
+)
+
+class Section:
+    def __init__(self, name):
+        '''
+        A named timed section, used with "with". One instance is shared by every use of the name.
+        '''
+        self.name = name
+
+    def __enter__(self):
+        Profiler.stack.append((time.perf_counter_ns(), Profiler.draw_calls))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = time.perf_counter_ns()
+        start, draw_calls = Profiler.stack.pop()
+        Profiler.record(self.name, start, end - start, Profiler.draw_calls - draw_calls, len(Profiler.stack))
+        return False  # Never swallow exceptions.
+
+class Profiler:
+    # Only one profiler, so we make the methods static
+    HISTORY = 600  # Frames kept for percentiles (10 seconds at 60 FPS).
+    TRACE_EVENTS = 100000  # Most recent timed sections kept for trace export.
+    TRACE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "traces")  # Trace files are written to traces/ in the repository, from any working directory.
+    STATS_INTERVAL = 30  # Frames between overlay statistics updates, so sorting does not cost every frame.
+    OVERLAY_FONT_SIZE = 10  # Font size of the overlay text.
+    # Sections that mostly wait (buffer swap, frame limiter, sleeping until input with event waiting on).
+    # They are reported apart from the work sections, since an idle window makes them as long as the user is idle.
+    WAIT_SECTIONS = ("end_drawing",)
+
+    # Methods of the render classes that get timed sections, by class name.
+    INSTRUMENTED = {
+        "Renderer": ("draw_board", "get_board_texture", "draw_board_view", "draw_view_labels", "draw_ship_placement_hover", "draw_hint_overlay", "draw_font_text"),
+        "Hud": ("draw_text", "draw_remaining_ships"),
+    }
+
+    installed = False  # True once the render classes and modules are instrumented.
+    show_overlay = False  # Toggled with F3.
+    sections = {}  # section name is the key, shared Section is the value
+    stack = []  # (start time, draw calls) of every open section, innermost last
+    draw_calls = 0  # Draw calls since the program started.
+    frame_start = None  # perf_counter_ns at the start of the current frame.
+    frame_draw_calls = 0  # Draw calls at the start of the current frame.
+    frame_totals = {}  # section name is the key, [time in ns, calls, draw calls] during the current frame is the value
+    frame_times = deque(maxlen=HISTORY)  # Work time of each recent frame, from begin_frame to end_frame (update and draw), in ns.
+    frame_draws = deque(maxlen=HISTORY)  # Draw calls of each recent frame.
+    history = {}  # section name is the key, deque of per-frame (time in ns, calls, draw calls) is the value
+    trace = deque(maxlen=TRACE_EVENTS)  # (name, start ns, duration ns, depth) of recent sections.
+    overlay_lines = []  # Text of the overlay, refreshed every STATS_INTERVAL frames.
+    frames = 0  # Frames since the program started.
+    last_export = ""  # Path of the last exported trace, shown in the overlay.
+
+    @staticmethod
+    def section(name):
+        '''
+        Returns the timed section for a name, to use as "with Profiler.section(name):".
+        '''
+        section = Profiler.sections.get(name)
+        if section is None:
+            section = Profiler.sections[name] = Section(name)
+        return section
+
+    @staticmethod
+    def record(name, start, duration, draw_calls, depth):
+        '''
+        Adds a finished section to the current frame totals and to the trace.
+        '''
+        totals = Profiler.frame_totals.get(name)
+        if totals is None:
+            totals = Profiler.frame_totals[name] = [0, 0, 0]
+        totals[0] += duration
+        totals[1] += 1
+        totals[2] += draw_calls
+        Profiler.trace.append((name, start, duration, depth))
+
+    @staticmethod
+    def timed(name, function):
+        '''
+        Returns a version of a function that runs inside the timed section for name.
+        '''
+        section = Profiler.section(name)
+        def timed_function(*args, **kwargs):
+            with section:
+                return function(*args, **kwargs)
+        timed_function.__wrapped__ = function
+        return timed_function
+
+    @staticmethod
+    def counted(function):
+        '''
+        Returns a version of a pyray draw function that counts its calls.
+        '''
+        def counted_function(*args, **kwargs):
+            Profiler.draw_calls += 1
+            return function(*args, **kwargs)
+        counted_function.__wrapped__ = function
+        return counted_function
+
+    @staticmethod
+    def install():
+        '''
+        Instruments the render classes and the pyray draw functions they use. Safe to call more than once.
+        '''
+        if Profiler.installed:
+            return
+        from . import renderer, hud, game  # Imported here because the renderer itself imports the profiler.
+
+        for cls in (renderer.Renderer, hud.Hud):
+            for name in Profiler.INSTRUMENTED[cls.__name__]:
+                setattr(cls, name, staticmethod(Profiler.timed(f"{cls.__name__}.{name}", getattr(cls, name))))
+
+        # The modules use "from pyray import *", so the draw functions are module globals we can wrap.
+        for module in (renderer, hud, game):
+            for name in DRAW_FUNCTIONS:
+                if name in vars(module):
+                    setattr(module, name, Profiler.counted(getattr(module, name)))
+        Profiler.installed = True
+
+    @staticmethod
+    def begin_frame():
+        '''
+        Starts a new frame: stores the totals of the previous frame and handles the profiler keys.
+        '''
+        now = time.perf_counter_ns()
+        if Profiler.frame_start is not None:
+            for name, totals in Profiler.frame_totals.items():
+                samples = Profiler.history.get(name)
+                if samples is None:
+                    samples = Profiler.history[name] = deque(maxlen=Profiler.HISTORY)
+                samples.append(tuple(totals))
+            Profiler.frame_totals = {}
+            Profiler.frames += 1
+            if Profiler.frames % Profiler.STATS_INTERVAL == 0 and Profiler.show_overlay:
+                Profiler.update_overlay()
+        Profiler.trace.append(("frame", now, 0, -1))  # Frame boundary marker.
+        Profiler.frame_start = now
+        Profiler.frame_draw_calls = Profiler.draw_calls
+
+        # is_key_pressed does not consume the key queue, so the game still sees every key through get_key_pressed.
+        if is_key_pressed(KeyboardKey.KEY_F3):
+            Profiler.show_overlay = not Profiler.show_overlay
+            Profiler.update_overlay()
+        if is_key_pressed(KeyboardKey.KEY_F4):
+            Profiler.export_trace()
+            Profiler.update_overlay()
+
+    @staticmethod
+    def end_frame():
+        '''
+        Ends the work of the current frame (called right before end_drawing), so the frame time leaves out
+        the buffer swap and any wait for the next tick or input event.
+        '''
+        if Profiler.frame_start is not None:
+            Profiler.frame_times.append(time.perf_counter_ns() - Profiler.frame_start)
+            Profiler.frame_draws.append(Profiler.draw_calls - Profiler.frame_draw_calls)
+
+    @staticmethod
+    def percentiles(values, points=(50, 95, 99)):
+        '''
+        Returns the nearest-rank percentiles of a list of values.
+        '''
+        if not values:
+            return [0 for _ in points]
+        ordered = sorted(values)
+        return [ordered[min(len(ordered) - 1, (len(ordered) * point) // 100)] for point in points]
+
+    @staticmethod
+    def summary():
+        '''
+        Returns the statistics over the recent frames as a dict: work time per frame and draw-call percentiles,
+        and for every section its time percentiles (per frame, in ms), calls and draw calls per frame.
+        The WAIT_SECTIONS are under "wait" instead of "sections".
+        '''
+        frames = len(Profiler.frame_times)
+        p50, p95, p99 = Profiler.percentiles(Profiler.frame_times)
+        result = {
+            "frames": frames,
+            "frame_ms": {"p50": p50 / 1e6, "p95": p95 / 1e6, "p99": p99 / 1e6},
+            "draw_calls": dict(zip(("p50", "p95", "p99"), Profiler.percentiles(Profiler.frame_draws))),
+            "sections": {},
+            "wait": {},
+        }
+        for name, samples in Profiler.history.items():
+            # Frames where a section did not run count as zero, so percentiles are per frame.
+            times = [sample[0] for sample in samples] + [0] * max(0, frames - len(samples))
+            p50, p95, p99 = Profiler.percentiles(times)
+            result["wait" if name in Profiler.WAIT_SECTIONS else "sections"][name] = {
+                "p50_ms": p50 / 1e6, "p95_ms": p95 / 1e6, "p99_ms": p99 / 1e6,
+                "calls_per_frame": sum(sample[1] for sample in samples) / max(frames, 1),
+                "draw_calls_per_frame": sum(sample[2] for sample in samples) / max(frames, 1),
+            }
+        return result
+
+    @staticmethod
+    def update_overlay():
+        '''
+        Recomputes the overlay text from the recent frames.
+        '''
+        stats = Profiler.summary()
+        frame = stats["frame_ms"]
+        draws = stats["draw_calls"]
+        lines = [
+            f"work ms p50 {frame['p50']:.2f}  p95 {frame['p95']:.2f}  p99 {frame['p99']:.2f}  (update + draw)",
+            f"draw calls p50 {draws['p50']}  p95 {draws['p95']}  p99 {draws['p99']}",
+            "section                  p50    p95    p99  draws",
+        ]
+        ordered = sorted(stats["sections"].items(), key=lambda item: -item[1]["p95_ms"])  # Most expensive first.
+        for name, section in ordered:
+            label = name.rsplit(".", 1)[-1][:24]  # Method names are unique enough without the class name.
+            lines.append(f"{label:<24} {section['p50_ms']:5.2f}  {section['p95_ms']:5.2f}  {section['p99_ms']:5.2f}  {section['draw_calls_per_frame']:5.1f}")
+        for name, section in stats["wait"].items():
+            lines.append(f"{name} (swap + wait, not work) p50 {section['p50_ms']:.2f}")
+        lines.append("F3 hide  F4 export trace" + (f"  ({Profiler.last_export})" if Profiler.last_export else ""))
+        Profiler.overlay_lines = lines
+
+    @staticmethod
+    def draw_overlay():
+        '''
+        Draws the overlay over the game when it is enabled. Its own draw calls are not counted.
+        '''
+        if not Profiler.show_overlay:
+            return
+        line_height = Profiler.OVERLAY_FONT_SIZE + 2
+        width = 340
+        height = len(Profiler.overlay_lines) * line_height + 8
+        left = WINDOW_WIDTH - width - 5
+        draw_rectangle(left, 5, width, height, Color(0, 0, 0, 190))
+        for k, line in enumerate(Profiler.overlay_lines):
+            draw_text(line, left + 4, 9 + k * line_height, Profiler.OVERLAY_FONT_SIZE, WHITE)
+
+    @staticmethod
+    def export_trace(path=None):
+        '''
+        Writes the recorded sections as a Chrome trace event file.
+        Returns:
+            The path of the written file, or None if it could not be written.
+        '''
+        if path is None:
+            path = os.path.join(Profiler.TRACE_DIR, time.strftime("trace_%Y%m%d_%H%M%S.json"))
+        events = []
+        origin = Profiler.trace[0][1] if Profiler.trace else 0
+        for name, start, duration, depth in Profiler.trace:
+            if depth < 0:
+                events.append({"name": name, "ph": "i", "s": "g", "ts": (start - origin) / 1e3, "pid": 0, "tid": 0})
+            else:
+                events.append({"name": name, "ph": "X", "ts": (start - origin) / 1e3, "dur": duration / 1e3, "pid": 0, "tid": 0})
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w") as file:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms", "otherData": Profiler.summary()}, file)
+        except OSError:
+            return None
+        Profiler.last_export = path
+        return path
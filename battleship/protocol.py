@@ -0,0 +1,69 @@
+# Filename: protocol.py
+# Description: This module defines the network protocol shared by the match server, the network client and spectators. Every message is a fixed-width 6 byte record, so both sides can split a stream into messages without any parsing.
+# Inputs: None
+# Output: Message types and the functions to pack and read messages
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import struct  # Packing messages into fixed-width records.
+from . import constants  # Cell values that spectators may see.
+
+DEFAULT_HOST = "127.0.0.1"  # The server only listens on localhost unless told otherwise.
+DEFAULT_PORT = 5810  # Default TCP port of the match server.
+
+# One message: type, a small argument, row, column.
+MESSAGE = struct.Struct("<BBHH")
+MESSAGE_SIZE = MESSAGE.size
+
+# Client to server messages.
+JOIN = 1  # arg: number of ships. Asks to be matched with another player who chose the same number.
+PLACE = 2  # arg: ship id, plus 128 if vertical; i, j: where the ship starts.
+ATTACK = 3  # i, j: the attacked cell.
+WATCH = 4  # i: id of the match to watch, or 0 for the newest running match. Asks to spectate instead of playing.
+
+# Server to client messages.
+START = 16  # arg: your player number; i: number of ships. Both players now place their ships.
+PLACED = 17  # arg, i, j: as in PLACE. The placement was accepted.
+REJECTED = 18  # arg: the type of the rejected message.
+ATTACK_START = 19  # arg: the player who attacks first. Both fleets are placed.
+SHOT = 20  # arg: attacking player, plus the result (replay RESULT_*) shifted left by 2, plus the id of a sunk ship shifted left by 4; i, j: the attacked cell.
+SUNK_CELL = 21  # arg: player whose ship sank; i, j: one cell of that ship. Sent after a sinking SHOT.
+GAME_OVER = 22  # arg: the winning player.
+OPPONENT_LEFT = 23  # The other player disconnected; the match is over.
+
+# Server to spectator messages. Spectators also get ATTACK_START, GAME_OVER and OPPONENT_LEFT.
+# A spectator only ever sees what both attackers see: hits, misses and sunk ships, never a ship that was not sunk.
+WATCHING = 24  # arg: number of ships; i: id of the match being watched.
+KEYFRAME = 25  # arg: player to attack next, plus the ATTACK_FLAG and OVER_FLAG; i: number of CELL messages following; j: move number.
+               # Both boards are cleared and then hold exactly the following cells.
+DELTA = 26  # arg: player to attack next; i: number of CELL messages following; j: move number (one more than the last one).
+            # The following cells changed in this move.
+CELL = 27  # arg: player whose board the cell is on, plus the visible state (index in VISIBLE_CELLS) shifted left by 2; i, j: the cell.
+
+VERTICAL_FLAG = 128  # Added to the ship id in PLACE and PLACED for vertical ships.
+# A match has one ship of each size 1..number of ships, so Player.get_ships gives each ship its size as its id.
+ATTACK_FLAG = 4  # Added to the KEYFRAME player when the attack phase has started.
+OVER_FLAG = 8  # Added to the KEYFRAME player when the match is over.
+VISIBLE_CELLS = (constants.HIT_CELL, constants.MISS_CELL, constants.SUNK_CELL)  # Cell values a spectator can see, by CELL state.
+VISIBLE_STATES = {value: state for state, value in enumerate(VISIBLE_CELLS)}  # cell value is the key, CELL state is the value
+
+def pack(kind, arg=0, i=0, j=0):
+    '''
+    Returns one message as bytes.
+    '''
+    return MESSAGE.pack(kind, arg, i, j)
+
+def split(buffer):
+    '''
+    Reads every complete message from the start of a bytearray and removes them from it.
+    Returns:
+        A list of (type, arg, i, j) tuples.
+    '''
+    complete = len(buffer) - len(buffer) % MESSAGE_SIZE
+    if not complete:
+        return []
+    with memoryview(buffer) as view:  # Released before the buffer is resized.
+        messages = list(MESSAGE.iter_unpack(view[:complete]))
+    del buffer[:complete]
+    return messages
@@ -9,23 +9,35 @@
 from pyray import *  # Importing all the necessary functions from the pyray module, used for rendering.
 from .constants import *  # Importing all the constants needed for game logic like cell size, colors, etc.
 from .board import Orientation # Importing Orientation enum for ship handling.
+from .fonts import FontManager # Importing the FontManager that provides the Roboto font at each UI size.
+from .profiler import Profiler # Importing the Profiler that times each frame.
+from .viewport import Viewport # Importing the pan/zoom camera used for boards too large for the board area.
 import random  # importing the random module  for ship colors
+import math  # importing the math module for rounding the visible label range
 
 class Renderer:
     # Only one renderer, so we make the methods static
-    font = None
+    board_textures = {}  # id(board) is the key, (board, {is_other_player: RenderTexture}) is the value, least recently drawn first
+    BOARD_TEXTURE_SLOTS = 2  # Boards whose textures are kept (both players' boards); drawing a new board frees the oldest.
+    BOARD_LABEL_MARGIN = 20  # Space in pixels left of and above the board for the row/column labels.
+    viewport = Viewport()  # Pan/zoom state of the board area, shared by every board drawn in it.
+    GRID_MIN_CELL_SIZE = 6  # Zoomed out further than this many pixels per cell, only the board outline is drawn.
+    SHIPS_SHOWN = 8  # Most ships listed in the remaining ships panel (the next ones to place).
+    SHIP_CELLS_SHOWN = 6  # Longer ships are drawn with this many cells and their size.
+    TICK_RATE = 60  # Most logic ticks (and frames) per second.
     @staticmethod
     def draw_font_text(text, posX, posY, fontSize, color):
         '''
-        Draw text using the font stored in the static font variable.
-        - Usually, this will be set to Roboto.
+        Draw text using the font baked for this text size by the FontManager.
+        - Usually, this will be Roboto.
         - In the case of font failure, fallback to default.
         '''
-        if Renderer.font is None: # If the default font is not set
+        font = FontManager.get(fontSize) # Get the Roboto font baked closest to this size.
+        if font is None: # If the font failed to load
             draw_text(text, posX, posY, fontSize, color) # Use the pyray default font.
             return # Return early since font failed
         
-        draw_text_ex(Renderer.font, text, (posX, posY), fontSize, 0, color) # Draw text using custom default font
+        draw_text_ex(font, text, (posX, posY), fontSize, 0, color) # Draw text using custom default font
 
     @staticmethod
     def get_mouse_board_coordinates():
@@ -36,100 +48,307 @@ class Renderer:
         Returns: A tuple (i, j) representing the row and column indices of the board.
         '''
         pos = get_mouse_position()  # Get the mouse position from pyray.
-        pos.x -= BOARD_PADDING_LEFT  # Adjust the x-coordinate based on the board's position.
-        pos.y -= BOARD_PADDING_TOP   # Adjust the y-coordinate based on the board's position.
-        i = int(pos.y // CELL_SIZE)  # Convert the y-coordinate into a row index.
-        j = int(pos.x // CELL_SIZE)  # Convert the x-coordinate into a column index.
+        return Renderer.viewport.cell_at(pos.x, pos.y)  # The viewport maps the position to a cell, (-1, -1) off the board.
 
-        return (i, j)  # Return the row and column indices as a tuple.
+    @staticmethod
+    def row_label(i):
+        '''
+        Returns the letters labelling row i: A..Z, then AA, AB, ... like spreadsheet columns, so every row of a large board has one.
+        '''
+        label = ""
+        i += 1
+        while i:
+            i, letter = divmod(i - 1, 26)
+            label = chr(ASCII_A + letter).upper() + label
+        return label
+
+    @staticmethod
+    def cell_rectangle(i, j, inset):
+        '''
+        Returns the window Rectangle of cell (i, j) in the current viewport, shrunk by inset pixels (at CELL_SIZE) on every side.
+        '''
+        view = Renderer.viewport
+        x, y = view.position(i, j)
+        inset = inset * view.cell_size / CELL_SIZE  # Keep the same proportions when zoomed.
+        size = max(view.cell_size - 2 * inset, 1.0)  # Even tiny cells stay one pixel wide.
+        return Rectangle(x + inset, y + inset, size, size)
 
     @staticmethod
-    def draw_remaining_ships_to_place(player): 
+    def draw_remaining_ships_to_place(player, left = 10, top = 130): 
         '''
         Draws the  ships the player has left to place in the info margins 
+        - left, top: top-left corner of the panel (the HUD draws it into its own texture at (0, 0)).
         '''
         cell_ship_size = 20
-        draw_text_ex(Renderer.font, f"Player{player.num} Ships", Vector2(10, 130), 20, 1.0, Color(0, 200, 255, 255))
-        draw_line(10, 150, 140, 150, BLACK)
-        for i, ship in enumerate(player.ships): # iterate over each ship 
-            for j in range(ship): # draw each ship cell corresponding to its size 
-                ship_color = BLACK 
-                if ship == player.ships[-1]: # if current ship that is drawn is the one to be placed by player 
-                    ship_color = Color(0, 200, 255, 255)  # cyan 
-                    
-
-                draw_rectangle_lines(10 + j * (cell_ship_size  + 2) , 180 + i * 25, cell_ship_size, cell_ship_size, ship_color) # draw cell 
+        font = FontManager.get(20) # Get the Roboto font baked for the panel label.
+        if font is None: # If the font failed to load, fallback to default.
+            draw_text(f"Player{player.num} Ships", left, top, 20, Color(0, 200, 255, 255))
+        else:
+            draw_text_ex(font, f"Player{player.num} Ships", Vector2(left, top), 20, 1.0, Color(0, 200, 255, 255))
+        draw_line(left, top + 20, left + 130, top + 20, BLACK)
+        for i, ship in enumerate(player.ships[-Renderer.SHIPS_SHOWN:]): # iterate over each ship (only the next ones of a large fleet)
+            ship_color = BLACK 
+            if ship == player.ships[-1]: # if current ship that is drawn is the one to be placed by player 
+                ship_color = Color(0, 200, 255, 255)  # cyan 
+            ship_size = player.ship_sizes[ship] # ships are listed by id, the panel shows their size
+            for j in range(min(ship_size, Renderer.SHIP_CELLS_SHOWN)): # draw each ship cell corresponding to its size 
+                draw_rectangle_lines(left + j * (cell_ship_size  + 2) , top + 50 + i * 25, cell_ship_size, cell_ship_size, ship_color) # draw cell 
+            if ship_size > Renderer.SHIP_CELLS_SHOWN: # a long ship gets its size written after the cells
+                Renderer.draw_font_text(str(ship_size), left + Renderer.SHIP_CELLS_SHOWN * (cell_ship_size + 2) + 2, top + 50 + i * 25, 20, ship_color)
 
     @staticmethod 
     def draw_ship_placement_hover(board, ship_length, ship_orientation): 
         # Draw the mouse cursor overlay on the board if it's over a valid cell
         i, j = Renderer.get_mouse_board_coordinates()  # Get the mouse's board coordinates.
+        if not board.is_valid_cell(i, j):  # Only draw the hover when the mouse is over a valid cell.
+            return
+
+        is_ship_placeable = ship_length == 1 or board.placement_mask(ship_length, ship_orientation)[i][j]  # Look up the precomputed legality grid.
+        hover_color = Color(143,188,143, 100)  # Semi-transparent green for a placeable ship.
+        if not is_ship_placeable:  # if it is not a placeable ship but mouse is over a valid cell, draw the hover red
+            hover_color = Color(220, 20, 60, 100)
+
         for k in range(ship_length):
             checkX = j + k * (ship_orientation != Orientation.VERTICAL)
             checkY = i + k * (ship_orientation == Orientation.VERTICAL)
+            if checkX < board.cols and checkY < board.rows:
+                draw_rectangle_rec(Renderer.cell_rectangle(checkY, checkX, 3), hover_color)
 
-            is_ship_placeable = board.is_placeable_on(i, j, ship_length, ship_orientation)
-            if not is_ship_placeable and board.is_valid_cell(i, j) and ship_length != 1:  # if it is not a placeable ship but mouse is over a valid cell, draw the hover red
-                if checkX < board.rows and checkY < board.cols: 
-                    draw_rectangle(BOARD_PADDING_LEFT + checkX * CELL_SIZE + 3, BOARD_PADDING_TOP + checkY * CELL_SIZE + 3, CELL_SIZE - 6, CELL_SIZE - 6, Color(220, 20, 60, 100))
-            elif board.is_valid_cell(i, j):  # Check if the mouse is over a valid cell.
-                # Highlight the cell under the mouse cursor with a semi-transparent yellow overlay.
-                draw_rectangle(BOARD_PADDING_LEFT + checkX * CELL_SIZE + 3, BOARD_PADDING_TOP + checkY * CELL_SIZE + 3, CELL_SIZE - 6, CELL_SIZE - 6, Color(143,188,143, 100))
 
+    @staticmethod
+    def get_cell_color(cell, is_other_player):
+        '''
+        Returns the fill color of a cell based on its state (empty, hit, miss, sunk, or contains a ship).
+        '''
+        # Determine the color of the cell based on its state
+        cell_color = WHITE  # Default cell color is WHITE.
+        if cell == EMPTY_CELL:  # If the cell is empty, set the color to WHITE.
+            cell_color = WHITE
+        elif cell == SUNK_CELL:
+            cell_color = Color(249,182,78, 255)  # yellowish color
+        elif cell == HIT_CELL:  # If the cell has been hit, set the color to RED.
+            cell_color = RED
+        elif cell == MISS_CELL:  # If the attack missed, set the color to GREEN.
+            cell_color = GREEN
+        elif cell > 0:  # If the cell contains part of a ship.
+            # Display ship cells based on whether it's an enemy board.
+            if is_other_player:
+                cell_color = WHITE  # For enemy ships, keep the cell color WHITE (hidden).
+            else:
+                cell_color = GRAY  # For the player's ships, display them in GRAY.
+        return cell_color
 
     @staticmethod
-    def draw_board(board, is_other_player, ship_length = 1, ship_orientation = None):
+    def draw_board_contents(board, is_other_player, left, top):
         '''
-        Draws the game board on the screen.
-        - The visual appearance of each cell depends on its state (empty, hit, miss, or contains a ship).
-        - Cells are rendered differently if the board belongs to the other player (enemy).
-        Args:
-            board: The Board instance representing the player's or enemy's board.
-            is_other_player: Boolean flag indicating if the board being drawn is for the enemy player.
+        Draws the row/column labels and every cell of the board with its top-left cell corner at (left, top).
         '''
         # Iterate over each col in the board
         for i in range(board.cols):
             # Draw the column numbers above the columns of the board
-            Renderer.draw_font_text(str(i + 1), BOARD_PADDING_LEFT + i * CELL_SIZE + 8, BOARD_PADDING_TOP - 20, 20, BLACK)
+            Renderer.draw_font_text(str(i + 1), left + i * CELL_SIZE + 8, top - 20, 20, BLACK)
 
         # Iterate over each row and cell in the board
         for i, row in enumerate(board.cells):
-
-            row_letter = chr(ASCII_A + i).upper() # Get the row letter in uppercase
-            Renderer.draw_font_text(row_letter, BOARD_PADDING_LEFT - 20, BOARD_PADDING_TOP + i * CELL_SIZE + 8, 20, BLACK) # Draw the row letter
+            row_letter = Renderer.row_label(i) # Get the row letter in uppercase
+            Renderer.draw_font_text(row_letter, left - 20, top + i * CELL_SIZE + 8, 20, BLACK) # Draw the row letter
 
             for j, cell in enumerate(row):
-                # Determine the color of the cell based on its state
-                cell_color = WHITE  # Default cell color is BLUE.
-                if cell == EMPTY_CELL:  # If the cell is empty, set the color to BLUE.
-                    cell_color = WHITE
-                elif cell == SUNK_CELL: 
-                    cell_color = Color(249,182,78, 255)  # yellowish color 
-                elif cell == HIT_CELL:  # If the cell has been hit, set the color to RED.
-                    cell_color = RED
-                elif cell == MISS_CELL:  # If the attack missed, set the color to GREEN.
-                    cell_color = GREEN
- 
-                elif cell > 0:  # If the cell contains part of a ship.
-                    # Display ship cells based on whether it's an enemy board.
-                    if is_other_player:
-                        cell_color = WHITE  # For enemy ships, keep the cell color BLUE (hidden).
-                    else:
-                        cell_color = GRAY  # For the player's ships, display them in GRAY.
-
                 # Draw the border and fill the cell with the determined color
-                # draw_rectangle_lines(BOARD_PADDING_LEFT + j * CELL_SIZE, BOARD_PADDING_TOP + i * CELL_SIZE, CELL_SIZE, CELL_SIZE, BLACK)  # Draw the cell border.
-                cell = Rectangle(BOARD_PADDING_LEFT + j * CELL_SIZE, BOARD_PADDING_TOP + i * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-                draw_rectangle_lines_ex(cell, 1.5, BLACK)
-                draw_rectangle(BOARD_PADDING_LEFT + j * CELL_SIZE + 3, BOARD_PADDING_TOP + i * CELL_SIZE + 3, CELL_SIZE - 6, CELL_SIZE - 6, cell_color)  # Fill the cell with the color.
+                cell_rect = Rectangle(left + j * CELL_SIZE, top + i * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+                draw_rectangle_lines_ex(cell_rect, 1.5, BLACK)  # Draw the cell border.
+                Renderer.draw_cell_fill(i, j, cell, is_other_player, left, top)
+
+    @staticmethod
+    def draw_cell_fill(i, j, cell, is_other_player, left, top):
+        '''
+        Fills cell (i, j) with the color for its state. The fill is opaque, so it fully replaces the previous one.
+        '''
+        draw_rectangle(left + j * CELL_SIZE + 3, top + i * CELL_SIZE + 3, CELL_SIZE - 6, CELL_SIZE - 6, Renderer.get_cell_color(cell, is_other_player))  # Fill the cell with the color.
+
+    @staticmethod
+    def free_board_textures(entry):
+        '''
+        Unloads the render textures of a board_textures entry; dropping the entry also releases the board it held.
+        '''
+        for texture in entry[1].values():
+            unload_render_texture(texture)
+
+    @staticmethod
+    def get_board_texture(board, is_other_player):
+        '''
+        Returns the render texture holding the board grid, labels and cell fills for this view of the board.
+        - On first use the whole board is drawn into a new texture.
+        - Afterwards only the cells in board.dirty_cells (changed by place_ship, place_attack or change_cells_to_sunk) are redrawn.
+        '''
+        entry = Renderer.board_textures.pop(id(board), None)
+        if entry is None or entry[0] is not board:  # A board we have not drawn yet (or a new board reusing the id).
+            if entry is not None:
+                Renderer.free_board_textures(entry)
+            while len(Renderer.board_textures) >= Renderer.BOARD_TEXTURE_SLOTS:  # A new game or a restore replaced the boards.
+                Renderer.free_board_textures(Renderer.board_textures.pop(next(iter(Renderer.board_textures))))
+            entry = (board, {})
+            board.dirty_cells.clear()  # New textures start from the current board anyway.
+        Renderer.board_textures[id(board)] = entry  # Reinserted, so the dict stays ordered by the last draw.
+        textures = entry[1]
 
-            Renderer.draw_ship_placement_hover(board, ship_length, ship_orientation)
+        margin = Renderer.BOARD_LABEL_MARGIN
+        if board.dirty_cells:
+            cells = board.cells
+            for view, texture in textures.items():  # Keep every existing view of the board up to date.
+                begin_texture_mode(texture)
+                for i, j in board.dirty_cells:
+                    Renderer.draw_cell_fill(i, j, cells[i][j], view, margin, margin)
+                end_texture_mode()
+            board.dirty_cells.clear()
+
+        texture = textures.get(is_other_player)
+        if texture is None:
+            texture = load_render_texture(margin + board.cols * CELL_SIZE, margin + board.rows * CELL_SIZE)
+            begin_texture_mode(texture)
+            clear_background(WHITE)  # Same background as the window, so text edges blend the same way.
+            Renderer.draw_board_contents(board, is_other_player, margin, margin)
+            end_texture_mode()
+            textures[is_other_player] = texture
+        return texture
+
+    @staticmethod
+    def draw_board_view(board, is_other_player):
+        '''
+        Draws a board too large for the board area through the viewport: the grid lines (when cells are big enough
+        to tell apart) and only the cells that are visible and not empty, so the cost follows the view, not the board.
+        '''
+        view = Renderer.viewport
+        first_row, last_row, first_col, last_col = view.visible()
+        left, top = view.position(0, 0)  # Board corners on the window, usually outside the area.
+        right, bottom = view.position(board.rows, board.cols)
+        x0, y0 = int(max(left, view.left)), int(max(top, view.top))
+        x1, y1 = int(min(right, view.left + view.width)), int(min(bottom, view.top + view.height))
+        if view.cell_size >= Renderer.GRID_MIN_CELL_SIZE:
+            for j in range(first_col, last_col + 1):
+                x = int(view.position(0, j)[0])
+                draw_line(x, y0, x, y1, BLACK)  # Column border.
+            for i in range(first_row, last_row + 1):
+                y = int(view.position(i, 0)[1])
+                draw_line(x0, y, x1, y, BLACK)  # Row border.
+        else:
+            draw_rectangle_lines(x0, y0, x1 - x0, y1 - y0, BLACK)  # Just the outline of the visible part.
+
+        # Same rectangles as cell_rectangle, worked out inline since this loop can visit thousands of cells.
+        size = view.cell_size
+        inset = 3 * size / CELL_SIZE
+        fill = max(size - 2 * inset, 1.0)
+        left += inset
+        top += inset
+        colors = {}  # cell value is the key, its color is the value
+        drawn = set()  # Pixels already filled when several cells share one pixel (zoomed far out).
+        for i, j, cell in board.nonempty_cells(first_row, last_row, first_col, last_col):
+            if cell > 0 and is_other_player:
+                continue  # Hidden enemy ships are drawn as empty cells.
+            x, y = left + j * size, top + i * size
+            if size < 1:
+                pixel = (int(x), int(y))
+                if pixel in drawn:
+                    continue
+                drawn.add(pixel)
+            color = colors.get(cell)
+            if color is None:
+                color = colors[cell] = Renderer.get_cell_color(cell, is_other_player)
+            draw_rectangle_rec(Rectangle(x, y, fill, fill), color)
+        board.dirty_cells.clear()  # The view is drawn from the board every frame, nothing to catch up on.
+
+    @staticmethod
+    def draw_view_labels(first_row, last_row, first_col, last_col):
+        '''
+        Draws the column numbers above and the row letters left of the visible part of a viewport board,
+        skipping labels so they do not overlap when zoomed out.
+        '''
+        view = Renderer.viewport
+        step = max(1, math.ceil(9 * len(str(view.cols)) / view.cell_size))  # Room for the longest number.
+        for j in range(math.ceil(view.col), last_col):
+            if j % step == 0:
+                x = view.position(0, j)[0]
+                Renderer.draw_font_text(str(j + 1), int(x + 2), view.top - 18, 15, BLACK)
+        step = max(1, math.ceil(16 / view.cell_size))  # Room for one line of text.
+        for i in range(math.ceil(view.row), last_row):
+            if i % step == 0:
+                label = Renderer.row_label(i)
+                y = view.position(i, 0)[1]
+                Renderer.draw_font_text(label, view.left - 9 * len(label) - 4, int(y + max(view.cell_size - 15, 0) / 2), 15, BLACK)
+
+    @staticmethod
+    def draw_hint_overlay(hints):
+        '''
+        Shades every unattacked cell by its exact hit probability and outlines the best next shots.
+        Args:
+            hints: A solved EndgameSolver for the board being drawn.
+        '''
+        best = max(hints.probabilities) or 1.0  # The likeliest cell gets the strongest shade.
+        for cell, probability in enumerate(hints.probabilities):
+            if probability > 0:
+                i, j = divmod(cell, hints.cols)
+                shade = Color(255, 140, 0, int(30 + 170 * probability / best))  # Semi-transparent orange.
+                draw_rectangle_rec(Renderer.cell_rectangle(i, j, 3), shade)
+        for i, j in hints.best_cells:
+            draw_rectangle_lines_ex(Renderer.cell_rectangle(i, j, 1), 2, BLUE)
+
+    @staticmethod
+    def draw_heatmap_overlay(heatmap):
+        '''
+        Shades the visible cells of the board by a heatmap from the replay analytics, the hottest cell the strongest.
+        Args:
+            heatmap: (rows, cols) NumPy array of non-negative weights, like BoardHeatmaps.heatmap.
+        '''
+        first_row, last_row, first_col, last_col = Renderer.viewport.visible()
+        visible = heatmap[first_row:last_row, first_col:last_col]
+        hottest = float(heatmap.max()) or 1.0
+        for i, j in zip(*visible.nonzero()):  # Only the visible cells, so large boards cost what the view shows.
+            weight = float(visible[i, j]) / hottest
+            shade = Color(128, 0, 255, int(20 + 160 * weight))  # Semi-transparent purple, apart from the orange hints.
+            draw_rectangle_rec(Renderer.cell_rectangle(first_row + int(i), first_col + int(j), 3), shade)
+
+    @staticmethod
+    def draw_board(board, is_other_player, ship_length = 1, ship_orientation = None, hints = None, heatmap = None):
+        '''
+        Draws the game board on the screen.
+        - A board that fits the board area: the grid, labels and cell fills come from a cached render texture drawn in a single call.
+        - A larger board: only the visible part is drawn through the viewport, clipped to the board area.
+        - The ship placement hover, the heatmap overlay and the hint overlay are drawn on top once per frame.
+        Args:
+            board: The Board instance representing the player's or enemy's board.
+            is_other_player: Boolean flag indicating if the board being drawn is for the enemy player.
+            hints: Optional solved EndgameSolver whose hit probabilities are drawn over the board.
+            heatmap: Optional (rows, cols) array of replay analytics drawn over the board.
+        '''
+        view = Renderer.viewport
+        view.show(board.rows, board.cols)  # A board of a new size starts fully zoomed out.
+        fits = view.fits(board.rows, board.cols)
+        if fits:
+            texture = Renderer.get_board_texture(board, is_other_player).texture
+            margin = Renderer.BOARD_LABEL_MARGIN
+            # Render textures are stored upside down, so the source rectangle uses a negative height.
+            draw_texture_rec(texture, Rectangle(0, 0, texture.width, -texture.height), Vector2(BOARD_PADDING_LEFT - margin, BOARD_PADDING_TOP - margin), WHITE)
+        else:
+            begin_scissor_mode(view.left, view.top, view.width, view.height)  # Nothing is drawn outside the board area.
+            Renderer.draw_board_view(board, is_other_player)
+
+        Renderer.draw_ship_placement_hover(board, ship_length, ship_orientation)
+        if heatmap is not None:
+            Renderer.draw_heatmap_overlay(heatmap)
+        if hints is not None:
+            Renderer.draw_hint_overlay(hints)
+
+        if not fits:
+            end_scissor_mode()
+            Renderer.draw_view_labels(*view.visible())
 
     @staticmethod
     def draw_window(game):
         '''
         Initializes and manages the game window.
-        - Continuously updates the window to reflect the game state until the window is closed.
+        - Runs one game_loop tick per frame, at most TICK_RATE times per second, until the window is closed.
+        - While the game is idle (game.is_idle()), end_drawing sleeps until the next input event instead of
+          drawing the same frame again, so an untouched window uses no CPU.
         Args:
             game: The Game instance responsible for handling the game's logic and state.
         '''
@@ -137,12 +356,27 @@ class Renderer:
         # Initialize the window with the specified dimensions and title
         init_window(WINDOW_WIDTH, WINDOW_HEIGHT, "EECS 581 Project 1 - Battleship")
 
-        # Set the font to Roboto font with 512 px dimensions (for better clarity).
-        Renderer.font = load_font_ex("./battleship/resources/roboto.ttf", 512, None, 0)
+        # Load the Roboto font at every size the UI uses (baked once, then loaded from the on-disk cache).
+        FontManager.load()
+
+        # Time every frame, renderer call and draw call (F3 shows the overlay, F4 exports a trace).
+        Profiler.install()
 
+        set_target_fps(Renderer.TICK_RATE)  # Fixed logic tick: end_drawing waits out the rest of each tick.
+        waiting = False  # Whether end_drawing currently waits for input events.
         while not window_should_close():  # Loop until the user closes the window.
+            if game.is_idle() != waiting:
+                waiting = not waiting
+                if waiting:
+                    enable_event_waiting()  # Nothing to do until the next key, click or mouse move.
+                else:
+                    disable_event_waiting()  # Keep ticking while a pan is held or the server may send messages.
+            Profiler.begin_frame()  # Close the previous frame's timings and check the profiler keys.
             begin_drawing()  # Start drawing on the window.
             clear_background(WHITE)  # Clear the window with a white background.
             game.game_loop()  # Update the game state and draw the necessary elements.
-            end_drawing()  # End drawing and present the frame.
+            Profiler.draw_overlay()  # Draw the profiler overlay on top when it is enabled.
+            Profiler.end_frame()  # The frame's work ends here; the rest is presenting and waiting.
+            with Profiler.section("end_drawing"):  # Includes the buffer swap, the tick wait and the wait for input events.
+                end_drawing()  # End drawing and present the frame.
         close_window()  # Close the window when the loop exits.
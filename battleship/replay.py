@@ -0,0 +1,382 @@
+# Filename: replay.py
+# Description: This module defines the compact binary replay format. ReplayLog records every ship placement and attack of a game as a fixed-width 6 byte event, Replay rebuilds both players at any turn using periodic snapshots, and ReplayArchive stores many games back to back in one file.
+# Inputs: Placement and attack events from the Engine (or any other game driver), or replay bytes read from disk
+# Output: Replay bytes and archive files, and Player/Board state rebuilt at any point of a recorded game
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import struct  # Packing the header and events into fixed-width records.
+from .player import Player  # Replays rebuild Player objects.
+from .board import Orientation
+from .constants import *  # Importing cell values like EMPTY_CELL and the attack results RESULT_MISS/HIT/SUNK.
+
+# Event kinds, stored in the low bit of the flags byte.
+PLACE_EVENT = 0
+ATTACK_EVENT = 1
+
+def rebuild_player(player, cells, hit_ships, ships):
+    '''
+    Rebuilds a player that has just been given its ships (get_ships, on an empty board) through place_ship and
+    place_attack, the methods every Player backend implements, so it works whether the cells are a list or bitmasks.
+    - Every placed ship is placed again where its cells are.
+    - Every attacked cell (miss, hit or sunk) is attacked again, which brings back the hits, sunk ships and cells left.
+    Args:
+        cells: Row-major cell values, like Board.cells flattened (a ship cell that was not hit holds its ship).
+        hit_ships: cell index is the key, ship that was hit (or sunk) on that cell is the value
+        ships: The ships still to place, in the order the player places them.
+    Raises:
+        ValueError: If the ships overlap or leave the board.
+    '''
+    cols = player.board.cols
+    ship_cells = {}  # ship is the key, indices of the cells it covers (in order) is the value
+    for index, value in enumerate(cells):
+        ship = value if value > 0 else hit_ships.get(index)
+        if ship:
+            ship_cells.setdefault(ship, []).append(index)
+
+    for ship in player.ships:
+        if ship in ships:
+            continue  # Still to be placed.
+        placed = ship_cells.get(ship)
+        if not placed:
+            raise ValueError(f"ship {ship} of player {player.num} is placed but has no cells")
+        vertical = len(placed) > 1 and placed[1] - placed[0] == cols  # On a one-column board the next cell is also 1 away.
+        i, j = divmod(placed[0], cols)
+        if not player.place_ship(i, j, ship, Orientation.VERTICAL if vertical else Orientation.HORIZONTAL):
+            raise ValueError(f"ship {ship} of player {player.num} does not fit where it was")
+    player.ships = list(ships)
+
+    for index, value in enumerate(cells):
+        if value == MISS_CELL or value == HIT_CELL or value == SUNK_CELL:
+            player.place_attack(*divmod(index, cols))
+
+class ReplayLog:
+    MAGIC = b"BSRP"  # Marks the start of a replay.
+    VERSION = 1  # Bump when the format changes.
+    # Header: magic, version, single player flag, rows, columns, number of ships.
+    # The header is followed by one size byte per ship, smallest first.
+    HEADER = struct.Struct("<4sBBHHB")
+    # One event: flags (bit 0 kind, bit 1 player 2, bit 2 vertical, bits 3-4 attack result),
+    # ship id (placed ship, or ship hit by the attack, 0 on a miss), row, column.
+    EVENT = struct.Struct("<BBHH")
+
+    def __init__(self, rows, cols, fleet, single_player=False):
+        '''
+        Starts an empty replay for a game on a rows x cols board where each player has the ships of fleet,
+        either a number of ships (sizes 1..fleet) or the list of ship sizes like Player.get_ships.
+        Raises:
+            ValueError: If the board or the fleet does not fit the replay format.
+        '''
+        ship_sizes = range(1, fleet + 1) if isinstance(fleet, int) else sorted(fleet)
+        # The header stores the ship count and every ship size in one byte, and events store ship ids in one byte
+        # and rows and columns in two, so anything larger would be written wrapped around.
+        if len(ship_sizes) > 255 or (ship_sizes and not 1 <= min(ship_sizes) <= max(ship_sizes) <= 255):
+            raise ValueError("a replay holds at most 255 ships of at most 255 cells")
+        if not (1 <= rows <= 0xFFFF and 1 <= cols <= 0xFFFF):
+            raise ValueError(f"a replay board is at most 65535 x 65535, not {rows} x {cols}")
+        self.data = bytearray(self.HEADER.pack(self.MAGIC, self.VERSION, single_player, rows, cols, len(ship_sizes)))
+        self.data += bytes(ship_sizes)  # Ship ids are positions in this list, counting from 1.
+        self.events_start = len(self.data)  # Offset of the first event.
+
+    def record_placement(self, player_num, i, j, ship, orientation):
+        '''
+        Records a successful ship placement.
+        '''
+        flags = PLACE_EVENT | (player_num == 2) << 1 | (orientation == Orientation.VERTICAL) << 2
+        self.data += self.EVENT.pack(flags, ship, i, j)
+
+    def record_attack(self, player_num, i, j, result, ship):
+        '''
+        Records an attack that was played (attacks on already shot cells are not recorded).
+        Args:
+            player_num: The attacking player.
+            result: RESULT_MISS, RESULT_HIT or RESULT_SUNK.
+            ship: Id of the ship that was hit, ignored on a miss.
+        '''
+        flags = ATTACK_EVENT | (player_num == 2) << 1 | result << 3
+        self.data += self.EVENT.pack(flags, ship if result != RESULT_MISS else 0, i, j)
+
+    @staticmethod
+    def from_bytes(data):
+        '''
+        Returns a ReplayLog that continues recording after existing replay bytes.
+        '''
+        replay = Replay(data)  # Validates the header and the event records.
+        log = ReplayLog.__new__(ReplayLog)
+        log.data = bytearray(data)
+        log.events_start = len(data) - len(replay.events_view)
+        return log
+
+    def __len__(self):
+        '''
+        Returns the number of recorded events.
+        '''
+        return (len(self.data) - self.events_start) // self.EVENT.size
+
+    def to_bytes(self):
+        '''
+        Returns the replay as immutable bytes.
+        '''
+        return bytes(self.data)
+
+    def save(self, path):
+        '''
+        Writes the replay to a file.
+        '''
+        with open(path, "wb") as file:
+            file.write(self.data)
+
+class Replay:
+    SNAPSHOT_INTERVAL = 16  # Events between snapshots; once recorded, a seek copies one snapshot and replays fewer than this many events.
+
+    def __init__(self, data, player_class=Player):
+        '''
+        Opens a recorded game from replay bytes (bytes, bytearray or memoryview, not copied).
+        Args:
+            player_class: The Player class (and so the Board backend) the game is rebuilt with.
+        '''
+        view = memoryview(data)
+        self.single_player, self.rows, self.cols, self.ship_sizes, header_size = Replay.read_header(view)
+        self.num_ships = len(self.ship_sizes)  # ship_sizes holds the size of every ship, smallest first; ship id k is ship_sizes[k - 1].
+        self.player_class = player_class
+        self.events_view = view[header_size:]  # The raw events, one EVENT record each.
+        self.snapshots = [self.snapshot(*self.new_players())]  # snapshots[k] is the state after k * SNAPSHOT_INTERVAL events.
+
+    @staticmethod
+    def read_header(view):
+        '''
+        Checks the header of replay bytes without building any players, for readers that only need the raw events.
+        Returns:
+            (single player flag, rows, cols, ship sizes smallest first, offset of the first event).
+        Raises:
+            ValueError: If the bytes are not a replay of this version, or do not end on an event boundary.
+        '''
+        header_size = ReplayLog.HEADER.size
+        if len(view) < header_size:
+            raise ValueError("replay is too short")
+        magic, version, single_player, rows, cols, num_ships = ReplayLog.HEADER.unpack_from(view)
+        if magic != ReplayLog.MAGIC or version != ReplayLog.VERSION:
+            raise ValueError("not a replay, or written by another version")
+        ship_sizes = tuple(view[header_size:header_size + num_ships])
+        header_size += num_ships
+        if len(ship_sizes) < num_ships:
+            raise ValueError("replay is too short")
+        if (len(view) - header_size) % ReplayLog.EVENT.size:
+            raise ValueError("replay ends in the middle of an event")
+        return bool(single_player), rows, cols, ship_sizes, header_size
+
+    @staticmethod
+    def load(path):
+        '''
+        Opens a replay file.
+        '''
+        with open(path, "rb") as file:
+            return Replay(file.read())
+
+    def __len__(self):
+        '''
+        Returns the number of events (turns) in the replay.
+        '''
+        return len(self.events_view) // ReplayLog.EVENT.size
+
+    def event(self, turn):
+        '''
+        Returns event number turn as (kind, player number, i, j, ship id, orientation, attack result).
+        '''
+        flags, ship, i, j = ReplayLog.EVENT.unpack_from(self.events_view, turn * ReplayLog.EVENT.size)
+        return Replay.decode(flags, ship, i, j)
+
+    def events(self):
+        '''
+        Iterates over every event, as returned by event().
+        '''
+        for flags, ship, i, j in ReplayLog.EVENT.iter_unpack(self.events_view):
+            yield Replay.decode(flags, ship, i, j)
+
+    @staticmethod
+    def decode(flags, ship, i, j):
+        '''
+        Unpacks the flags byte of an event.
+        '''
+        orientation = Orientation.VERTICAL if flags & 4 else Orientation.HORIZONTAL
+        return flags & 1, 2 if flags & 2 else 1, i, j, ship, orientation, (flags >> 3) & 3
+
+    def new_players(self):
+        '''
+        Returns both players as they are before the first event.
+        '''
+        players = (self.player_class(1), self.player_class(2))
+        for player in players:
+            player.board = player.board_class(self.rows, self.cols)
+            player.get_ships(self.ship_sizes)
+        return players
+
+    @staticmethod
+    def snapshot(player1, player2):
+        '''
+        Returns a copy of both players' state (Player.copy_state) that restore() puts back without replaying anything.
+        '''
+        return player1.copy_state(), player2.copy_state()
+
+    def restore(self, snapshot):
+        '''
+        Returns new (player1, player2) objects holding a copy of the state of a snapshot, so the snapshot can be reused.
+        '''
+        players = self.new_players()
+        for player, state in zip(players, snapshot):
+            player.load_state(state)
+        return players
+
+    @staticmethod
+    def apply(players, event):
+        '''
+        Applies one event to (player1, player2).
+        '''
+        kind, player_num, i, j, ship, orientation, _ = event
+        if kind == PLACE_EVENT:
+            player = players[player_num - 1]
+            player.place_ship(i, j, ship, orientation)
+            player.ships.remove(ship)
+            player.ships_placed = not player.ships
+        else:
+            players[2 - player_num].place_attack(i, j)  # The attacker's enemy is the other player.
+
+    def state_at(self, turn):
+        '''
+        Rebuilds both players as they were after the first turn events (0 is the start, len(self) the end).
+        Seeks from the closest earlier snapshot, recording new snapshots on the way.
+        Returns:
+            A new (player1, player2) tuple; changing it does not affect the replay.
+        '''
+        if turn < 0 or turn > len(self):
+            raise IndexError("turn out of range")
+        interval = self.SNAPSHOT_INTERVAL
+        index = min(turn // interval, len(self.snapshots) - 1)
+        players = self.restore(self.snapshots[index])
+        for position in range(index * interval, turn):
+            Replay.apply(players, self.event(position))
+            if (position + 1) % interval == 0 and (position + 1) // interval == len(self.snapshots):
+                self.snapshots.append(self.snapshot(*players))  # Later seeks can start from here.
+        return players
+
+    def winner(self):
+        '''
+        Returns the number of the winning player, or None if the recorded game did not finish.
+        '''
+        player1, player2 = self.state_at(len(self))
+        if not (player1.ships_placed and player2.ships_placed):
+            return None
+        if player2.is_loss():
+            return 1
+        if player1.is_loss():
+            return 2
+        return None
+
+class ReplayArchive:
+    # Every replay is stored as its length followed by its bytes.
+    LENGTH = struct.Struct("<I")
+    READ_BUFFER = 1 << 20  # Bytes read from the file at a time when streaming.
+    BLOCK = 256  # Consecutive replays handed to the same part by stream().
+
+    def __init__(self, path):
+        '''
+        Opens (or creates on the first append) an archive file of many replays.
+        '''
+        self.path = path
+        self.offsets = None  # Start of each replay in the file, built on first access.
+
+    def append(self, replay_data):
+        '''
+        Adds one replay (bytes or a ReplayLog) to the end of the archive.
+        '''
+        if isinstance(replay_data, ReplayLog):
+            replay_data = replay_data.data
+        with open(self.path, "ab") as file:
+            file.write(self.LENGTH.pack(len(replay_data)))
+            file.write(replay_data)
+        self.offsets = None  # The index is rebuilt on the next read.
+
+    def extend(self, records):
+        '''
+        Adds already length-prefixed records (as produced by ReplayArchive.pack) to the end of the archive.
+        '''
+        with open(self.path, "ab") as file:
+            file.write(records)
+        self.offsets = None
+
+    @staticmethod
+    def pack(replay_data):
+        '''
+        Returns one length-prefixed archive record, so workers can build records without touching the file.
+        '''
+        return ReplayArchive.LENGTH.pack(len(replay_data)) + bytes(replay_data)
+
+    def read_all(self):
+        '''
+        Returns the whole archive file as bytes.
+        '''
+        with open(self.path, "rb") as file:
+            return file.read()
+
+    def __iter__(self):
+        '''
+        Iterates over the raw bytes of every replay, reading the file as it goes.
+        '''
+        return self.stream()
+
+    def stream(self, part=0, parts=1):
+        '''
+        Lazily yields the raw bytes of the replays of one part of the archive, so only one replay is in memory at a time.
+        The replays are dealt out in blocks of BLOCK: block k belongs to part k % parts, so parts processes can
+        share one archive without an index and every replay is read by exactly one of them.
+        '''
+        prefix_size = self.LENGTH.size
+        with open(self.path, "rb", buffering=self.READ_BUFFER) as file:
+            index = 0
+            while True:
+                prefix = file.read(prefix_size)
+                if len(prefix) < prefix_size:
+                    break
+                (length,) = self.LENGTH.unpack(prefix)
+                if (index // self.BLOCK) % parts == part:
+                    data = file.read(length)
+                    if len(data) < length:
+                        break  # A replay cut short by an interrupted append.
+                    yield data
+                else:
+                    file.seek(length, 1)  # Another part reads this one.
+                index += 1
+
+    def build_index(self):
+        '''
+        Records where every replay starts without reading the replays themselves.
+        '''
+        self.offsets = []
+        with open(self.path, "rb") as file:
+            while True:
+                prefix = file.read(self.LENGTH.size)
+                if len(prefix) < self.LENGTH.size:
+                    break
+                (length,) = self.LENGTH.unpack(prefix)
+                self.offsets.append((file.tell(), length))
+                file.seek(length, 1)
+
+    def __len__(self):
+        '''
+        Returns the number of replays in the archive.
+        '''
+        if self.offsets is None:
+            self.build_index()
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        '''
+        Returns the Replay at an index, reading only that replay from disk.
+        '''
+        if self.offsets is None:
+            self.build_index()
+        offset, length = self.offsets[index]
+        with open(self.path, "rb") as file:
+            file.seek(offset)
+            return Replay(file.read(length))
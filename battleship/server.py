@@ -0,0 +1,408 @@
+# Filename: server.py
+# Description: This module defines the asyncio match server. It pairs up connecting players, runs the placement and attack rules from Player for every match in one process, and batches each connection's outgoing messages into one write per event loop pass. Spectators can watch any running match: they get a keyframe of the visible cells when they join and at intervals, and between keyframes only the cells each move changed, with ships that were not sunk never sent.
+# Inputs: TCP connections (players and spectators) speaking the protocol in protocol.py; command line arguments (host, port, statistics interval, player backend)
+# Output: Match updates sent to the players and spectators, and periodic statistics on standard output
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import argparse  # Command line parsing.
+import asyncio  # Event loop and TCP server.
+import time  # Timing move handling for the statistics.
+from .player import Player  # Every match runs the normal Player rules.
+from .compact import CompactPlayer  # Same rules with a much smaller memory footprint.
+from .bitboard import BitPlayer  # Same rules on bitmask boards.
+from .board import Orientation
+from .constants import *  # Importing cell values like MISS_CELL.
+from .replay import RESULT_MISS, RESULT_HIT, RESULT_SUNK  # Attack results sent in SHOT messages.
+from . import protocol
+
+# Player backends by name, for the --backend option.
+PLAYER_BACKENDS = {"list": Player, "compact": CompactPlayer, "bitmask": BitPlayer}
+
+class Match:
+    # Many matches live at once, keep them small.
+    __slots__ = ("server", "id", "num_ships", "players", "connections", "turn", "attack_phase", "over",
+                 "spectators", "stream", "moves", "keyframe_cache")
+    KEYFRAME_INTERVAL = 32  # Every this many moves spectators get a keyframe instead of a delta, so nobody stays out of sync for long.
+    SPECTATOR_BUFFER_LIMIT = 65536  # Spectators with more unsent bytes than this skip deltas and get a keyframe once they catch up.
+
+    def __init__(self, server, match_id, connections, num_ships, player_class):
+        '''
+        Starts a match between two connections; both players place their ships at the same time.
+        '''
+        self.server = server
+        self.id = match_id  # Spectators pick a match by id.
+        self.num_ships = num_ships
+        self.players = (player_class(1), player_class(2))
+        for player in self.players:
+            player.get_ships(num_ships)
+        self.connections = connections
+        self.turn = 2  # Like the local game, Player 2 attacks first.
+        self.attack_phase = False
+        self.over = False
+        self.spectators = []  # Connections watching the match.
+        self.stream = bytearray()  # Messages for every spectator, written once per loop pass by flush.
+        self.moves = 0  # Attacks played, the move number in KEYFRAME and DELTA messages.
+        self.keyframe_cache = None  # (state, keyframe bytes) of the last keyframe built, shared by spectators joining together.
+
+    def broadcast(self, message, spectators=False):
+        '''
+        Queues a message for both players, and for the spectators too if asked.
+        '''
+        for connection in self.connections:
+            connection.send(message)
+        if spectators:
+            self.publish(message)
+
+    def publish(self, message):
+        '''
+        Queues a message for every spectator; it is only packed once however many spectators there are.
+        '''
+        if not self.spectators:
+            return
+        if not self.stream:
+            self.server.schedule_flush(self)
+        self.stream += message
+
+    def visible_cells(self, cells):
+        '''
+        Returns the CELL messages of the (player number, i, j, value) cells a spectator may see; ship cells and empty cells are left out.
+        '''
+        states = protocol.VISIBLE_STATES
+        return b"".join(protocol.pack(protocol.CELL, num | states[value] << 2, i, j) for num, i, j, value in cells if value in states)
+
+    def keyframe(self):
+        '''
+        Returns the keyframe of the match: a KEYFRAME message followed by one CELL message per visible cell of both boards.
+        Only cells that were attacked are sent, never the full boards.
+        '''
+        state = (self.moves, self.turn, self.attack_phase, self.over)
+        if self.keyframe_cache is None or self.keyframe_cache[0] != state:
+            cells = self.visible_cells((player.num, i, j, value) for player in self.players
+                                       for i, j, value in player.board.nonempty_cells(0, player.board.rows, 0, player.board.cols))
+            arg = self.turn | (protocol.ATTACK_FLAG if self.attack_phase else 0) | (protocol.OVER_FLAG if self.over else 0)
+            self.keyframe_cache = (state, protocol.pack(protocol.KEYFRAME, arg, len(cells) // protocol.MESSAGE_SIZE, self.moves & 0xFFFF) + cells)
+        return self.keyframe_cache[1]
+
+    def publish_move(self):
+        '''
+        Counts an attack and sends the spectators the cells it changed on either board (read from the boards' dirty_cells,
+        which place_attack and change_cells_to_sunk fill in), or a keyframe every KEYFRAME_INTERVAL moves.
+        '''
+        self.moves += 1
+        if not self.spectators:
+            return
+        changed = []
+        for player in self.players:
+            board = player.board
+            if board.dirty_cells:
+                rows = board.cells
+                changed += [(player.num, i, j, rows[i][j]) for i, j in board.dirty_cells]
+                board.dirty_cells.clear()
+        if self.moves % self.KEYFRAME_INTERVAL == 0:
+            self.publish(self.keyframe())
+        else:
+            cells = self.visible_cells(changed)
+            self.publish(protocol.pack(protocol.DELTA, self.turn, len(cells) // protocol.MESSAGE_SIZE, self.moves & 0xFFFF) + cells)
+
+    def watch(self, connection):
+        '''
+        Adds a spectator and queues the WATCHING reply and a keyframe for it.
+        '''
+        if not self.spectators:
+            for player in self.players:
+                player.board.dirty_cells.clear()  # Start tracking changes from now on; the keyframe has everything before.
+        self.spectators.append(connection)
+        connection.watching = self
+        connection.lagging = False
+        connection.send(protocol.pack(protocol.WATCHING, self.num_ships, self.id))
+        connection.send(self.keyframe())
+
+    def flush(self):
+        '''
+        Writes the queued spectator messages to every spectator, the same bytes object each time.
+        A spectator that is not reading fast enough skips them, and gets a keyframe instead once its buffer drains.
+        '''
+        data = bytes(self.stream)
+        self.stream.clear()
+        for connection in self.spectators:
+            transport = connection.transport
+            if transport.is_closing():
+                continue
+            if transport.get_write_buffer_size() > self.SPECTATOR_BUFFER_LIMIT:
+                connection.lagging = True
+            elif connection.lagging:
+                connection.lagging = False
+                transport.write(self.keyframe())  # Replaces everything skipped, including this pass.
+            else:
+                transport.write(data)
+
+class Connection(asyncio.Protocol):
+    __slots__ = ("server", "transport", "incoming", "outgoing", "match", "num", "watching", "lagging")
+
+    def __init__(self, server):
+        '''
+        One client connection. Messages are only queued here; the server flushes every queue once per loop pass.
+        '''
+        self.server = server
+        self.transport = None
+        self.incoming = bytearray()  # Bytes received but not yet handled (at most part of one message).
+        self.outgoing = bytearray()  # Messages waiting for the next flush.
+        self.match = None  # The Match this connection plays in, once paired.
+        self.num = 0  # This connection's player number in its match.
+        self.watching = None  # The Match this connection spectates, if any.
+        self.lagging = False  # Whether spectator messages were skipped because the connection was not reading them.
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.server.connections += 1
+
+    def connection_lost(self, exc):
+        self.server.connections -= 1
+        self.server.leave(self)
+
+    def data_received(self, data):
+        self.incoming += data
+        for kind, arg, i, j in protocol.split(self.incoming):
+            self.server.handle(self, kind, arg, i, j)
+
+    def send(self, message):
+        '''
+        Queues a message; it is written together with everything else queued during this loop pass.
+        '''
+        if not self.outgoing:
+            self.server.schedule_flush(self)
+        self.outgoing += message
+
+    def flush(self):
+        '''
+        Writes every queued message at once.
+        '''
+        if self.outgoing and not self.transport.is_closing():
+            self.transport.write(self.outgoing)
+        self.outgoing = bytearray()
+
+class MatchServer:
+    MAX_SHIPS = 5  # Largest ship count a client may ask for, like the menu.
+
+    def __init__(self, player_class=Player):
+        '''
+        Holds the waiting players, the flush queue and the statistics for every match in the process.
+        Args:
+            player_class: The Player class (and so the Board backend) used for every match.
+        '''
+        self.player_class = player_class
+        self.waiting = {}  # number of ships is the key, Connection waiting for an opponent is the value
+        self.pending_flush = []  # Connections with queued messages.
+        self.flush_scheduled = False
+        self.loop = None
+        self.connections = 0
+        self.matches = 0  # Matches currently running.
+        self.running = {}  # match id is the key, running Match is the value (oldest first)
+        self.next_match_id = 1
+        self.spectators = 0  # Connections currently watching a match.
+        self.finished = 0  # Matches finished since the server started.
+        self.moves = 0  # Placements and attacks handled since the last statistics line.
+        self.move_time = 0  # Time spent handling them, in ns.
+
+    def protocol_factory(self):
+        return Connection(self)
+
+    def schedule_flush(self, connection):
+        '''
+        Adds a connection to the flush queue, and makes sure the queue is flushed after this loop pass.
+        '''
+        self.pending_flush.append(connection)
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.loop.call_soon(self.flush)
+
+    def flush(self):
+        '''
+        Writes the queued messages of every connection (one write per connection) and the spectator messages of every match.
+        '''
+        self.flush_scheduled = False
+        pending = self.pending_flush
+        self.pending_flush = []
+        for connection in pending:
+            connection.flush()
+
+    def handle(self, connection, kind, arg, i, j):
+        '''
+        Handles one message from a client.
+        '''
+        start = time.perf_counter_ns()
+        match = connection.match
+        if kind == protocol.JOIN and match is None and connection.watching is None:
+            self.join(connection, arg)
+        elif kind == protocol.WATCH and match is None and connection.watching is None:
+            self.watch(connection, i)
+        elif kind == protocol.PLACE and match is not None and not match.attack_phase:
+            self.place(connection, match, arg, i, j)
+        elif kind == protocol.ATTACK and match is not None and match.attack_phase and not match.over:
+            self.attack(connection, match, i, j)
+        else:
+            connection.send(protocol.pack(protocol.REJECTED, kind))
+        self.moves += 1
+        self.move_time += time.perf_counter_ns() - start
+
+    def join(self, connection, num_ships):
+        '''
+        Pairs a connection with a waiting player who chose the same number of ships, or makes it wait.
+        '''
+        if num_ships < 1 or num_ships > self.MAX_SHIPS or connection in self.waiting.values():
+            connection.send(protocol.pack(protocol.REJECTED, protocol.JOIN))
+            return
+        opponent = self.waiting.pop(num_ships, None)
+        if opponent is None:
+            self.waiting[num_ships] = connection
+            return
+
+        match = Match(self, self.next_match_id, (opponent, connection), num_ships, self.player_class)
+        self.next_match_id = self.next_match_id % 0xFFFF + 1  # Match ids fit in a message's i field.
+        self.running[match.id] = match
+        self.matches += 1
+        for num, player_connection in ((1, opponent), (2, connection)):
+            player_connection.match = match
+            player_connection.num = num
+            player_connection.send(protocol.pack(protocol.START, num, num_ships))
+
+    def watch(self, connection, match_id):
+        '''
+        Makes a connection a spectator of the match with the given id, or of the newest running match if the id is 0.
+        '''
+        if match_id:
+            match = self.running.get(match_id)
+        else:
+            match = next(reversed(self.running.values()), None)
+        if match is None:
+            connection.send(protocol.pack(protocol.REJECTED, protocol.WATCH))
+            return
+        match.watch(connection)
+        self.spectators += 1
+
+    def place(self, connection, match, arg, i, j):
+        '''
+        Places one of the connection's ships with Player.place_ship.
+        '''
+        player = match.players[connection.num - 1]
+        ship = arg & ~protocol.VERTICAL_FLAG
+        orientation = Orientation.VERTICAL if arg & protocol.VERTICAL_FLAG else Orientation.HORIZONTAL
+        if ship not in player.ships or not player.place_ship(i, j, ship, orientation):
+            connection.send(protocol.pack(protocol.REJECTED, protocol.PLACE))
+            return
+
+        player.ships.remove(ship)
+        player.ships_placed = not player.ships
+        connection.send(protocol.pack(protocol.PLACED, arg, i, j))
+        if match.players[0].ships_placed and match.players[1].ships_placed:
+            match.attack_phase = True
+            match.broadcast(protocol.pack(protocol.ATTACK_START, match.turn), spectators=True)
+
+    def attack(self, connection, match, i, j):
+        '''
+        Plays the connection's attack with Player.place_attack, if it is its turn.
+        '''
+        enemy = match.players[2 - connection.num]
+        if connection.num != match.turn or not enemy.board.is_valid_cell(i, j):
+            connection.send(protocol.pack(protocol.REJECTED, protocol.ATTACK))
+            return
+        res, ship = enemy.place_attack(i, j)
+        if ship == MISS_CELL:  # Already attacked, the turn is not used.
+            connection.send(protocol.pack(protocol.REJECTED, protocol.ATTACK))
+            return
+
+        sunk = res and enemy.ship_count[ship] == 0
+        result = RESULT_SUNK if sunk else RESULT_HIT if res else RESULT_MISS
+        match.broadcast(protocol.pack(protocol.SHOT, connection.num | result << 2 | (ship << 4 if sunk else 0), i, j))
+        if sunk:  # The attacker learns where the sunk ship was.
+            for hit_i, hit_j in enemy.ship_hits[ship]:
+                match.broadcast(protocol.pack(protocol.SUNK_CELL, enemy.num, hit_i, hit_j))
+
+        if enemy.is_loss():
+            match.over = True
+            match.publish_move()
+            match.broadcast(protocol.pack(protocol.GAME_OVER, connection.num), spectators=True)
+            self.end_match(match)
+        else:
+            match.turn = enemy.num
+            match.publish_move()
+
+    def end_match(self, match):
+        '''
+        Forgets a finished match; its connections may JOIN again and its spectators may WATCH another match.
+        Messages already queued for the spectators are still written by the next flush.
+        '''
+        self.matches -= 1
+        self.finished += 1
+        del self.running[match.id]
+        for connection in match.connections:
+            connection.match = None
+        for connection in match.spectators:
+            connection.watching = None
+            self.spectators -= 1
+
+    def leave(self, connection):
+        '''
+        Cleans up after a disconnected client.
+        '''
+        for num_ships, waiting in list(self.waiting.items()):
+            if waiting is connection:
+                del self.waiting[num_ships]
+        watching = connection.watching
+        if watching is not None:
+            watching.spectators.remove(connection)
+            connection.watching = None
+            self.spectators -= 1
+        match = connection.match
+        if match is not None:
+            for other in match.connections:
+                if other is not connection:
+                    other.send(protocol.pack(protocol.OPPONENT_LEFT))
+            match.over = True
+            match.publish(protocol.pack(protocol.OPPONENT_LEFT))
+            self.end_match(match)
+
+    async def report(self, interval):
+        '''
+        Prints connection, match and move handling statistics every interval seconds.
+        '''
+        while True:
+            await asyncio.sleep(interval)
+            average = self.move_time / self.moves / 1e3 if self.moves else 0.0
+            print(f"connections {self.connections}  matches {self.matches}  spectators {self.spectators}  finished {self.finished}"
+                  f"  moves/s {self.moves / interval:.0f}  handling {average:.1f} us/move", flush=True)
+            self.moves = 0
+            self.move_time = 0
+
+    async def serve(self, host=protocol.DEFAULT_HOST, port=protocol.DEFAULT_PORT, report_interval=None):
+        '''
+        Runs the server until it is cancelled.
+        '''
+        self.loop = asyncio.get_running_loop()
+        server = await self.loop.create_server(self.protocol_factory, host, port, backlog=4096)
+        if report_interval:
+            self.loop.create_task(self.report(report_interval))
+        async with server:
+            await server.serve_forever()
+
+def main():
+    '''
+    Parses the command line and runs the match server.
+    '''
+    parser = argparse.ArgumentParser(description="Battleship match server.")
+    parser.add_argument("--host", default=protocol.DEFAULT_HOST, help="address to listen on (default: localhost only)")
+    parser.add_argument("--port", type=int, default=protocol.DEFAULT_PORT, help="TCP port to listen on")
+    parser.add_argument("--report", type=float, default=5.0, help="seconds between statistics lines (0 to disable)")
+    parser.add_argument("--backend", choices=PLAYER_BACKENDS, default="compact", help="Player/Board backend for every match")
+    args = parser.parse_args()
+
+    print(f"Battleship server listening on {args.host}:{args.port}", flush=True)
+    try:
+        asyncio.run(MatchServer(PLAYER_BACKENDS[args.backend]).serve(args.host, args.port, args.report))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
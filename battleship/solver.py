@@ -0,0 +1,186 @@
+# Filename: solver.py
+# Description: This module defines the EndgameSolver class, an exact solver for the late attack phase. It counts every configuration of the unsunk enemy ships that agrees with the HIT, MISS and SUNK cells on the board by sweeping the board cell by cell and memoizing the count of every board sub-state, and from those counts gives the true hit probability of every cell and the best next shots.
+# Inputs: A Board as seen by the attacker and the sizes of the enemy ships that are not sunk yet
+# Output: The number of consistent configurations, the hit probability of every cell, and the cells with the highest probability
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import time  # Wall-clock budget of a solve.
+from .constants import *  # Importing cell values like HIT_CELL, MISS_CELL and SUNK_CELL.
+
+# What the attacker knows about each cell.
+UNKNOWN = 0  # Not attacked yet.
+HIT = 1  # A hit on a ship that is not sunk yet; some unsunk ship covers it.
+BLOCKED = 2  # A miss or a sunk ship; no unsunk ship covers it.
+
+class EndgameSolver:
+    MAX_STATES = 200000  # Sub-states visited before giving up; the search is meant for the late attack phase.
+    MAX_CELLS = 400  # Larger boards are not solved; every sub-state carries one claim per column.
+
+    def __init__(self, board, ship_sizes, max_states=None, max_seconds=None):
+        '''
+        Reads what the attacker can see on the board.
+        A configuration places every unsunk ship inside the board on UNKNOWN and HIT cells, without overlaps, so that
+        every HIT cell is covered and no ship is only HIT cells (it would have been sunk). Every configuration is
+        equally likely, like the layouts FleetSampler draws.
+        Args:
+            board: The board being attacked; unattacked ship cells count as unknown.
+            ship_sizes: Sizes of the ships that are not sunk yet (sizes may repeat).
+            max_states: Optional limit replacing MAX_STATES.
+            max_seconds: Optional wall-clock budget of solve, checked every 64 sub-states.
+        '''
+        self.rows = board.rows
+        self.cols = board.cols
+        self.max_states = max_states or self.MAX_STATES
+        self.max_seconds = max_seconds
+        self.ship_sizes = sorted(ship_sizes)
+        # Ships of the same size are interchangeable, so each one only starts after the one before it of that size;
+        # otherwise every configuration would be counted once per ordering of them.
+        self.previous_twin = [k - 1 if k and self.ship_sizes[k - 1] == ship_size else -1 for k, ship_size in enumerate(self.ship_sizes)]
+        self.knowledge = []  # UNKNOWN, HIT or BLOCKED for every cell, in row-major order.
+        for row in board.cells[:self.rows]:
+            for value in row[:self.cols]:
+                if value == MISS_CELL or value == SUNK_CELL:
+                    self.knowledge.append(BLOCKED)
+                elif value == HIT_CELL:
+                    self.knowledge.append(HIT)
+                else:
+                    self.knowledge.append(UNKNOWN)
+
+        # required[c] holds the ships that must have been placed before cell c, because they cannot start any later.
+        num_cells = self.rows * self.cols
+        self.required = [0] * (num_cells + 1)
+        for k, ship_size in enumerate(self.ship_sizes):
+            last_start = max((self.rows - 1) * self.cols + self.cols - ship_size,  # Last horizontal start.
+                             (self.rows - ship_size) * self.cols + self.cols - 1)  # Last vertical start.
+            for cell in range(max(last_start + 1, 0), num_cells + 1):
+                self.required[cell] |= 1 << k
+
+        self.states = 0  # Sub-states visited by solve.
+        self.total = 0  # Number of consistent configurations, set by solve.
+        self.probabilities = None  # Hit probability of every cell (0 for attacked cells), set by solve.
+        self.best_cells = []  # (i, j) cells with the highest hit probability, set by solve.
+
+    @classmethod
+    def for_player(cls, enemy, max_states=None, max_seconds=None):
+        '''
+        Returns a solver for the enemy player's board, with the ships ship_count says are not sunk.
+        '''
+        ship_sizes = [enemy.ship_sizes[ship] for ship, cells_left in enemy.ship_count.items() if cells_left > 0]
+        return cls(enemy.board, ship_sizes, max_states, max_seconds)
+
+    def transitions(self, cell, state):
+        '''
+        Yields every way the sweep can continue past a cell.
+        A sub-state is (placed, seen, claims):
+        - placed: bitmask of the ships already started.
+        - seen: bitmask of the started ships that cover at least one UNKNOWN cell so far.
+        - claims: for the next cols cells, 0 if free, or (ship, cells left including this one, vertical) if a
+          ship started earlier covers it. A vertical ship claims the cell below when the sweep passes it.
+        Returns:
+            Pairs (next sub-state, whether a ship covers the cell).
+        '''
+        placed, seen, claims = state
+        knowledge = self.knowledge[cell]
+        claim = claims[0]
+        rest = claims[1:]
+
+        if claim:  # A ship started earlier covers this cell.
+            if knowledge == BLOCKED:
+                return
+            ship, left, vertical = claim
+            if knowledge == UNKNOWN:
+                seen |= 1 << ship
+            if left == 1:  # Last cell of the ship, it must not be all hits.
+                if seen >> ship & 1:
+                    yield (placed, seen & ~(1 << ship), rest + (0,)), True
+                return
+            yield (placed, seen, rest + ((ship, left - 1, True) if vertical else 0,)), True
+            return
+
+        if knowledge != HIT:  # Leave the cell empty.
+            yield (placed, seen, rest + (0,)), False
+        if knowledge == BLOCKED:
+            return
+
+        i, j = divmod(cell, self.cols)
+        unknown = knowledge == UNKNOWN
+        for ship, ship_size in enumerate(self.ship_sizes):
+            if placed >> ship & 1:
+                continue
+            twin = self.previous_twin[ship]
+            if twin >= 0 and not placed >> twin & 1:
+                continue  # The same size ship before it has not started yet.
+            started = placed | 1 << ship
+            if ship_size == 1:  # Fits anywhere free, the same either way round.
+                if unknown:
+                    yield (started, seen, rest + (0,)), True
+                continue
+            ship_seen = seen | 1 << ship if unknown else seen
+            if j + ship_size <= self.cols and not any(rest[:ship_size - 1]):  # Horizontal: claim the next cells in the row.
+                run = tuple((ship, ship_size - 1 - x, False) for x in range(ship_size - 1))
+                yield (started, ship_seen, run + rest[ship_size - 1:] + (0,)), True
+            if i + ship_size <= self.rows:  # Vertical: claim the cell below.
+                yield (started, ship_seen, rest + ((ship, ship_size - 1, True),)), True
+
+    def solve(self):
+        '''
+        Counts the consistent configurations and the hit probability of every cell.
+        - Forward sweep: for every cell, the sub-states the sweep can be in and the number of ways to reach each one.
+        - Backward sweep: the number of completions of every sub-state, memoized per cell. A cell's hit probability
+          is the sum of (ways to reach) * (completions) over the moves covering it, divided by the total.
+        Returns:
+            True if the board was solved; False if it had no consistent configuration, or needed too many sub-states
+            or more than max_seconds.
+        '''
+        deadline = time.perf_counter() + self.max_seconds if self.max_seconds else None
+        num_cells = self.rows * self.cols
+        full = (1 << len(self.ship_sizes)) - 1
+        levels = [{(0, 0, (0,) * self.cols): 1}]  # levels[c] maps a sub-state before cell c to the ways to reach it.
+        self.states = 1
+        for cell in range(num_cells):
+            following = {}
+            required = self.required[cell + 1]
+            for visited, (state, ways) in enumerate(levels[cell].items()):
+                if deadline and not visited % 64 and time.perf_counter() > deadline:
+                    return False
+                for child, _ in self.transitions(cell, state):
+                    if required & ~child[0]:
+                        continue  # A ship that can no longer start was never placed.
+                    following[child] = following.get(child, 0) + ways
+            self.states += len(following)
+            if self.states > self.max_states:
+                return False
+            levels.append(following)
+
+        completions = {state: 1 for state in levels[num_cells] if state[0] == full}  # Every ship placed and finished.
+        cover = [0] * num_cells
+        for cell in range(num_cells - 1, -1, -1):
+            counts = {}
+            for visited, (state, ways) in enumerate(levels[cell].items()):
+                if deadline and not visited % 64 and time.perf_counter() > deadline:
+                    return False
+                total = 0
+                for child, covered in self.transitions(cell, state):
+                    count = completions.get(child, 0)
+                    total += count
+                    if covered:
+                        cover[cell] += ways * count
+                if total:
+                    counts[state] = total
+            completions = counts
+
+        self.total = completions.get((0, 0, (0,) * self.cols), 0)
+        if not self.total:
+            return False
+        self.probabilities = [cover[cell] / self.total if self.knowledge[cell] == UNKNOWN else 0.0 for cell in range(num_cells)]
+        best = max(self.probabilities)
+        self.best_cells = [divmod(cell, self.cols) for cell, probability in enumerate(self.probabilities) if probability == best and best > 0]
+        return True
+
+    def probability(self, i, j):
+        '''
+        Returns the hit probability of cell (i, j) after solve.
+        '''
+        return self.probabilities[i * self.cols + j]
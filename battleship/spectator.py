@@ -0,0 +1,165 @@
+# Filename: spectator.py
+# Description: This module defines SpectatorGame, the spectator mode of the pyray front end. It watches a match hosted by the match server: it starts from the keyframe the server sends on joining, then applies the small per-move deltas (only the cells each attack changed) and resynchronizes on every later keyframe. Spectators only ever get hits, misses and sunk ships, so both boards are drawn the way an attacker sees them.
+# Inputs: Keyboard input (B to switch boards) and KEYFRAME, DELTA and CELL messages from the match server
+# Output: A read-only game window following one networked match
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+from .client import NetworkGame  # The spectator reuses the client's connection handling.
+from .renderer import Renderer  # Drawing the watched board.
+from .constants import *  # Importing cell values like EMPTY_CELL and key codes.
+from . import protocol
+
+class SpectatorGame(NetworkGame):
+    '''
+    Front end for a spectator of a match hosted by the match server.
+    - Nothing is sent besides the WATCH request; every key except B is ignored.
+    - The boards only hold what the server shows spectators, and are drawn masked like an enemy board.
+    '''
+
+    def __init__(self, host=protocol.DEFAULT_HOST, port=protocol.DEFAULT_PORT, match_id=0):
+        '''
+        Connects to the match server and asks to watch a match (the newest running one if match_id is 0).
+        '''
+        super().__init__(host, port)
+        self.menu_phase = False
+        self.moves = None  # Move number of the last keyframe or delta applied, None until the first keyframe.
+        self.cells_left = 0  # CELL messages still expected after the last KEYFRAME or DELTA.
+        self.apply_cells = False  # Whether those CELL messages are applied (False for a stale or out of order delta).
+        self.is_delta = False  # Whether the CELL messages being read belong to a DELTA (one move) rather than a KEYFRAME.
+        self.move_results = set()  # (player number, cell value) of every cell the delta changed, for the last move message.
+        self.send(protocol.WATCH, 0, match_id)
+        self.title = "Looking for a match..."
+        self.color_info = "B = SWITCH BOARD\nEMPTY = WHITE\nMISSED = GREEN\nHIT = RED\nSUNK = YELLOW"
+
+    def current_player(self):
+        '''
+        Returns the player attacking next; spectators see every board as an enemy board.
+        '''
+        return self.player_lookup_table[self.turn]
+
+    def current_enemy(self):
+        '''
+        Returns the player whose board is attacked next.
+        '''
+        return self.enemy_lookup_table[self.turn]
+
+    def handle_key(self, key):
+        '''
+        B switches between the board attacked next and the other one; spectators have no other commands.
+        '''
+        if key == ASCII_B and (self.attack_phase or self.game_end_phase):
+            self.show_own_board = not self.show_own_board
+            self.update_board_message()
+
+    def handle_click(self, button, x, y):
+        '''
+        Spectators cannot place ships or attack.
+        '''
+
+    def update_board_message(self):
+        '''
+        Tells which board is shown.
+        '''
+        shown = self.current_player() if self.show_own_board else self.current_enemy()
+        self.secondary_message = f"Viewing {self.player_names[shown.num]}'s Board [B to Switch]"
+
+    def show_attack_phase(self):
+        '''
+        Draws the board attacked next, or the other one after B, with the unsunk ships hidden (there are none to show anyway).
+        '''
+        shown = self.current_player() if self.show_own_board else self.current_enemy()
+        Renderer.draw_board(shown.board, True)
+
+    def clear_boards(self):
+        '''
+        Empties both boards before a keyframe is applied.
+        '''
+        for player in (self.player1, self.player2):
+            board = player.board
+            for i, j, _ in list(board.nonempty_cells(0, board.rows, 0, board.cols)):
+                board.cells[i][j] = EMPTY_CELL
+                board.dirty_cells.add((i, j))
+
+    def handle(self, kind, arg, i, j):
+        '''
+        Applies one message from the server.
+        '''
+        if kind == protocol.WATCHING:
+            self.title = ""
+            self.message = f"Watching match {i}"
+            self.last_move_message = "The players are placing their ships..."
+        elif kind == protocol.KEYFRAME:
+            self.clear_boards()
+            self.moves = j
+            self.cells_left = i
+            self.apply_cells = True
+            self.is_delta = False
+            self.set_phase(arg)
+        elif kind == protocol.DELTA:
+            in_order = self.moves is not None and j == (self.moves + 1) & 0xFFFF
+            self.cells_left = i
+            self.apply_cells = in_order  # A stale delta is already in the last keyframe; after a gap, wait for the next keyframe.
+            self.is_delta = True
+            self.move_results = set()
+            if in_order:
+                self.moves = j
+                self.set_phase(arg | protocol.ATTACK_FLAG)
+        elif kind == protocol.CELL:
+            self.apply_cell(arg, i, j)
+        elif kind == protocol.ATTACK_START:
+            self.set_phase(arg | protocol.ATTACK_FLAG)
+        elif kind == protocol.GAME_OVER:
+            self.attack_phase = False
+            self.game_end_phase = True
+            self.turn = arg
+            self.message = ""
+            self.secondary_message = ""
+            self.win_message = f"{self.player_names[arg]} Has Won!"
+        elif kind == protocol.REJECTED:
+            self.end_game("No match to watch")
+        elif kind == protocol.OPPONENT_LEFT:
+            self.end_game("A player left the match")
+
+    def set_phase(self, arg):
+        '''
+        Applies the player to attack next and the phase flags of a KEYFRAME (or an ATTACK_START).
+        '''
+        self.turn = arg & 3
+        if arg & protocol.OVER_FLAG:
+            return  # GAME_OVER follows with the winner.
+        if arg & protocol.ATTACK_FLAG and not self.attack_phase:
+            self.attack_phase = True
+            self.last_move_message = ""
+        if self.attack_phase:
+            self.message = f"{self.player_names[self.turn]}'s Turn to Attack"
+            self.update_board_message()
+
+    def apply_cell(self, arg, i, j):
+        '''
+        Applies one CELL message of the keyframe or delta being read.
+        '''
+        if not self.cells_left:
+            return
+        self.cells_left -= 1
+        if self.apply_cells:
+            board = self.player_lookup_table[arg & 3].board
+            if board.is_valid_cell(i, j):
+                value = protocol.VISIBLE_CELLS[arg >> 2]
+                board.cells[i][j] = value
+                board.dirty_cells.add((i, j))
+                self.move_results.add((arg & 3, value))
+        if not self.cells_left and self.apply_cells and self.is_delta:
+            self.describe_move()
+
+    def describe_move(self):
+        '''
+        Describes the move once every cell of a delta was applied; the attacker is the owner of the other board.
+        '''
+        for num, value in self.move_results:
+            name = self.player_names[3 - num]
+            if value == SUNK_CELL:
+                self.last_move_message = f"{name} sunk a ship!"
+                return
+            self.last_move_message = f"{name} hit a ship!" if value == HIT_CELL else f"{name} missed!"
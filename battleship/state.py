@@ -0,0 +1,344 @@
+# Filename: state.py
+# Description: This module defines GameState, the whole state of a game (phase, turn, both boards and the fleet bookkeeping of both players) laid out in one contiguous buffer. Cloning is a single buffer copy, the state can be saved to and loaded from disk, and attacks can be played directly on the buffer for AI search.
+# Inputs: An Engine (or Game) to capture, or a saved state file
+# Output: GameState buffers and files, and Engines restored from them
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import struct  # Packing the header and fixed-width fields.
+from array import array  # Typed rows copied into the buffer.
+from .board import Orientation
+from .constants import *  # Importing cell values like HIT_CELL and MISS_CELL.
+from .replay import ReplayLog, rebuild_player  # Saved games keep their replay log; players are rebuilt from the saved cells.
+from .engine import Engine  # States are restored into Engines.
+
+# Game phases, as stored in the header.
+MENU_PHASE = 0
+PLACE_SHIP_PHASE = 1
+ATTACK_PHASE = 2
+GAME_END_PHASE = 3
+
+class GameState:
+    MAGIC = b"BSGS"  # Marks the start of a state buffer.
+    VERSION = 2  # Bump when the layout changes.
+    # Header: magic, version, rows, columns, number of ships (largest ship id), phase, turn, viewing own board, vertical, single player.
+    HEADER = struct.Struct("<4sBHHBBBBBB")
+    # Per player after the arrays: remaining ship cells, all ships placed.
+    PLAYER_TAIL = struct.Struct("<iB")
+    # Saved files append the message strings and the replay log, each as a length and its bytes.
+    LENGTH = struct.Struct("<I")
+    MESSAGES = ("message", "title", "win_message", "last_move_message", "secondary_message")
+
+    def __init__(self, buffer):
+        '''
+        Wraps a state buffer (bytearray, not copied). Use capture() or load() to create one.
+
+        Layout after the header, for each player:
+            cells      rows*cols int8   board cell values (EMPTY_CELL, MISS_CELL, HIT_CELL, SUNK_CELL or a ship id)
+            hit_ships  rows*cols uint8  id of the ship hit on each cell, 0 if none (this is ship_hits)
+            ship_count max+1 uint8      cells left of each ship id
+            ships_left max+1 uint8      1 for every ship id still to be placed
+            ship_sizes max+1 uint8      size of each ship id
+            PLAYER_TAIL                 remaining ship cells, all ships placed
+        '''
+        self.buffer = buffer
+        magic, version, self.rows, self.cols, self.num_ships = self.HEADER.unpack_from(buffer)[:5]
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError("not a game state, or written by another version")
+
+        cells = self.rows * self.cols
+        self.cells_offset = 0  # Offsets of each section inside a player block.
+        self.hits_offset = cells
+        self.count_offset = 2 * cells
+        self.left_offset = self.count_offset + self.num_ships + 1
+        self.sizes_offset = self.left_offset + self.num_ships + 1
+        self.tail_offset = self.sizes_offset + self.num_ships + 1
+        self.player_size = self.tail_offset + self.PLAYER_TAIL.size
+        if len(buffer) != self.HEADER.size + 2 * self.player_size:
+            raise ValueError("game state has the wrong size")
+
+        # Typed views into the buffer, so reads and writes need no copies.
+        view = memoryview(buffer)
+        self.players = []
+        for num in (1, 2):
+            base = self.player_offset(num)
+            self.players.append((
+                view[base:base + cells].cast("b"),  # cells
+                view[base + self.hits_offset:base + self.count_offset],  # hit_ships
+                view[base + self.count_offset:base + self.left_offset],  # ship_count
+                view[base + self.left_offset:base + self.sizes_offset],  # ships_left
+                view[base + self.sizes_offset:base + self.tail_offset],  # ship_sizes
+            ))
+
+    @staticmethod
+    def buffer_size(rows, cols, num_ships):
+        '''
+        Returns the size in bytes of a state buffer.
+        '''
+        return GameState.HEADER.size + 2 * (2 * rows * cols + 3 * (num_ships + 1) + GameState.PLAYER_TAIL.size)
+
+    def player_offset(self, num):
+        '''
+        Returns where player num's block starts in the buffer.
+        '''
+        return self.HEADER.size + (num - 1) * self.player_size
+
+    @staticmethod
+    def capture(engine):
+        '''
+        Returns a new GameState holding the state of an Engine (or Game).
+        Raises:
+            ValueError: If the board or the fleet does not fit the fixed-width fields of the layout.
+        '''
+        player1, player2 = engine.player1, engine.player2
+        rows, cols = player1.board.rows, player1.board.cols
+        num_ships = max([0, *player1.ship_count, *player2.ship_count])  # Ship ids are 1..num_ships.
+        # Cells are int8 (a ship id on an unhit cell), so ship ids must fit in 1..127; ship sizes and the other
+        # per-ship fields are uint8, and rows and columns are stored in two bytes.
+        if num_ships > 127:
+            raise ValueError(f"a game state holds at most 127 ships, not {num_ships}")
+        if max([0, *player1.ship_sizes.values(), *player2.ship_sizes.values()]) > 255:
+            raise ValueError("a game state holds ships of size at most 255")
+        if not (1 <= rows <= 0xFFFF and 1 <= cols <= 0xFFFF):
+            raise ValueError(f"a game state board is at most 65535 x 65535, not {rows} x {cols}")
+        buffer = bytearray(GameState.buffer_size(rows, cols, num_ships))
+        GameState.HEADER.pack_into(buffer, 0, GameState.MAGIC, GameState.VERSION, rows, cols, num_ships, 0, 1, 0, 0, 0)
+        state = GameState(buffer)
+        state.phase = GameState.engine_phase(engine)
+        state.turn = engine.turn
+        state.show_own_board = engine.show_own_board
+        state.vertical = engine.ship_orientation == Orientation.VERTICAL
+        state.single_player = engine.single_player
+
+        for num, player in ((1, player1), (2, player2)):
+            cells, hit_ships, ship_count, ships_left, ship_sizes = state.players[num - 1]
+            for i, row in enumerate(player.board.cells):
+                cells[i * cols:(i + 1) * cols] = array("b", row)  # Same int8 format as the view.
+            for ship, hits in player.ship_hits.items():
+                for i, j in hits:
+                    hit_ships[i * cols + j] = ship
+            for ship, cells_left in player.ship_count.items():
+                ship_count[ship] = cells_left
+            for ship, ship_size in player.ship_sizes.items():
+                ship_sizes[ship] = ship_size
+            for ship in player.ships:
+                ships_left[ship] += 1
+            GameState.PLAYER_TAIL.pack_into(buffer, state.player_offset(num) + state.tail_offset, player.num_ship_cells, player.ships_placed)
+        return state
+
+    @staticmethod
+    def engine_phase(engine):
+        '''
+        Returns the phase number of an Engine.
+        '''
+        if engine.menu_phase:
+            return MENU_PHASE
+        if engine.place_ship_phase:
+            return PLACE_SHIP_PHASE
+        if engine.attack_phase:
+            return ATTACK_PHASE
+        return GAME_END_PHASE
+
+    # Header fields, read and written in place as properties (header_field only builds them).
+    def header_field(offset):
+        def get(self):
+            return self.buffer[offset]
+        def set(self, value):
+            self.buffer[offset] = int(value)
+        return property(get, set)
+    # The five one-byte fields at the end of the header.
+    phase = header_field(HEADER.size - 5)
+    turn = header_field(HEADER.size - 4)
+    show_own_board = header_field(HEADER.size - 3)
+    vertical = header_field(HEADER.size - 2)
+    single_player = header_field(HEADER.size - 1)
+    del header_field
+
+    def clone(self):
+        '''
+        Returns an independent copy of the state (one buffer copy).
+        '''
+        return GameState(bytearray(self.buffer))
+
+    def copy_from(self, other):
+        '''
+        Overwrites this state with another one of the same size, reusing this buffer.
+        '''
+        self.buffer[:] = other.buffer
+
+    def num_ship_cells(self, num):
+        '''
+        Returns how many ship cells player num has left.
+        '''
+        return self.PLAYER_TAIL.unpack_from(self.buffer, self.player_offset(num) + self.tail_offset)[0]
+
+    def is_loss(self, num):
+        '''
+        Returns True if player num has no ship cells left.
+        '''
+        return self.num_ship_cells(num) <= 0
+
+    def cell(self, num, i, j):
+        '''
+        Returns the value of cell (i, j) on player num's board.
+        '''
+        return self.players[num - 1][0][i * self.cols + j]
+
+    def place_attack(self, num, i, j):
+        '''
+        Attacks cell (i, j) on player num's board, with the same rules and results as Player.place_attack.
+        '''
+        cells, hit_ships, ship_count, _, _ = self.players[num - 1]
+        index = i * self.cols + j
+        value = cells[index]
+        if value == SUNK_CELL or value == HIT_CELL or value == MISS_CELL:
+            return False, MISS_CELL
+        if value == EMPTY_CELL:
+            cells[index] = MISS_CELL
+            return False, EMPTY_CELL
+
+        ship_count[value] -= 1  # Unhit ship cells hold the ship id.
+        hit_ships[index] = value
+        tail = self.player_offset(num) + self.tail_offset
+        self.PLAYER_TAIL.pack_into(self.buffer, tail, self.num_ship_cells(num) - 1, 1)
+        if ship_count[value] == 0:
+            for hit in self.ship_cells(num, value):
+                cells[hit] = SUNK_CELL
+        else:
+            cells[index] = HIT_CELL
+        return True, value
+
+    def ship_cells(self, num, ship):
+        '''
+        Returns the cell indices where player num's ship with the given id has been hit.
+        '''
+        hit_ships = self.players[num - 1][1].obj  # The underlying bytearray, for its fast find.
+        base = self.player_offset(num) + self.hits_offset
+        end = base + self.rows * self.cols
+        marker = bytes((ship,))
+        found = []
+        index = hit_ships.find(marker, base, end)
+        while index >= 0:
+            found.append(index - base)
+            index = hit_ships.find(marker, index + 1, end)
+        return found
+
+    def attack(self, i, j):
+        '''
+        The current player attacks (i, j), then the turn passes like in Engine.attack.
+        Returns:
+            True if an attack occurred, otherwise False.
+        '''
+        if self.phase != ATTACK_PHASE or not (0 <= i < self.rows and 0 <= j < self.cols):
+            return False
+        enemy = 2 if self.turn == 1 else 1
+        res, ship = self.place_attack(enemy, i, j)
+        if ship == MISS_CELL:
+            return False
+        if self.is_loss(enemy):
+            self.phase = GAME_END_PHASE
+        else:
+            self.turn = enemy
+        return True
+
+    def restore(self, engine, replay=None):
+        '''
+        Loads the state into an existing Engine (or Game), replacing both players' boards and fleets.
+        Messages are reset to fit the restored phase; load() restores saved messages afterwards.
+        Args:
+            replay: Optional replay bytes to continue recording into; otherwise recording stops.
+        '''
+        engine.menu_phase = self.phase == MENU_PHASE
+        engine.place_ship_phase = self.phase == PLACE_SHIP_PHASE
+        engine.attack_phase = self.phase == ATTACK_PHASE
+        engine.game_end_phase = self.phase == GAME_END_PHASE
+        engine.turn = self.turn
+        engine.show_own_board = bool(self.show_own_board)
+        engine.ship_orientation = Orientation.VERTICAL if self.vertical else Orientation.HORIZONTAL
+        engine.single_player = bool(self.single_player)
+        engine.player_names[2] = "Computer" if engine.single_player else "Player 2"
+
+        for num, player in ((1, engine.player1), (2, engine.player2)):
+            self.restore_player(num, player)
+
+        # The computer rebuilds its heatmaps from what is visible on Player 1's board.
+        engine.ai = engine.new_ai() if engine.single_player and engine.attack_phase else None
+        if hasattr(engine, "hints_stale"):
+            engine.hints_stale = True  # A Game solves its hints again for the restored boards.
+        engine.replay = ReplayLog.from_bytes(replay) if replay is not None else None
+        engine.last_move_message = ""
+        engine.win_message = f"{engine.player_names[engine.turn]} Has Won!" if engine.game_end_phase else ""
+        if engine.attack_phase:
+            engine.message = f"{engine.player_names[engine.turn]}'s Turn to Attack"
+            viewed = "OWN" if engine.show_own_board else "ENEMY'S"
+            engine.secondary_message = f"Viewing {viewed} Board [B to Switch]"
+        elif engine.place_ship_phase:
+            engine.message = f"{engine.player_names[engine.turn]}'s Turn to Place Ships"
+            engine.secondary_message = "Press R to Auto-Place Ships"
+
+    def restore_player(self, num, player):
+        '''
+        Rebuilds player num on a new board through get_ships, place_ship and place_attack (see rebuild_player),
+        so restoring works whatever the Player backend. The hits, sunk ships and cells left follow from the attacks.
+        Raises:
+            ValueError: If the ships in the state overlap or leave the board.
+        '''
+        cells, hit_ships, _, ships_left, ship_sizes = self.players[num - 1]
+        player.board = player.board_class(self.rows, self.cols)
+        player.get_ships(list(ship_sizes[1:]))  # Ids are given smallest ship first, as when the state was captured.
+        hit_cells = {index: ship for index, ship in enumerate(hit_ships) if ship}
+        ships = [ship for ship in range(1, self.num_ships + 1) if ships_left[ship]]
+        rebuild_player(player, cells.tolist(), hit_cells, ships)
+        player.ships_placed = bool(self.PLAYER_TAIL.unpack_from(self.buffer, self.player_offset(num) + self.tail_offset)[1])
+
+    def to_engine(self, engine_class=Engine):
+        '''
+        Returns a new Engine (or engine_class instance) holding this state.
+        '''
+        engine = engine_class()
+        self.restore(engine)
+        return engine
+
+    @staticmethod
+    def save(engine, path):
+        '''
+        Saves an Engine to a file: its state buffer, then its messages and replay log.
+        '''
+        state = GameState.capture(engine)
+        with open(path, "wb") as file:
+            file.write(GameState.LENGTH.pack(len(state.buffer)))
+            file.write(state.buffer)
+            for name in GameState.MESSAGES:
+                text = getattr(engine, name).encode()
+                file.write(GameState.LENGTH.pack(len(text)))
+                file.write(text)
+            replay = engine.replay.data if engine.replay is not None else b""
+            file.write(GameState.LENGTH.pack(len(replay)))
+            file.write(replay)
+
+    @staticmethod
+    def load(engine, path):
+        '''
+        Restores an Engine from a file written by save().
+        Returns:
+            The loaded GameState.
+        '''
+        with open(path, "rb") as file:
+            data = memoryview(file.read())
+        sections = []
+        offset = 0
+        while offset < len(data):
+            (length,) = GameState.LENGTH.unpack_from(data, offset)
+            offset += GameState.LENGTH.size
+            sections.append(data[offset:offset + length])
+            offset += length
+        if len(sections) != 2 + len(GameState.MESSAGES):
+            raise ValueError("not a saved game")
+
+        state = GameState(bytearray(sections[0]))
+        replay = sections[-1]
+        state.restore(engine, bytes(replay) if len(replay) else None)
+        for name, text in zip(GameState.MESSAGES, sections[1:-1]):
+            setattr(engine, name, bytes(text).decode())
+        return state
@@ -0,0 +1,191 @@
+# Filename: strategies.py
+# Description: This module defines the attack and placement strategies that computer players can use, with lookup tables by name for the tournament runner.
+# Inputs: The Player being attacked (attack strategies) or the Player placing ships (placement strategies)
+# Output: Attack coordinates and ship placements
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import random  # Random source for shot order and ship placement.
+import numpy as np  # Used to filter the board placement masks down to edge placements.
+from .board import Orientation
+from .constants import *  # Importing cell values like MISS_CELL.
+from .ai import ProbabilityAI  # The heatmap AI is one of the attack strategies.
+from .fleet import FleetSampler  # Uniform whole-fleet layouts.
+
+class RandomAttack:
+    def __init__(self, enemy, rng=None):
+        '''
+        Attacks every cell of the enemy board once, in random order.
+        '''
+        self.rng = rng or random.Random()
+        board = enemy.board
+        self.cells = [(i, j) for i in range(board.rows) for j in range(board.cols)]  # Every cell on the board.
+        self.rng.shuffle(self.cells)  # Shot order is a random permutation.
+
+    def choose_attack(self):
+        '''
+        Returns the next cell of the random permutation.
+        '''
+        return self.cells.pop()
+
+    def record_attack(self, i, j, res, ship):
+        '''
+        Random shooting ignores attack results.
+        '''
+
+class HuntTargetAttack:
+    def __init__(self, enemy, rng=None):
+        '''
+        Classic hunt/target play: hunt on a checkerboard pattern, then shoot around hits until the ship sinks.
+        '''
+        self.rng = rng or random.Random()
+        self.enemy = enemy
+        board = enemy.board
+        self.rows = board.rows
+        self.cols = board.cols
+        self.shot = set()  # Cells already attacked.
+        self.targets = []  # Stack of neighbours of unsunk hits to try next.
+        self.hunt_cells = [(i, j) for i in range(self.rows) for j in range(self.cols) if (i + j) % 2 == 0]  # Checkerboard cells.
+        self.rng.shuffle(self.hunt_cells)
+        self.other_cells = [(i, j) for i in range(self.rows) for j in range(self.cols) if (i + j) % 2 == 1]  # Only needed for size 1 ships.
+        self.rng.shuffle(self.other_cells)
+
+    def choose_attack(self):
+        '''
+        Returns a target cell next to a hit if there is one, otherwise the next hunting cell.
+        '''
+        for cells in (self.targets, self.hunt_cells, self.other_cells):
+            while cells:
+                cell = cells.pop()
+                if cell not in self.shot:
+                    return cell
+        return None
+
+    def record_attack(self, i, j, res, ship):
+        '''
+        Queues the neighbours of a hit, and forgets them once the ship is sunk.
+        '''
+        self.shot.add((i, j))
+        if not res:
+            return
+        if self.enemy.ship_count[ship] == 0:  # The ship sank, go back to hunting.
+            self.targets.clear()
+            return
+
+        for di, dj in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            ni, nj = i + di, j + dj
+            if 0 <= ni < self.rows and 0 <= nj < self.cols and (ni, nj) not in self.shot:
+                self.targets.append((ni, nj))
+
+class LargeBoardHuntAttack(HuntTargetAttack):
+    MAX_DRAWS = 64  # Random draws per hunting shot before the cells left are listed once.
+
+    def __init__(self, enemy, rng=None):
+        '''
+        Hunt/target play for very large boards: hunting cells are drawn at random when they are needed,
+        instead of listing and shuffling every cell of the board up front.
+        '''
+        self.rng = rng or random.Random()
+        self.enemy = enemy
+        board = enemy.board
+        self.rows = board.rows
+        self.cols = board.cols
+        self.shot = set()  # Cells already attacked.
+        self.targets = []  # Stack of neighbours of unsunk hits to try next.
+        self.hunt_cells = None  # Checkerboard cells left, only listed once random draws stop finding them.
+        self.other_cells = None
+
+    def choose_attack(self):
+        '''
+        Returns a target cell next to a hit if there is one, otherwise a random unshot checkerboard cell.
+        '''
+        while self.targets:
+            cell = self.targets.pop()
+            if cell not in self.shot:
+                return cell
+        if self.hunt_cells is None:
+            for _ in range(self.MAX_DRAWS):
+                cell = (self.rng.randrange(self.rows), self.rng.randrange(self.cols))
+                if (cell[0] + cell[1]) % 2 == 0 and cell not in self.shot:
+                    return cell
+            # Most of the board is shot, so list what is left and continue like HuntTargetAttack.
+            left = [(i, j) for i in range(self.rows) for j in range(self.cols) if (i, j) not in self.shot]
+            self.hunt_cells = [cell for cell in left if (cell[0] + cell[1]) % 2 == 0]
+            self.rng.shuffle(self.hunt_cells)
+            self.other_cells = [cell for cell in left if (cell[0] + cell[1]) % 2 == 1]
+            self.rng.shuffle(self.other_cells)
+        return super().choose_attack()
+
+class HeatmapAttack(ProbabilityAI):
+    ENDGAME_PLACEMENTS = 0  # Only the incremental heatmaps, never the exact endgame solver (under 1 ms a move, for long tournaments).
+
+class RandomPlacement:
+    @staticmethod
+    def choose(player, rng):
+        '''
+        Picks a uniformly random legal position for the player's next ship.
+        '''
+        return ProbabilityAI.choose_placement(player, rng)
+
+class UniformPlacement:
+    @staticmethod
+    def choose(player, rng):
+        '''
+        Picks the next ship's position from a fleet layout drawn uniformly from every legal layout of the remaining ships.
+        Drawing the rest of the fleet again for each ship keeps the whole layout uniform.
+        '''
+        board = player.board
+        layout = FleetSampler.for_board(board).sample_board(board, [player.ship_sizes[ship] for ship in player.ships], rng)
+        return None if layout is None else layout[-1]
+
+class EdgePlacement:
+    @staticmethod
+    def choose(player, rng):
+        '''
+        Picks a random legal position for the player's next ship that touches the edge of the board, if any.
+        '''
+        board = player.board
+        ship_size = player.ship_sizes[player.ships[-1]]
+        rows, cols = np.indices((board.rows, board.cols))  # Row and column of every starting cell.
+        options = []
+        for orientation in (Orientation.HORIZONTAL, Orientation.VERTICAL):
+            end_rows = rows + (ship_size - 1) * (orientation == Orientation.VERTICAL)  # Last cell of the ship.
+            end_cols = cols + (ship_size - 1) * (orientation == Orientation.HORIZONTAL)
+            on_edge = (rows == 0) | (cols == 0) | (end_rows == board.rows - 1) | (end_cols == board.cols - 1)
+            for cell in np.flatnonzero(on_edge & board.placement_mask(ship_size, orientation)):
+                options.append((int(cell), orientation))
+        if not options:
+            return RandomPlacement.choose(player, rng)  # Fall back to anywhere on the board.
+
+        cell, orientation = rng.choice(options)
+        i, j = divmod(cell, board.cols)
+        return i, j, orientation
+
+def place_fleet(player, placement_strategy, rng):
+    '''
+    Places all of the player's ships (largest first, like the placement phase) using a placement strategy.
+    Returns:
+        True if every ship was placed, otherwise False.
+    '''
+    while player.ships:
+        choice = placement_strategy.choose(player, rng)
+        if choice is None or not player.place_ship(choice[0], choice[1], player.ships[-1], choice[2]):
+            return False
+        player.ships.pop()
+    player.ships_placed = True
+    return True
+
+# Strategies by name, used by the tournament runner.
+ATTACK_STRATEGIES = {
+    "random": RandomAttack,
+    "hunt": HuntTargetAttack,
+    "large_hunt": LargeBoardHuntAttack,
+    "probability": ProbabilityAI,
+    "heatmap": HeatmapAttack,
+}
+PLACEMENT_STRATEGIES = {
+    "random": RandomPlacement,
+    "uniform": UniformPlacement,
+    "edge": EdgePlacement,
+}
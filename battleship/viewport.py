@@ -0,0 +1,109 @@
+# Filename: viewport.py
+# Description: This module defines the Viewport class, the pan/zoom camera over the board area of the window. It maps between window pixels and board cells and works out which cells are visible, so the renderer only draws those and boards up to 1000x1000 stay interactive.
+# Inputs: The board size, mouse wheel zoom steps and pan distances in pixels
+# Output: Cell positions on the window, the cell under the mouse, and the range of visible rows and columns
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import math  # Rounding the visible range outwards.
+from .constants import *  # Importing the board area position and the cell size.
+
+class Viewport:
+    ZOOM_STEP = 1.25  # Cell size factor for one mouse wheel step.
+
+    def __init__(self, left=BOARD_PADDING_LEFT, top=BOARD_PADDING_TOP, width=BOARD_VIEW_SIZE, height=BOARD_VIEW_SIZE):
+        '''
+        Initializes a viewport over a 10x10 board drawn at CELL_SIZE, the same layout as the fixed board.
+        Args:
+            left, top: Window position of the top-left corner of the board area.
+            width, height: Size of the board area in pixels.
+        '''
+        self.left = left
+        self.top = top
+        self.width = width
+        self.height = height
+        self.rows = 10  # Size of the board being shown.
+        self.cols = 10
+        self.cell_size = float(CELL_SIZE)  # Current zoom, in pixels per cell.
+        self.row = 0.0  # Board row (fractional) at the top edge of the area.
+        self.col = 0.0  # Board column (fractional) at the left edge of the area.
+
+    def fits(self, rows, cols):
+        '''
+        Checks if a whole board of this size fits in the area at CELL_SIZE, so it never needs panning or zooming.
+        '''
+        return rows * CELL_SIZE <= self.height and cols * CELL_SIZE <= self.width
+
+    def min_cell_size(self):
+        '''
+        Returns the smallest zoom: the whole board fits in the area.
+        '''
+        return min(float(CELL_SIZE), self.width / self.cols, self.height / self.rows)
+
+    def show(self, rows, cols):
+        '''
+        Switches to a board of the given size; a new size starts zoomed out to the whole board.
+        '''
+        if (rows, cols) == (self.rows, self.cols):
+            return
+        self.rows = rows
+        self.cols = cols
+        self.cell_size = float(CELL_SIZE) if self.fits(rows, cols) else self.min_cell_size()
+        self.row = 0.0
+        self.col = 0.0
+
+    def clamp(self):
+        '''
+        Keeps the view on the board: it can not be scrolled past the last row or column.
+        '''
+        self.row = min(max(self.row, 0.0), max(self.rows - self.height / self.cell_size, 0.0))
+        self.col = min(max(self.col, 0.0), max(self.cols - self.width / self.cell_size, 0.0))
+
+    def zoom_at(self, steps, x, y):
+        '''
+        Zooms in (positive steps) or out around window position (x, y), keeping the cell under it in place.
+        '''
+        old = self.cell_size
+        size = min(max(old * self.ZOOM_STEP ** steps, self.min_cell_size()), float(CELL_SIZE))
+        anchor_row = self.row + (y - self.top) / old  # Board position under the cursor.
+        anchor_col = self.col + (x - self.left) / old
+        self.cell_size = size
+        self.row = anchor_row - (y - self.top) / size
+        self.col = anchor_col - (x - self.left) / size
+        self.clamp()
+
+    def pan(self, dx, dy):
+        '''
+        Moves the board by (dx, dy) pixels on the window, like dragging it.
+        '''
+        self.col -= dx / self.cell_size
+        self.row -= dy / self.cell_size
+        self.clamp()
+
+    def contains(self, x, y):
+        '''
+        Checks if window position (x, y) is inside the board area.
+        '''
+        return self.left <= x < self.left + self.width and self.top <= y < self.top + self.height
+
+    def cell_at(self, x, y):
+        '''
+        Returns the (i, j) board cell under window position (x, y), or (-1, -1) outside the board area.
+        '''
+        if not self.contains(x, y):
+            return (-1, -1)
+        return (int(self.row + (y - self.top) / self.cell_size), int(self.col + (x - self.left) / self.cell_size))
+
+    def position(self, i, j):
+        '''
+        Returns the window position (x, y) of the top-left corner of cell (i, j).
+        '''
+        return (self.left + (j - self.col) * self.cell_size, self.top + (i - self.row) * self.cell_size)
+
+    def visible(self):
+        '''
+        Returns (first_row, last_row, first_col, last_col) of the cells at least partly inside the area; the last ones are exclusive.
+        '''
+        return (int(self.row), min(self.rows, math.ceil(self.row + self.height / self.cell_size)),
+                int(self.col), min(self.cols, math.ceil(self.col + self.width / self.cell_size)))
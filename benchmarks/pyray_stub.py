@@ -0,0 +1,140 @@
+# Filename: pyray_stub.py
+# Description: This module provides a headless, recording stand-in for the pyray API so the renderer and game loop can be benchmarked without a window. Every call is counted, and input (mouse position, clicks, key presses) is scripted by the benchmark.
+# Inputs: Scripted input set by the benchmark before each frame
+# Output: Per-frame counts of every pyray call, and of draw calls in particular
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import sys  # Installing the stub in place of the real pyray module.
+import types  # Building the stub module and simple return values.
+from collections import Counter  # Counting calls per function.
+
+# Functions that issue draw work (each one is at least one draw call in raylib).
+DRAW_FUNCTIONS = (
+    "clear_background", "draw_text", "draw_text_ex", "draw_line", "draw_rectangle", "draw_rectangle_lines",
+    "draw_rectangle_lines_ex", "draw_texture_rec", "draw_rectangle_rec",
+)
+# Functions that are recorded but do not draw anything.
+OTHER_FUNCTIONS = (
+    "init_window", "close_window", "begin_drawing", "end_drawing", "begin_texture_mode", "end_texture_mode",
+    "load_render_texture", "unload_render_texture", "measure_text_ex", "get_font_default", "get_mouse_position",
+    "is_mouse_button_pressed", "get_key_pressed", "is_key_pressed", "window_should_close", "set_target_fps", "set_texture_filter",
+    "get_mouse_wheel_move", "get_mouse_delta", "is_mouse_button_down", "is_key_down", "begin_scissor_mode", "end_scissor_mode",
+    "load_font_data", "unload_font_data", "gen_image_font_atlas", "export_image", "load_image", "unload_image",
+    "load_texture_from_image", "mem_free", "enable_event_waiting", "disable_event_waiting",
+)
+
+class RecordingPyray(types.ModuleType):
+    def __init__(self):
+        '''
+        Creates the stub module with recording versions of every pyray function the game uses.
+        '''
+        super().__init__("pyray")
+        self.calls = Counter()  # Function name is the key, number of calls since the last reset is the value.
+        self.mouse = (0, 0)  # Scripted mouse position in window pixels.
+        self.pressed_buttons = set()  # Mouse buttons pressed this frame.
+        self.pressed_keys = []  # Keys pressed this frame, returned one by one by get_key_pressed.
+        self.held_buttons = set()  # Mouse buttons held down this frame.
+        self.held_keys = set()  # Keys held down this frame.
+        self.wheel = 0.0  # Mouse wheel movement this frame.
+        self.mouse_delta = (0, 0)  # Mouse movement since the previous frame.
+        self.frames_left = 0  # Frames until window_should_close returns True.
+
+        # Plain values and struct constructors.
+        self.WHITE = (255, 255, 255, 255)
+        self.BLACK = (0, 0, 0, 255)
+        self.RED = (230, 41, 55, 255)
+        self.GREEN = (0, 228, 48, 255)
+        self.GRAY = (130, 130, 130, 255)
+        self.BLUE = (0, 121, 241, 255)
+        self.BLANK = (0, 0, 0, 0)
+        self.FONT_DEFAULT = 0
+        self.Color = lambda r, g, b, a: (r, g, b, a)
+        self.Rectangle = lambda x, y, width, height: (x, y, width, height)
+        self.Vector2 = lambda x, y: types.SimpleNamespace(x=x, y=y)
+        self.MouseButton = types.SimpleNamespace(MOUSE_BUTTON_LEFT=0, MOUSE_BUTTON_RIGHT=1, MOUSE_BUTTON_MIDDLE=2)
+        self.TextureFilter = types.SimpleNamespace(TEXTURE_FILTER_BILINEAR=1)
+        self.KeyboardKey = types.SimpleNamespace(KEY_F3=292, KEY_F4=293, KEY_RIGHT=262, KEY_LEFT=263, KEY_DOWN=264, KEY_UP=265)
+
+        for name in DRAW_FUNCTIONS + OTHER_FUNCTIONS:
+            setattr(self, name, self.recorder(name, getattr(self, "fake_" + name, None)))
+        # Only the pyray names are exported by "from pyray import *", not the module attributes or the scripted input.
+        self.__all__ = [name for name in vars(self) if not name.startswith("_") and name not in ("calls", "mouse", "pressed_buttons", "pressed_keys", "held_buttons", "held_keys", "wheel", "mouse_delta", "frames_left")]
+
+    def recorder(self, name, implementation):
+        '''
+        Returns a function that counts its calls and returns the fake implementation's result (or None).
+        '''
+        calls = self.calls
+        def record(*args, **kwargs):
+            calls[name] += 1
+            if implementation is not None:
+                return implementation(*args, **kwargs)
+            return None
+        return record
+
+    def fake_get_mouse_position(self):
+        return types.SimpleNamespace(x=self.mouse[0], y=self.mouse[1])
+
+    def fake_is_mouse_button_pressed(self, button):
+        return button in self.pressed_buttons
+
+    def fake_is_mouse_button_down(self, button):
+        return button in self.held_buttons
+
+    def fake_get_mouse_wheel_move(self):
+        return self.wheel
+
+    def fake_get_mouse_delta(self):
+        return types.SimpleNamespace(x=self.mouse_delta[0], y=self.mouse_delta[1])
+
+    def fake_is_key_down(self, key):
+        return key in self.held_keys
+
+    def fake_get_key_pressed(self):
+        return self.pressed_keys.pop(0) if self.pressed_keys else 0
+
+    def fake_is_key_pressed(self, key):
+        return key in self.pressed_keys
+
+    def fake_window_should_close(self):
+        self.frames_left -= 1
+        return self.frames_left < 0
+
+    def fake_load_render_texture(self, width, height):
+        return types.SimpleNamespace(texture=types.SimpleNamespace(width=width, height=height))
+
+    def fake_measure_text_ex(self, font, text, fontSize, spacing):
+        lines = text.split("\n")
+        return types.SimpleNamespace(x=max(len(line) for line in lines) * fontSize * 0.5, y=len(lines) * fontSize)
+
+    def draw_call_count(self):
+        '''
+        Returns the number of draw calls recorded since the last reset.
+        '''
+        return sum(self.calls[name] for name in DRAW_FUNCTIONS)
+
+    def reset(self):
+        '''
+        Clears the call counts and the scripted input for the next frame.
+        '''
+        self.calls.clear()
+        self.pressed_buttons.clear()
+        self.pressed_keys.clear()
+        self.held_buttons.clear()
+        self.held_keys.clear()
+        self.wheel = 0.0
+        self.mouse_delta = (0, 0)
+
+def install():
+    '''
+    Installs the stub as the "pyray" module. Must run before anything from the battleship package is imported.
+    Returns:
+        The installed RecordingPyray module.
+    '''
+    if "battleship.renderer" in sys.modules:
+        raise RuntimeError("install the pyray stub before importing the battleship package")
+    stub = RecordingPyray()
+    sys.modules["pyray"] = stub
+    return stub
@@ -0,0 +1,438 @@
+# Filename: run_benchmarks.py
+# Description: This script benchmarks the game logic, the renderer and the package startup, and reports time per call and draw calls per frame. Each bench_* function describes what it measures.
+# Inputs: Command line arguments (number of games and frames, seed, output file, optional baseline to compare against)
+# Output: JSON results (and a list of regressions when a baseline is given)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import os  # Locating the repository root.
+import sys  # Making the battleship package importable.
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # The repository root holds the battleship package.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import pyray_stub  # The stub must replace pyray before the battleship package is imported.
+STUB = pyray_stub.install()
+
+import argparse  # Command line parsing.
+import json  # Machine-readable output.
+import platform  # Recording the environment with the results.
+import random  # Seeded randomized games.
+import statistics  # Frame time summaries.
+import subprocess  # Fresh interpreters for the startup benchmark.
+import time  # Timing.
+import numpy as np  # Seeding the batched fleet sampler.
+from battleship.board import Orientation
+from battleship.player import Player
+from battleship.bitboard import BitPlayer
+from battleship.sparse import SparsePlayer
+from battleship.fleet import FleetSampler
+from battleship.batch import BatchSimulator, BATCH_POLICIES
+from battleship.renderer import Renderer
+from battleship.game import Game
+from battleship.constants import *
+
+BACKENDS = {"list": Player, "bitmask": BitPlayer, "sparse": SparsePlayer}  # Player classes benchmarked by the logic benchmarks.
+# Metrics checked by --baseline. Maximum frame times are left out, they are too noisy to compare between runs.
+COMPARED_METRICS = ("ns_per_call", "frame_us_mean", "draw_calls_mean", "draw_calls_max", "draw_calls_last", "import_ms_median")
+# Modules timed by the startup benchmark; True if the module may load pyray (the window front end).
+STARTUP_MODULES = {
+    "battleship": False,
+    "battleship.constants": False,
+    "battleship.board": False,
+    "battleship.player": False,
+    "battleship.engine": False,
+    "battleship.game": True,
+}
+# Run in a fresh interpreter: prints the import time in ns and whether pyray got loaded.
+STARTUP_SCRIPT = "import sys, time; start = time.perf_counter_ns(); import {module}; print(time.perf_counter_ns() - start, int('pyray' in sys.modules))"
+
+class Timer:
+    def __init__(self):
+        '''
+        Accumulates the time and number of calls of one operation.
+        '''
+        self.total_ns = 0
+        self.calls = 0
+
+    def result(self):
+        '''
+        Returns the summary stored in the JSON output.
+        '''
+        return {"calls": self.calls, "total_ms": self.total_ns / 1e6, "ns_per_call": self.total_ns / max(self.calls, 1)}
+
+def bench_logic(player_class, games, seed):
+    '''
+    Plays full randomized games (random placement attempts, random attack order) and times every
+    is_placeable_on, place_ship, place_attack, is_loss and change_cells_to_sunk call of one backend.
+    logic_speedups then compares each backend against the list Player.
+    '''
+    clock = time.perf_counter_ns
+    timers = {name: Timer() for name in ("is_placeable_on", "place_ship", "place_attack", "is_loss", "change_cells_to_sunk")}
+    rng = random.Random(seed)
+    for _ in range(games):
+        player = player_class(1)
+        player.get_ships(5)
+        board = player.board
+        for ship in reversed(player.ships):  # Place ships largest first, like the placement phase.
+            ship_size = player.ship_sizes[ship]
+            while True:
+                i, j = rng.randrange(board.rows), rng.randrange(board.cols)
+                orientation = rng.choice((Orientation.HORIZONTAL, Orientation.VERTICAL))
+                start = clock()
+                placeable = board.is_placeable_on(i, j, ship_size, orientation)
+                timers["is_placeable_on"].total_ns += clock() - start
+                timers["is_placeable_on"].calls += 1
+                if placeable:
+                    start = clock()
+                    player.place_ship(i, j, ship, orientation)
+                    timers["place_ship"].total_ns += clock() - start
+                    timers["place_ship"].calls += 1
+                    break
+
+        cells = [(i, j) for i in range(board.rows) for j in range(board.cols)]
+        rng.shuffle(cells)
+        for i, j in cells:
+            start = clock()
+            player.place_attack(i, j)
+            timers["place_attack"].total_ns += clock() - start
+            timers["place_attack"].calls += 1
+            start = clock()
+            lost = player.is_loss()
+            timers["is_loss"].total_ns += clock() - start
+            timers["is_loss"].calls += 1
+            if lost:
+                break
+
+        for ship_size in player.ship_hits:  # Every ship is sunk now; sinking again rewrites the same cells.
+            start = clock()
+            player.change_cells_to_sunk(ship_size)
+            timers["change_cells_to_sunk"].total_ns += clock() - start
+            timers["change_cells_to_sunk"].calls += 1
+    return {name: timer.result() for name, timer in timers.items()}
+
+def logic_speedups(logic):
+    '''
+    Returns, for every backend, how many times faster than the list Player each operation is (above 1 is faster).
+    '''
+    reference = logic["list"]
+    return {name: {operation: round(reference[operation]["ns_per_call"] / max(timer["ns_per_call"], 1e-9), 2)
+                   for operation, timer in timers.items()}
+            for name, timers in logic.items() if name != "list"}
+
+def bench_fleet(layouts, seed):
+    '''
+    Times uniform fleet layout sampling (ships 1..5 on a 10x10 board), one layout at a time and in NumPy batches.
+    '''
+    sampler = FleetSampler(10, 10)
+    ship_sizes = [1, 2, 3, 4, 5]
+    sampler.sample_batch(ship_sizes, 1)  # Build the placement index outside the timed part.
+    results = {}
+
+    rng = random.Random(seed)
+    timer = Timer()
+    start = time.perf_counter_ns()
+    for _ in range(layouts):
+        sampler.sample(ship_sizes, 0, rng)
+    timer.total_ns, timer.calls = time.perf_counter_ns() - start, layouts
+    results["sample"] = timer.result()
+
+    timer = Timer()
+    start = time.perf_counter_ns()
+    sampler.sample_batch(ship_sizes, 10 * layouts, np.random.default_rng(seed))
+    timer.total_ns, timer.calls = time.perf_counter_ns() - start, 10 * layouts  # Per layout, so both rows compare.
+    results["sample_batch"] = timer.result()
+
+    for result in results.values():
+        result["layouts_per_s"] = 1e9 / result["ns_per_call"]
+    return results
+
+def bench_batch(games, seed):
+    '''
+    Plays games full games (ships 1..5 on a 10x10 board) in lockstep with BatchSimulator: times attack alone with a random
+    shot order, then every batched policy including choosing the shots. ns_per_call is per shot, so it compares with place_attack.
+    '''
+    rng = np.random.default_rng(seed)
+    simulator = BatchSimulator(games, fleet=5)
+    results = {}
+
+    simulator.place_random(rng)
+    order = np.argsort(rng.random((games, simulator.rows * simulator.cols)), axis=1)  # A random shot order for every game.
+    timer = Timer()
+    start = time.perf_counter_ns()
+    for step in range(order.shape[1]):
+        simulator.attack(order[:, step] // simulator.cols, order[:, step] % simulator.cols)
+    timer.total_ns, timer.calls = time.perf_counter_ns() - start, int(simulator.shots.sum())
+    results["attack"] = timer.result()
+
+    for name, policy in BATCH_POLICIES.items():
+        simulator.place_random(rng)
+        timer = Timer()
+        start = time.perf_counter_ns()
+        shots = simulator.play(policy, rng)
+        timer.total_ns, timer.calls = time.perf_counter_ns() - start, int(shots.sum())
+        results[name] = timer.result()
+        results[name]["shots_mean"] = float(shots.mean())
+
+    for result in results.values():
+        result["shots_per_s"] = 1e9 / result["ns_per_call"]
+    return results
+
+def summarize_frames(draw_calls, frame_ns):
+    '''
+    Summarizes per-frame draw-call counts and frame times.
+    '''
+    if not draw_calls:
+        return {"frames": 0}
+    return {
+        "frames": len(draw_calls),
+        "draw_calls_mean": statistics.fmean(draw_calls),
+        "draw_calls_max": max(draw_calls),
+        "draw_calls_last": draw_calls[-1],
+        "frame_us_mean": statistics.fmean(frame_ns) / 1e3,
+        "frame_us_max": max(frame_ns) / 1e3,
+    }
+
+def board_mouse_position(i, j):
+    '''
+    Returns the window position of the center of board cell (i, j).
+    '''
+    return (BOARD_PADDING_LEFT + j * CELL_SIZE + CELL_SIZE // 2, BOARD_PADDING_TOP + i * CELL_SIZE + CELL_SIZE // 2)
+
+def bench_draw_board(frames, seed):
+    '''
+    Draws a mid-game board for a number of frames (own and enemy views), attacking one cell every few frames,
+    and counts the draw calls the recording pyray stub receives per frame.
+    '''
+    rng = random.Random(seed)
+    player = Player(1)
+    player.get_ships(5)
+    for ship_size in range(5, 0, -1):
+        while not player.place_ship(rng.randrange(10), rng.randrange(10), ship_size, rng.choice(list(Orientation))):
+            pass
+    cells = [(i, j) for i in range(player.board.rows) for j in range(player.board.cols)]
+    rng.shuffle(cells)
+
+    results = {}
+    for view, is_other_player in (("own", False), ("enemy", True)):
+        draw_calls = []
+        frame_ns = []
+        for frame in range(frames):
+            STUB.reset()
+            STUB.mouse = board_mouse_position(rng.randrange(10), rng.randrange(10))
+            if frame % 10 == 9 and cells:
+                player.place_attack(*cells.pop())  # Change a cell now and then so dirty redraws are measured too.
+            start = time.perf_counter_ns()
+            Renderer.draw_board(player.board, is_other_player, 3, Orientation.HORIZONTAL)
+            frame_ns.append(time.perf_counter_ns() - start)
+            draw_calls.append(STUB.draw_call_count())
+        results[view] = summarize_frames(draw_calls, frame_ns)
+    return results
+
+def bench_draw_large(frames, seed):
+    '''
+    Draws the enemy view of a 1000x1000 sparse board with 50 ships and 5000 shots through the pan/zoom viewport,
+    zooming in one wheel step per frame from the whole board down to full-size cells and back, with a shot every few frames.
+    '''
+    rng = random.Random(seed)
+    player = SparsePlayer(1)
+    player.board = player.board_class(1000, 1000)
+    player.get_ships(50)
+    layout = FleetSampler.for_board(player.board).sample_board(player.board, [player.ship_sizes[ship] for ship in player.ships], rng)
+    for ship, (i, j, orientation) in zip(player.ships, layout):
+        player.place_ship(i, j, ship, orientation)
+    for _ in range(5000):
+        player.place_attack(rng.randrange(1000), rng.randrange(1000))
+
+    view = Renderer.viewport
+    view.show(player.board.rows, player.board.cols)
+    draw_calls = []
+    frame_ns = []
+    for frame in range(frames):
+        STUB.reset()
+        STUB.mouse = (BOARD_PADDING_LEFT + BOARD_VIEW_SIZE // 2, BOARD_PADDING_TOP + BOARD_VIEW_SIZE // 2)
+        view.zoom_at(1 if frame // 20 % 2 == 0 else -1, *STUB.mouse)  # Twenty steps in, twenty steps out.
+        if frame % 10 == 9:
+            player.place_attack(rng.randrange(1000), rng.randrange(1000))
+        start = time.perf_counter_ns()
+        Renderer.draw_board(player.board, True)
+        frame_ns.append(time.perf_counter_ns() - start)
+        draw_calls.append(STUB.draw_call_count())
+    return summarize_frames(draw_calls, frame_ns)
+
+def bench_attack_large(shots, seed):
+    '''
+    Times place_attack on a 1000x1000 board with 50 ships, for the list Player and the sparse backend,
+    with the same fleet and the same random shots (repeats included).
+    '''
+    results = {}
+    for name, player_class in (("list", Player), ("sparse", SparsePlayer)):
+        rng = random.Random(seed)
+        player = player_class(1)
+        player.board = player.board_class(1000, 1000)
+        player.get_ships(50)
+        layout = FleetSampler.for_board(player.board).sample_board(player.board, [player.ship_sizes[ship] for ship in player.ships], rng)
+        for ship, (i, j, orientation) in zip(player.ships, layout):
+            player.place_ship(i, j, ship, orientation)
+        cells = [(rng.randrange(1000), rng.randrange(1000)) for _ in range(shots)]
+        cells += [(i, j) for i, j, _ in layout]  # Hit the first cell of every ship too.
+        timer = Timer()
+        clock = time.perf_counter_ns
+        for i, j in cells:
+            start = clock()
+            player.place_attack(i, j)
+            timer.total_ns += clock() - start
+            timer.calls += 1
+        results[name] = timer.result()
+    return results
+
+def script_input(game, rng, frame):
+    '''
+    Sets the stub's input for one frame of a scripted two-player game.
+    '''
+    if frame % 3:
+        return  # Leave idle frames in between, like a real player.
+    if game.menu_phase:
+        STUB.pressed_keys.append(ASCII_0 + 5)  # Play with 5 ships.
+    elif game.place_ship_phase:
+        player = game.current_player()
+        if rng.random() < 0.2:
+            STUB.pressed_buttons.add(STUB.MouseButton.MOUSE_BUTTON_RIGHT)  # Rotate now and then.
+            return
+        legal = [(i, j) for i in range(player.board.rows) for j in range(player.board.cols)
+                 if player.board.is_placeable_on(i, j, player.ship_sizes[player.ships[-1]], game.ship_orientation)]
+        STUB.mouse = board_mouse_position(*rng.choice(legal))
+        STUB.pressed_buttons.add(STUB.MouseButton.MOUSE_BUTTON_LEFT)
+    elif game.attack_phase:
+        STUB.mouse = board_mouse_position(rng.randrange(10), rng.randrange(10))
+        STUB.pressed_buttons.add(STUB.MouseButton.MOUSE_BUTTON_LEFT)
+
+def bench_game_loop(games, seed):
+    '''
+    Runs scripted games through Game.game_loop against the recording pyray stub and records draw calls and frame time per phase.
+    '''
+    rng = random.Random(seed)
+    per_phase = {"menu": ([], []), "placement": ([], []), "attack": ([], []), "game_end": ([], [])}
+    for _ in range(games):
+        game = Game()
+        frame = 0
+        end_frames = 0
+        while end_frames < 30:  # Keep drawing the end screen for a few frames.
+            phase = "menu" if game.menu_phase else "placement" if game.place_ship_phase else "attack" if game.attack_phase else "game_end"
+            STUB.reset()
+            script_input(game, rng, frame)
+            start = time.perf_counter_ns()
+            game.game_loop()
+            per_phase[phase][1].append(time.perf_counter_ns() - start)
+            per_phase[phase][0].append(STUB.draw_call_count())
+            frame += 1
+            end_frames += game.game_end_phase
+    return {phase: summarize_frames(*data) for phase, data in per_phase.items()}
+
+def bench_startup(runs):
+    '''
+    Imports each of STARTUP_MODULES in runs fresh interpreters (the real pyray, not the stub) and records the import time.
+    A module that fails to import gets an "error" entry with the last line of its traceback; the others are still timed.
+    startup_regressions then checks that the logic modules did not load pyray.
+    '''
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = {}
+    for module in STARTUP_MODULES:
+        times = []
+        loads_pyray = False
+        try:
+            for _ in range(runs):
+                output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT.format(module=module)], cwd=root,
+                                        capture_output=True, text=True, check=True).stdout
+                import_ns, pyray_loaded = output.split()[-2:]  # raylib prints its own banner first.
+                times.append(int(import_ns) / 1e6)
+                loads_pyray |= pyray_loaded == "1"
+        except subprocess.CalledProcessError as error:
+            lines = error.stderr.strip().splitlines() or [f"exit status {error.returncode}"]
+            results[module] = {"runs": runs, "error": lines[-1]}
+            continue
+        results[module] = {"runs": runs, "import_ms_median": statistics.median(times), "import_ms_min": min(times), "loads_pyray": loads_pyray}
+    return results
+
+def startup_regressions(results):
+    '''
+    Returns a list of the modules that failed to import, and of the logic modules that load pyray on import;
+    they must stay importable without a display.
+    '''
+    regressions = []
+    for module, result in results["results"]["startup"].items():
+        if "error" in result:
+            regressions.append(f"startup.{module}: {result['error']}")
+        elif result["loads_pyray"] and not STARTUP_MODULES[module]:
+            regressions.append(f"startup.{module}: imports pyray")
+    return regressions
+
+def compare(results, baseline, threshold):
+    '''
+    Returns a list of human-readable regressions: timings that got slower, or draw-call counts that grew,
+    by more than the threshold fraction compared with the baseline results.
+    '''
+    regressions = []
+    def walk(path, new, old):
+        if isinstance(new, dict) and isinstance(old, dict):
+            for key in new:
+                if key in old:
+                    walk(path + [key], new[key], old[key])
+        elif isinstance(new, (int, float)) and isinstance(old, (int, float)) and old > 0:
+            if path[-1] in COMPARED_METRICS and new > old * (1 + threshold):
+                regressions.append(f"{'.'.join(path)}: {old:.3f} -> {new:.3f} (+{(new / old - 1):.1%})")
+    walk([], results["results"], baseline["results"])
+    return regressions
+
+def main():
+    '''
+    Parses the command line, runs every benchmark and writes the JSON results.
+    '''
+    parser = argparse.ArgumentParser(description="Benchmark the Battleship Board, Player and Renderer hot paths.")
+    parser.add_argument("--games", type=int, default=2000, help="randomized games for the logic benchmarks")
+    parser.add_argument("--layouts", type=int, default=100000, help="fleet layouts for the sampling benchmark (ten times as many batched)")
+    parser.add_argument("--batch-games", type=int, default=20000, help="games played in lockstep for the batch benchmark")
+    parser.add_argument("--frames", type=int, default=600, help="frames for the draw_board benchmark")
+    parser.add_argument("--loop-games", type=int, default=5, help="scripted games for the game_loop benchmark")
+    parser.add_argument("--startup-runs", type=int, default=10, help="fresh interpreters per module for the startup benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="seed for reproducible runs")
+    parser.add_argument("-o", "--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    logic = {name: bench_logic(player_class, args.games, args.seed) for name, player_class in BACKENDS.items()}
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {"games": args.games, "layouts": args.layouts, "batch_games": args.batch_games, "frames": args.frames, "loop_games": args.loop_games, "startup_runs": args.startup_runs, "seed": args.seed},
+        "logic_speedup": logic_speedups(logic),  # Not compared against a baseline: it is a ratio of the timings below.
+        "results": {
+            "logic": logic,
+            "fleet": bench_fleet(args.layouts, args.seed),
+            "batch": bench_batch(args.batch_games, args.seed),
+            "draw_board": bench_draw_board(args.frames, args.seed),
+            "draw_board_large": bench_draw_large(args.frames, args.seed),
+            "attack_large": bench_attack_large(100 * args.frames, args.seed),
+            "game_loop": bench_game_loop(args.loop_games, args.seed),
+            "startup": bench_startup(args.startup_runs),
+        },
+    }
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    regressions = startup_regressions(results)
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions += compare(results, json.load(file), args.threshold)
+    for regression in regressions:
+        print("REGRESSION", regression, file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+# Filename: server_load.py
+# Description: This script load-tests the match server over localhost. It opens two bot connections per match, plays every match to the end with random legal placements and attacks, and reports move round-trip latency percentiles and throughput. Optional spectator connections watch the newest match and report the bytes they receive per move.
+# Inputs: Command line arguments (number of matches, ships, spectators, host and port, or --spawn to start a server process)
+# Output: JSON results with matches played, moves per second, round-trip latency percentiles and spectator traffic
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import os  # Locating the repository root.
+import sys  # Making the battleship package importable.
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # The repository root holds the battleship package.
+
+import argparse  # Command line parsing.
+import asyncio  # Running thousands of bot connections in one process.
+import json  # Machine-readable output.
+import random  # Random placements and shot order.
+import resource  # Raising the open file limit for many sockets.
+import subprocess  # Optionally starting the server in its own process.
+import time  # Latency measurement.
+from battleship.player import Player
+from battleship.ai import ProbabilityAI
+from battleship import protocol
+
+class Bot(asyncio.Protocol):
+    def __init__(self, num_ships, rng, results):
+        '''
+        One scripted player: joins, places its whole fleet in one batch, then attacks random cells on its turns.
+        '''
+        self.num_ships = num_ships
+        self.rng = rng
+        self.results = results  # Shared dict of latencies and counters.
+        self.transport = None
+        self.incoming = bytearray()
+        self.num = 0
+        self.cells = []  # Shot order.
+        self.sent_at = 0  # perf_counter_ns when the pending attack was sent.
+        self.finished = asyncio.get_running_loop().create_future()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def join(self):
+        '''
+        Asks for a match. Called once every bot is connected, so all matches run at the same time.
+        '''
+        self.transport.write(protocol.pack(protocol.JOIN, self.num_ships))
+
+    def connection_lost(self, exc):
+        if not self.finished.done():
+            self.finished.set_result(False)
+
+    def data_received(self, data):
+        self.incoming += data
+        my_turn = False
+        for kind, arg, i, j in protocol.split(self.incoming):
+            if kind == protocol.START:
+                self.num = arg
+                self.place_fleet()
+            elif kind == protocol.ATTACK_START and arg == self.num:
+                my_turn = True
+            elif kind == protocol.SHOT:
+                if arg & 3 == self.num:
+                    self.results["latency"].append(time.perf_counter_ns() - self.sent_at)
+                    self.results["moves"] += 1
+                else:
+                    my_turn = True  # The opponent shot, so it is our turn unless a GAME_OVER follows in the batch.
+            elif kind == protocol.GAME_OVER:
+                self.results["finished"] += arg == self.num  # Count each match once, from the winner.
+                self.finished.set_result(True)
+                self.transport.close()
+            elif kind in (protocol.REJECTED, protocol.OPPONENT_LEFT):
+                self.results["errors"] += 1
+        if my_turn:
+            self.attack()
+
+    def place_fleet(self):
+        '''
+        Sends every placement at once, chosen legal on a local copy of the board.
+        '''
+        player = Player(self.num)
+        player.get_ships(self.num_ships)
+        messages = bytearray()
+        while player.ships:
+            i, j, orientation = ProbabilityAI.choose_placement(player, self.rng)
+            ship = player.ships.pop()
+            player.place_ship(i, j, ship, orientation)
+            arg = ship | (protocol.VERTICAL_FLAG if orientation.value else 0)
+            messages += protocol.pack(protocol.PLACE, arg, i, j)
+        self.cells = [(i, j) for i in range(10) for j in range(10)]
+        self.rng.shuffle(self.cells)
+        self.transport.write(messages)
+
+    def attack(self):
+        '''
+        Sends the next attack and remembers when, for the round-trip latency.
+        '''
+        if self.finished.done() or not self.cells:
+            return
+        i, j = self.cells.pop()
+        self.sent_at = time.perf_counter_ns()
+        self.transport.write(protocol.pack(protocol.ATTACK, 0, i, j))
+
+class Spectator(asyncio.Protocol):
+    def __init__(self, results):
+        '''
+        One spectator: watches the newest match until it ends, counting what it receives.
+        '''
+        self.results = results  # Shared dict of spectator counters.
+        self.transport = None
+        self.incoming = bytearray()
+        self.finished = asyncio.get_running_loop().create_future()
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.watch()
+
+    def watch(self):
+        '''
+        Asks to watch the newest running match.
+        '''
+        if not self.finished.done():
+            self.transport.write(protocol.pack(protocol.WATCH))
+
+    def connection_lost(self, exc):
+        if not self.finished.done():
+            self.finished.set_result(False)
+
+    def data_received(self, data):
+        self.results["spectator_bytes"] += len(data)
+        self.incoming += data
+        for kind, arg, i, j in protocol.split(self.incoming):
+            if kind == protocol.KEYFRAME:
+                self.results["keyframes"] += 1
+            elif kind == protocol.DELTA:
+                self.results["deltas"] += 1
+            elif kind == protocol.CELL and arg >> 2 >= len(protocol.VISIBLE_CELLS):
+                self.results["errors"] += 1  # Spectators must only get hits, misses and sunk cells.
+            elif kind in (protocol.START, protocol.PLACED, protocol.SHOT, protocol.SUNK_CELL):
+                self.results["errors"] += 1  # Player messages must never reach a spectator.
+            elif kind == protocol.REJECTED:
+                asyncio.get_running_loop().call_later(0.05, self.watch)  # No match running yet, try again.
+            elif kind in (protocol.GAME_OVER, protocol.OPPONENT_LEFT):
+                self.results["watched"] += 1
+                self.finished.set_result(True)
+                self.transport.close()
+
+def percentile(ordered, point):
+    '''
+    Returns the nearest-rank percentile of a sorted list.
+    '''
+    return ordered[min(len(ordered) - 1, len(ordered) * point // 100)] if ordered else 0
+
+async def run(args):
+    '''
+    Connects every bot, waits for all matches to finish and returns the results.
+    '''
+    loop = asyncio.get_running_loop()
+    results = {"latency": [], "moves": 0, "finished": 0, "errors": 0, "spectator_bytes": 0, "keyframes": 0, "deltas": 0, "watched": 0}
+    rng = random.Random(args.seed)
+    bots = []
+    start = time.perf_counter()
+    for first in range(0, 2 * args.matches, 500):  # Connect in batches, so the server's listen backlog never overflows.
+        count = min(500, 2 * args.matches - first)
+        connections = await asyncio.gather(*(
+            loop.create_connection(lambda: Bot(args.ships, random.Random(rng.random()), results), args.host, args.port)
+            for _ in range(count)))
+        bots += [bot for _, bot in connections]
+    connected = time.perf_counter()
+    for bot in bots:
+        bot.join()
+    spectators = []
+    for first in range(0, args.spectators, 500):
+        connections = await asyncio.gather(*(
+            loop.create_connection(lambda: Spectator(results), args.host, args.port)
+            for _ in range(min(500, args.spectators - first))))
+        spectators += [spectator for _, spectator in connections]
+    await asyncio.wait_for(asyncio.gather(*(bot.finished for bot in bots), *(spectator.finished for spectator in spectators)), args.timeout)
+    elapsed = time.perf_counter() - connected
+
+    latency = sorted(results["latency"])
+    return {
+        "matches": args.matches,
+        "finished": results["finished"],
+        "errors": results["errors"],
+        "moves": results["moves"],
+        "connect_s": connected - start,
+        "play_s": elapsed,
+        "moves_per_s": results["moves"] / elapsed if elapsed else 0.0,
+        "round_trip_us": {f"p{point}": percentile(latency, point) / 1e3 for point in (50, 95, 99)},
+        "spectators": {
+            "connected": args.spectators,
+            "watched_to_end": results["watched"],
+            "keyframes": results["keyframes"],
+            "deltas": results["deltas"],
+            "bytes": results["spectator_bytes"],
+            "bytes_per_delta": results["spectator_bytes"] / results["deltas"] if results["deltas"] else 0.0,
+        },
+    }
+
+def main():
+    '''
+    Parses the command line, optionally starts a server process, and runs the load test.
+    '''
+    parser = argparse.ArgumentParser(description="Load-test the Battleship match server over localhost.")
+    parser.add_argument("-m", "--matches", type=int, default=1000, help="simultaneous matches (two connections each)")
+    parser.add_argument("--spectators", type=int, default=0, help="spectator connections watching the newest match")
+    parser.add_argument("-s", "--ships", type=int, default=5, help="number of ships (sizes 1..N)")
+    parser.add_argument("--host", default=protocol.DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=protocol.DEFAULT_PORT)
+    parser.add_argument("--spawn", action="store_true", help="start a server process for the test")
+    parser.add_argument("--backend", default="compact", help="Player backend of the spawned server (list, compact or bitmask)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=600.0, help="seconds to wait for every match to finish")
+    args = parser.parse_args()
+
+    # Every match needs two sockets here (and two in the server), and so does every spectator.
+    sockets = 4 * args.matches + 2 * args.spectators + 64
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, max(soft, sockets)), hard))
+
+    server = None
+    if args.spawn:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        server = subprocess.Popen([sys.executable, "-c", SPAWN_SERVER, args.host, str(args.port), str(sockets), args.backend], cwd=root)
+        time.sleep(1.5)  # Give the server time to start listening.
+    try:
+        print(json.dumps(asyncio.run(run(args)), indent=2))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+# Started with --spawn: raises the server's open file limit, then runs it with a statistics line every second.
+SPAWN_SERVER = """
+import asyncio, resource, sys
+from battleship.server import MatchServer, PLAYER_BACKENDS
+soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, max(soft, int(sys.argv[3]))), hard))
+asyncio.run(MatchServer(PLAYER_BACKENDS[sys.argv[4]]).serve(sys.argv[1], int(sys.argv[2]), 1.0))
+"""
+
+if __name__ == "__main__":
+    main()
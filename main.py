@@ -1,21 +1,101 @@
 # Filename: main.py
 # Description: This script initializes and runs a Battleship game. It creates a game instance and uses the Renderer class to draw the game window.
-# Inputs: None
+# Inputs: Optional command line arguments: --connect HOST[:PORT] to play a networked match, --watch HOST[:PORT] to spectate one, --rows/--cols/--ships/--fleet for a larger local game, --record FILE to append finished games to a replay archive, or --heatmaps FILE for the replay heatmap overlay
 # Output: The rendered game window
 # Other sources for the code: ChatGPT (for proper commenting format)
 # Authors: Xavier and Andrew
 # Creation Date: 9th of September, 2024
 
+import argparse  # Parsing the optional network arguments.
 from battleship import Game, Renderer  # Importing the Game and Renderer classes from the battleship module.
+from battleship.player import Player  # Player backend for normal boards.
+from battleship.sparse import SparsePlayer  # Player backend that only stores the used cells of large boards.
+from battleship.protocol import DEFAULT_PORT  # Default port of the match server.
+from battleship.constants import CLASSIC_FLEET  # Default fleet picked with F in the menu.
+
+def largest_ship_count(rows, cols, limit):
+    """
+    Returns the largest ship count, at most limit, whose ships (sizes 1..N) fit on a rows x cols board:
+    the largest along a row or column and all of them in half the cells. Returns 0 if not even one ship fits.
+    """
+    count = min(limit, max(rows, cols), 255)
+    while count * (count + 1) // 2 > rows * cols // 2:
+        count -= 1
+    return count
+
+def fleet_fits(fleet, rows, cols):
+    """
+    Returns True if the ship sizes of fleet fit on a rows x cols board: every ship along a row or column and all of them in half the cells.
+    """
+    return 1 <= len(fleet) <= 127 and all(1 <= size <= min(max(rows, cols), 255) for size in fleet) and sum(fleet) <= rows * cols // 2
+
+def parse_args(argv=None):
+    """
+    Parses and checks the command line.
+    - Only values the user passed are rejected; --ships defaults to as many ships as the board holds, at most Game.MAX_SHIPS,
+      and --fleet to the classic fleet, or to no fleet (no F option) if it does not fit.
+    Returns:
+        (parser, args, fleet): the parser (for errors found later), the parsed arguments and the fleet picked with F,
+        as a list of ship sizes (empty if there is none).
+    """
+    parser = argparse.ArgumentParser(description="EECS 581 Project 1 - Battleship")
+    parser.add_argument("--connect", metavar="HOST[:PORT]", help="play a match hosted by the match server (python -m battleship.server)")
+    parser.add_argument("--watch", metavar="HOST[:PORT]", help="spectate a match hosted by the match server")
+    parser.add_argument("--match", type=int, default=0, help="id of the match to spectate (default: the newest running match)")
+    parser.add_argument("--rows", type=int, default=10, help="board rows for a local game (up to 1000)")
+    parser.add_argument("--cols", type=int, default=10, help="board columns for a local game (up to 1000)")
+    parser.add_argument("--ships", type=int, help=f"largest ship count the menu accepts (sizes 1..N; default: {Game.MAX_SHIPS}, or fewer if the board is smaller)")
+    parser.add_argument("--heatmaps", metavar="FILE", help="heatmaps exported by python -m battleship.analytics, shown with M in a local game")
+    parser.add_argument("--fleet", help="ship sizes picked with F in the menu, comma separated (sizes may repeat; default: " + ",".join(map(str, CLASSIC_FLEET)) + " if it fits the board)")
+    parser.add_argument("--record", metavar="FILE", help="append every finished local game to this replay archive (nothing is recorded otherwise)")
+    args = parser.parse_args(argv)
+    if not (1 <= args.rows <= 1000 and 1 <= args.cols <= 1000):
+        parser.error("the board must be between 1x1 and 1000x1000")
+    if args.ships is None:
+        args.ships = largest_ship_count(args.rows, args.cols, Game.MAX_SHIPS)
+        if not args.ships:
+            parser.error("the board is too small for any ship")
+    elif not 1 <= args.ships <= min(max(args.rows, args.cols), 255) or args.ships * (args.ships + 1) // 2 > args.rows * args.cols // 2:
+        parser.error("the ships must fit on the board (the largest along a row or column, all of them in half the cells)")
+    if args.fleet is None:
+        fleet = list(CLASSIC_FLEET) if fleet_fits(CLASSIC_FLEET, args.rows, args.cols) else []  # No F option on boards too small for it.
+    else:
+        try:
+            fleet = [int(size) for size in args.fleet.split(",")]
+        except ValueError:
+            parser.error("--fleet must be ship sizes separated by commas, like 5,4,3,3,2")
+        if not fleet_fits(fleet, args.rows, args.cols):
+            parser.error("the fleet must fit on the board (every ship along a row or column, all of them in half the cells)")
+    return parser, args, fleet
 
 def main():
     """
     This is the main function that initializes the game.
-    - It creates an instance of the Game class.
+    - It creates an instance of the Game class (or NetworkGame when connecting to a match server).
     - Then, it uses the Renderer class to draw the game window.
     """
-    # Create the Game class
-    game = Game()  # The game variable is initialized with the Game class instance, which contains the game's logic.
+    parser, args, fleet = parse_args()
+
+    if args.watch:
+        from battleship.spectator import SpectatorGame  # Only needed in spectator mode.
+        host, _, port = args.watch.partition(":")
+        game = SpectatorGame(host or "127.0.0.1", int(port or DEFAULT_PORT), args.match)  # Follows a match the server runs, read only.
+    elif args.connect:
+        from battleship.client import NetworkGame  # Only needed in client mode.
+        host, _, port = args.connect.partition(":")
+        game = NetworkGame(host or "127.0.0.1", int(port or DEFAULT_PORT))  # The server runs the rules, this window plays one side.
+    else:
+        # Create the Game class
+        # Boards larger than the default only store the cells that are used.
+        player_class = Player if args.rows * args.cols <= 100 else SparsePlayer
+        game = Game(player_class, rows=args.rows, cols=args.cols, max_ships=args.ships, fleet=fleet)  # The game variable is initialized with the Game class instance, which contains the game's logic.
+        if args.record:
+            game.record_replays(args.record)  # Finished games are only saved when asked for.
+        if args.heatmaps:
+            try:
+                game.load_heatmaps(args.heatmaps)  # Placement and shot heatmaps of recorded games, drawn with M.
+            except (OSError, ValueError) as error:
+                parser.error(f"cannot load heatmaps: {error}")
 
     # Use the Renderer class to draw the game window with the game instance
     Renderer.draw_window(game)  # The Renderer class uses the game instance to draw the game window.
@@ -0,0 +1,80 @@
+# Filename: test_ai.py
+# Description: Tests the ProbabilityAI computer opponent: its heatmaps follow the enemy board, it never repeats a shot, it finishes seeded games, and a single-player Engine game runs to the end.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import random
+import unittest
+from battleship.ai import ProbabilityAI
+from battleship.engine import Engine
+from battleship.player import Player
+from battleship.constants import *
+
+def random_fleet(num, rng):
+    '''
+    Returns a Player with ships 1..num placed at random legal positions.
+    '''
+    player = Player(1)
+    player.get_ships(num)
+    while player.ships:
+        i, j, orientation = ProbabilityAI.choose_placement(player, rng)
+        assert player.place_ship(i, j, player.ships[-1], orientation)
+        player.ships.pop()
+    return player
+
+class ProbabilityAITest(unittest.TestCase):
+    def test_finishes_seeded_games(self):
+        '''
+        The AI sinks the whole fleet within the 100 cells, never shooting a cell twice.
+        '''
+        for seed in range(10):
+            with self.subTest(seed=seed):
+                rng = random.Random(seed)
+                enemy = random_fleet(5, rng)
+                ai = ProbabilityAI(enemy, random.Random(seed))
+                shots = set()
+                while not enemy.is_loss():
+                    i, j = ai.choose_attack()
+                    self.assertNotIn((i, j), shots)
+                    shots.add((i, j))
+                    res, ship_size = enemy.place_attack(i, j)
+                    ai.record_attack(i, j, res, ship_size)
+                self.assertLess(len(shots), 100)
+
+    def test_heat_is_recomputed_state(self):
+        '''
+        The incrementally updated heatmaps match those of a new AI built from the same board mid-game.
+        '''
+        rng = random.Random(3)
+        enemy = random_fleet(4, rng)
+        ai = ProbabilityAI(enemy, random.Random(3))
+        for _ in range(25):
+            i, j = ai.choose_attack()
+            res, ship_size = enemy.place_attack(i, j)
+            ai.record_attack(i, j, res, ship_size)
+        fresh = ProbabilityAI(enemy)
+        self.assertEqual(ai.heat, fresh.heat)
+        self.assertEqual(ai.target, fresh.target)
+        self.assertEqual(ai.open_hits, fresh.open_hits)
+
+    def test_single_player_game(self):
+        '''
+        The computer places its fleet and answers each attack until someone wins.
+        '''
+        engine = Engine(single_player=True)
+        engine.select_ship_count(3)
+        for i in range(3):
+            self.assertTrue(engine.place_ship(i, 0))
+        self.assertTrue(engine.attack_phase)
+        self.assertFalse(engine.player2.ships)
+        cells = [(i, j) for i in range(10) for j in range(10)]
+        while engine.attack_phase:
+            self.assertEqual(engine.turn, 1)  # The computer always answers right away.
+            engine.attack(*cells.pop())
+        self.assertIsNotNone(engine.winner())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# Filename: test_analytics.py
+# Description: Tests the replay analytics: the heatmaps and shot statistics of a recorded archive match the games that were played, parts of the archive streamed separately merge into the same result as one pass, invalid records are skipped, and the exported file loads back unchanged.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import os
+import random  # Seeded layouts and shot orders.
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from battleship.analytics import ArchiveStats, BoardHeatmaps, RunningStats
+from battleship.constants import *
+from battleship.engine import Engine
+from battleship.replay import ReplayArchive
+
+def record_games(path, count, seed):
+    '''
+    Plays count classic-fleet games with random placements and shots, appends them to an archive,
+    and returns the (rows, cols) ship cell counts of every fleet, the attacks of every game and the hits of all games.
+    '''
+    rng = random.Random(seed)
+    archive = ReplayArchive(path)
+    placements = np.zeros((10, 10), dtype=np.int64)
+    game_shots = []
+    hits = 0
+    for _ in range(count):
+        engine = Engine(record=True)
+        engine.select_fleet()
+        while engine.place_ship_phase:
+            engine.auto_place_ships(rng)
+        for player in (engine.player1, engine.player2):
+            for i, j in player.ship_index:
+                placements[i][j] += 1
+        cells = [(i, j) for i in range(10) for j in range(10)]
+        orders = {1: rng.sample(cells, len(cells)), 2: rng.sample(cells, len(cells))}
+        shots = 0
+        while engine.attack_phase:
+            engine.attack(*orders[engine.turn].pop())
+            shots += 1
+        game_shots.append(shots)
+        hits += sum(value in (HIT_CELL, SUNK_CELL) for player in (engine.player1, engine.player2) for row in player.board.cells for value in row)
+        archive.append(engine.replay)
+    return placements, game_shots, hits
+
+class AnalyticsTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.folder = folder.name
+        self.path = os.path.join(self.folder, "games.bsra")
+        self.placements, self.game_shots, self.hits = record_games(self.path, 12, 1)
+
+    def test_matches_games(self):
+        stats = ArchiveStats.analyze(self.path)
+        board = stats.boards[(10, 10)]
+        self.assertEqual((board.games, board.finished, board.fleets), (12, 12, 24))
+        self.assertEqual(board.placements.tolist(), self.placements.tolist())
+        self.assertEqual(int(board.shots.sum()), sum(self.game_shots))
+        self.assertEqual(int(board.hits.sum()), self.hits)
+        self.assertAlmostEqual(board.game_shots.mean, sum(self.game_shots) / 12)
+        self.assertEqual((board.game_shots.low, board.game_shots.high), (min(self.game_shots), max(self.game_shots)))
+        self.assertEqual(int(board.orientations.sum()), 24 * 5)
+
+    def test_parts_merge_into_one_pass(self):
+        '''
+        Streaming the archive in interleaved parts and merging the results gives the same statistics as one pass.
+        '''
+        whole = ArchiveStats.analyze(self.path).boards[(10, 10)]
+        with mock.patch.object(ReplayArchive, "BLOCK", 2):  # Small blocks, so every part gets some of the 12 games.
+            merged = ArchiveStats()
+            for part in range(3):
+                partial = ArchiveStats()
+                partial.add_records(ReplayArchive(self.path).stream(part, 3))
+                self.assertEqual(partial.boards[(10, 10)].games, 4)
+                merged.merge(partial)
+        board = merged.boards[(10, 10)]
+        for kind in BoardHeatmaps.KINDS:
+            self.assertEqual(getattr(board, kind).tolist(), getattr(whole, kind).tolist())
+        self.assertEqual(board.games, whole.games)
+        self.assertAlmostEqual(board.game_shots.mean, whole.game_shots.mean)
+        self.assertAlmostEqual(board.game_shots.std(), whole.game_shots.std())
+
+    def test_running_stats_merge(self):
+        values = np.random.default_rng(2).normal(50, 10, 1000)
+        whole, left, right = RunningStats(), RunningStats(), RunningStats()
+        whole.add(values)
+        left.add(values[:300])
+        right.add(values[300:])
+        left.merge(right)
+        self.assertEqual(left.count, 1000)
+        self.assertAlmostEqual(left.mean, float(values.mean()))
+        self.assertAlmostEqual(left.std(), float(values.std(ddof=1)))
+        self.assertAlmostEqual(whole.std(), left.std())
+
+    def test_skips_invalid_records(self):
+        stats = ArchiveStats()
+        stats.add_records([b"not a replay", *ReplayArchive(self.path)])
+        self.assertEqual(stats.skipped, 1)
+        self.assertEqual(stats.boards[(10, 10)].games, 12)
+
+    def test_save_and_load(self):
+        stats = ArchiveStats.analyze(self.path)
+        path = os.path.join(self.folder, "heatmaps.npz")
+        stats.save(path)
+        loaded = ArchiveStats.load(path)
+        self.assertEqual(loaded.summary(), stats.summary())
+        self.assertEqual(loaded.boards[(10, 10)].heatmap("shots").tolist(), stats.boards[(10, 10)].heatmap("shots").tolist())
+        with self.assertRaises(ValueError):
+            np.savez(path, other=np.zeros(1))
+            ArchiveStats.load(path)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+# Filename: test_batch.py
+# Description: Tests that BatchSimulator plays the same games as Player.place_attack: boards loaded from Players give the same results, cells and losses shot for shot, random fleets are legal, and the batched policies finish every game without repeating a cell.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import random  # Seeded layouts and shot orders.
+import unittest
+import numpy as np
+from battleship.batch import BatchSimulator, BATCH_POLICIES
+from battleship.constants import *
+from battleship.fleet import FleetSampler
+from battleship.player import Player
+
+def random_players(count, fleet, seed):
+    '''
+    Returns count Players with the fleet placed uniformly at random.
+    '''
+    rng = random.Random(seed)
+    players = []
+    for _ in range(count):
+        player = Player(1)
+        player.get_ships(fleet)
+        sampler = FleetSampler.for_board(player.board)
+        for ship, (i, j, orientation) in zip(player.ships, sampler.sample([player.ship_sizes[ship] for ship in player.ships], rng=rng)):
+            player.place_ship(i, j, ship, orientation)
+        players.append(player)
+    return players
+
+class BatchTest(unittest.TestCase):
+    def test_matches_player(self):
+        '''
+        Loaded Players and the batch give the same attack results, cells and losses on every shot.
+        '''
+        for fleet in (5, list(CLASSIC_FLEET)):
+            with self.subTest(fleet=fleet):
+                players = random_players(8, fleet, 1)
+                simulator = BatchSimulator(len(players), fleet=fleet)
+                simulator.load_players(players)
+                rng = random.Random(2)
+                cells = [(i, j) for i in range(10) for j in range(10)]
+                orders = [rng.sample(cells, len(cells)) for _ in players]
+                for step in range(len(cells) + 5):  # The last steps repeat cells, which must change nothing.
+                    shots = [order[step % len(cells)] for order in orders]
+                    live = [not player.is_loss() for player in players]
+                    hit, ship = simulator.attack(np.array([i for i, _ in shots]), np.array([j for _, j in shots]))
+                    for game, (player, (i, j)) in enumerate(zip(players, shots)):
+                        if live[game]:
+                            self.assertEqual((bool(hit[game]), int(ship[game])), tuple(player.place_attack(i, j)))
+                        self.assertEqual(simulator.cells[game].tolist(), player.board.cells)
+                    self.assertEqual(simulator.is_loss().tolist(), [player.is_loss() for player in players])
+                self.assertTrue(simulator.is_loss().all())
+
+    def test_place_random(self):
+        '''
+        Random fleets cover exactly the ship sizes, without overlaps.
+        '''
+        simulator = BatchSimulator(50, fleet=list(CLASSIC_FLEET))
+        simulator.place_random(np.random.default_rng(3))
+        for game in range(simulator.count):
+            ids, counts = np.unique(simulator.ship_ids[game], return_counts=True)
+            self.assertEqual(dict(zip(ids.tolist(), counts.tolist())), {0: 83, 1: 2, 2: 3, 3: 3, 4: 4, 5: 5})
+        self.assertEqual(simulator.num_ship_cells.tolist(), [17] * 50)
+
+    def test_policies_finish(self):
+        for name, policy in BATCH_POLICIES.items():
+            with self.subTest(policy=name):
+                simulator = BatchSimulator(30, fleet=5)
+                simulator.place_random(np.random.default_rng(4))
+                shots = simulator.play(policy, np.random.default_rng(5))
+                self.assertTrue(simulator.is_loss().all())
+                self.assertTrue(((shots >= 15) & (shots <= 100)).all())
+                self.assertEqual(simulator.attacked().sum(axis=(1, 2)).tolist(), shots.tolist())  # No cell was shot twice.
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+# Filename: test_benchmarks.py
+# Description: Tests the benchmark suite end to end on a tiny run: the JSON results hold every benchmark, a run compared with itself passes, and a faster baseline is reported as a regression. The suite runs in its own process because it replaces pyray with its recording stub.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "run_benchmarks.py")
+
+def run(*args):
+    return subprocess.run([sys.executable, SCRIPT, "--games", "5", "--frames", "5", "--loop-games", "1", "--layouts", "100", "--startup-runs", "1", "--batch-games", "20", *args],
+                          capture_output=True, text=True)
+
+class BenchmarkSuiteTest(unittest.TestCase):
+    def test_run_and_compare(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            process = run("-o", output)
+            self.assertEqual(process.returncode, 0, process.stderr)
+            with open(output) as file:
+                results = json.load(file)
+
+            logic = results["results"]["logic"]
+            self.assertEqual(set(logic), {"list", "bitmask", "sparse"})
+            for timers in logic.values():
+                self.assertGreater(timers["place_attack"]["calls"], 0)
+                self.assertGreater(timers["is_loss"]["calls"], 0)
+            self.assertEqual(set(results["logic_speedup"]), {"bitmask", "sparse"})
+            self.assertEqual(set(results["results"]["attack_large"]), {"list", "sparse"})
+            self.assertIn("attack", results["results"]["game_loop"])
+            self.assertEqual(set(results["results"]["batch"]), {"attack", "random", "hunt"})
+            startup = results["results"]["startup"]
+            self.assertIn("battleship.engine", startup)
+            self.assertFalse(startup["battleship.engine"]["loads_pyray"])
+
+            # Pretend the baseline was ten times faster: every timing is now a regression.
+            for timers in logic.values():
+                for timer in timers.values():
+                    timer["ns_per_call"] /= 10
+            baseline = os.path.join(directory, "baseline.json")
+            with open(baseline, "w") as file:
+                json.dump(results, file)
+            process = run("-o", output, "--baseline", baseline)
+            self.assertEqual(process.returncode, 1)
+            self.assertIn("REGRESSION logic.list.place_attack.ns_per_call", process.stderr)
+
+if __name__ == "__main__":
+    unittest.main()
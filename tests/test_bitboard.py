@@ -0,0 +1,96 @@
+# Filename: test_bitboard.py
+# Description: Tests that BitPlayer plays exactly like the list-based Player: same placement checks, attack results, cells view, ship_count, ship_hits and is_loss over seeded games.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import random
+import unittest
+from battleship.player import Player
+from battleship.bitboard import BitBoard, BitPlayer
+from battleship.board import Orientation
+from battleship.constants import *
+
+def place_random_fleet(players, num, rng):
+    '''
+    Places the same random fleet of ships 1..num on every player, largest first.
+    '''
+    for player in players:
+        player.get_ships(num)
+    while players[0].ships:
+        ship = players[0].ships[-1]
+        i, j = rng.randrange(10), rng.randrange(10)
+        orientation = rng.choice([Orientation.HORIZONTAL, Orientation.VERTICAL])
+        placed = [player.place_ship(i, j, ship, orientation) for player in players]
+        assert len(set(placed)) == 1, placed  # Every backend must agree on every placement.
+        if placed[0]:
+            for player in players:
+                player.ships.pop()
+
+class BitPlayerTest(unittest.TestCase):
+    def assert_same_state(self, player, bit_player):
+        self.assertEqual(bit_player.board.cells, player.board.cells)
+        self.assertEqual(dict(bit_player.ship_count), player.ship_count)
+        self.assertEqual({ship: sorted(cells) for ship, cells in bit_player.ship_hits.items()},
+                         {ship: sorted(cells) for ship, cells in player.ship_hits.items()})
+        self.assertEqual(bit_player.num_ship_cells, player.num_ship_cells)
+        self.assertEqual(bit_player.is_loss(), player.is_loss())
+
+    def test_seeded_games(self):
+        '''
+        Random placements and random attacks (repeats included) give the same results on both backends.
+        '''
+        for seed in range(20):
+            with self.subTest(seed=seed):
+                rng = random.Random(seed)
+                player, bit_player = Player(1), BitPlayer(1)
+                num = rng.randint(1, 5)
+                place_random_fleet([player, bit_player], num, rng)
+                self.assert_same_state(player, bit_player)
+                while not player.is_loss():
+                    i, j = rng.randrange(10), rng.randrange(10)
+                    self.assertEqual(bit_player.place_attack(i, j), player.place_attack(i, j))
+                    self.assert_same_state(player, bit_player)
+                self.assertTrue(bit_player.is_loss())
+
+    def test_not_lost_before_placement(self):
+        '''
+        A player whose ships are not all placed yet has not lost, as with Player.
+        '''
+        bit_player = BitPlayer(1)
+        bit_player.get_ships(2)
+        self.assertFalse(bit_player.is_loss())
+        self.assertEqual(dict(bit_player.ship_count), {1: 1, 2: 2})
+        bit_player.place_ship(0, 0, 2)
+        self.assertFalse(bit_player.is_loss())
+        self.assertEqual(bit_player.num_ship_cells, 3)
+
+    def test_cells_view_follows_masks(self):
+        '''
+        The cached cells view is rebuilt after an attack changes the masks.
+        '''
+        bit_player = BitPlayer(1)
+        bit_player.get_ships(2)
+        bit_player.place_ship(0, 0, 2)
+        self.assertEqual(bit_player.board.cells[0][:3], [2, 2, EMPTY_CELL])
+        bit_player.place_attack(0, 0)
+        bit_player.place_attack(0, 2)
+        self.assertEqual(bit_player.board.cells[0][:3], [HIT_CELL, 2, MISS_CELL])
+        bit_player.place_attack(0, 1)
+        self.assertEqual(bit_player.board.cells[0][:3], [SUNK_CELL, SUNK_CELL, MISS_CELL])
+
+    def test_placement_tables_bounded(self):
+        '''
+        The shared placement table cache never grows past PLACEMENT_TABLES.
+        '''
+        for size in range(1, 10):
+            board = BitBoard(size + 5, size + 5)
+            for ship in range(1, 6):
+                board.is_placeable_on(0, 0, ship, Orientation.VERTICAL)
+                board.is_placeable_on(0, 0, ship, Orientation.HORIZONTAL)
+        self.assertLessEqual(len(BitBoard.placement_tables), BitBoard.PLACEMENT_TABLES)
+
+if __name__ == "__main__":
+    unittest.main()
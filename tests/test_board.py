@@ -0,0 +1,51 @@
+# Filename: test_board.py
+# Description: Tests that the cached placement masks of Board and BitBoard agree with is_placeable_on for every start cell, and follow the board as ships are placed.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import unittest
+from battleship.player import Player
+from battleship.bitboard import BitPlayer
+from battleship.board import Orientation
+
+class PlacementMaskTest(unittest.TestCase):
+    def assert_mask_matches(self, board):
+        for ship_size in range(1, 6):
+            for orientation in Orientation:
+                mask = board.placement_mask(ship_size, orientation)
+                for i in range(board.rows):
+                    for j in range(board.cols):
+                        self.assertEqual(bool(mask[i][j]), board.is_placeable_on(i, j, ship_size, orientation),
+                                         (ship_size, orientation, i, j))
+
+    def test_matches_is_placeable_on(self):
+        '''
+        The mask matches is_placeable_on on an empty board and after every placement.
+        '''
+        for player_class in (Player, BitPlayer):
+            with self.subTest(player_class=player_class.__name__):
+                player = player_class(1)
+                player.get_ships(5)
+                self.assert_mask_matches(player.board)
+                for ship, i, j, orientation in [(5, 0, 0, Orientation.HORIZONTAL), (4, 2, 9, Orientation.VERTICAL),
+                                                     (3, 7, 3, Orientation.HORIZONTAL)]:
+                    self.assertTrue(player.place_ship(i, j, ship, orientation))
+                    self.assert_mask_matches(player.board)
+
+    def test_mask_is_cached(self):
+        '''
+        The same grid is returned until a ship is placed.
+        '''
+        player = Player(1)
+        player.get_ships(3)
+        mask = player.board.placement_mask(3)
+        self.assertIs(player.board.placement_mask(3), mask)
+        self.assertFalse(mask.flags.writeable)
+        player.place_ship(0, 0, 3)
+        self.assertIsNot(player.board.placement_mask(3), mask)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# Filename: test_book.py
+# Description: Tests the OpeningBook: a book written by the builder reads back the same grids and shots from the mapped file, a missing or foreign file gives no book, the shipped book covers the menu fleets and the classic fleet, and the ProbabilityAI follows the book until its first hit and then plays from the same heatmaps as an AI built without it.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from battleship.ai import ProbabilityAI
+from battleship.book import OpeningBook
+from battleship.constants import *
+from test_ai import random_fleet
+
+class BookFileTest(unittest.TestCase):
+    def test_write_and_read(self):
+        '''
+        Entries written to a file read back unchanged, keyed by board size and sorted ship sizes.
+        '''
+        rng = np.random.default_rng(0)
+        entries = [(rows, cols, ship_sizes, *OpeningBook.compute(rows, cols, ship_sizes, 2000, 4, rng))
+                   for rows, cols, ship_sizes in ((6, 6, [1, 2]), (5, 7, [3, 2, 2]))]
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "book.bsob")
+            OpeningBook.write(path, entries)
+            book = OpeningBook(path)
+            for rows, cols, ship_sizes, occupancy, opening in entries:
+                self.assertEqual(book.occupancy(rows, cols, ship_sizes).tolist(), occupancy.reshape(rows, cols).tolist())
+                self.assertEqual(book.opening(rows, cols, list(reversed(ship_sizes))).tolist(), opening.tolist())
+            self.assertEqual(book.opening(6, 6, 2).tolist(), entries[0][4].tolist())  # A ship count means sizes 1..N.
+            self.assertIsNone(book.occupancy(6, 6, [2, 2]))
+            book.data.close()
+
+    def test_compute(self):
+        '''
+        Occupancies add up to the fleet's cells, and the opening never repeats a cell.
+        '''
+        occupancy, opening = OpeningBook.compute(10, 10, list(CLASSIC_FLEET), 5000, 8, np.random.default_rng(1))
+        self.assertAlmostEqual(float(occupancy.sum()), 17.0, places=3)
+        self.assertEqual(len(set(opening.tolist())), len(opening))
+
+    def test_missing_or_foreign_file(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "book.bsob")
+            self.assertIsNone(OpeningBook.open(path))
+            with open(path, "wb") as file:
+                file.write(b"not a book")
+            OpeningBook.books.pop(path)
+            self.assertIsNone(OpeningBook.open(path))
+
+    def test_shipped_book(self):
+        book = OpeningBook.open()
+        self.assertIsNotNone(book)
+        for fleet in (1, 2, 3, 4, 5, list(CLASSIC_FLEET)):
+            with self.subTest(fleet=fleet):
+                self.assertEqual(len(book.opening(10, 10, fleet)), OpeningBook.SHOTS)
+
+class BookAITest(unittest.TestCase):
+    def test_follows_book_until_hit(self):
+        '''
+        The AI plays the book shots while they miss, then its heatmaps match those of an AI that never had a book.
+        '''
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                enemy = random_fleet(5, random.Random(seed))
+                ai = ProbabilityAI(enemy, random.Random(seed))
+                self.assertFalse(ai.heatmap_ready)
+                opening = OpeningBook.open().opening(10, 10, 5).tolist()
+                played = []
+                while not ai.heatmap_ready:
+                    i, j = ai.choose_attack()
+                    if not ai.heatmap_ready:
+                        played.append(i * 10 + j)
+                    ai.record_attack(i, j, *enemy.place_attack(i, j))
+                self.assertEqual(played, opening[:len(played)])
+                with mock.patch.object(OpeningBook, "open", return_value=None):
+                    fresh = ProbabilityAI(enemy)
+                self.assertEqual(ai.heat, fresh.heat)
+                self.assertEqual(ai.target, fresh.target)
+
+if __name__ == "__main__":
+    unittest.main()
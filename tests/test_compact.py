@@ -0,0 +1,98 @@
+# Filename: test_compact.py
+# Description: Tests that CompactPlayer plays exactly like the list-based Player over seeded games, that its cells rows are live views of the flat array, that ship_at() still names a ship once it is hit, that it rejects fleets it cannot store, and that it stays small.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import random
+import sys
+import unittest
+from battleship.player import Player
+from battleship.board import Orientation
+from battleship.compact import CompactPlayer
+from battleship.constants import *
+from test_bitboard import place_random_fleet
+
+def cells_of(board):
+    return [list(row) for row in board.cells]
+
+class CompactPlayerTest(unittest.TestCase):
+    def assert_same_state(self, player, compact_player):
+        self.assertEqual(cells_of(compact_player.board), player.board.cells)
+        self.assertEqual(compact_player.ship_count, player.ship_count)
+        self.assertEqual({ship: sorted(cells) for ship, cells in compact_player.ship_hits.items()},
+                         {ship: sorted(cells) for ship, cells in player.ship_hits.items()})
+        self.assertEqual(compact_player.num_ship_cells, player.num_ship_cells)
+        self.assertEqual(compact_player.is_loss(), player.is_loss())
+
+    def test_seeded_games(self):
+        '''
+        Random placements and random attacks (repeats included) give the same results on both backends.
+        '''
+        for seed in range(20):
+            with self.subTest(seed=seed):
+                rng = random.Random(seed)
+                player, compact_player = Player(1), CompactPlayer(1)
+                place_random_fleet([player, compact_player], rng.randint(1, 5), rng)
+                self.assert_same_state(player, compact_player)
+                while not player.is_loss():
+                    i, j = rng.randrange(10), rng.randrange(10)
+                    self.assertEqual(compact_player.place_attack(i, j), player.place_attack(i, j))
+                    self.assert_same_state(player, compact_player)
+
+    def test_cells_rows_are_live(self):
+        '''
+        cells is built once, and its rows follow later attacks without being rebuilt.
+        '''
+        compact_player = CompactPlayer(1)
+        compact_player.get_ships(2)
+        compact_player.place_ship(0, 0, 2)
+        cells = compact_player.board.cells
+        self.assertEqual(list(cells[0][:3]), [2, 2, EMPTY_CELL])
+        compact_player.place_attack(0, 0)
+        compact_player.place_attack(0, 2)
+        self.assertIs(compact_player.board.cells, cells)
+        self.assertEqual(list(cells[0][:3]), [HIT_CELL, 2, MISS_CELL])
+        self.assertTrue(compact_player.board.placement_mask(2)[5, 0])
+        self.assertFalse(compact_player.board.placement_mask(2)[0, 1])
+
+    def test_ship_at_after_hits(self):
+        '''
+        ship_at() still names the ship once its cells are hit or sunk, for ships of the same size side by side.
+        '''
+        compact_player = CompactPlayer(1)
+        compact_player.get_ships([3, 3, 2])
+        self.assertTrue(compact_player.place_ship(0, 0, 3))
+        self.assertTrue(compact_player.place_ship(1, 0, 2, Orientation.VERTICAL))
+        self.assertTrue(compact_player.place_ship(1, 1, 1))
+        for j in range(3):
+            compact_player.place_attack(0, j)
+        compact_player.place_attack(1, 0)
+        self.assertEqual(compact_player.board.cells[0][0], SUNK_CELL)
+        self.assertEqual([compact_player.ship_at(0, j) for j in range(4)], [3, 3, 3, 0])
+        self.assertEqual([compact_player.ship_at(i, 0) for i in range(1, 5)], [2, 2, 2, 0])
+        self.assertEqual(compact_player.ship_at(1, 1), 1)
+        self.assertEqual(compact_player.ship_count, {1: 2, 2: 2, 3: 0})
+
+    def test_limits(self):
+        with self.assertRaises(ValueError):
+            CompactPlayer(1).get_ships(CompactPlayer.MAX_SHIPS + 1)
+        with self.assertRaises(ValueError):
+            CompactPlayer(1).get_ships([CompactPlayer.MAX_SHIPS + 1])
+
+    def test_size(self):
+        '''
+        A 10x10 player with 5 placed ships stays around 670 bytes (object headers included), against several KB for Player.
+        '''
+        compact_player = CompactPlayer(1)
+        compact_player.get_ships(5)
+        for ship in range(5, 0, -1):
+            self.assertTrue(compact_player.place_ship(5 - ship, 0, ship))
+        board = compact_player.board
+        parts = (compact_player, board, board.data, board.owners, compact_player.ships, compact_player.fleet)
+        self.assertLess(sum(map(sys.getsizeof, parts)), 700)
+
+if __name__ == "__main__":
+    unittest.main()
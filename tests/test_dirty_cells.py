@@ -0,0 +1,49 @@
+# Filename: test_dirty_cells.py
+# Description: Tests that Board and BitBoard report the same dirty cells (the cells the renderer must redraw) after placements, hits, misses and sinks.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import unittest
+from battleship.player import Player
+from battleship.bitboard import BitPlayer
+from battleship.board import Orientation
+
+class DirtyCellsTest(unittest.TestCase):
+    def test_backends_agree(self):
+        '''
+        Each step marks exactly the cells whose value changed, and clear() starts over.
+        '''
+        steps = [
+            (lambda p: p.place_ship(2, 3, 2, Orientation.VERTICAL), {(2, 3), (3, 3)}),
+            (lambda p: p.place_attack(2, 3), {(2, 3)}),  # Hit.
+            (lambda p: p.place_attack(0, 0), {(0, 0)}),  # Miss.
+            (lambda p: p.place_attack(0, 0), set()),  # Repeated attack changes nothing.
+            (lambda p: p.place_attack(3, 3), {(2, 3), (3, 3)}),  # Sink redraws the whole ship.
+        ]
+        for player_class in (Player, BitPlayer):
+            with self.subTest(player_class=player_class.__name__):
+                player = player_class(1)
+                player.get_ships(2)
+                for step, expected in steps:
+                    player.board.dirty_cells.clear()
+                    step(player)
+                    self.assertEqual(set(player.board.dirty_cells), expected)
+                    self.assertEqual(bool(player.board.dirty_cells), bool(expected))
+
+    def test_add(self):
+        '''
+        Cells can also be marked by hand (e.g. by a network client that writes cells directly).
+        '''
+        for player_class in (Player, BitPlayer):
+            with self.subTest(player_class=player_class.__name__):
+                board = player_class(1).board
+                board.dirty_cells.add((4, 5))
+                self.assertEqual(set(board.dirty_cells), {(4, 5)})
+                board.dirty_cells.clear()
+                self.assertFalse(board.dirty_cells)
+
+if __name__ == "__main__":
+    unittest.main()
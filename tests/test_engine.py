@@ -0,0 +1,91 @@
+# Filename: test_engine.py
+# Description: Tests that the Engine state machine plays a whole two-player game from explicit commands alone: the ship count, placements, rotations, attacks and turn changes, without a window.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import unittest
+from battleship.engine import Engine
+from battleship.board import Orientation
+from battleship.constants import *
+
+def place_fleet(engine, rows):
+    '''
+    Places the current player's ships (largest first) horizontally at the start of the given rows.
+    '''
+    for i in rows:
+        if not engine.place_ship(i, 0):
+            raise AssertionError(f"could not place a ship on row {i}")
+
+class EngineTest(unittest.TestCase):
+    def test_menu_checks_ship_count(self):
+        '''
+        Only ship counts between MIN_SHIPS and MAX_SHIPS start the placement phase.
+        '''
+        engine = Engine()
+        self.assertFalse(engine.select_ship_count(Engine.MIN_SHIPS - 1))
+        self.assertFalse(engine.select_ship_count(Engine.MAX_SHIPS + 1))
+        self.assertTrue(engine.menu_phase)
+        self.assertTrue(engine.select_ship_count(3))
+        self.assertFalse(engine.menu_phase)
+        self.assertTrue(engine.place_ship_phase)
+        self.assertFalse(engine.select_ship_count(3))  # Only once, from the menu.
+
+    def test_placement(self):
+        '''
+        Ships are placed largest first with the current orientation; overlapping placements are refused.
+        '''
+        engine = Engine()
+        engine.select_ship_count(3)
+        self.assertTrue(engine.place_ship(0, 0))  # The size 3 ship.
+        self.assertEqual(engine.player1.board.cells[0][:4], [3, 3, 3, EMPTY_CELL])
+        engine.rotate_ship()
+        self.assertIs(engine.ship_orientation, Orientation.VERTICAL)
+        self.assertFalse(engine.place_ship(0, 2))  # Crosses the first ship.
+        self.assertEqual(engine.last_move_message, "Not a correct placement!")
+        self.assertTrue(engine.place_ship(1, 5))  # The size 2 ship, down column 5.
+        self.assertEqual([engine.player1.board.cells[i][5] for i in range(3)], [EMPTY_CELL, 2, 2])
+        self.assertEqual(engine.turn, 1)
+        self.assertTrue(engine.place_ship(9, 9))  # The size 1 ship; Player 2 places next.
+        self.assertTrue(engine.player1.ships_placed)
+        self.assertEqual(engine.turn, 2)
+
+    def test_full_game(self):
+        '''
+        Players take turns attacking until every enemy ship is sunk; repeated or own-board attacks do not use the turn.
+        '''
+        engine = Engine()
+        engine.select_ship_count(2)
+        place_fleet(engine, (0, 1))
+        place_fleet(engine, (5, 6))
+        self.assertTrue(engine.attack_phase)
+        self.assertEqual(engine.turn, 2)  # Player 2 placed last and attacks first.
+
+        self.assertTrue(engine.attack(9, 9))  # Player 2 misses.
+        self.assertEqual(engine.player1.board.cells[9][9], MISS_CELL)
+        self.assertEqual(engine.turn, 1)
+        engine.toggle_show_board()
+        self.assertFalse(engine.attack(5, 0))  # Viewing own board.
+        engine.toggle_show_board()
+        self.assertTrue(engine.attack(5, 0))  # Player 1 hits the size 2 ship.
+        self.assertEqual(engine.player2.board.cells[5][0], HIT_CELL)
+        self.assertEqual(engine.last_move_message, "Player 1 has hit a ship!")
+        self.assertTrue(engine.attack(9, 8))
+        self.assertFalse(engine.attack(5, 0))  # Already hit, Player 1 must pick another cell.
+        self.assertEqual(engine.turn, 1)
+        self.assertTrue(engine.attack(5, 1))
+        self.assertEqual(engine.last_move_message, "Player 1 has sunk a ship!")
+        self.assertEqual(engine.player2.board.cells[5][:2], [SUNK_CELL, SUNK_CELL])
+        self.assertIsNone(engine.winner())
+        self.assertTrue(engine.attack(9, 7))
+        self.assertTrue(engine.attack(6, 0))  # The last ship.
+        self.assertTrue(engine.game_end_phase)
+        self.assertFalse(engine.attack_phase)
+        self.assertIs(engine.winner(), engine.player1)
+        self.assertEqual(engine.win_message, "Player 1 Has Won!")
+        self.assertFalse(engine.attack(0, 0))  # The game is over.
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+# Filename: test_events.py
+# Description: Tests that InputQueue turns one tick of keyboard and mouse state into ordered events, that mouse moves alone queue nothing, and that the Game applies the queued events and reports when the window loop may sleep. The pyray input calls are replaced by a scripted input, so no window is needed.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from pyray import KeyboardKey, MouseButton
+from battleship import events
+from battleship.events import InputQueue, KEY_EVENT, CLICK_EVENT, WHEEL_EVENT, PAN_EVENT
+from battleship.board import Orientation
+from battleship.constants import *
+from battleship.game import Game
+
+class ScriptedInput:
+    '''
+    Stands in for the pyray input functions for one tick at a time.
+    '''
+    def __init__(self):
+        self.next_tick()
+
+    def next_tick(self, keys=(), clicks=(), wheel=0, down=(), mouse=(0, 0), delta=(0, 0)):
+        self.keys = list(keys)
+        self.clicks = set(clicks)
+        self.wheel = wheel
+        self.down = set(down)
+        self.mouse = mouse
+        self.delta = delta
+
+    def patches(self):
+        return {
+            "get_mouse_position": lambda: SimpleNamespace(x=self.mouse[0], y=self.mouse[1]),
+            "get_key_pressed": lambda: self.keys.pop(0) if self.keys else 0,
+            "is_mouse_button_pressed": lambda button: button in self.clicks,
+            "get_mouse_wheel_move": lambda: self.wheel,
+            "is_mouse_button_down": lambda button: button in self.down,
+            "get_mouse_delta": lambda: SimpleNamespace(x=self.delta[0], y=self.delta[1]),
+            "is_key_down": lambda key: key in self.down,
+        }
+
+def cell_position(i, j):
+    '''
+    Returns the window position of the center of board cell (i, j) in the default viewport.
+    '''
+    return (BOARD_PADDING_LEFT + j * CELL_SIZE + CELL_SIZE // 2, BOARD_PADDING_TOP + i * CELL_SIZE + CELL_SIZE // 2)
+
+class InputTest(unittest.TestCase):
+    def setUp(self):
+        self.input = ScriptedInput()
+        for name, function in self.input.patches().items():
+            patcher = mock.patch.object(events, name, function)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_poll_queues_one_tick(self):
+        '''
+        Every key pressed during the tick is queued in order, followed by clicks and the wheel, at the mouse position.
+        '''
+        queue = InputQueue()
+        self.input.next_tick(keys=[ASCII_B, ASCII_H], clicks=[MouseButton.MOUSE_BUTTON_LEFT], wheel=2, mouse=(30, 40))
+        self.assertTrue(queue.poll())
+        self.assertEqual(list(queue), [(KEY_EVENT, ASCII_B, 30, 40), (KEY_EVENT, ASCII_H, 30, 40),
+                                       (CLICK_EVENT, MouseButton.MOUSE_BUTTON_LEFT, 30, 40), (WHEEL_EVENT, 2, 30, 40)])
+        self.assertEqual(list(queue), [])  # Iterating empties the queue.
+
+    def test_mouse_moves_queue_nothing(self):
+        queue = InputQueue()
+        for position in ((10, 10), (200, 120), (5, 300)):
+            self.input.next_tick(mouse=position)
+            self.assertFalse(queue.poll())
+        self.assertEqual(list(queue), [])
+
+    def test_held_pan_keeps_ticking(self):
+        '''
+        Held arrow keys and a middle-button drag pan on every tick and mark the queue as held.
+        '''
+        queue = InputQueue()
+        self.input.next_tick(down=[KeyboardKey.KEY_LEFT])
+        self.assertTrue(queue.poll())
+        self.assertTrue(queue.held)
+        self.assertEqual(list(queue), [(PAN_EVENT, 0, InputQueue.PAN_SPEED, 0)])
+        self.input.next_tick(down=[MouseButton.MOUSE_BUTTON_MIDDLE], delta=(3, -4))
+        self.assertTrue(queue.poll())
+        self.assertEqual(list(queue), [(PAN_EVENT, 0, 3, -4)])
+        self.input.next_tick()
+        self.assertFalse(queue.poll())
+        self.assertFalse(queue.held)
+
+    def test_game_applies_events(self):
+        '''
+        The Game turns queued keys and clicks into Engine commands, and is idle unless a pan is held.
+        '''
+        game = Game()
+        self.assertTrue(game.is_idle())
+        self.input.next_tick(keys=[ASCII_0 + 2])
+        game.handle_events()
+        self.assertTrue(game.place_ship_phase)
+        self.input.next_tick(clicks=[MouseButton.MOUSE_BUTTON_LEFT], mouse=cell_position(3, 4))
+        game.handle_events()
+        self.assertEqual(game.player1.board.cells[3][4:6], [2, 2])
+        self.input.next_tick(clicks=[MouseButton.MOUSE_BUTTON_RIGHT])
+        game.handle_events()
+        self.assertEqual(game.ship_orientation, Orientation.VERTICAL)
+        self.input.next_tick(down=[KeyboardKey.KEY_UP])
+        game.handle_events()
+        self.assertFalse(game.is_idle())
+
+if __name__ == "__main__":
+    unittest.main()
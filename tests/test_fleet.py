@@ -0,0 +1,131 @@
+# Filename: test_fleet.py
+# Description: Tests the uniform fleet layout sampler (legal layouts, every layout equally likely on a small board, ships already placed, NumPy batches), auto-placement in the Engine on every backend, and the network client waiting for every PLACED reply of an auto-placed fleet.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import random
+import socket
+import unittest
+from collections import Counter
+import numpy as np
+from battleship import protocol
+from battleship.board import Orientation
+from battleship.engine import Engine
+from battleship.player import Player
+from battleship.bitboard import BitPlayer
+from battleship.compact import CompactPlayer
+from battleship.fleet import FleetSampler
+
+def layout_cells(ship_sizes, layout):
+    '''
+    Returns the set of cells of every ship in a layout (aligned with ship_sizes), or None if two ships overlap.
+    '''
+    cells = set()
+    for ship_size, (i, j, orientation) in zip(ship_sizes, layout):
+        ship = {(i + k, j) if orientation == Orientation.VERTICAL else (i, j + k) for k in range(ship_size)}
+        if ship & cells:
+            return None
+        cells |= ship
+    return cells
+
+def all_layouts(rows, cols, ship_sizes):
+    '''
+    Returns every legal layout of the ships on an empty board, by brute force.
+    '''
+    layouts = [()]
+    for ship_size in ship_sizes:
+        starts = [(i, j, orientation) for i in range(rows) for j in range(cols) for orientation in Orientation
+                  if (i + ship_size if orientation == Orientation.VERTICAL else j + ship_size) <= (rows if orientation == Orientation.VERTICAL else cols)]
+        layouts = [layout + (start,) for layout in layouts for start in starts]
+    return [layout for layout in layouts if layout_cells(ship_sizes, layout) is not None]
+
+class FleetSamplerTest(unittest.TestCase):
+    def test_layouts_are_legal(self):
+        sampler = FleetSampler(10, 10)
+        rng = random.Random(1)
+        for _ in range(200):
+            layout = sampler.sample([1, 2, 3, 4, 5], 0, rng)
+            cells = layout_cells([1, 2, 3, 4, 5], layout)
+            self.assertIsNotNone(cells)
+            self.assertTrue(all(0 <= i < 10 and 0 <= j < 10 for i, j in cells))
+
+    def test_uniform(self):
+        '''
+        On a 3x3 board with ships 1 and 2, every legal layout comes up about equally often.
+        '''
+        layouts = all_layouts(3, 3, [1, 2])
+        keys = {tuple(layout) for layout in layouts}
+        sampler = FleetSampler(3, 3)
+        rng = random.Random(2)
+        draws = 200 * len(layouts)
+        counts = Counter(tuple(sampler.sample([1, 2], 0, rng)) for _ in range(draws))
+        self.assertEqual(set(counts), keys)
+        expected = draws / len(layouts)
+        chi2 = sum((count - expected) ** 2 / expected for count in counts.values())
+        self.assertLess(chi2, 2 * len(layouts))  # About len(layouts) - 1 when uniform.
+
+    def test_occupied_cells(self):
+        '''
+        Ships already on the board are avoided, and a fleet that cannot fit gives None.
+        '''
+        player = Player(1)
+        player.get_ships(3)
+        player.place_ship(0, 0, 3)
+        occupied = FleetSampler.occupied_mask(player.board)
+        layout = FleetSampler.for_board(player.board).sample([1, 2], occupied, random.Random(3))
+        self.assertFalse(layout_cells([1, 2], layout) & {(0, 0), (0, 1), (0, 2)})
+        self.assertIsNone(FleetSampler(2, 2).sample([3], 0, random.Random(3)))
+
+    def test_batch(self):
+        sampler = FleetSampler(10, 10)
+        ship_sizes = [5, 3, 1, 4, 2]
+        for row in sampler.sample_batch(ship_sizes, 100, np.random.default_rng(4)):
+            self.assertIsNotNone(layout_cells(ship_sizes, sampler.decode(ship_sizes, row)))
+
+class AutoPlaceTest(unittest.TestCase):
+    def test_engine_auto_place(self):
+        '''
+        R places the rest of the current player's fleet, around the ships placed by hand, on every backend.
+        '''
+        for player_class in (Player, BitPlayer, CompactPlayer):
+            with self.subTest(backend=player_class.__name__):
+                engine = Engine(player_class)
+                engine.select_ship_count(5)
+                engine.place_ship(0, 0)
+                self.assertTrue(engine.auto_place_ships(random.Random(5)))
+                self.assertTrue(engine.auto_place_ships(random.Random(6)))
+                self.assertTrue(engine.attack_phase)
+                for player in (engine.player1, engine.player2):
+                    self.assertEqual(player.num_ship_cells, 15)
+                    self.assertEqual(sum(value > 0 for row in player.board.cells for value in row), 15)
+
+    def test_network_client_waits_for_every_reply(self):
+        '''
+        An auto-placed fleet is sent as a batch; the client only places again once every PLACED came back.
+        '''
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        from battleship.client import NetworkGame
+        game = NetworkGame("127.0.0.1", listener.getsockname()[1])
+        try:
+            game.handle(protocol.START, 1, 3, 0)
+            self.assertTrue(game.auto_place_ships(random.Random(7)))
+            placements = protocol.split(game.outgoing)
+            self.assertEqual(len(placements), 3)
+            for _, arg, i, j in placements[:2]:
+                game.handle(protocol.PLACED, arg, i, j)
+                self.assertTrue(game.waiting_for_server)
+                self.assertFalse(game.auto_place_ships())
+            game.handle(protocol.PLACED, *placements[2][1:])
+            self.assertFalse(game.waiting_for_server)
+            self.assertTrue(game.current_player().ships_placed)
+        finally:
+            game.socket.close()
+            listener.close()
+
+if __name__ == "__main__":
+    unittest.main()
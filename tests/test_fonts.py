@@ -0,0 +1,53 @@
+# Filename: test_fonts.py
+# Description: Tests the font atlas cache: a baked atlas is read back with the same glyph metrics, a stale cache is ignored, and get() picks the closest baked size. Baking runs on the CPU, so no window is needed.
+# Inputs: battleship/resources/roboto.ttf
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+from battleship.fonts import FontManager
+
+class FontCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patcher = mock.patch.object(FontManager, "CACHE_DIR", directory.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_round_trip(self):
+        '''
+        The atlas baked for a size is found in the cache with the same glyph metrics.
+        '''
+        self.assertIsNone(FontManager.read_cache(20))
+        atlas, metrics = FontManager.bake(20)
+        self.assertEqual(len(metrics), FontManager.GLYPH_COUNT)
+        cached = FontManager.read_cache(20)
+        self.assertIsNotNone(cached)
+        self.assertEqual((cached[0].width, cached[0].height), (atlas.width, atlas.height))
+        self.assertEqual([glyph[:4] for glyph in cached[1]], [glyph[:4] for glyph in metrics])
+
+    def test_stale_cache_ignored(self):
+        '''
+        A cache written for another version of the format is baked again.
+        '''
+        FontManager.bake(15)
+        with mock.patch.object(FontManager, "CACHE_VERSION", FontManager.CACHE_VERSION + 1):
+            self.assertIsNone(FontManager.read_cache(15))
+        self.assertIsNone(FontManager.read_cache(22))  # Never baked.
+
+    def test_get_closest_size(self):
+        with mock.patch.object(FontManager, "fonts", {15: "f15", 30: "f30"}):
+            self.assertEqual(FontManager.get(15), "f15")
+            self.assertEqual(FontManager.get(20), "f30")  # Smallest baked size that is at least as large.
+            self.assertEqual(FontManager.get(40), "f30")
+        with mock.patch.object(FontManager, "fonts", {}):
+            self.assertIsNone(FontManager.get(20))
+
+if __name__ == "__main__":
+    unittest.main()
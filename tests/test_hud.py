@@ -0,0 +1,77 @@
+# Filename: test_hud.py
+# Description: Tests that the retained HUD only re-renders a layer when its content key changes, and frees the texture it replaces. The pyray texture calls are replaced by recorders, so no window is needed.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from battleship import hud
+from battleship.hud import Hud
+
+class HudTest(unittest.TestCase):
+    def setUp(self):
+        self.loaded = []
+        self.unloaded = []
+        self.drawn = []
+
+        def load_render_texture(width, height):
+            texture = SimpleNamespace(texture=SimpleNamespace(width=width, height=height))
+            self.loaded.append(texture)
+            return texture
+
+        patches = {
+            "load_render_texture": load_render_texture,
+            "unload_render_texture": self.unloaded.append,
+            "begin_texture_mode": lambda texture: None,
+            "end_texture_mode": lambda: None,
+            "clear_background": lambda color: None,
+            "draw_texture_rec": lambda texture, source, position, tint: self.drawn.append(texture),
+        }
+        for name, function in patches.items():
+            patcher = mock.patch.object(hud, name, function)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(Hud.layers.clear)
+        Hud.layers.clear()
+
+    def test_redraws_only_on_change(self):
+        '''
+        Drawing the same content again only composites the cached texture.
+        '''
+        contents = []
+        draw = lambda key: Hud.draw_layer("slot", key, lambda: (10, 5), lambda: contents.append(key), 0, 0)
+        draw("a")
+        draw("a")
+        draw("a")
+        self.assertEqual(contents, ["a"])
+        self.assertEqual(len(self.loaded), 1)
+        self.assertEqual(len(self.drawn), 3)
+
+        draw("b")
+        self.assertEqual(contents, ["a", "b"])
+        self.assertEqual(self.unloaded, [self.loaded[0]])  # The old texture is freed.
+
+    def test_empty_text_draws_nothing(self):
+        Hud.draw_text("message", "", 0, 0, 20, (0, 0, 0, 255))
+        self.assertEqual(self.loaded, [])
+        self.assertEqual(self.drawn, [])
+
+    def test_remaining_ships_key(self):
+        '''
+        The ships panel is re-rendered when a ship is placed, not every frame.
+        '''
+        player = SimpleNamespace(num=1, ships=[1, 2, 3], ship_sizes={1: 1, 2: 2, 3: 3})
+        with mock.patch.object(hud.Renderer, "draw_remaining_ships_to_place") as draw_panel:
+            Hud.draw_remaining_ships(player, 10, 130)
+            Hud.draw_remaining_ships(player, 10, 130)
+            self.assertEqual(draw_panel.call_count, 1)
+            player.ships.pop()
+            Hud.draw_remaining_ships(player, 10, 130)
+            self.assertEqual(draw_panel.call_count, 2)
+
+if __name__ == "__main__":
+    unittest.main()
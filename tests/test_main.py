@@ -0,0 +1,62 @@
+# Filename: test_main.py
+# Description: Tests the command line checks of main.py: defaults fit the board they are used on, and only values the user passed are rejected.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import contextlib
+import io
+import unittest
+import main
+from battleship.engine import Engine
+
+def rejected(argv):
+    '''
+    Returns True if parse_args exits with a usage error for argv.
+    '''
+    with contextlib.redirect_stderr(io.StringIO()):
+        try:
+            main.parse_args(argv)
+        except SystemExit:
+            return True
+    return False
+
+class ShipsTest(unittest.TestCase):
+    def test_default_fits_board(self):
+        '''
+        Without --ships, the menu accepts as many ships as the board holds, at most Game.MAX_SHIPS.
+        '''
+        for rows, cols, ships in ((10, 10, 5), (5, 5, 4), (3, 3, 2), (1, 2, 1), (1000, 1000, 5)):
+            with self.subTest(rows=rows, cols=cols):
+                _, args, _ = main.parse_args(["--rows", str(rows), "--cols", str(cols)])
+                self.assertEqual(args.ships, ships)
+
+    def test_passed_value_checked(self):
+        self.assertTrue(rejected(["--rows", "5", "--cols", "5", "--ships", "5"]))
+        self.assertFalse(rejected(["--rows", "5", "--cols", "5", "--ships", "4"]))
+        self.assertTrue(rejected(["--rows", "1", "--cols", "1"]))  # Not even one ship fits.
+
+class FleetTest(unittest.TestCase):
+    def test_default_only_if_it_fits(self):
+        '''
+        Without --fleet, small boards start with no F option instead of being rejected.
+        '''
+        _, _, fleet = main.parse_args([])
+        self.assertEqual(fleet, [5, 4, 3, 3, 2])
+        _, args, fleet = main.parse_args(["--rows", "5", "--cols", "5"])
+        self.assertEqual((args.ships, fleet), (4, []))
+        engine = Engine(rows=5, cols=5, fleet=fleet)
+        self.assertNotIn("F for", engine.title)
+        self.assertFalse(engine.select_fleet())
+        self.assertTrue(engine.select_ship_count(4))
+
+    def test_passed_fleet_checked(self):
+        self.assertTrue(rejected(["--rows", "5", "--cols", "5", "--fleet", "5,4,3,3,2"]))
+        self.assertTrue(rejected(["--fleet", "5,x"]))
+        _, _, fleet = main.parse_args(["--rows", "5", "--cols", "5", "--fleet", "3,3"])
+        self.assertEqual(fleet, [3, 3])
+
+if __name__ == "__main__":
+    unittest.main()
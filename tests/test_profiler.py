@@ -0,0 +1,83 @@
+# Filename: test_profiler.py
+# Description: Tests the frame profiler: timed sections add up per frame, waiting sections are reported apart from work, percentiles use the nearest rank, and traces export as Chrome trace events. The key check is replaced so no window is needed.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import json
+import os
+import tempfile
+import unittest
+from collections import deque
+from unittest import mock
+from battleship import profiler
+from battleship.profiler import Profiler
+
+class ProfilerTest(unittest.TestCase):
+    def setUp(self):
+        # Every test starts from an empty profiler and leaves the shared state as it found it.
+        state = {"sections": {}, "stack": [], "draw_calls": 0, "frame_start": None, "frame_draw_calls": 0,
+                 "frame_totals": {}, "frame_times": deque(maxlen=Profiler.HISTORY),
+                 "frame_draws": deque(maxlen=Profiler.HISTORY), "history": {},
+                 "trace": deque(maxlen=Profiler.TRACE_EVENTS), "frames": 0, "last_export": ""}
+        for name, value in state.items():
+            patcher = mock.patch.object(Profiler, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(profiler, "is_key_pressed", lambda key: False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def play_frames(self, count):
+        draw = Profiler.counted(lambda: None)
+        work = Profiler.timed("work", lambda: [draw(), draw()])
+        for _ in range(count):
+            Profiler.begin_frame()
+            work()
+            Profiler.end_frame()
+            with Profiler.section("end_drawing"):
+                pass
+        Profiler.begin_frame()  # Stores the totals of the last frame.
+
+    def test_summary(self):
+        '''
+        Every frame counts one work call with two draw calls; the swap is reported as waiting, not work.
+        '''
+        self.play_frames(10)
+        stats = Profiler.summary()
+        self.assertEqual(stats["frames"], 10)
+        self.assertEqual(stats["draw_calls"], {"p50": 2, "p95": 2, "p99": 2})
+        self.assertEqual(stats["sections"]["work"]["calls_per_frame"], 1)
+        self.assertEqual(stats["sections"]["work"]["draw_calls_per_frame"], 2)
+        self.assertIn("end_drawing", stats["wait"])
+        self.assertNotIn("end_drawing", stats["sections"])
+
+    def test_percentiles(self):
+        self.assertEqual(Profiler.percentiles(list(range(1, 101))), [51, 96, 100])
+        self.assertEqual(Profiler.percentiles([]), [0, 0, 0])
+
+    def test_export_trace(self):
+        '''
+        The trace holds frame markers and one complete event per timed section.
+        '''
+        self.play_frames(3)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Profiler.export_trace(os.path.join(directory, "trace.json"))
+            with open(path) as file:
+                trace = json.load(file)
+        names = [event["name"] for event in trace["traceEvents"]]
+        self.assertEqual(names.count("frame"), 4)
+        self.assertEqual(names.count("work"), 3)
+        self.assertEqual(trace["otherData"]["frames"], 3)
+
+    def test_default_trace_dir(self):
+        '''
+        Traces without a path go to traces/ in the repository, whatever the working directory.
+        '''
+        repository = os.path.dirname(os.path.dirname(os.path.abspath(profiler.__file__)))
+        self.assertEqual(Profiler.TRACE_DIR, os.path.join(repository, "traces"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+# Filename: test_protocol.py
+# Description: Tests the network protocol (packing and splitting a stream into messages), plays a whole match against the asyncio match server over localhost, and checks that a rejected JOIN returns the client to the menu.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import asyncio
+import socket
+import unittest
+from battleship import protocol
+from battleship.server import MatchServer
+
+class ProtocolTest(unittest.TestCase):
+    def test_pack_and_split(self):
+        '''
+        Messages split back into the packed fields, and an incomplete record waits for the rest of its bytes.
+        '''
+        stream = protocol.pack(protocol.PLACE, 3 | protocol.VERTICAL_FLAG, 7, 65535) + protocol.pack(protocol.ATTACK, 0, 1, 2)
+        buffer = bytearray(stream[:protocol.MESSAGE_SIZE + 2])
+        self.assertEqual(protocol.split(buffer), [(protocol.PLACE, 3 | protocol.VERTICAL_FLAG, 7, 65535)])
+        self.assertEqual(len(buffer), 2)
+        self.assertEqual(protocol.split(buffer), [])
+        buffer += stream[protocol.MESSAGE_SIZE + 2:]
+        self.assertEqual(protocol.split(buffer), [(protocol.ATTACK, 0, 1, 2)])
+        self.assertEqual(buffer, bytearray())
+
+async def collect(reader, received):
+    '''
+    Appends every message read from a stream to received until the stream closes.
+    '''
+    buffer = bytearray()
+    while data := await reader.read(4096):
+        buffer += data
+        received.extend(protocol.split(buffer))
+
+async def until(condition):
+    '''
+    Waits (at most 5 seconds) until condition() is true.
+    '''
+    async with asyncio.timeout(5):
+        while not condition():
+            await asyncio.sleep(0.001)
+
+def kinds(messages):
+    return [kind for kind, *_ in messages]
+
+async def play_match(num_ships):
+    '''
+    Runs a server, connects two clients that place their ships on separate rows and attack every cell in order,
+    and returns every message each client received.
+    '''
+    server = MatchServer()
+    server.loop = asyncio.get_running_loop()
+    listener = await server.loop.create_server(server.protocol_factory, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    clients = [await asyncio.open_connection("127.0.0.1", port) for _ in range(2)]
+    received = [[], []]
+    readers = [asyncio.create_task(collect(reader, messages)) for (reader, _), messages in zip(clients, received)]
+    writers = [writer for _, writer in clients]
+
+    writers[0].write(protocol.pack(protocol.JOIN, num_ships))
+    await until(lambda: server.waiting)  # Player 1 joins first.
+    writers[1].write(protocol.pack(protocol.JOIN, num_ships))
+    await until(lambda: all(protocol.START in kinds(messages) for messages in received))
+    for writer in writers:
+        for ship_size in range(1, num_ships + 1):
+            writer.write(protocol.pack(protocol.PLACE, ship_size, ship_size - 1, 0))
+    await until(lambda: all(protocol.ATTACK_START in kinds(messages) for messages in received))
+
+    cells = [(i, j) for i in range(10) for j in range(10)]
+    shots = {1: list(cells), 2: list(cells)}
+    turn = next(arg for kind, arg, _, _ in received[0] if kind == protocol.ATTACK_START)
+    while protocol.GAME_OVER not in kinds(received[1]):
+        count = kinds(received[1]).count(protocol.SHOT)
+        writers[turn - 1].write(protocol.pack(protocol.ATTACK, 0, *shots[turn].pop(0)))
+        await until(lambda: kinds(received[1]).count(protocol.SHOT) > count)
+        turn = 3 - turn
+    await until(lambda: protocol.GAME_OVER in kinds(received[0]))
+
+    for writer in writers:
+        writer.close()
+    await asyncio.gather(*readers)
+    listener.close()
+    await listener.wait_closed()
+    return received
+
+class ServerTest(unittest.TestCase):
+    def test_full_match(self):
+        '''
+        Both players are matched, every placement is accepted, and with the same fleets and shot order,
+        Player 2 (who attacks first) wins.
+        '''
+        received = asyncio.run(play_match(3))
+        for num in (1, 2):
+            messages = received[num - 1]
+            self.assertEqual(messages[0][:2], (protocol.START, num))
+            self.assertEqual(kinds(messages).count(protocol.PLACED), 3)
+            self.assertNotIn(protocol.REJECTED, kinds(messages))
+            self.assertEqual(messages[-1][:2], (protocol.GAME_OVER, 2))
+            self.assertEqual(kinds(messages).count(protocol.SUNK_CELL), 6 + 3)  # All of player 1's ships, and player 2's ships 1 and 2.
+
+class ClientTest(unittest.TestCase):
+    def test_rejected_join_returns_to_menu(self):
+        '''
+        After the server rejects a JOIN, the client can choose a ship count again.
+        '''
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        from battleship.client import NetworkGame
+        game = NetworkGame("127.0.0.1", listener.getsockname()[1])
+        try:
+            title = game.title
+            self.assertTrue(game.select_ship_count(3))
+            self.assertFalse(game.select_ship_count(3))
+            game.handle(protocol.REJECTED, protocol.JOIN, 0, 0)
+            self.assertEqual(game.title, title)
+            self.assertTrue(game.select_ship_count(2))
+            self.assertEqual([message[:2] for message in protocol.split(game.outgoing)], [(protocol.JOIN, 3), (protocol.JOIN, 2)])
+        finally:
+            game.socket.close()
+            listener.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+# Filename: test_replay.py
+# Description: Tests the binary replay format: an Engine game recorded on request round-trips through ReplayLog, Replay and ReplayArchive, seeking through snapshots matches replaying every event, and other Player backends rebuild the same boards.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import os
+import random
+import tempfile
+import unittest
+import tournament
+from battleship.engine import Engine
+from battleship.player import Player
+from battleship.bitboard import BitPlayer
+from battleship.compact import CompactPlayer
+from battleship.sparse import SparsePlayer
+from battleship.replay import ReplayLog, Replay, ReplayArchive
+
+def play_engine_game(seed):
+    '''
+    Plays a recorded two-player Engine game with random legal moves and returns the finished engine.
+    '''
+    rng = random.Random(seed)
+    engine = Engine(record=True)
+    engine.select_ship_count(4)
+    while engine.place_ship_phase:
+        if rng.random() < 0.3:
+            engine.rotate_ship()
+        engine.place_ship(rng.randrange(10), rng.randrange(10))
+    while engine.attack_phase:
+        engine.attack(rng.randrange(10), rng.randrange(10))
+    return engine
+
+def cells_of(players):
+    '''
+    Returns a copy of both players' cells.
+    '''
+    return [[list(row) for row in player.board.cells] for player in players]
+
+class ReplayTest(unittest.TestCase):
+    def test_not_recorded_by_default(self):
+        engine = Engine()
+        engine.select_ship_count(3)
+        self.assertIsNone(engine.replay)
+
+    def test_engine_round_trip(self):
+        '''
+        The end of the replay is the engine's final position, with the same winner.
+        '''
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                engine = play_engine_game(seed)
+                replay = Replay(engine.replay.to_bytes())
+                player1, player2 = replay.state_at(len(replay))
+                self.assertEqual(cells_of((player1, player2)), cells_of((engine.player1, engine.player2)))
+                self.assertEqual(dict(player2.ship_count), dict(engine.player2.ship_count))
+                self.assertEqual(replay.winner(), engine.winner().num)
+
+    def test_seeking_matches_replaying(self):
+        '''
+        Every turn rebuilt from a snapshot (in any order) matches applying the events one by one.
+        '''
+        log = ReplayLog(10, 10, 5)
+        tournament.play_game((("probability", "random"), ("hunt", "edge")), 5, random.Random(1), log)
+        replay = Replay(log.to_bytes())
+        players = replay.new_players()
+        expected = [cells_of(players)]
+        for event in replay.events():
+            Replay.apply(players, event)
+            expected.append(cells_of(players))
+
+        turns = list(range(len(replay) + 1))
+        random.Random(2).shuffle(turns)
+        for turn in turns:
+            self.assertEqual(cells_of(replay.state_at(turn)), expected[turn], turn)
+
+    def test_other_backend(self):
+        '''
+        A replay rebuilt with BitPlayer has the same boards.
+        '''
+        engine = play_engine_game(4)
+        data = engine.replay.to_bytes()
+        replay, bit_replay = Replay(data), Replay(data, BitPlayer)
+        for turn in range(0, len(replay) + 1, 7):
+            self.assertEqual(cells_of(bit_replay.state_at(turn)), cells_of(replay.state_at(turn)))
+            self.assertIsInstance(bit_replay.state_at(turn)[0], BitPlayer)
+
+    def test_seek_copies_a_snapshot(self):
+        '''
+        Once the snapshots are recorded, a seek on any backend plays fewer than SNAPSHOT_INTERVAL moves, and players
+        returned by one seek share nothing with the snapshot, so changing them does not change the next seek.
+        '''
+        data = play_engine_game(5).replay.to_bytes()
+        expected = Replay(data)
+        for player_class in (Player, BitPlayer, CompactPlayer, SparsePlayer):
+            with self.subTest(backend=player_class.__name__):
+                moves = []
+                def count(method):
+                    def counted(self, *args):
+                        moves.append(method.__name__)
+                        return method(self, *args)
+                    return counted
+                counting_class = type("Counting" + player_class.__name__, (player_class,),
+                                      {"place_ship": count(player_class.place_ship), "place_attack": count(player_class.place_attack)})
+                replay = Replay(data, counting_class)
+                replay.state_at(len(replay))  # Records every snapshot.
+                for turn in range(len(replay) + 1):
+                    moves.clear()
+                    players = replay.state_at(turn)
+                    self.assertLess(len(moves), Replay.SNAPSHOT_INTERVAL, turn)
+                    self.assertEqual(cells_of(players), cells_of(expected.state_at(turn)), turn)
+                    for player, other in zip(players, expected.state_at(turn)):
+                        self.assertEqual(dict(player.ship_count), dict(other.ship_count))
+                        self.assertEqual(player.num_ship_cells, other.num_ship_cells)
+                        self.assertEqual(list(player.ships), list(other.ships))
+                    for i in range(10):
+                        for j in range(10):
+                            players[0].place_attack(i, j)  # Must not leak into the snapshot.
+                    self.assertEqual(cells_of(replay.state_at(turn)), cells_of(expected.state_at(turn)), turn)
+
+    def test_archive(self):
+        with tempfile.TemporaryDirectory() as directory:
+            archive = ReplayArchive(os.path.join(directory, "games.bsra"))
+            engines = [play_engine_game(seed) for seed in range(3)]
+            for engine in engines:
+                archive.append(engine.replay)
+            self.assertEqual(len(archive), 3)
+            self.assertEqual([bytes(data) for data in archive], [engine.replay.to_bytes() for engine in engines])
+            self.assertEqual(archive[1].winner(), engines[1].winner().num)
+
+    def test_limits(self):
+        with self.assertRaises(ValueError):
+            ReplayLog(10, 10, 256)
+        with self.assertRaises(ValueError):
+            ReplayLog(0x10000, 10, 5)
+        data = ReplayLog(10, 10, 5).to_bytes()
+        with self.assertRaises(ValueError):
+            Replay(b"XXXX" + data[4:])
+        with self.assertRaises(ValueError):
+            Replay(data + b"\x00")  # Not a whole event.
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# Filename: test_ship_ids.py
+# Description: Tests that ships are tracked by id so a fleet can repeat sizes: the classic 5-4-3-3-2 fleet plays the same on every Player backend, ships of the same size sink separately, replays and saved states keep the fleet, and the endgame solver counts layouts of identical ships once.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import random
+import unittest
+from battleship.board import Board, Orientation
+from battleship.constants import *
+from battleship.engine import Engine
+from battleship.player import Player
+from battleship.bitboard import BitPlayer
+from battleship.compact import CompactPlayer
+from battleship.sparse import SparsePlayer
+from battleship.replay import Replay
+from battleship.solver import EndgameSolver
+from battleship.state import GameState
+from test_solver import brute_force
+
+BACKENDS = (Player, BitPlayer, CompactPlayer, SparsePlayer)
+
+def classic_game(player_class, seed, record=False):
+    '''
+    Returns an Engine playing the classic fleet with both fleets placed at random, and each player's shot order.
+    '''
+    rng = random.Random(seed)
+    engine = Engine(player_class, record=record)
+    engine.select_fleet()
+    while engine.place_ship_phase:
+        engine.auto_place_ships(rng)
+    cells = [(i, j) for i in range(10) for j in range(10)]
+    return engine, {1: rng.sample(cells, len(cells)), 2: rng.sample(cells, len(cells))}
+
+class FleetTest(unittest.TestCase):
+    def test_ids(self):
+        '''
+        Ships get ids 1..N smallest first, and a ship count still means sizes 1..N with the id equal to the size.
+        '''
+        for player_class in BACKENDS:
+            with self.subTest(backend=player_class.__name__):
+                player = player_class(1)
+                player.get_ships(CLASSIC_FLEET)
+                self.assertEqual(list(player.ships), [1, 2, 3, 4, 5])
+                self.assertEqual(dict(player.ship_sizes), {1: 2, 2: 3, 3: 3, 4: 4, 5: 5})
+                self.assertEqual(player.num_ship_cells, 17)
+                player.get_ships(3)
+                self.assertEqual(dict(player.ship_sizes), {1: 1, 2: 2, 3: 3})
+
+    def test_same_size_ships_sink_separately(self):
+        '''
+        Two ships of size 3 side by side are hit, sunk and looked up as different ships.
+        '''
+        for player_class in BACKENDS:
+            with self.subTest(backend=player_class.__name__):
+                player = player_class(1)
+                player.get_ships([3, 3])
+                self.assertTrue(player.place_ship(0, 0, 1))
+                self.assertTrue(player.place_ship(1, 0, 2))
+                self.assertFalse(player.place_ship(1, 1, 2, Orientation.VERTICAL))  # Crosses ship 2.
+                self.assertEqual([player.ship_at(i, 0) for i in range(3)], [1, 2, 0])
+                self.assertEqual(player.place_attack(0, 0), (True, 1))
+                self.assertEqual(player.place_attack(1, 0), (True, 2))
+                player.place_attack(0, 1)
+                self.assertEqual(player.place_attack(0, 2), (True, 1))
+                self.assertEqual(dict(player.ship_count), {1: 0, 2: 2})
+                self.assertEqual([player.board.cells[0][j] for j in range(3)], [SUNK_CELL] * 3)
+                self.assertEqual([player.board.cells[1][j] for j in range(3)], [HIT_CELL, 2, 2])
+                self.assertEqual(player.ship_at(0, 1), 1)
+                self.assertFalse(player.is_loss())
+
+    def test_backends_agree(self):
+        '''
+        Whole classic games give the same results and boards on every backend.
+        '''
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                games = [classic_game(player_class, seed) for player_class in BACKENDS]
+                reference, orders = games[0]
+                while reference.attack_phase:
+                    i, j = orders[reference.turn].pop()
+                    results = [engine.attack(i, j) for engine, _ in games]
+                    self.assertEqual(len(set(results)), 1)
+                for engine, _ in games:
+                    for num in (1, 2):
+                        player, expected = engine.player_lookup_table[num], reference.player_lookup_table[num]
+                        self.assertEqual([list(row) for row in player.board.cells], expected.board.cells)
+                        self.assertEqual(dict(player.ship_count), expected.ship_count)
+                    self.assertEqual(engine.winner().num, reference.winner().num)
+
+    def test_menu_fleet_must_fit(self):
+        engine = Engine(rows=3, cols=3)
+        self.assertFalse(engine.select_fleet([4]))
+        self.assertFalse(engine.select_fleet([3, 3, 3, 1]))
+        self.assertTrue(engine.select_fleet([3, 3]))
+        self.assertEqual(engine.player2.ship_sizes, {1: 3, 2: 3})
+
+class SavedFleetTest(unittest.TestCase):
+    def test_replay_keeps_fleet(self):
+        '''
+        A replay stores the ship sizes, and every backend replays a classic game to the same final boards.
+        '''
+        engine, orders = classic_game(Player, 4, record=True)
+        while engine.attack_phase:
+            engine.attack(*orders[engine.turn].pop())
+        data = engine.replay.to_bytes()
+        for player_class in BACKENDS:
+            with self.subTest(backend=player_class.__name__):
+                replay = Replay(data, player_class)
+                self.assertEqual(replay.ship_sizes, (2, 3, 3, 4, 5))
+                players = replay.state_at(len(replay))
+                for player, expected in zip(players, (engine.player1, engine.player2)):
+                    self.assertEqual([list(row) for row in player.board.cells], expected.board.cells)
+
+    def test_state_keeps_fleet(self):
+        '''
+        A captured classic game restores into every backend with the same ships, and plays on identically.
+        '''
+        for player_class in BACKENDS:
+            with self.subTest(backend=player_class.__name__):
+                original, orders = classic_game(Player, 5)
+                for _ in range(40):
+                    original.attack(*orders[original.turn].pop())
+                restored = Engine(player_class)
+                GameState.capture(original).restore(restored)
+                self.assertEqual(dict(restored.player1.ship_sizes), original.player1.ship_sizes)
+                while original.attack_phase:
+                    i, j = orders[original.turn].pop()
+                    self.assertEqual(restored.attack(i, j), original.attack(i, j))
+                    self.assertEqual(dict(restored.player2.ship_count), original.player2.ship_count)
+
+class TwinShipSolverTest(unittest.TestCase):
+    def test_identical_ships_counted_once(self):
+        '''
+        Swapping two ships of the same size gives the same layout, so the solver counts half the ordered fleets.
+        '''
+        for ship_sizes in ([2, 2], [1, 2, 2], [1, 1, 2]):
+            with self.subTest(ship_sizes=ship_sizes):
+                board = Board(4, 4)
+                board.cells[1][1] = MISS_CELL
+                board.cells[2][2] = HIT_CELL
+                total, _ = brute_force(board, ship_sizes)
+                solver = EndgameSolver(board, ship_sizes)
+                self.assertTrue(solver.solve())
+                self.assertEqual(solver.total, total // 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+# Filename: test_solver.py
+# Description: Tests the exact endgame solver against brute-force enumeration of every fleet configuration on small boards, its wall-clock budget, the computer's use of it, and the hint overlay's bookkeeping in local, restored and networked games.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import itertools
+import random
+import socket
+import unittest
+from battleship import protocol
+from battleship.board import Board
+from battleship.constants import *
+from battleship.engine import Engine
+from battleship.game import Game
+from battleship.ai import ProbabilityAI
+from battleship.solver import EndgameSolver
+from battleship.state import GameState
+
+def brute_force(board, ship_sizes):
+    '''
+    Returns the number of consistent configurations and how many of them cover each cell, by trying every one.
+    '''
+    rows, cols = board.rows, board.cols
+    def placements(ship_size):
+        for i in range(rows):
+            for j in range(cols):
+                if j + ship_size <= cols:
+                    yield frozenset((i, j + k) for k in range(ship_size))
+                if ship_size > 1 and i + ship_size <= rows:
+                    yield frozenset((i + k, j) for k in range(ship_size))
+    hits = {(i, j) for i in range(rows) for j in range(cols) if board.cells[i][j] == HIT_CELL}
+    blocked = {(i, j) for i in range(rows) for j in range(cols) if board.cells[i][j] in (MISS_CELL, SUNK_CELL)}
+    total = 0
+    cover = {}
+    for fleet in itertools.product(*(list(placements(ship_size)) for ship_size in ship_sizes)):
+        cells = set().union(*fleet)
+        if len(cells) != sum(ship_sizes) or cells & blocked or not hits <= cells or any(ship <= hits for ship in fleet):
+            continue
+        total += 1
+        for cell in cells - hits:
+            cover[cell] = cover.get(cell, 0) + 1
+    return total, cover
+
+def random_board(rng, rows, cols, ship_sizes):
+    '''
+    Returns a board with the ships placed at random and some cells attacked, as the attacker sees it, and the ships left.
+    '''
+    board = Board(rows, cols)
+    cells = {}
+    for ship_size in ship_sizes:
+        while True:
+            vertical = rng.random() < 0.5
+            i, j = rng.randrange(rows), rng.randrange(cols)
+            ship = [(i + k, j) if vertical else (i, j + k) for k in range(ship_size)]
+            if all(0 <= a < rows and 0 <= b < cols and (a, b) not in cells for a, b in ship):
+                cells.update({cell: ship_size for cell in ship})
+                break
+    left = {ship_size: ship_size for ship_size in ship_sizes}
+    for i, j in rng.sample([(i, j) for i in range(rows) for j in range(cols)], rng.randrange(rows * cols // 2)):
+        ship_size = cells.get((i, j))
+        if ship_size is None:
+            board.cells[i][j] = MISS_CELL
+            continue
+        board.cells[i][j] = HIT_CELL
+        left[ship_size] -= 1
+        if not left[ship_size]:
+            for cell, size in cells.items():
+                if size == ship_size:
+                    board.cells[cell[0]][cell[1]] = SUNK_CELL
+    return board, [ship_size for ship_size, cells_left in left.items() if cells_left]
+
+class EndgameSolverTest(unittest.TestCase):
+    def test_matches_brute_force(self):
+        '''
+        Configuration counts and hit probabilities match enumerating every configuration.
+        '''
+        rng = random.Random(1)
+        for case in range(40):
+            with self.subTest(case=case):
+                rows = cols = rng.randint(3, 5)
+                board, ship_sizes = random_board(rng, rows, cols, [1, 2, 3])
+                total, cover = brute_force(board, ship_sizes)
+                solver = EndgameSolver(board, ship_sizes)
+                self.assertEqual(solver.solve(), total > 0)
+                if not total:
+                    continue
+                self.assertEqual(solver.total, total)
+                for i in range(rows):
+                    for j in range(cols):
+                        expected = cover.get((i, j), 0) / total if board.cells[i][j] == EMPTY_CELL else 0.0
+                        self.assertAlmostEqual(solver.probability(i, j), expected)
+                best = max(solver.probabilities)
+                self.assertTrue(all(solver.probability(i, j) == best for i, j in solver.best_cells))
+
+    def test_time_budget(self):
+        '''
+        A solve that runs past max_seconds gives up instead of blocking; the state limit does the same.
+        '''
+        board = Board(10, 10)
+        self.assertFalse(EndgameSolver(board, [2, 3], max_seconds=1e-9).solve())
+        self.assertFalse(EndgameSolver(board, [2, 3], max_states=10).solve())
+        self.assertTrue(EndgameSolver(Board(4, 4), [1, 2]).solve())
+
+class EndgameAITest(unittest.TestCase):
+    def test_ai_budget(self):
+        '''
+        With no time for the solver, the computer falls back to its heatmaps and still plays legal shots.
+        '''
+        class NoTimeAI(ProbabilityAI):
+            ENDGAME_SECONDS = 1e-9
+        for ai_class in (ProbabilityAI, NoTimeAI):
+            with self.subTest(ai=ai_class.__name__):
+                rng = random.Random(2)
+                engine = Engine()
+                engine.select_ship_count(5)
+                engine.auto_place_ships(rng)
+                engine.auto_place_ships(rng)
+                ai = ai_class(engine.player1, random.Random(3))
+                shots = set()
+                while not engine.player1.is_loss():
+                    cell = ai.choose_attack()
+                    self.assertNotIn(cell, shots)
+                    shots.add(cell)
+                    res, ship_size = engine.player1.place_attack(*cell)
+                    ai.record_attack(*cell, res, ship_size)
+                self.assertLess(len(shots), 100)
+
+class HintTest(unittest.TestCase):
+    def test_restore_marks_hints_stale(self):
+        '''
+        Loading a state into a Game solves the hints again for the restored boards.
+        '''
+        rng = random.Random(4)
+        engine = Engine()
+        engine.select_ship_count(3)
+        engine.auto_place_ships(rng)
+        engine.auto_place_ships(rng)
+        game = Game()
+        game.toggle_hints()
+        game.hints_stale = False
+        GameState.capture(engine).restore(game)
+        self.assertTrue(game.hints_stale)
+        self.assertEqual(game.hint_ship_sizes(game.current_enemy()), [1, 2, 3])
+
+    def test_network_sunk_ships(self):
+        '''
+        The network client learns which of the opponent's ships sank from SHOT, and the hints leave them out.
+        '''
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        from battleship.client import NetworkGame
+        game = NetworkGame("127.0.0.1", listener.getsockname()[1])
+        try:
+            game.handle(protocol.START, 1, 3, 0)
+            game.handle(protocol.ATTACK_START, 1, 0, 0)
+            game.handle(protocol.SHOT, 1 | RESULT_SUNK << 2 | 2 << 4, 4, 4)
+            self.assertEqual(game.hint_ship_sizes(game.current_enemy()), [1, 3])
+            self.assertTrue(game.hints_stale)
+        finally:
+            game.socket.close()
+            listener.close()
+
+if __name__ == "__main__":
+    unittest.main()
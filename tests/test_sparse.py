@@ -0,0 +1,82 @@
+# Filename: test_sparse.py
+# Description: Tests that SparsePlayer plays exactly like the list-based Player on normal and large boards, that only the cells in use are stored, and that its placement masks and cell views match the list board.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import random
+import unittest
+import numpy as np
+from battleship.board import Orientation
+from battleship.constants import *
+from battleship.player import Player
+from battleship.sparse import SparsePlayer
+
+def new_players(rows, cols, num):
+    '''
+    Returns a list Player and a SparsePlayer with rows x cols boards and ships 1..num to place.
+    '''
+    players = [Player(1), SparsePlayer(1)]
+    for player in players:
+        player.board = player.board_class(rows, cols)
+        player.get_ships(num)
+    return players
+
+class SparsePlayerTest(unittest.TestCase):
+    def assert_same_state(self, player, sparse_player):
+        self.assertEqual([list(row) for row in sparse_player.board.cells], player.board.cells)
+        self.assertEqual(sparse_player.ship_count, player.ship_count)
+        self.assertEqual(sparse_player.ship_hits, player.ship_hits)
+        self.assertEqual(sparse_player.num_ship_cells, player.num_ship_cells)
+        self.assertEqual(sparse_player.board.dirty_cells, player.board.dirty_cells)
+
+    def test_seeded_games(self):
+        '''
+        Random placements and random attacks (repeats included) give the same results on both backends.
+        '''
+        for seed, (rows, cols) in enumerate(((10, 10), (8, 14), (40, 25)) * 4):
+            with self.subTest(seed=seed, rows=rows, cols=cols):
+                rng = random.Random(seed)
+                player, sparse_player = new_players(rows, cols, 5)
+                while player.ships:
+                    args = (rng.randrange(rows), rng.randrange(cols), player.ships[-1], rng.choice(list(Orientation)))
+                    placed = player.place_ship(*args)
+                    self.assertEqual(sparse_player.place_ship(*args), placed)
+                    if placed:
+                        player.ships.pop()
+                self.assert_same_state(player, sparse_player)
+                while not player.is_loss():
+                    i, j = rng.randrange(rows), rng.randrange(cols)
+                    self.assertEqual(sparse_player.place_attack(i, j), player.place_attack(i, j))
+                self.assert_same_state(player, sparse_player)
+                self.assertTrue(sparse_player.is_loss())
+
+    def test_only_used_cells_are_stored(self):
+        sparse_player = SparsePlayer(1)
+        sparse_player.board = sparse_player.board_class(1000, 1000)
+        sparse_player.get_ships(3)
+        sparse_player.place_ship(999, 997, 3)
+        sparse_player.place_attack(0, 0)
+        sparse_player.place_attack(999, 998)
+        self.assertEqual(sparse_player.board.values, {999997: 3, 999998: HIT_CELL, 999999: 3, 0: MISS_CELL})
+        self.assertEqual(sparse_player.board.cells[999][-3:], [3, HIT_CELL, 3])
+
+    def test_placement_masks_match(self):
+        '''
+        The running-count placement masks of the sparse board match the list board's sliding windows.
+        '''
+        rng = random.Random(1)
+        player, sparse_player = new_players(12, 9, 5)
+        for ship_size in range(5, 0, -1):
+            while not player.place_ship(rng.randrange(12), rng.randrange(9), ship_size, rng.choice(list(Orientation))):
+                pass
+        sparse_player.board.cells = player.board.cells
+        for ship_size in range(1, 10):
+            for orientation in Orientation:
+                np.testing.assert_array_equal(sparse_player.board.placement_mask(ship_size, orientation),
+                                              player.board.placement_mask(ship_size, orientation))
+
+if __name__ == "__main__":
+    unittest.main()
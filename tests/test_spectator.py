@@ -0,0 +1,111 @@
+# Filename: test_spectator.py
+# Description: Tests spectating over the asyncio match server: a spectator who joins before the first attack and one who joins mid-match both rebuild exactly the visible cells of both boards from the keyframes and per-move deltas, deltas are numbered one move apart, and ships that were not sunk are never sent.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import asyncio
+import unittest
+from battleship import protocol
+from battleship.server import MatchServer
+from test_protocol import collect, until, kinds
+
+def rebuild(messages):
+    '''
+    Applies a spectator's KEYFRAME, DELTA and CELL messages like SpectatorGame and returns
+    the visible cells ({(player number, i, j): cell value}) and the move number of every DELTA.
+    '''
+    cells = {}
+    deltas = []
+    for kind, arg, i, j in messages:
+        if kind == protocol.KEYFRAME:
+            cells = {}
+        elif kind == protocol.DELTA:
+            deltas.append(j)
+        elif kind == protocol.CELL:
+            cells[(arg & 3, i, j)] = protocol.VISIBLE_CELLS[arg >> 2]
+    return cells, deltas
+
+def visible(match):
+    '''
+    Returns the cells of both boards of a Match that an attacker can see.
+    '''
+    return {(player.num, i, j): value for player in match.players
+            for i, j, value in player.board.nonempty_cells(0, player.board.rows, 0, player.board.cols) if value in protocol.VISIBLE_STATES}
+
+async def watch_match(num_ships, late_join):
+    '''
+    Runs a server and a match where both players attack every cell in order. One spectator joins before the first
+    attack and another after late_join attacks. Returns the Match and every message each spectator received.
+    '''
+    server = MatchServer()
+    server.loop = asyncio.get_running_loop()
+    listener = await server.loop.create_server(server.protocol_factory, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    clients = [await asyncio.open_connection("127.0.0.1", port) for _ in range(4)]
+    received = [[] for _ in clients]
+    readers = [asyncio.create_task(collect(reader, messages)) for (reader, _), messages in zip(clients, received)]
+    writers = [writer for _, writer in clients]
+
+    writers[0].write(protocol.pack(protocol.JOIN, num_ships))
+    await until(lambda: server.waiting)
+    writers[1].write(protocol.pack(protocol.JOIN, num_ships))
+    await until(lambda: server.running)
+    match = next(iter(server.running.values()))
+    for writer in writers[:2]:
+        for ship in range(1, num_ships + 1):
+            writer.write(protocol.pack(protocol.PLACE, ship, ship - 1, 0))
+    await until(lambda: match.attack_phase)
+    writers[2].write(protocol.pack(protocol.WATCH, 0, match.id))
+    await until(lambda: protocol.KEYFRAME in kinds(received[2]))
+
+    cells = [(i, j) for i in range(10) for j in range(10)]
+    shots = {1: list(cells), 2: list(cells)}
+    while not match.over:
+        if match.moves == late_join:
+            writers[3].write(protocol.pack(protocol.WATCH))  # The newest running match.
+            await until(lambda: protocol.KEYFRAME in kinds(received[3]))
+        moves = match.moves
+        writers[match.turn - 1].write(protocol.pack(protocol.ATTACK, 0, *shots[match.turn].pop(0)))
+        await until(lambda: match.moves > moves)
+    await until(lambda: all(protocol.GAME_OVER in kinds(messages) for messages in received[2:]))
+
+    for writer in writers:
+        writer.close()
+    await asyncio.gather(*readers)
+    listener.close()
+    await listener.wait_closed()
+    return match, received[2:]
+
+class SpectatorTest(unittest.TestCase):
+    def test_spectators_follow_match(self):
+        match, spectators = asyncio.run(watch_match(3, 20))
+        expected = visible(match)
+        for messages in spectators:
+            with self.subTest(first=messages[0]):
+                self.assertEqual(messages[0][:3], (protocol.WATCHING, 3, match.id))
+                cells, deltas = rebuild(messages)
+                self.assertEqual(cells, expected)
+                self.assertEqual(messages[-1][:2], (protocol.GAME_OVER, 2))
+                keyframes = [j for kind, _, _, j in messages if kind == protocol.KEYFRAME]
+                for move in deltas:  # Every delta follows the move before it, or a keyframe every KEYFRAME_INTERVAL moves.
+                    self.assertTrue(move - 1 in deltas or move - 1 in keyframes)
+                self.assertEqual(len(deltas) + len(keyframes) - 1, match.moves - keyframes[0])
+
+    def test_unsunk_ships_hidden(self):
+        '''
+        A keyframe of a fresh match sends no cells though both fleets are on the boards, and every cell ever sent was attacked.
+        '''
+        match, spectators = asyncio.run(watch_match(2, 0))
+        expected = visible(match)
+        for messages in spectators:
+            keyframe = next(message for message in messages if message[0] == protocol.KEYFRAME)
+            self.assertEqual(keyframe[2], 0)
+            for kind, arg, i, j in messages:
+                if kind == protocol.CELL:
+                    self.assertIn((arg & 3, i, j), expected)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# Filename: test_startup.py
+# Description: Tests that the package exposes its classes lazily, that the game logic plays a whole game without loading pyray, NumPy or the optional modules, and that the startup benchmark records a module that fails to import instead of aborting. Each check runs in a fresh interpreter so earlier imports do not hide a regression.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def run_python(script):
+    '''
+    Runs a script in a fresh interpreter from the repository root and returns the JSON it prints last.
+    '''
+    process = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True)
+    if process.returncode:
+        raise AssertionError(process.stderr)
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+LOGIC_GAME = '''
+import json, sys
+import battleship
+loaded = sorted(name for name in battleship.__all__ if name in vars(battleship))
+from battleship import Engine
+engine = Engine()
+engine.select_ship_count(3)
+for _ in range(2):
+    for row in range(3):
+        engine.place_ship(row, 0)
+for row in range(3):
+    for col in range(3):
+        engine.attack(row, col)
+        engine.attack(row, col)
+modules = [name for name in ("pyray", "numpy", "battleship.ai", "battleship.replay", "battleship.fleet") if name in sys.modules]
+print(json.dumps({"loaded": loaded, "modules": modules, "over": engine.game_end_phase}))
+'''
+
+STARTUP_ERROR = '''
+import json, sys
+sys.path.insert(0, "benchmarks")
+import run_benchmarks
+run_benchmarks.STARTUP_MODULES = {"battleship.no_such_module": False, "battleship.constants": False}
+results = run_benchmarks.bench_startup(1)
+print(json.dumps({"results": results, "regressions": run_benchmarks.startup_regressions({"results": {"startup": results}})}))
+'''
+
+class StartupTest(unittest.TestCase):
+    def test_logic_loads_nothing_extra(self):
+        '''
+        Importing the package loads no class up front, and a whole two-player game needs neither pyray nor NumPy.
+        '''
+        result = run_python(LOGIC_GAME)
+        self.assertEqual(result["loaded"], [])
+        self.assertEqual(result["modules"], [])
+        self.assertTrue(result["over"])
+
+    def test_lazy_attributes(self):
+        result = run_python("import json, battleship; print(json.dumps([battleship.BitPlayer.__module__, 'Game' in dir(battleship)]))")
+        self.assertEqual(result, ["battleship.bitboard", True])
+        with self.assertRaises(AttributeError):
+            import battleship
+            battleship.NoSuchClass
+
+    def test_startup_records_import_errors(self):
+        '''
+        A module that fails to import gets an "error" entry and a regression; the other modules are still timed.
+        '''
+        result = run_python(STARTUP_ERROR)
+        failed = result["results"]["battleship.no_such_module"]
+        self.assertIn("ModuleNotFoundError", failed["error"])
+        self.assertIn("import_ms_median", result["results"]["battleship.constants"])
+        self.assertFalse(result["results"]["battleship.constants"]["loads_pyray"])
+        self.assertEqual(len(result["regressions"]), 1)
+        self.assertTrue(result["regressions"][0].startswith("startup.battleship.no_such_module:"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+# Filename: test_state.py
+# Description: Tests that a GameState captured from a game restores into an Engine on every Player backend, mid-placement and mid-attack, that the restored game plays on exactly like the original, and that clones, buffer attacks, save/load and the field limits behave.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import os
+import random  # Seeded layouts and shot orders.
+import tempfile
+import unittest
+from battleship.engine import Engine
+from battleship.player import Player
+from battleship.bitboard import BitPlayer
+from battleship.compact import CompactPlayer
+from battleship.sparse import SparsePlayer
+from battleship.state import GameState
+
+BACKENDS = (Player, BitPlayer, CompactPlayer, SparsePlayer)
+
+def player_state(player):
+    '''
+    Returns everything a restore must bring back for one player, in a form every backend can be compared by.
+    '''
+    return (
+        [list(row) for row in player.board.cells],
+        dict(player.ship_count),
+        {ship_size: sorted(hits) for ship_size, hits in player.ship_hits.items()},
+        list(player.ships),
+        player.num_ship_cells,
+        player.ships_placed,
+    )
+
+def engine_state(engine):
+    '''
+    Returns the phase, turn and both players' state of an Engine.
+    '''
+    phase = (engine.menu_phase, engine.place_ship_phase, engine.attack_phase, engine.game_end_phase, engine.turn)
+    return phase, player_state(engine.player1), player_state(engine.player2)
+
+def new_game(player_class, seed, shots, record=False):
+    '''
+    Returns an Engine with 5 ships placed at random for both players and shots attacks played,
+    and each player's remaining shot order.
+    '''
+    rng = random.Random(seed)
+    engine = Engine(player_class, record=record)
+    engine.select_ship_count(5)
+    while engine.place_ship_phase:
+        if rng.random() < 0.3:
+            engine.rotate_ship()
+        engine.place_ship(rng.randrange(10), rng.randrange(10))
+    cells = [(i, j) for i in range(10) for j in range(10)]
+    orders = {1: rng.sample(cells, len(cells)), 2: rng.sample(cells, len(cells))}
+    for _ in range(shots):
+        if not engine.attack_phase:
+            break
+        engine.attack(*orders[engine.turn].pop())
+    return engine, orders
+
+class RestoreTest(unittest.TestCase):
+    def test_restore_every_backend(self):
+        '''
+        Mid-attack states restore into every backend, from every backend, and play on identically.
+        '''
+        for source in BACKENDS:
+            for target in BACKENDS:
+                for seed, shots in ((1, 0), (2, 37), (3, 90), (4, 200)):
+                    with self.subTest(source=source.__name__, target=target.__name__, seed=seed):
+                        original, orders = new_game(source, seed, shots)
+                        restored = Engine(target)
+                        GameState.capture(original).restore(restored)
+                        self.assertEqual(engine_state(restored), engine_state(original))
+                        while original.attack_phase:  # Both games must go on the same way.
+                            i, j = orders[original.turn].pop()
+                            self.assertEqual(restored.attack(i, j), original.attack(i, j))
+                        self.assertEqual(engine_state(restored), engine_state(original))
+
+    def test_restore_during_placement(self):
+        '''
+        A state captured while ships are still being placed restores the placed ships and the ones left to place.
+        '''
+        for player_class in BACKENDS:
+            with self.subTest(backend=player_class.__name__):
+                original = Engine(player_class)
+                original.select_ship_count(5)
+                original.place_ship(0, 0)
+                original.rotate_ship()
+                original.place_ship(2, 3)
+                restored = Engine(player_class)
+                GameState.capture(original).restore(restored)
+                self.assertEqual(engine_state(restored), engine_state(original))
+                self.assertTrue(restored.place_ship(5, 5))
+
+    def test_one_column_board(self):
+        '''
+        On a one-column board every ship is vertical with its cells 1 apart, and restores where it was.
+        '''
+        rng = random.Random(8)
+        original = Engine(rows=40, cols=1)
+        original.select_ship_count(4)
+        while original.place_ship_phase:
+            original.auto_place_ships(rng)
+        for _ in range(30):
+            original.attack(rng.randrange(40), 0)
+        for player_class in BACKENDS:
+            with self.subTest(backend=player_class.__name__):
+                restored = Engine(player_class, rows=40, cols=1)
+                GameState.capture(original).restore(restored)
+                self.assertEqual(engine_state(restored), engine_state(original))
+
+class BufferTest(unittest.TestCase):
+    def test_clone_is_independent(self):
+        engine, orders = new_game(Player, 5, 20)
+        state = GameState.capture(engine)
+        clone = state.clone()
+        i, j = orders[state.turn][-1]
+        self.assertTrue(clone.attack(i, j))
+        self.assertNotEqual(clone.buffer, state.buffer)
+        self.assertEqual(state.buffer, GameState.capture(engine).buffer)
+
+    def test_attack_matches_engine(self):
+        '''
+        Attacks played on the buffer give the same state as attacks played on the Engine.
+        '''
+        engine, orders = new_game(Player, 6, 10)
+        state = GameState.capture(engine)
+        while engine.attack_phase:
+            i, j = orders[engine.turn].pop()
+            self.assertEqual(state.attack(i, j), engine.attack(i, j))
+        self.assertEqual(state.buffer, GameState.capture(engine).buffer)
+        self.assertTrue(state.is_loss(1) or state.is_loss(2))
+
+    def test_save_and_load(self):
+        '''
+        A saved game loads with its messages and keeps recording into its replay log.
+        '''
+        engine, orders = new_game(Player, 7, 30, record=True)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "game.bss")
+            GameState.save(engine, path)
+            loaded = Engine()
+            GameState.load(loaded, path)
+        self.assertEqual(engine_state(loaded), engine_state(engine))
+        self.assertEqual(loaded.message, engine.message)
+        self.assertEqual(loaded.replay.to_bytes(), engine.replay.to_bytes())
+        self.assertEqual(len(loaded.replay), len(engine.replay))
+        i, j = orders[engine.turn].pop()
+        engine.attack(i, j)
+        loaded.attack(i, j)
+        self.assertEqual(loaded.replay.to_bytes(), engine.replay.to_bytes())
+
+    def test_limits(self):
+        '''
+        Ships too large for the int8 cells are refused with a ValueError instead of wrapping around.
+        '''
+        engine = Engine()
+        engine.player1.get_ships(130)
+        with self.assertRaisesRegex(ValueError, "at most 127"):
+            GameState.capture(engine)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+# Filename: test_tournament.py
+# Description: Tests the tournament runner: seeded games are reproducible and consistent, unplaceable fleets and bad ship counts are rejected, and tasks interleave the pairings.
+# Inputs: None
+# Output: unittest results (python -m pytest tests or python -m unittest discover tests)
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import contextlib
+import io
+import random
+import sys
+import unittest
+from unittest import mock
+import tournament
+
+class TournamentTest(unittest.TestCase):
+    def test_seeded_games(self):
+        '''
+        Every game ends with the winner having hit every ship cell, and the same seed plays the same games.
+        '''
+        competitors = (("probability", "random"), ("hunt", "edge"))
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                winner, turns, hits, misses = tournament.play_game(competitors, 5, random.Random(seed))
+                self.assertIn(winner, (0, 1))
+                self.assertEqual(hits, 15)  # Ships of sizes 1..5.
+                self.assertEqual(turns, hits + misses)
+                self.assertEqual(tournament.play_game(competitors, 5, random.Random(seed)), (winner, turns, hits, misses))
+
+    def test_chunk_results(self):
+        '''
+        A chunk packs one record per game, and playing it again gives the same bytes.
+        '''
+        task = (0, ("random", "random"), ("probability", "edge"), 3, 0, 6, 1, False)
+        pairing, packed, records = tournament.play_chunk(task)
+        self.assertEqual(pairing, 0)
+        self.assertEqual(len(packed), 6 * tournament.RESULT_FORMAT.size)
+        self.assertEqual(records, b"")  # Replays are only recorded when asked for.
+        self.assertEqual(tournament.play_chunk(task), (pairing, packed, records))
+        stats = tournament.PairingStats()
+        stats.add(packed)
+        self.assertEqual(stats.games, 6)
+        self.assertEqual(sum(stats.wins), 6)
+
+    def test_unplaceable_fleet(self):
+        '''
+        A fleet that does not fit on the board is an error instead of a broken game.
+        '''
+        with self.assertRaises(ValueError):
+            tournament.play_game((("random", "random"), ("random", "random")), 15, random.Random(0))
+
+    def test_ship_count_checked(self):
+        '''
+        The command line only accepts ship counts the board can hold.
+        '''
+        for ships in ("0", "15"):
+            with self.subTest(ships=ships):
+                argv = ["tournament.py", "-s", ships, "random", "hunt"]
+                with mock.patch.object(sys, "argv", argv), contextlib.redirect_stderr(io.StringIO()):
+                    with self.assertRaises(SystemExit):
+                        tournament.main()
+
+    def test_tasks_interleave_pairings(self):
+        '''
+        Chunks of different pairings alternate, and every game of every pairing is covered once.
+        '''
+        competitors = [("random", "random"), ("hunt", "random"), ("probability", "random")]
+        pairings = [(0, 1), (0, 2), (1, 2)]
+        games = tournament.CHUNK_SIZE * 2 + 7
+        tasks = tournament.make_tasks(competitors, pairings, games, 5, 0)
+        self.assertEqual([task[0] for task in tasks[:3]], [0, 1, 2])
+        for index in range(len(pairings)):
+            self.assertEqual(sum(task[5] for task in tasks if task[0] == index), games)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,229 @@
+# Filename: tournament.py
+# Description: This script runs round-robin tournaments between computer strategies (an attack strategy paired with a placement strategy) across a multiprocessing pool and reports win rates with confidence intervals.
+# Inputs: Command line arguments (competitors, games per pairing, ship count, worker count, seed, optional replay archive)
+# Output: Per-pairing and overall win rates, 95% confidence intervals and average turns/hits/misses, and optionally every game in a replay archive
+# Other sources for the code: None
+# Authors: Xavier and Andrew
+# Creation Date: 17th of October, 2026
+
+import argparse  # Command line parsing.
+import itertools  # Building round-robin pairings.
+import math  # Confidence interval math.
+import multiprocessing  # Worker pool for playing games in parallel.
+import random  # Seeded random source for each game.
+import struct  # Packing per-game results into compact bytes.
+from battleship.engine import Engine
+from battleship.player import Player
+from battleship.board import Orientation
+from battleship.replay import ReplayLog, ReplayArchive, RESULT_MISS, RESULT_HIT, RESULT_SUNK
+from battleship.strategies import ATTACK_STRATEGIES, PLACEMENT_STRATEGIES, place_fleet
+
+# One packed record per game: winning side (0 or 1), turns the winner took, winner hits, winner misses.
+RESULT_FORMAT = struct.Struct("<BHHH")
+CHUNK_SIZE = 50  # Games per task sent to a worker, small so every worker stays busy until the end.
+
+def parse_competitor(name):
+    '''
+    Splits an "attack:placement" competitor name into its strategy names.
+    '''
+    attack, _, placement = name.partition(":")
+    placement = placement or "random"
+    if attack not in ATTACK_STRATEGIES or placement not in PLACEMENT_STRATEGIES:
+        raise argparse.ArgumentTypeError(f"unknown competitor '{name}'")
+    return attack, placement
+
+def play_game(competitors, num_ships, rng, log=None):
+    '''
+    Plays one full game between two competitors.
+    Args:
+        competitors: Two (attack, placement) strategy name pairs; the first one attacks first.
+        num_ships: Number of ships (sizes 1..num_ships) for each player.
+        rng: Random source for the game.
+        log: Optional ReplayLog that every placement and attack is recorded to.
+    Returns:
+        A tuple (winner index, turns, hits, misses) where turns, hits and misses are the winner's.
+    Raises:
+        ValueError: If a player's fleet cannot be placed on the board.
+    '''
+    players = [Player(1), Player(2)]
+    for player, (_, placement) in zip(players, competitors):
+        player.get_ships(num_ships)
+        if not place_fleet(player, PLACEMENT_STRATEGIES[placement], rng):
+            raise ValueError(f"could not place {num_ships} ships with the '{placement}' placement strategy")
+        if log is not None:
+            for i, j, ship, orientation in placed_ships(player):
+                log.record_placement(player.num, i, j, ship, orientation)
+
+    # Each side attacks the other side's board.
+    attackers = [ATTACK_STRATEGIES[competitors[0][0]](players[1], rng), ATTACK_STRATEGIES[competitors[1][0]](players[0], rng)]
+    hits = [0, 0]
+    misses = [0, 0]
+    side = 0
+    while True:
+        enemy = players[1 - side]
+        i, j = attackers[side].choose_attack()
+        res, ship = enemy.place_attack(i, j)
+        attackers[side].record_attack(i, j, res, ship)
+        if log is not None:
+            result = (RESULT_SUNK if enemy.ship_count[ship] == 0 else RESULT_HIT) if res else RESULT_MISS
+            log.record_attack(side + 1, i, j, result, ship)
+        if res:
+            hits[side] += 1
+        else:
+            misses[side] += 1
+        if enemy.is_loss():
+            return side, hits[side] + misses[side], hits[side], misses[side]
+        side = 1 - side
+
+def placed_ships(player):
+    '''
+    Finds every ship on a freshly placed board, from the cells each ship covers.
+    Returns:
+        A list of (i, j, ship id, orientation) tuples, one per ship, in increasing ship id.
+    '''
+    ships = []
+    for ship in sorted(player.ship_cells):
+        cells = player.ship_cells[ship]
+        i, j = min(cells)  # The top-left end of the ship.
+        vertical = len(cells) > 1 and (i + 1, j) in cells
+        ships.append((i, j, ship, Orientation.VERTICAL if vertical else Orientation.HORIZONTAL))
+    return ships
+
+def play_chunk(task):
+    '''
+    Worker entry point: plays a chunk of games for one pairing without any shared state.
+    Args:
+        task: (pairing index, competitor A, competitor B, ship count, first game number, game count, seed, record replays).
+    Returns:
+        (pairing index, packed results, archive records) where winner 0 means competitor A won.
+        The archive records are empty unless replays are recorded.
+    '''
+    pairing, first, second, num_ships, start, count, seed, record = task
+    results = bytearray()
+    records = bytearray()
+    for game in range(start, start + count):
+        rng = random.Random(seed * 1000003 + pairing * 7919 + game)  # Reproducible, independent games.
+        a_first = game % 2 == 0  # Alternate which competitor attacks first.
+        order = (first, second) if a_first else (second, first)
+        log = ReplayLog(10, 10, num_ships) if record else None
+        winner, turns, hits, misses = play_game(order, num_ships, rng, log)
+        if log is not None:
+            records += ReplayArchive.pack(log.data)
+        if not a_first:
+            winner = 1 - winner  # Report the winner relative to competitor A.
+        results += RESULT_FORMAT.pack(winner, turns, hits, misses)
+    return pairing, bytes(results), bytes(records)
+
+def wilson_interval(wins, games, z=1.96):
+    '''
+    Returns the Wilson score interval (low, high) for a win rate, 95% by default.
+    '''
+    if games == 0:
+        return 0.0, 1.0
+    rate = wins / games
+    denominator = 1 + z * z / games
+    center = (rate + z * z / (2 * games)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / games + z * z / (4 * games * games)) / denominator
+    return center - margin, center + margin
+
+class PairingStats:
+    def __init__(self):
+        '''
+        Running totals for one pairing, indexed by side (0 = competitor A, 1 = competitor B).
+        '''
+        self.games = 0
+        self.wins = [0, 0]
+        self.turns = [0, 0]  # Sum of turns to win.
+        self.hits = [0, 0]  # Sum of hits in won games.
+        self.misses = [0, 0]  # Sum of misses in won games.
+
+    def add(self, packed):
+        '''
+        Folds a chunk of packed per-game results into the totals.
+        '''
+        for winner, turns, hits, misses in RESULT_FORMAT.iter_unpack(packed):
+            self.games += 1
+            self.wins[winner] += 1
+            self.turns[winner] += turns
+            self.hits[winner] += hits
+            self.misses[winner] += misses
+
+def format_rate(wins, games):
+    '''
+    Formats a win rate with its 95% confidence interval.
+    '''
+    low, high = wilson_interval(wins, games)
+    rate = wins / games if games else 0.0
+    return f"{rate:7.2%} [{low:.2%}, {high:.2%}]"
+
+def make_tasks(competitors, pairings, games, num_ships, seed, record=False):
+    '''
+    Splits every pairing into chunks of CHUNK_SIZE games, interleaving the pairings so that slow and fast
+    pairings are spread over all the workers instead of queued one after the other.
+    '''
+    tasks = []
+    for start in range(0, games, CHUNK_SIZE):
+        for index, (a, b) in enumerate(pairings):
+            tasks.append((index, competitors[a], competitors[b], num_ships, start, min(CHUNK_SIZE, games - start), seed, record))
+    return tasks
+
+def run_tournament(competitors, games, num_ships, workers, seed, archive_path=None):
+    '''
+    Plays every pairing of competitors for the given number of games and prints the results.
+    If archive_path is given, every game is also appended to that replay archive.
+    '''
+    pairings = list(itertools.combinations(range(len(competitors)), 2))
+    tasks = make_tasks(competitors, pairings, games, num_ships, seed, archive_path is not None)
+
+    stats = [PairingStats() for _ in pairings]
+    archive = ReplayArchive(archive_path) if archive_path else None
+    with multiprocessing.Pool(workers) as pool:
+        for index, packed, records in pool.imap_unordered(play_chunk, tasks):
+            stats[index].add(packed)
+            if archive is not None:
+                archive.extend(records)
+
+    names = [f"{attack}:{placement}" for attack, placement in competitors]
+    totals = [PairingStats() for _ in competitors]  # Per-competitor totals, kept on side 0.
+    print("Pairings (win rate of the first competitor, 95% CI):")
+    for (a, b), pairing in zip(pairings, stats):
+        for side, who in ((0, a), (1, b)):
+            totals[who].games += pairing.games
+            totals[who].wins[0] += pairing.wins[side]
+            totals[who].turns[0] += pairing.turns[side]
+            totals[who].hits[0] += pairing.hits[side]
+            totals[who].misses[0] += pairing.misses[side]
+        print(f"  {names[a]:>20} vs {names[b]:<20} {format_rate(pairing.wins[0], pairing.games)}")
+
+    print("Overall (win rate, 95% CI, averages over won games):")
+    for name, total in zip(names, totals):
+        won = max(total.wins[0], 1)
+        print(f"  {name:>20} {format_rate(total.wins[0], total.games)}"
+              f"  turns {total.turns[0] / won:6.2f}  hits {total.hits[0] / won:5.2f}  misses {total.misses[0] / won:6.2f}")
+
+def main():
+    '''
+    Parses the command line and runs the tournament.
+    '''
+    default_competitors = [f"{attack}:{placement}" for attack in ATTACK_STRATEGIES for placement in PLACEMENT_STRATEGIES]
+    parser = argparse.ArgumentParser(description="Round-robin tournament between Battleship AI strategies.")
+    parser.add_argument("competitors", nargs="*", default=default_competitors,
+                        help="attack:placement pairs, e.g. probability:edge (default: every combination)")
+    parser.add_argument("-n", "--games", type=int, default=1000, help="games per pairing")
+    parser.add_argument("-s", "--ships", type=int, default=5, help="number of ships (sizes 1..N)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for reproducible tournaments")
+    parser.add_argument("--archive", help="append a replay of every game to this replay archive file")
+    args = parser.parse_args()
+
+    competitors = [parse_competitor(name) for name in args.competitors]
+    if len(competitors) < 2:
+        parser.error("need at least two competitors")
+    if not Engine.MIN_SHIPS <= args.ships <= Engine.MAX_SHIPS:  # Larger fleets do not fit on the 10x10 board.
+        parser.error(f"--ships must be between {Engine.MIN_SHIPS} and {Engine.MAX_SHIPS}")
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+    run_tournament(competitors, args.games, args.ships, args.workers, args.seed, args.archive)
+
+if __name__ == "__main__":
+    main()